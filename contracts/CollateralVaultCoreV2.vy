@@ -9,8 +9,17 @@ from ethereum.ercs import IERC721
 interface IDelegationRegistry:
     def delegateForToken(delegate: address, contract_: address, tokenId: uint256, value_: bool): nonpayable
 
+interface IDelegateRegistryV2:
+    def delegateERC721(to: address, contract_: address, tokenId: uint256, rights: bytes32, enable: bool) -> bytes32: payable
+    def multicall(data: DynArray[Bytes[164], 100]): payable
+
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 
 # Events
 
@@ -30,6 +39,11 @@ event CollateralVaultPeripheralAddressSet:
     currentValue: address
     newValue: address
 
+event DelegationRegistrySet:
+    currentValue: address
+    newValue: address
+    version: uint256
+
 
 # Global variables
 
@@ -40,13 +54,50 @@ proposedOwner: public(address)
 
 collateralVaultPeripheralAddress: public(address)
 delegationRegistry: public(IDelegationRegistry)
+delegationRegistryVersion: public(uint256) # 1 for delegate.cash v1, 2 for delegate.xyz v2
+previousDelegationRegistry: public(IDelegationRegistry) # last v1 registry, still holding the delegations of open loans
 
 ##### INTERNAL METHODS #####
 
 
 @internal
 def _setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
-    extcall self.delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+    if self.delegationRegistryVersion == 2:
+        extcall IDelegateRegistryV2(self.delegationRegistry.address).delegateERC721(_wallet, _collateralAddress, _tokenId, empty(bytes32), _value)
+    else:
+        extcall self.delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+
+    if not _value and self.previousDelegationRegistry.address != empty(address):
+        extcall self.previousDelegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, False)
+
+
+@internal
+def _setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
+    if self.delegationRegistryVersion != 2:
+        for collateral: Collateral in _collaterals:
+            self._setDelegation(_wallet, collateral.contractAddress, collateral.tokenId, _value)
+        return
+
+    # the v2 registry takes all the token delegations in a single multicall, each call being 4 + 5 * 32 bytes
+    calls: DynArray[Bytes[164], 100] = []
+    for collateral: Collateral in _collaterals:
+        calls.append(
+            _abi_encode(
+                _wallet,
+                collateral.contractAddress,
+                collateral.tokenId,
+                empty(bytes32),
+                _value,
+                method_id=method_id("delegateERC721(address,address,uint256,bytes32,bool)")
+            )
+        )
+    if len(calls) > 0:
+        extcall IDelegateRegistryV2(self.delegationRegistry.address).multicall(calls)
+
+    if not _value and self.previousDelegationRegistry.address != empty(address):
+        for collateral: Collateral in _collaterals:
+            extcall self.previousDelegationRegistry.delegateForToken(_wallet, collateral.contractAddress, collateral.tokenId, False)
+
 
 @view
 @internal
@@ -54,6 +105,20 @@ def _collateralOwner(_collateralAddress: address, _tokenId: uint256) -> address:
     assert staticcall IERC165(_collateralAddress).supportsInterface(0x80ac58cd), "collat addr is not a ERC721"
     return staticcall IERC721(_collateralAddress).ownerOf(_tokenId)
 
+
+@internal
+def _storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegateWallet: address):
+    extcall IERC721(_collateralAddress).safeTransferFrom(_wallet, self, _tokenId, b"")
+    if _delegateWallet != empty(address):
+        self._setDelegation(_delegateWallet, _collateralAddress, _tokenId, True)
+
+
+@internal
+def _transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256):
+    assert self._collateralOwner(_collateralAddress, _tokenId) == self, "collateral not owned by vault"
+
+    extcall IERC721(_collateralAddress).safeTransferFrom(self, _wallet, _tokenId, b"")
+
 ##### EXTERNAL METHODS - VIEW #####
 
 
@@ -85,6 +150,7 @@ def isCollateralApprovedForVault(_borrower: address, _collateralAddress: address
 def __init__(_delegationRegistryAddress: address):
     self.owner = msg.sender
     self.delegationRegistry = IDelegationRegistry(_delegationRegistryAddress)
+    self.delegationRegistryVersion = 1
 
 
 @external
@@ -133,27 +199,83 @@ def setCollateralVaultPeripheralAddress(_address: address):
     self.collateralVaultPeripheralAddress = _address
 
 
+@external
+def setDelegationRegistry(_address: address, _version: uint256):
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert _address != empty(address), "address is the zero addr"
+    assert _version == 1 or _version == 2, "version not supported"
+    assert self.delegationRegistry.address != _address, "new value is the same"
+
+    # the delegations of open loans stay in the v1 registry and are cleared there token by token as the loans close
+    if self.delegationRegistryVersion == 1:
+        self.previousDelegationRegistry = self.delegationRegistry
+
+    log DelegationRegistrySet(
+        self.delegationRegistry.address,
+        _address,
+        _version
+    )
+
+    self.delegationRegistry = IDelegationRegistry(_address)
+    self.delegationRegistryVersion = _version
+
+
 @external
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegateWallet: address):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
 
-    extcall IERC721(_collateralAddress).safeTransferFrom(_wallet, self, _tokenId, b"")
+    self._storeCollateral(_wallet, _collateralAddress, _tokenId, _delegateWallet)
+
+
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegateWallet: address):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+
+    # collections approved for all the wallet tokens only need to be checked once
+    approvedCollections: DynArray[address, 100] = []
+    for collateral: Collateral in _collaterals:
+        assert self._collateralOwner(collateral.contractAddress, collateral.tokenId) == _wallet, "collateral not owned by wallet"
+        if collateral.contractAddress not in approvedCollections:
+            if staticcall IERC721(collateral.contractAddress).isApprovedForAll(_wallet, self):
+                approvedCollections.append(collateral.contractAddress)
+            else:
+                assert staticcall IERC721(collateral.contractAddress).getApproved(collateral.tokenId) == self, "transfer is not approved"
+
+        self._storeCollateral(_wallet, collateral.contractAddress, collateral.tokenId, empty(address))
+
     if _delegateWallet != empty(address):
-        self._setDelegation(_delegateWallet, _collateralAddress, _tokenId, True)
+        self._setDelegations(_delegateWallet, _collaterals, True)
 
 
 @external
 def transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegateWallet: address):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
     assert _delegateWallet != empty(address), "delegate is zero addr"
-    assert self._collateralOwner(_collateralAddress, _tokenId) == self, "collateral not owned by vault"
 
-    extcall IERC721(_collateralAddress).safeTransferFrom(self, _wallet, _tokenId, b"")
+    self._transferCollateral(_wallet, _collateralAddress, _tokenId)
     self._setDelegation(_delegateWallet, _collateralAddress, _tokenId, False)
 
 
+@external
+def transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegateWallet: address):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+    assert _delegateWallet != empty(address), "delegate is zero addr"
+
+    for collateral: Collateral in _collaterals:
+        self._transferCollateral(_wallet, collateral.contractAddress, collateral.tokenId)
+
+    self._setDelegations(_delegateWallet, _collaterals, False)
+
+
 @external
 def setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
 
     self._setDelegation(_wallet, _collateralAddress, _tokenId, _value)
+
+
+@external
+def setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+
+    self._setDelegations(_wallet, _collaterals, _value)
@@ -26,6 +26,10 @@ interface CryptoPunksMarket:
 interface IDelegationRegistry:
     def delegateForToken(delegate: address, contract_: address, tokenId: uint256, value_: bool): nonpayable
 
+interface IDelegateRegistryV2:
+    def delegateERC721(to: address, contract_: address, tokenId: uint256, rights: bytes32, enable: bool) -> bytes32: payable
+    def multicall(data: DynArray[Bytes[164], 100]): payable
+
 interface ISelf:
     def initialize(_owner: address): nonpayable
 
@@ -34,6 +38,11 @@ interface ISelf:
 # Structs
 
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 # cryptopunks Offer
 struct Offer:
     isForSale: bool
@@ -126,6 +135,7 @@ liquidationsPeripheralAddress: public(address)
 
 cryptoPunksMarketAddress: public(immutable(CryptoPunksMarket))
 delegationRegistry: public(immutable(IDelegationRegistry))
+delegationRegistryVersion: public(immutable(uint256)) # 1 for delegate.cash v1, 2 for delegate.xyz v2
 
 
 
@@ -192,7 +202,34 @@ def _vault_owns_collateral(_collateralAddress: address, _tokenId: uint256) -> bo
 
 @internal
 def _setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
-    extcall delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+    if delegationRegistryVersion == 2:
+        extcall IDelegateRegistryV2(delegationRegistry.address).delegateERC721(_wallet, _collateralAddress, _tokenId, empty(bytes32), _value)
+    else:
+        extcall delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+
+
+@internal
+def _set_delegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
+    if delegationRegistryVersion != 2:
+        for collateral: Collateral in _collaterals:
+            self._setDelegation(_wallet, collateral.contractAddress, collateral.tokenId, _value)
+        return
+
+    # the v2 registry takes all the token delegations in a single multicall, each call being 4 + 5 * 32 bytes
+    calls: DynArray[Bytes[164], 100] = []
+    for collateral: Collateral in _collaterals:
+        calls.append(
+            _abi_encode(
+                _wallet,
+                collateral.contractAddress,
+                collateral.tokenId,
+                empty(bytes32),
+                _value,
+                method_id=method_id("delegateERC721(address,address,uint256,bytes32,bool)")
+            )
+        )
+    if len(calls) > 0:
+        extcall IDelegateRegistryV2(delegationRegistry.address).multicall(calls)
 
 
 @internal
@@ -236,8 +273,6 @@ def _transfer_collateral(_wallet: address, _collateralAddress: address, _tokenId
     else:
         raise "address not supported by vault"
 
-    self._setDelegation(_delegateWallet, _collateralAddress, _tokenId, False)
-
 
 
 ##### EXTERNAL METHODS - VIEW #####
@@ -268,10 +303,12 @@ def isCollateralApprovedForVault(_borrower: address, _collateralAddress: address
 ##### EXTERNAL METHODS - WRITE #####
 
 @deploy
-def __init__(_cryptoPunksMarketAddress: address, _delegationRegistryAddress: address):
+def __init__(_cryptoPunksMarketAddress: address, _delegationRegistryAddress: address, _delegationRegistryVersion: uint256):
+    assert _delegationRegistryVersion == 1 or _delegationRegistryVersion == 2, "version not supported"
     self.owner = msg.sender
     cryptoPunksMarketAddress = CryptoPunksMarket(_cryptoPunksMarketAddress)
     delegationRegistry = IDelegationRegistry(_delegationRegistryAddress)
+    delegationRegistryVersion = _delegationRegistryVersion
 
 
 @external
@@ -388,6 +425,59 @@ def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uin
 
 
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+
+    """
+    @notice Stores the given collaterals
+    @dev Logs a `CollateralStored` event for each collateral. The ERC721 interface and approval for all are checked once per collection
+    @param _wallet The wallet to transfer the collaterals from
+    @param _collaterals The collaterals to store
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    @param _createDelegation Wether to set _wallet as a delegate for the tokens
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert _erc20TokenContract != empty(address), "address is the zero addr"
+    assert self.loansAddress != empty(address), "mapping not found"
+    assert msg.sender == self.loansAddress, "msg.sender is not authorised"
+
+    erc721Collections: DynArray[address, 100] = []
+    approvedCollections: DynArray[address, 100] = []
+    for collateral: Collateral in _collaterals:
+        assert collateral.contractAddress != empty(address), "collat addr is the zero addr"
+
+        if self._is_punk(collateral.contractAddress):
+            assert self._punk_owner(collateral.contractAddress, collateral.tokenId) == _wallet, "collateral not owned by wallet"
+            assert self._is_punk_approved_for_vault(_wallet, collateral.contractAddress, collateral.tokenId), "transfer is not approved"
+            self._store_punk(_wallet, collateral.contractAddress, collateral.tokenId)
+
+        else:
+            if collateral.contractAddress not in erc721Collections:
+                assert self._is_erc721(collateral.contractAddress), "address not supported by vault"
+                erc721Collections.append(collateral.contractAddress)
+                if staticcall IERC721(collateral.contractAddress).isApprovedForAll(_wallet, self):
+                    approvedCollections.append(collateral.contractAddress)
+
+            assert self._erc721_owner(collateral.contractAddress, collateral.tokenId) == _wallet, "collateral not owned by wallet"
+            if collateral.contractAddress not in approvedCollections:
+                assert staticcall IERC721(collateral.contractAddress).getApproved(collateral.tokenId) == self, "transfer is not approved"
+            self._store_erc721(_wallet, collateral.contractAddress, collateral.tokenId)
+
+        log CollateralStored(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet,
+            _wallet if _createDelegation else empty(address)
+        )
+
+    if _createDelegation:
+        self._set_delegations(_wallet, _collaterals, True)
+
+
+
 @external
 def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address):
 
@@ -407,6 +497,7 @@ def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _t
     assert msg.sender == self.loansAddress, "msg.sender is not authorised"
 
     self._transfer_collateral(_wallet, _collateralAddress, _tokenId, _wallet)
+    self._setDelegation(_wallet, _collateralAddress, _tokenId, False)
 
     log CollateralFromLoanTransferred(
         _collateralAddress,
@@ -418,6 +509,38 @@ def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _t
 
 
 
+@external
+def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address):
+
+    """
+    @notice Transfers the given collaterals from the vault to a wallet
+    @dev Logs a `CollateralFromLoanTransferred` event for each collateral; to be used by `LoansPeripheral`
+    @param _wallet The wallet to transfer the collaterals to
+    @param _collaterals The collaterals to transfer
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert _erc20TokenContract != empty(address), "address is the zero addr"
+    assert self.loansAddress != empty(address), "mapping not found"
+    assert msg.sender == self.loansAddress, "msg.sender is not authorised"
+
+    for collateral: Collateral in _collaterals:
+        assert collateral.contractAddress != empty(address), "collat addr is the zero addr"
+        self._transfer_collateral(_wallet, collateral.contractAddress, collateral.tokenId, _wallet)
+
+        log CollateralFromLoanTransferred(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet
+        )
+
+    self._set_delegations(_wallet, _collaterals, False)
+
+
+
 @external
 def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256):
 
@@ -434,6 +557,7 @@ def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: addr
     assert _collateralAddress != empty(address), "collat addr is the zero addr"
 
     self._transfer_collateral(_wallet, _collateralAddress, _tokenId, _wallet)
+    self._setDelegation(_wallet, _collateralAddress, _tokenId, False)
 
     log CollateralFromLiquidationTransferred(
         _collateralAddress,
@@ -445,6 +569,35 @@ def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: addr
 
 
 
+@external
+def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]):
+
+    """
+    @notice Transfers the given collaterals from the vault to a wallet, as part of their liquidations
+    @dev Logs a `CollateralFromLiquidationTransferred` event for each collateral; to be used by `LiquidationsPeripheral`
+    @param _wallet The wallet to transfer the collaterals to
+    @param _collaterals The collaterals to transfer
+    """
+
+    assert msg.sender == self.liquidationsPeripheralAddress, "msg.sender is not authorised"
+    assert _wallet != empty(address), "address is the zero addr"
+
+    for collateral: Collateral in _collaterals:
+        assert collateral.contractAddress != empty(address), "collat addr is the zero addr"
+        self._transfer_collateral(_wallet, collateral.contractAddress, collateral.tokenId, _wallet)
+
+        log CollateralFromLiquidationTransferred(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet
+        )
+
+    self._set_delegations(_wallet, _collaterals, False)
+
+
+
 @external
 def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool):
 
@@ -466,6 +619,25 @@ def setCollateralDelegation(_wallet: address, _collateralAddress: address, _toke
 
 
 
+@external
+def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool):
+
+    """
+    @notice Creates or removes the token delegations for the given collaterals
+    @param _wallet The wallet to delegate the collaterals to
+    @param _collaterals The collaterals to delegate
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    @param _value Wether to set or unset the delegations
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert self.loansAddress != empty(address), "mapping not found"
+    assert msg.sender == self.loansAddress, "msg.sender is not authorised"
+
+    self._set_delegations(_wallet, _collaterals, _value)
+
+
+
 @view
 @external
 def collateralSupportsDelegation(_collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address) -> bool:
@@ -21,7 +21,10 @@ interface IVault:
     def setCollateralVaultPeripheralAddress(_address: address): nonpayable
     def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address): nonpayable
     def transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address): nonpayable
+    def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address): nonpayable
+    def transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address): nonpayable
     def setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool): nonpayable
+    def setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool): nonpayable
     def collateralOwner(_collateralAddress: address, _tokenId: uint256) -> address: view
     def ownsCollateral(_collateralAddress: address, _tokenId: uint256) -> bool: view
     def isCollateralApprovedForVault(_borrower: address, _collateralAddress: address, _tokenId: uint256) -> bool: view
@@ -29,6 +32,10 @@ interface IVault:
 
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
 
 # Events
 
@@ -121,6 +128,47 @@ def _getVaultAddress(_collateralAddress: address, _tokenId: uint256) -> address:
         return vault
     return self.collateralVaultCoreDefaultAddress
 
+
+@view
+@internal
+def _getVaultAddresses(_collaterals: DynArray[Collateral, 100]) -> DynArray[address, 100]:
+    vaults: DynArray[address, 100] = []
+    for collateral: Collateral in _collaterals:
+        assert collateral.contractAddress != empty(address), "collat addr is the zero addr"
+        vaults.append(self._getVaultAddress(collateral.contractAddress, collateral.tokenId))
+    return vaults
+
+
+@pure
+@internal
+def _vaultCollaterals(_vault: address, _vaults: DynArray[address, 100], _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    collaterals: DynArray[Collateral, 100] = []
+    for i: uint256 in range(len(_collaterals), bound=100):
+        if _vaults[i] == _vault:
+            collaterals.append(_collaterals[i])
+    return collaterals
+
+
+@internal
+def _storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate: address):
+    # one call per vault core, each core checks the ownership and approvals of its collaterals
+    vaults: DynArray[address, 100] = self._getVaultAddresses(_collaterals)
+    processedVaults: DynArray[address, 100] = []
+    for vault: address in vaults:
+        if vault not in processedVaults:
+            processedVaults.append(vault)
+            extcall IVault(vault).storeCollaterals(_wallet, self._vaultCollaterals(vault, vaults, _collaterals), _delegate)
+
+
+@internal
+def _transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100]):
+    vaults: DynArray[address, 100] = self._getVaultAddresses(_collaterals)
+    processedVaults: DynArray[address, 100] = []
+    for vault: address in vaults:
+        if vault not in processedVaults:
+            processedVaults.append(vault)
+            extcall IVault(vault).transferCollaterals(_wallet, self._vaultCollaterals(vault, vaults, _collaterals), _wallet)
+
 ##### EXTERNAL METHODS - VIEW #####
 
 @view
@@ -296,6 +344,39 @@ def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uin
     )
 
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+
+    """
+    @notice Stores the given collaterals, with a single call to each vault core
+    @dev Logs a `CollateralStored` event for each collateral
+    @param _wallet The wallet to transfer the collaterals from
+    @param _collaterals The collaterals to store
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    @param _createDelegation Wether to set _wallet as a delegate for the tokens
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert _erc20TokenContract != empty(address), "address is the zero addr"
+    assert self.loansPeripheralAddresses[_erc20TokenContract] != empty(address), "mapping not found"
+    assert msg.sender == self.loansPeripheralAddresses[_erc20TokenContract], "msg.sender is not authorised"
+
+    delegate: address = empty(address)
+    if _createDelegation:
+        delegate = _wallet
+    self._storeCollaterals(_wallet, _collaterals, delegate)
+
+    for collateral: Collateral in _collaterals:
+        log CollateralStored(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet,
+            delegate
+        )
+
+
 @external
 def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address):
 
@@ -325,6 +406,34 @@ def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _t
     )
 
 
+@external
+def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address):
+
+    """
+    @notice Transfers the given collaterals from the vault to a wallet, with a single call to each vault core
+    @dev Logs a `CollateralFromLoanTransferred` event for each collateral; to be used by `LoansPeripheral`
+    @param _wallet The wallet to transfer the collaterals to
+    @param _collaterals The collaterals to transfer
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert _erc20TokenContract != empty(address), "address is the zero addr"
+    assert self.loansPeripheralAddresses[_erc20TokenContract] != empty(address), "mapping not found"
+    assert msg.sender == self.loansPeripheralAddresses[_erc20TokenContract], "msg.sender is not authorised"
+
+    self._transferCollaterals(_wallet, _collaterals)
+
+    for collateral: Collateral in _collaterals:
+        log CollateralFromLoanTransferred(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet
+        )
+
+
 @external
 def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256):
 
@@ -351,6 +460,31 @@ def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: addr
     )
 
 
+@external
+def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]):
+
+    """
+    @notice Transfers the given collaterals from the vault to a wallet as part of their liquidations, with a single call to each vault core
+    @dev Logs a `CollateralFromLiquidationTransferred` event for each collateral; to be used by `LiquidationsPeripheral`
+    @param _wallet The wallet to transfer the collaterals to
+    @param _collaterals The collaterals to transfer
+    """
+
+    assert msg.sender == self.liquidationsPeripheralAddress, "msg.sender is not authorised"
+    assert _wallet != empty(address), "address is the zero addr"
+
+    self._transferCollaterals(_wallet, _collaterals)
+
+    for collateral: Collateral in _collaterals:
+        log CollateralFromLiquidationTransferred(
+            collateral.contractAddress,
+            _wallet,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _wallet
+        )
+
+
 @external
 def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool):
 
@@ -371,6 +505,29 @@ def setCollateralDelegation(_wallet: address, _collateralAddress: address, _toke
     extcall IVault(self._getVaultAddress(_collateralAddress, _tokenId)).setDelegation(_wallet, _collateralAddress, _tokenId, _value)
 
 
+@external
+def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool):
+
+    """
+    @notice Creates or removes the token delegations for the given collaterals, with a single call to each vault core
+    @param _wallet The wallet to delegate the collaterals to
+    @param _collaterals The collaterals to delegate
+    @param _erc20TokenContract The token address by which the loans contract is indexed
+    @param _value Wether to set or unset the delegations
+    """
+
+    assert _wallet != empty(address), "address is the zero addr"
+    assert self.loansPeripheralAddresses[_erc20TokenContract] != empty(address), "mapping not found"
+    assert msg.sender == self.loansPeripheralAddresses[_erc20TokenContract], "msg.sender is not authorised"
+
+    vaults: DynArray[address, 100] = self._getVaultAddresses(_collaterals)
+    processedVaults: DynArray[address, 100] = []
+    for vault: address in vaults:
+        if vault not in processedVaults:
+            processedVaults.append(vault)
+            extcall IVault(vault).setDelegations(_wallet, self._vaultCollaterals(vault, vaults, _collaterals), _value)
+
+
 @view
 @external
 def collateralSupportsDelegation(_collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address) -> bool:
@@ -15,9 +15,18 @@ interface CryptoPunksMarket:
 interface IDelegationRegistry:
     def delegateForToken(delegate: address, contract_: address, tokenId: uint256, value_: bool): nonpayable
 
+interface IDelegateRegistryV2:
+    def delegateERC721(to: address, contract_: address, tokenId: uint256, rights: bytes32, enable: bool) -> bytes32: payable
+    def multicall(data: DynArray[Bytes[164], 100]): payable
+
 
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 struct Offer:
     isForSale: bool
     punkIndex: uint256
@@ -43,6 +52,11 @@ event CollateralVaultPeripheralAddressSet:
     currentValue: address
     newValue: address
 
+event DelegationRegistrySet:
+    currentValue: address
+    newValue: address
+    version: uint256
+
 
 # Global variables
 
@@ -53,12 +67,74 @@ vaultName: public(constant(String[30])) = "cryptopunks"
 collateralVaultPeripheralAddress: public(address)
 cryptoPunksMarketAddress: public(address)
 delegationRegistry: public(IDelegationRegistry)
+delegationRegistryVersion: public(uint256) # 1 for delegate.cash v1, 2 for delegate.xyz v2
+previousDelegationRegistry: public(IDelegationRegistry) # last v1 registry, still holding the delegations of open loans
 
 ##### INTERNAL METHODS #####
 
 @internal
 def _setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
-    extcall self.delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+    if self.delegationRegistryVersion == 2:
+        extcall IDelegateRegistryV2(self.delegationRegistry.address).delegateERC721(_wallet, _collateralAddress, _tokenId, empty(bytes32), _value)
+    else:
+        extcall self.delegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, _value)
+
+    if not _value and self.previousDelegationRegistry.address != empty(address):
+        extcall self.previousDelegationRegistry.delegateForToken(_wallet, _collateralAddress, _tokenId, False)
+
+
+@internal
+def _setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
+    if self.delegationRegistryVersion != 2:
+        for collateral: Collateral in _collaterals:
+            self._setDelegation(_wallet, collateral.contractAddress, collateral.tokenId, _value)
+        return
+
+    # the v2 registry takes all the token delegations in a single multicall, each call being 4 + 5 * 32 bytes
+    calls: DynArray[Bytes[164], 100] = []
+    for collateral: Collateral in _collaterals:
+        calls.append(
+            _abi_encode(
+                _wallet,
+                collateral.contractAddress,
+                collateral.tokenId,
+                empty(bytes32),
+                _value,
+                method_id=method_id("delegateERC721(address,address,uint256,bytes32,bool)")
+            )
+        )
+    if len(calls) > 0:
+        extcall IDelegateRegistryV2(self.delegationRegistry.address).multicall(calls)
+
+    if not _value and self.previousDelegationRegistry.address != empty(address):
+        for collateral: Collateral in _collaterals:
+            extcall self.previousDelegationRegistry.delegateForToken(_wallet, collateral.contractAddress, collateral.tokenId, False)
+
+
+@internal
+def _storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address):
+    assert _collateralAddress == self.cryptoPunksMarketAddress, "address not supported by vault"
+
+    offer: Offer = staticcall CryptoPunksMarket(_collateralAddress).punksOfferedForSale(_tokenId)
+
+    assert offer.isForSale, "collateral not for sale"
+    assert offer.punkIndex == _tokenId, "collateral with wrong punkIndex"
+    assert offer.seller == _wallet, "collateral now owned by wallet"
+    assert offer.minValue == 0, "collateral offer is not zero"
+    assert offer.onlySellTo == empty(address) or offer.onlySellTo == self, "collateral buying not authorized"
+
+    extcall CryptoPunksMarket(_collateralAddress).buyPunk(_tokenId)
+
+    if _delegate_wallet != empty(address):
+        self._setDelegation(_delegate_wallet, _collateralAddress, _tokenId, True)
+
+
+@internal
+def _transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256):
+    assert _collateralAddress == self.cryptoPunksMarketAddress, "address not supported by vault"
+    assert staticcall CryptoPunksMarket(_collateralAddress).punkIndexToAddress(_tokenId) == self, "collateral not owned by vault"
+
+    extcall CryptoPunksMarket(_collateralAddress).transferPunk(_wallet, _tokenId)
 
 
 ##### EXTERNAL METHODS - VIEW #####
@@ -94,6 +170,7 @@ def __init__(_cryptoPunksMarketAddress: address, _delegationRegistryAddress: add
     self.owner = msg.sender
     self.cryptoPunksMarketAddress = _cryptoPunksMarketAddress
     self.delegationRegistry = IDelegationRegistry(_delegationRegistryAddress)
+    self.delegationRegistryVersion = 1
 
 
 @external
@@ -141,37 +218,75 @@ def setCollateralVaultPeripheralAddress(_address: address):
     self.collateralVaultPeripheralAddress = _address
 
 
+@external
+def setDelegationRegistry(_address: address, _version: uint256):
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert _address != empty(address), "address is the zero addr"
+    assert _version == 1 or _version == 2, "version not supported"
+    assert self.delegationRegistry.address != _address, "new value is the same"
+
+    # the delegations of open loans stay in the v1 registry and are cleared there token by token as the loans close
+    if self.delegationRegistryVersion == 1:
+        self.previousDelegationRegistry = self.delegationRegistry
+
+    log DelegationRegistrySet(
+        self.delegationRegistry.address,
+        _address,
+        _version
+    )
+
+    self.delegationRegistry = IDelegationRegistry(_address)
+    self.delegationRegistryVersion = _version
+
+
 @external
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
-    assert _collateralAddress == self.cryptoPunksMarketAddress, "address not supported by vault"
 
-    offer: Offer = staticcall CryptoPunksMarket(_collateralAddress).punksOfferedForSale(_tokenId)
+    self._storeCollateral(_wallet, _collateralAddress, _tokenId, _delegate_wallet)
 
-    assert offer.isForSale, "collateral not for sale"
-    assert offer.punkIndex == _tokenId, "collateral with wrong punkIndex"
-    assert offer.seller == _wallet, "collateral now owned by wallet"
-    assert offer.minValue == 0, "collateral offer is not zero"
-    assert offer.onlySellTo == empty(address) or offer.onlySellTo == self, "collateral buying not authorized"
 
-    extcall CryptoPunksMarket(_collateralAddress).buyPunk(_tokenId)
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+
+    # punks have no collection wide approval, each sale offer is checked when storing
+    for collateral: Collateral in _collaterals:
+        self._storeCollateral(_wallet, collateral.contractAddress, collateral.tokenId, empty(address))
 
     if _delegate_wallet != empty(address):
-        self._setDelegation(_delegate_wallet, _collateralAddress, _tokenId, True)
+        self._setDelegations(_delegate_wallet, _collaterals, True)
+
 
 @external
 def transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
-    assert _collateralAddress == self.cryptoPunksMarketAddress, "address not supported by vault"
-    assert staticcall CryptoPunksMarket(_collateralAddress).punkIndexToAddress(_tokenId) == self, "collateral not owned by vault"
     assert _delegate_wallet != empty(address), "delegate is zero addr"
 
-    extcall CryptoPunksMarket(_collateralAddress).transferPunk(_wallet, _tokenId)
+    self._transferCollateral(_wallet, _collateralAddress, _tokenId)
     self._setDelegation(_delegate_wallet, _collateralAddress, _tokenId, False)
 
 
+@external
+def transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+    assert _delegate_wallet != empty(address), "delegate is zero addr"
+
+    for collateral: Collateral in _collaterals:
+        self._transferCollateral(_wallet, collateral.contractAddress, collateral.tokenId)
+
+    self._setDelegations(_delegate_wallet, _collaterals, False)
+
+
 @external
 def setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
     assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
 
     self._setDelegation(_wallet, _collateralAddress, _tokenId, _value)
+
+
+@external
+def setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
+    assert msg.sender == self.collateralVaultPeripheralAddress, "msg.sender is not authorised"
+
+    self._setDelegations(_wallet, _collaterals, _value)
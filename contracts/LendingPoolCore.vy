@@ -15,7 +15,30 @@ struct InvestorFunds:
     sharesBasisPoints: uint256
     activeForRewards: bool
 
+# storage representation of InvestorFunds
+struct PackedInvestorFunds:
+    amounts: uint256 # currentAmountDeposited (bits 0-127) and sharesBasisPoints (128-255)
+    totals: uint256 # totalAmountDeposited (bits 0-127), totalAmountWithdrawn (128-254) and activeForRewards (255)
+
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    totalSharesBasisPoints: uint256
+    activeLenders: uint256
+    protocolFeesAccrued: uint256
+
+struct LenderFunds:
+    wallet: address
+    currentAmountDeposited: uint256
+    totalAmountDeposited: uint256
+    totalAmountWithdrawn: uint256
+    sharesBasisPoints: uint256
+    activeForRewards: bool
+
 interface ILendingPoolCore:
+    def funds(arg0: address) -> InvestorFunds: view
     def activeLenders() -> uint256: view
     def fundsAvailable() -> uint256: view
     def fundsInvested() -> uint256: view
@@ -54,19 +77,21 @@ proposedOwner: public(address)
 lendingPoolPeripheral: public(address)
 erc20TokenContract: public(address)
 
-funds: public(HashMap[address, InvestorFunds])
-lenders: DynArray[address, 2**50]
-knownLenders: public(HashMap[address, bool])
-activeLenders: public(uint256)
+investorFunds: HashMap[address, PackedInvestorFunds]
+lenders: DynArray[address, 2**50] # known lenders, the active ones first followed by the inactive ones
+lendersIndex: HashMap[address, uint256] # given a lender, its position in lenders plus one (0 if unknown)
 
-fundsAvailable: public(uint256)
-fundsInvested: public(uint256)
-totalFundsInvested: public(uint256)
-totalRewards: public(uint256)
-totalSharesBasisPoints: public(uint256)
+poolAmounts: uint256 # fundsAvailable (bits 0-127) and fundsInvested (128-255)
+poolTotals: uint256 # totalFundsInvested (bits 0-127) and totalRewards (128-255)
+poolShares: uint256 # totalSharesBasisPoints (bits 0-127) and activeLenders (128-255)
+protocolFeesAccrued: public(uint256)
 
 migrationDone: public(bool)
 
+MAX_PAGE_SIZE: constant(uint256) = 1000
+AMOUNT_MASK: constant(uint256) = 2**128 - 1
+TOTAL_WITHDRAWN_MASK: constant(uint256) = 2**127 - 1
+
 ##### INTERNAL METHODS #####
 
 @view
@@ -76,20 +101,229 @@ def _fundsAreAllowed(_owner: address, _spender: address, _amount: uint256) -> bo
     return _amount <= amountAllowed
 
 
+@pure
+@internal
+def _pack(_low: uint256, _high: uint256) -> uint256:
+    assert max(_low, _high) <= AMOUNT_MASK, "amount out of bounds"
+    return _low | (_high << 128)
+
+
+@pure
+@internal
+def _unpack(_value: uint256) -> (uint256, uint256):
+    return _value & AMOUNT_MASK, _value >> 128
+
+
+@view
+@internal
+def _getInvestorFunds(_lender: address) -> InvestorFunds:
+    packed: PackedInvestorFunds = self.investorFunds[_lender]
+    return InvestorFunds(
+        currentAmountDeposited=packed.amounts & AMOUNT_MASK,
+        totalAmountDeposited=packed.totals & AMOUNT_MASK,
+        totalAmountWithdrawn=(packed.totals >> 128) & TOTAL_WITHDRAWN_MASK,
+        sharesBasisPoints=packed.amounts >> 128,
+        activeForRewards=packed.totals >> 255 != 0
+    )
+
+
+@internal
+def _setInvestorFunds(_lender: address, _funds: InvestorFunds):
+    assert _funds.totalAmountWithdrawn <= TOTAL_WITHDRAWN_MASK, "amount out of bounds"
+    self.investorFunds[_lender] = PackedInvestorFunds(
+        amounts=self._pack(_funds.currentAmountDeposited, _funds.sharesBasisPoints),
+        totals=self._pack(_funds.totalAmountDeposited, _funds.totalAmountWithdrawn) | (convert(_funds.activeForRewards, uint256) << 255)
+    )
+
+
+@view
+@internal
+def _poolState() -> PoolState:
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalSharesBasisPoints: uint256 = 0
+    activeLenders: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+    totalSharesBasisPoints, activeLenders = self._unpack(self.poolShares)
+
+    return PoolState(
+        fundsAvailable=fundsAvailable,
+        fundsInvested=fundsInvested,
+        totalFundsInvested=totalFundsInvested,
+        totalRewards=totalRewards,
+        totalSharesBasisPoints=totalSharesBasisPoints,
+        activeLenders=activeLenders,
+        protocolFeesAccrued=self.protocolFeesAccrued
+    )
+
+
+@view
+@internal
+def _fundsInPool() -> uint256:
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    return fundsAvailable + fundsInvested
+
+
 @view
 @internal
 def _computeShares(_amount: uint256) -> uint256:
-    if self.totalSharesBasisPoints == 0:
+    totalSharesBasisPoints: uint256 = self.poolShares & AMOUNT_MASK
+    if totalSharesBasisPoints == 0:
         return _amount
-    return self.totalSharesBasisPoints * _amount // (self.fundsAvailable + self.fundsInvested)
+    return totalSharesBasisPoints * _amount // self._fundsInPool()
 
 
 @view
 @internal
 def _computeWithdrawableAmount(_lender: address) -> uint256:
-    if self.totalSharesBasisPoints == 0:
+    totalSharesBasisPoints: uint256 = self.poolShares & AMOUNT_MASK
+    if totalSharesBasisPoints == 0:
+        return 0
+    return self._fundsInPool() * (self.investorFunds[_lender].amounts >> 128) // totalSharesBasisPoints
+
+
+@internal
+def _accountForReceivedFunds(_amount: uint256, _rewardsAmount: uint256, _investedAmount: uint256):
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+
+    self.poolAmounts = self._pack(fundsAvailable + _amount + _rewardsAmount, fundsInvested - _investedAmount)
+    self.poolTotals = self._pack(totalFundsInvested, totalRewards + _rewardsAmount)
+
+
+@internal
+def _addLender(_lender: address):
+    # new lenders are added to the inactive partition
+    self.lenders.append(_lender)
+    self.lendersIndex[_lender] = len(self.lenders)
+
+
+@internal
+def _swapLenders(_index: uint256, _otherIndex: uint256):
+    if _index == _otherIndex:
+        return
+
+    lender: address = self.lenders[_index]
+    otherLender: address = self.lenders[_otherIndex]
+    self.lenders[_index] = otherLender
+    self.lenders[_otherIndex] = lender
+    self.lendersIndex[otherLender] = _index + 1
+    self.lendersIndex[lender] = _otherIndex + 1
+
+
+@internal
+def _activateLender(_lender: address, _activeLenders: uint256) -> uint256:
+    # swaps the lender with the first inactive one and returns the new active lenders count
+    self._swapLenders(self.lendersIndex[_lender] - 1, _activeLenders)
+    return _activeLenders + 1
+
+
+@internal
+def _deactivateLender(_lender: address, _activeLenders: uint256) -> uint256:
+    # swaps the lender with the last active one and returns the new active lenders count
+    self._swapLenders(self.lendersIndex[_lender] - 1, _activeLenders - 1)
+    return _activeLenders - 1
+
+
+@internal
+def _migrateLender(_lender: address, _funds: InvestorFunds):
+    self._setInvestorFunds(_lender, _funds)
+    self._addLender(_lender)
+
+    if _funds.activeForRewards:
+        totalSharesBasisPoints: uint256 = 0
+        activeLenders: uint256 = 0
+        totalSharesBasisPoints, activeLenders = self._unpack(self.poolShares)
+        self.poolShares = self._pack(totalSharesBasisPoints, self._activateLender(_lender, activeLenders))
+
+
+@internal
+def _deposit(_lender: address, _amount: uint256):
+    sharesAmount: uint256 = self._computeShares(_amount)
+    funds: InvestorFunds = self._getInvestorFunds(_lender)
+
+    totalSharesBasisPoints: uint256 = 0
+    activeLenders: uint256 = 0
+    totalSharesBasisPoints, activeLenders = self._unpack(self.poolShares)
+
+    if funds.currentAmountDeposited > 0:
+        funds.totalAmountDeposited += _amount
+        funds.currentAmountDeposited += _amount
+        funds.sharesBasisPoints += sharesAmount
+    elif funds.currentAmountDeposited == 0 and self.lendersIndex[_lender] != 0:
+        funds.totalAmountDeposited += _amount
+        funds.currentAmountDeposited = _amount
+        funds.sharesBasisPoints = sharesAmount
+        funds.activeForRewards = True
+
+        if self.lendersIndex[_lender] > activeLenders:
+            activeLenders = self._activateLender(_lender, activeLenders)
+    else:
+        funds = InvestorFunds(
+            currentAmountDeposited=_amount,
+            totalAmountDeposited=_amount,
+            totalAmountWithdrawn=0,
+            sharesBasisPoints=sharesAmount,
+            activeForRewards=True
+        )
+        self._addLender(_lender)
+        activeLenders = self._activateLender(_lender, activeLenders)
+
+    self._setInvestorFunds(_lender, funds)
+
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    self.poolAmounts = self._pack(fundsAvailable + _amount, fundsInvested)
+    self.poolShares = self._pack(totalSharesBasisPoints + sharesAmount, activeLenders)
+
+
+@internal
+def _withdraw(_lender: address, _amount: uint256, _withdrawableAmount: uint256):
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert fundsAvailable >= _amount, "Available funds less than amount"
+
+    newDepositAmount: uint256 = _withdrawableAmount - _amount
+    newLenderSharesAmount: uint256 = self._computeShares(newDepositAmount)
+    funds: InvestorFunds = self._getInvestorFunds(_lender)
+
+    totalSharesBasisPoints: uint256 = 0
+    activeLenders: uint256 = 0
+    totalSharesBasisPoints, activeLenders = self._unpack(self.poolShares)
+    totalSharesBasisPoints -= (funds.sharesBasisPoints - newLenderSharesAmount)
+
+    if newDepositAmount == 0 and self.lendersIndex[_lender] <= activeLenders:
+        activeLenders = self._deactivateLender(_lender, activeLenders)
+
+    self._setInvestorFunds(_lender, InvestorFunds(
+        currentAmountDeposited=newDepositAmount,
+        totalAmountDeposited=funds.totalAmountDeposited,
+        totalAmountWithdrawn=funds.totalAmountWithdrawn + _amount,
+        sharesBasisPoints=newLenderSharesAmount,
+        activeForRewards=newDepositAmount > 0
+    ))
+
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested)
+    self.poolShares = self._pack(totalSharesBasisPoints, activeLenders)
+
+
+@pure
+@internal
+def _pageLength(_length: uint256, _offset: uint256, _limit: uint256) -> uint256:
+    if _offset >= _length:
         return 0
-    return (self.fundsAvailable + self.fundsInvested) * self.funds[_lender].sharesBasisPoints // self.totalSharesBasisPoints
+    return min(min(_limit, _length - _offset), MAX_PAGE_SIZE)
 
 
 ##### EXTERNAL METHODS - VIEW #####
@@ -100,6 +334,100 @@ def lendersArray() -> DynArray[address, 2**50]:
   return self.lenders
 
 
+@view
+@external
+def lendersLength() -> uint256:
+    return len(self.lenders)
+
+
+@view
+@external
+def lendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    page: DynArray[address, MAX_PAGE_SIZE] = []
+    for i: uint256 in range(self._pageLength(len(self.lenders), _offset, _limit), bound=MAX_PAGE_SIZE):
+        page.append(self.lenders[_offset + i])
+    return page
+
+
+@view
+@external
+def activeLendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    page: DynArray[address, MAX_PAGE_SIZE] = []
+    for i: uint256 in range(self._pageLength(self.poolShares >> 128, _offset, _limit), bound=MAX_PAGE_SIZE):
+        page.append(self.lenders[_offset + i])
+    return page
+
+
+@view
+@external
+def inactiveLendersLength() -> uint256:
+    return len(self.lenders) - (self.poolShares >> 128)
+
+
+@view
+@external
+def inactiveLendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    activeLenders: uint256 = self.poolShares >> 128
+    page: DynArray[address, MAX_PAGE_SIZE] = []
+    for i: uint256 in range(self._pageLength(len(self.lenders) - activeLenders, _offset, _limit), bound=MAX_PAGE_SIZE):
+        page.append(self.lenders[activeLenders + _offset + i])
+    return page
+
+
+@view
+@external
+def knownLenders(_lender: address) -> bool:
+    return self.lendersIndex[_lender] != 0
+
+
+@view
+@external
+def poolState() -> PoolState:
+    return self._poolState()
+
+
+@view
+@external
+def fundsAvailable() -> uint256:
+    return self.poolAmounts & AMOUNT_MASK
+
+
+@view
+@external
+def fundsInvested() -> uint256:
+    return self.poolAmounts >> 128
+
+
+@view
+@external
+def totalFundsInvested() -> uint256:
+    return self.poolTotals & AMOUNT_MASK
+
+
+@view
+@external
+def totalRewards() -> uint256:
+    return self.poolTotals >> 128
+
+
+@view
+@external
+def totalSharesBasisPoints() -> uint256:
+    return self.poolShares & AMOUNT_MASK
+
+
+@view
+@external
+def activeLenders() -> uint256:
+    return self.poolShares >> 128
+
+
+@view
+@external
+def funds(_lender: address) -> InvestorFunds:
+    return self._getInvestorFunds(_lender)
+
+
 @view
 @external
 def computeWithdrawableAmount(_lender: address) -> uint256:
@@ -109,37 +437,37 @@ def computeWithdrawableAmount(_lender: address) -> uint256:
 @view
 @external
 def fundsInPool() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    return self._fundsInPool()
 
 
 @view
 @external
 def currentAmountDeposited(_lender: address) -> uint256:
-    return self.funds[_lender].currentAmountDeposited
+    return self.investorFunds[_lender].amounts & AMOUNT_MASK
 
 
 @view
 @external
 def totalAmountDeposited(_lender: address) -> uint256:
-    return self.funds[_lender].totalAmountDeposited
+    return self.investorFunds[_lender].totals & AMOUNT_MASK
 
 
 @view
 @external
 def totalAmountWithdrawn(_lender: address) -> uint256:
-    return self.funds[_lender].totalAmountWithdrawn
+    return (self.investorFunds[_lender].totals >> 128) & TOTAL_WITHDRAWN_MASK
 
 
 @view
 @external
 def sharesBasisPoints(_lender: address) -> uint256:
-    return self.funds[_lender].sharesBasisPoints
+    return self.investorFunds[_lender].amounts >> 128
 
 
 @view
 @external
 def activeForRewards(_lender: address) -> bool:
-    return self.funds[_lender].activeForRewards
+    return self.investorFunds[_lender].totals >> 255 != 0
 
 
 ##### EXTERNAL METHODS - NON-VIEW #####
@@ -163,17 +491,47 @@ def migrateLender(
 ):
     assert not self.migrationDone, "migration already done"
     assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert self.lendersIndex[_wallet] == 0, "lender already migrated"
 
-    self.lenders.append(_wallet)
-    self.knownLenders[_wallet] = True
-    self.funds[_wallet] = InvestorFunds({
-            currentAmountDeposited: _currentAmountDeposited,
-            totalAmountDeposited: _totalAmountDeposited,
-            totalAmountWithdrawn: _totalAmountWithdrawn,
-            sharesBasisPoints: _sharesBasisPoints,
-            activeForRewards: _activeForRewards
-            }
-    )
+    self._migrateLender(_wallet, InvestorFunds(
+        currentAmountDeposited=_currentAmountDeposited,
+        totalAmountDeposited=_totalAmountDeposited,
+        totalAmountWithdrawn=_totalAmountWithdrawn,
+        sharesBasisPoints=_sharesBasisPoints,
+        activeForRewards=_activeForRewards
+    ))
+
+
+@external
+def migrateLenders(_lenders: DynArray[LenderFunds, 256]):
+    assert not self.migrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+
+    # lenders already migrated are skipped, so that a batch can be safely resent
+    for lender: LenderFunds in _lenders:
+        if self.lendersIndex[lender.wallet] != 0:
+            continue
+        self._migrateLender(lender.wallet, InvestorFunds(
+            currentAmountDeposited=lender.currentAmountDeposited,
+            totalAmountDeposited=lender.totalAmountDeposited,
+            totalAmountWithdrawn=lender.totalAmountWithdrawn,
+            sharesBasisPoints=lender.sharesBasisPoints,
+            activeForRewards=lender.activeForRewards
+        ))
+
+
+@external
+def migrateLegacyLenders(_from: address, _lenders: DynArray[address, 256]):
+    assert not self.migrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert _from.is_contract, "LPCore is not a contract"
+
+    for lender: address in _lenders:
+        if self.lendersIndex[lender] != 0:
+            continue
+        funds: InvestorFunds = staticcall ILendingPoolCore(_from).funds(lender)
+        assert funds.totalAmountDeposited > 0, "lender not found"
+        self._migrateLender(lender, funds)
 
 
 @external
@@ -183,12 +541,20 @@ def migrate(_from: address):
     assert _from != empty(address), "_address is the zero address"
     assert _from.is_contract, "LPCore is not a contract"
 
-    self.activeLenders = staticcall ILendingPoolCore(_from).activeLenders()
-    self.fundsAvailable = staticcall ILendingPoolCore(_from).fundsAvailable()
-    self.fundsInvested = staticcall ILendingPoolCore(_from).fundsInvested()
-    self.totalFundsInvested = staticcall ILendingPoolCore(_from).totalFundsInvested()
-    self.totalRewards = staticcall ILendingPoolCore(_from).totalRewards()
-    self.totalSharesBasisPoints = staticcall ILendingPoolCore(_from).totalSharesBasisPoints()
+    # the source pool may predate poolState, so the totals are read one by one
+    self.poolAmounts = self._pack(
+        staticcall ILendingPoolCore(_from).fundsAvailable(),
+        staticcall ILendingPoolCore(_from).fundsInvested()
+    )
+    self.poolTotals = self._pack(
+        staticcall ILendingPoolCore(_from).totalFundsInvested(),
+        staticcall ILendingPoolCore(_from).totalRewards()
+    )
+
+    # the active lenders count is kept by the lenders registry, which must be fully migrated at this point
+    activeLenders: uint256 = self.poolShares >> 128
+    assert activeLenders == staticcall ILendingPoolCore(_from).activeLenders(), "lenders not migrated"
+    self.poolShares = self._pack(staticcall ILendingPoolCore(_from).totalSharesBasisPoints(), activeLenders)
 
     self.migrationDone = True
 
@@ -252,35 +618,7 @@ def deposit(_lender: address, _payer: address, _amount: uint256) -> bool:
     assert _payer != empty(address), "The _payer is the zero address"
     assert self._fundsAreAllowed(_payer, self, _amount), "Not enough funds allowed"
 
-    sharesAmount: uint256 = self._computeShares(_amount)
-
-    if self.funds[_lender].currentAmountDeposited > 0:
-        self.funds[_lender].totalAmountDeposited += _amount
-        self.funds[_lender].currentAmountDeposited += _amount
-        self.funds[_lender].sharesBasisPoints += sharesAmount
-    elif self.funds[_lender].currentAmountDeposited == 0 and self.knownLenders[_lender]:
-        self.funds[_lender].totalAmountDeposited += _amount
-        self.funds[_lender].currentAmountDeposited = _amount
-        self.funds[_lender].sharesBasisPoints = sharesAmount
-        self.funds[_lender].activeForRewards = True
-
-        self.activeLenders += 1
-    else:
-        self.funds[_lender] = InvestorFunds(
-            {
-                currentAmountDeposited: _amount,
-                totalAmountDeposited: _amount,
-                totalAmountWithdrawn: 0,
-                sharesBasisPoints: sharesAmount,
-                activeForRewards: True
-            }
-        )
-        self.lenders.append(_lender)
-        self.knownLenders[_lender] = True
-        self.activeLenders += 1
-
-    self.fundsAvailable += _amount
-    self.totalSharesBasisPoints += sharesAmount
+    self._deposit(_lender, _amount)
 
     return extcall IERC20(self.erc20TokenContract).transferFrom(_payer, self, _amount)
 
@@ -292,30 +630,63 @@ def withdraw(_lender: address, _wallet: address, _amount: uint256) -> bool:
     assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
     assert _lender != empty(address), "The _lender is the zero address"
     assert _wallet != empty(address), "The _wallet is the zero address"
-    assert self._computeWithdrawableAmount(_lender) >= _amount, "_amount more than withdrawable"
-    assert self.fundsAvailable >= _amount, "Available funds less than amount"
+    withdrawableAmount: uint256 = self._computeWithdrawableAmount(_lender)
+    assert withdrawableAmount >= _amount, "_amount more than withdrawable"
 
-    newDepositAmount: uint256 = self._computeWithdrawableAmount(_lender) - _amount
-    newLenderSharesAmount: uint256 = self._computeShares(newDepositAmount)
-    self.totalSharesBasisPoints -= (self.funds[_lender].sharesBasisPoints - newLenderSharesAmount)
-
-    self.funds[_lender] = InvestorFunds(
-        {
-            currentAmountDeposited: newDepositAmount,
-            totalAmountDeposited: self.funds[_lender].totalAmountDeposited,
-            totalAmountWithdrawn: self.funds[_lender].totalAmountWithdrawn + _amount,
-            sharesBasisPoints: newLenderSharesAmount,
-            activeForRewards: True
-        }
-    )
+    self._withdraw(_lender, _amount, withdrawableAmount)
 
-    if self.funds[_lender].currentAmountDeposited == 0:
-        self.funds[_lender].activeForRewards = False
-        self.activeLenders -= 1
+    return extcall IERC20(self.erc20TokenContract).transfer(_wallet, _amount)
 
-    self.fundsAvailable -= _amount
 
-    return extcall IERC20(self.erc20TokenContract).transfer(_wallet, _amount)
+@external
+def depositChecked(
+    _lender: address,
+    _payer: address,
+    _amount: uint256,
+    _maxPoolShareEnabled: bool,
+    _maxPoolShare: uint256,
+    _maxCapitalEfficiency: uint256
+) -> PoolState:
+    # _amount should be passed in wei
+    # checks the lender pool share limit in the same frame as the deposit and returns the resulting pool state
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _lender != empty(address), "The _lender is the zero address"
+    assert _payer != empty(address), "The _payer is the zero address"
+    assert self._fundsAreAllowed(_payer, self, _amount), "Not enough funds allowed"
+
+    if _maxPoolShareEnabled:
+        fundsInvestable: uint256 = (self._fundsInPool() + _amount) * _maxCapitalEfficiency // 10000
+        assert fundsInvestable > 0, "max pool share surpassed"
+        lenderDepositedAmount: uint256 = self.investorFunds[_lender].amounts & AMOUNT_MASK
+        assert (lenderDepositedAmount + _amount) * 10000 // fundsInvestable <= _maxPoolShare, "max pool share surpassed"
+
+    self._deposit(_lender, _amount)
+
+    if not extcall IERC20(self.erc20TokenContract).transferFrom(_payer, self, _amount):
+        raise "error creating deposit"
+
+    return self._poolState()
+
+
+@external
+def withdrawChecked(_lender: address, _wallet: address, _amount: uint256, _lockedAmount: uint256) -> PoolState:
+    # _amount should be passed in wei
+    # _lockedAmount is the part of the lender deposit that must stay in the pool, the resulting pool state is returned
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _lender != empty(address), "The _lender is the zero address"
+    assert _wallet != empty(address), "The _wallet is the zero address"
+    withdrawableAmount: uint256 = self._computeWithdrawableAmount(_lender)
+    assert withdrawableAmount >= _amount, "_amount more than withdrawable"
+    assert withdrawableAmount - _amount >= _lockedAmount, "withdraw within lock period"
+
+    self._withdraw(_lender, _amount, withdrawableAmount)
+
+    if not extcall IERC20(self.erc20TokenContract).transfer(_wallet, _amount):
+        raise "error withdrawing funds"
+
+    return self._poolState()
 
 
 @external
@@ -327,9 +698,15 @@ def sendFunds(_to: address, _amount: uint256) -> bool:
     assert _amount > 0, "_amount has to be higher than 0"
     assert staticcall IERC20(self.erc20TokenContract).balanceOf(self) >= _amount, "Insufficient balance"
 
-    self.fundsAvailable -= _amount
-    self.fundsInvested += _amount
-    self.totalFundsInvested += _amount
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested + _amount)
+    self.poolTotals = self._pack(totalFundsInvested + _amount, totalRewards)
 
     return extcall IERC20(self.erc20TokenContract).transfer(_to, _amount)
 
@@ -343,9 +720,7 @@ def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256,
     assert _amount + _rewardsAmount > 0, "Amount has to be higher than 0"
     assert staticcall IERC20(self.erc20TokenContract).allowance(_borrower, self) >= _amount, "insufficient value received"
 
-    self.fundsAvailable += _amount + _rewardsAmount
-    self.fundsInvested -= _investedAmount
-    self.totalRewards += _rewardsAmount
+    self._accountForReceivedFunds(_amount, _rewardsAmount, _investedAmount)
 
     return extcall IERC20(self.erc20TokenContract).transferFrom(_borrower, self, _amount + _rewardsAmount)
 
@@ -361,3 +736,74 @@ def transferProtocolFees(_borrower: address, _protocolWallet: address, _amount:
     assert staticcall IERC20(self.erc20TokenContract).allowance(_borrower, self) >= _amount, "insufficient value received"
 
     return extcall IERC20(self.erc20TokenContract).transferFrom(_borrower, _protocolWallet, _amount)
+
+
+@external
+def settleFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _investedAmount: uint256, _protocolFeesAmount: uint256) -> bool:
+    # all amounts should be passed in wei
+    # the protocol fees are pulled together with the payment and kept until claimed
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _borrower != empty(address), "_borrower is the zero address"
+    assert _amount + _rewardsAmount + _protocolFeesAmount > 0, "Amount has to be higher than 0"
+
+    paymentAmount: uint256 = _amount + _rewardsAmount + _protocolFeesAmount
+    assert staticcall IERC20(self.erc20TokenContract).allowance(_borrower, self) >= paymentAmount, "insufficient value received"
+
+    self._accountForReceivedFunds(_amount, _rewardsAmount, _investedAmount)
+    self.protocolFeesAccrued += _protocolFeesAmount
+
+    return extcall IERC20(self.erc20TokenContract).transferFrom(_borrower, self, paymentAmount)
+
+
+@external
+def claimProtocolFees(_protocolWallet: address) -> bool:
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _protocolWallet != empty(address), "_protocolWallet is the zero address"
+
+    amount: uint256 = self.protocolFeesAccrued
+    assert amount > 0, "no protocol fees to claim"
+
+    self.protocolFeesAccrued = 0
+
+    return extcall IERC20(self.erc20TokenContract).transfer(_protocolWallet, amount)
+
+
+@external
+def refinanceFunds(
+    _borrower: address,
+    _amount: uint256,
+    _rewardsAmount: uint256,
+    _newAmount: uint256,
+    _protocolFeesAmount: uint256
+) -> bool:
+    # all amounts should be passed in wei
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _borrower != empty(address), "_borrower is the zero address"
+    assert _newAmount > 0, "_amount has to be higher than 0"
+
+    paymentAmount: uint256 = _amount + _rewardsAmount + _protocolFeesAmount
+    if paymentAmount > _newAmount:
+        assert staticcall IERC20(self.erc20TokenContract).allowance(_borrower, self) >= paymentAmount - _newAmount, "insufficient value received"
+    else:
+        assert staticcall IERC20(self.erc20TokenContract).balanceOf(self) >= _newAmount - paymentAmount, "Insufficient balance"
+
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+
+    self.poolAmounts = self._pack(fundsAvailable + _amount + _rewardsAmount - _newAmount, fundsInvested - _amount + _newAmount)
+    self.poolTotals = self._pack(totalFundsInvested + _newAmount, totalRewards + _rewardsAmount)
+    self.protocolFeesAccrued += _protocolFeesAmount
+
+    if paymentAmount > _newAmount:
+        return extcall IERC20(self.erc20TokenContract).transferFrom(_borrower, self, paymentAmount - _newAmount)
+    elif paymentAmount < _newAmount:
+        return extcall IERC20(self.erc20TokenContract).transfer(_borrower, _newAmount - paymentAmount)
+
+    return True
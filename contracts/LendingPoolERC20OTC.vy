@@ -22,6 +22,16 @@ struct InvestorFunds:
     sharesBasisPoints: uint256
     activeForRewards: bool
 
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    collateralClaimsValue: uint256
+    currentAmountDeposited: uint256
+    totalAmountDeposited: uint256
+    totalAmountWithdrawn: uint256
+
 # Events
 
 event ProxyCreated:
@@ -133,14 +143,14 @@ isPoolDeprecated: public(bool)
 
 # core
 
-poolFunds: public(InvestorFunds)
 lender: public(address)
 
-fundsAvailable: public(uint256)
-fundsInvested: public(uint256)
-totalFundsInvested: public(uint256)
-totalRewards: public(uint256)
-collateralClaimsValue: public(uint256)
+poolAmounts: uint256 # fundsAvailable (bits 0-127) and fundsInvested (128-255)
+poolTotals: uint256 # totalFundsInvested (bits 0-127) and totalRewards (128-255)
+lenderAmounts: uint256 # currentAmountDeposited (bits 0-127) and totalAmountDeposited (128-255)
+lenderTotals: uint256 # totalAmountWithdrawn (bits 0-127) and collateralClaimsValue (128-255)
+
+AMOUNT_MASK: constant(uint256) = 2**128 - 1
 
 
 ##### INTERNAL METHODS - VIEW #####
@@ -152,34 +162,102 @@ def _fundsAreAllowed(_owner: address, _spender: address, _amount: uint256) -> bo
     return _amount <= amountAllowed
 
 
+@pure
+@internal
+def _pack(_low: uint256, _high: uint256) -> uint256:
+    assert max(_low, _high) <= AMOUNT_MASK, "amount out of bounds"
+    return _low | (_high << 128)
+
+
+@pure
+@internal
+def _unpack(_value: uint256) -> (uint256, uint256):
+    return _value & AMOUNT_MASK, _value >> 128
+
+
+@view
+@internal
+def _poolState() -> PoolState:
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
+
+    return PoolState(
+        fundsAvailable=fundsAvailable,
+        fundsInvested=fundsInvested,
+        totalFundsInvested=totalFundsInvested,
+        totalRewards=totalRewards,
+        collateralClaimsValue=collateralClaimsValue,
+        currentAmountDeposited=currentAmountDeposited,
+        totalAmountDeposited=totalAmountDeposited,
+        totalAmountWithdrawn=totalAmountWithdrawn
+    )
+
+
+@view
+@internal
+def _poolFunds() -> InvestorFunds:
+    return InvestorFunds(
+        currentAmountDeposited=self.lenderAmounts & AMOUNT_MASK,
+        totalAmountDeposited=self.lenderAmounts >> 128,
+        totalAmountWithdrawn=self.lenderTotals & AMOUNT_MASK,
+        sharesBasisPoints=0,
+        activeForRewards=False
+    )
+
+
+@view
+@internal
+def _fundsAvailable() -> uint256:
+    return self.poolAmounts & AMOUNT_MASK
+
+
+@view
+@internal
+def _fundsInvested() -> uint256:
+    return self.poolAmounts >> 128
+
+
 @view
 @internal
 def _poolHasFundsToInvestAfterDeposit(_amount: uint256) -> bool:
-    return self.fundsAvailable + _amount > 0
+    return self._fundsAvailable() + _amount > 0
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterPayment(_amount: uint256, _rewards: uint256) -> bool:
-    return self.fundsAvailable + _amount + _rewards> 0
+    return self._fundsAvailable() + _amount + _rewards > 0
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterWithdraw(_amount: uint256) -> bool:
-    return self.fundsAvailable > _amount
+    return self._fundsAvailable() > _amount
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterInvestment(_amount: uint256) -> bool:
-    return self.fundsAvailable > _amount
+    return self._fundsAvailable() > _amount
 
 
 @view
 @internal
 def _computeWithdrawableAmount() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    return fundsAvailable + fundsInvested
 
 
 ##### INTERNAL METHODS - WRITE #####
@@ -198,10 +276,15 @@ def _deposit(_amount: uint256, _payer: address):
         if not extcall IERC20(erc20TokenContract).transferFrom(_payer, self, _amount):
             raise "error creating deposit"
 
-    self.poolFunds.totalAmountDeposited += _amount
-    self.poolFunds.currentAmountDeposited += _amount
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    self.lenderAmounts = self._pack(currentAmountDeposited + _amount, totalAmountDeposited + _amount)
 
-    self.fundsAvailable += _amount
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    self.poolAmounts = self._pack(fundsAvailable + _amount, fundsInvested)
 
     log Deposit(msg.sender, msg.sender, _amount, erc20TokenContract)
 
@@ -210,12 +293,21 @@ def _deposit(_amount: uint256, _payer: address):
 def _withdraw_accounting(_amount: uint256):
     assert _amount > 0, "_amount has to be higher than 0"
     assert msg.sender == self.lender, "The sender is not the lender"
-    assert self.fundsAvailable >= _amount, "available funds less than amount"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert fundsAvailable >= _amount, "available funds less than amount"
 
-    self.poolFunds.currentAmountDeposited -= _amount
-    self.poolFunds.totalAmountWithdrawn += _amount
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
 
-    self.fundsAvailable -= _amount
+    self.lenderAmounts = self._pack(currentAmountDeposited - _amount, totalAmountDeposited)
+    self.lenderTotals = self._pack(totalAmountWithdrawn + _amount, collateralClaimsValue)
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested)
 
 
 
@@ -226,12 +318,17 @@ def _accountForSentFunds(_to: address, _receiver: address, _amount: uint256):
     assert msg.sender == self.loansContract, "msg.sender is not the loans addr"
     assert _to != empty(address), "_to is the zero address"
     assert _amount > 0, "_amount has to be higher than 0"
-    assert _amount <= self.fundsAvailable, "insufficient liquidity"
-    assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _amount, "Insufficient balance"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert _amount <= fundsAvailable, "insufficient liquidity"
+
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
 
-    self.fundsAvailable -= _amount
-    self.fundsInvested += _amount
-    self.totalFundsInvested += _amount
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested + _amount)
+    self.poolTotals = self._pack(totalFundsInvested + _amount, totalRewards)
 
     log FundsTransfer(_to, _to, _amount, erc20TokenContract)
 
@@ -241,7 +338,7 @@ def _receiveFunds(_borrower: address, _payer: address, _amount: uint256, _reward
     assert msg.sender == self.loansContract, "msg.sender is not the loans addr"
     assert _borrower != empty(address), "_borrower is the zero address"
     assert _amount + _rewardsAmount > 0, "amount should be higher than 0"
-    assert self.fundsInvested >= _amount, "amount higher than invested"
+    assert self._fundsInvested() >= _amount, "amount higher than invested"
 
     rewardsProtocol: uint256 = _rewardsAmount * self.protocolFeesShare // 10000
     rewardsPool: uint256 = _rewardsAmount - rewardsProtocol
@@ -265,10 +362,7 @@ def _transferReceivedFunds(
     assert _payer != empty(address), "_borrower is the zero address"
     assert staticcall IERC20(erc20TokenContract).allowance(_payer, self) >= _amount + _rewardsPool + _rewardsProtocol, "insufficient value received"
 
-    self.fundsAvailable += _amount + _rewardsPool
-    self.fundsInvested -= _amount
-    self.totalRewards += _rewardsPool
-    self.poolFunds.currentAmountDeposited += _rewardsPool
+    self._addReceivedFunds(_amount, _rewardsPool)
 
     if not extcall IERC20(erc20TokenContract).transferFrom(_payer, self, _amount + _rewardsPool):
         raise "error receiving funds in LPOTC"
@@ -290,6 +384,24 @@ def _transferReceivedFunds(
     )
 
 
+@internal
+def _addReceivedFunds(_amount: uint256, _rewardsPool: uint256):
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+
+    # the pool rewards are credited to the lender deposit
+    self.poolAmounts = self._pack(fundsAvailable + _amount + _rewardsPool, fundsInvested - _amount)
+    self.poolTotals = self._pack(totalFundsInvested, totalRewards + _rewardsPool)
+    self.lenderAmounts = self._pack(currentAmountDeposited + _rewardsPool, totalAmountDeposited)
+
+
 @internal
 def _accountForReceivedFunds(
     _borrower: address,
@@ -299,10 +411,7 @@ def _accountForReceivedFunds(
     _origin: String[30]
 ):
 
-    self.fundsAvailable += _amount + _rewardsPool
-    self.fundsInvested -= _amount
-    self.totalRewards += _rewardsPool
-    self.poolFunds.currentAmountDeposited += _rewardsPool
+    self._addReceivedFunds(_amount, _rewardsPool)
 
     if _rewardsProtocol > 0:
         assert self.protocolWallet != empty(address), "protocolWallet is zero addr"
@@ -360,31 +469,31 @@ def lendingPoolCoreContract() -> address:
 @view
 @external
 def maxFundsInvestable() -> uint256:
-    return self.fundsAvailable
+    return self._fundsAvailable()
 
 
 @view
 @external
 def theoreticalMaxFundsInvestable() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    return self._computeWithdrawableAmount()
 
 
 @view
 @external
 def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
-    return self.fundsAvailable + self.fundsInvested + _amount
+    return self._computeWithdrawableAmount() + _amount
 
 
 @view
 @external
 def lenderFunds(_lender: address) -> InvestorFunds:
-    return self.poolFunds if _lender == self.lender else empty(InvestorFunds)
+    return self._poolFunds() if _lender == self.lender else empty(InvestorFunds)
 
 
 @view
 @external
 def funds(_lender: address) -> InvestorFunds:
-    return self.poolFunds if _lender == self.lender else empty(InvestorFunds)
+    return self._poolFunds() if _lender == self.lender else empty(InvestorFunds)
 
 
 @view
@@ -393,6 +502,20 @@ def lendersArray() -> DynArray[address, 2**0]:
   return [self.lender]
 
 
+@view
+@external
+def lendersLength() -> uint256:
+    return 1
+
+
+@view
+@external
+def lendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 2**0]:
+    if _offset == 0 and _limit > 0:
+        return [self.lender]
+    return []
+
+
 @view
 @external
 def lockedAmount(_lender: address) -> uint256:
@@ -408,25 +531,67 @@ def computeWithdrawableAmount(_lender: address) -> uint256:
 @view
 @external
 def fundsInPool() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    return self._computeWithdrawableAmount()
 
 
 @view
 @external
 def currentAmountDeposited(_lender: address) -> uint256:
-    return self.poolFunds.currentAmountDeposited if _lender == self.lender else 0
+    return self.lenderAmounts & AMOUNT_MASK if _lender == self.lender else 0
 
 
 @view
 @external
 def totalAmountDeposited(_lender: address) -> uint256:
-    return self.poolFunds.totalAmountDeposited if _lender == self.lender else 0
+    return self.lenderAmounts >> 128 if _lender == self.lender else 0
 
 
 @view
 @external
 def totalAmountWithdrawn(_lender: address) -> uint256:
-    return self.poolFunds.totalAmountWithdrawn if _lender == self.lender else 0
+    return self.lenderTotals & AMOUNT_MASK if _lender == self.lender else 0
+
+
+@view
+@external
+def poolState() -> PoolState:
+    return self._poolState()
+
+
+@view
+@external
+def poolFunds() -> InvestorFunds:
+    return self._poolFunds()
+
+
+@view
+@external
+def fundsAvailable() -> uint256:
+    return self._fundsAvailable()
+
+
+@view
+@external
+def fundsInvested() -> uint256:
+    return self._fundsInvested()
+
+
+@view
+@external
+def totalFundsInvested() -> uint256:
+    return self.poolTotals & AMOUNT_MASK
+
+
+@view
+@external
+def totalRewards() -> uint256:
+    return self.poolTotals >> 128
+
+
+@view
+@external
+def collateralClaimsValue() -> uint256:
+    return self.lenderTotals >> 128
 
 
 
@@ -634,6 +799,7 @@ def sendFunds(_to: address, _amount: uint256):
     """
 
     self._accountForSentFunds(_to, _to, _amount)
+    assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _amount, "Insufficient balance"
 
     if not extcall IERC20(erc20TokenContract).transfer(_to, _amount):
         raise "error sending funds in LPOTC"
@@ -666,6 +832,39 @@ def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256):
     self._receiveFunds(_borrower, _borrower, _amount, _rewardsAmount)
 
 
+@payable
+@external
+def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    raise "not supported"
+
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+
+    """
+    @notice Receives the payment of a loan and funds its refinancing loan in the pool ERC20, transferring only the difference between both
+    @dev Logs the `FundsReceipt` and `FundsTransfer` events
+    @param _borrower The wallet address of the borrower
+    @param _amount Value of the paid loans principal
+    @param _rewardsAmount Value of the paid loans interest (including the protocol fee share)
+    @param _newAmount Value of the new loans principal
+    """
+
+    paymentAmount: uint256 = _amount + _rewardsAmount
+    if paymentAmount > _newAmount:
+        assert self._fundsAreAllowed(_borrower, self, paymentAmount - _newAmount), "insufficient liquidity"
+        if not extcall IERC20(erc20TokenContract).transferFrom(_borrower, self, paymentAmount - _newAmount):
+            raise "error receiving funds in LPOTC"
+
+    self._receiveFunds(_borrower, self, _amount, _rewardsAmount)
+    self._accountForSentFunds(_borrower, _borrower, _newAmount)
+
+    if _newAmount > paymentAmount:
+        assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _newAmount - paymentAmount, "Insufficient balance"
+        if not extcall IERC20(erc20TokenContract).transfer(_borrower, _newAmount - paymentAmount):
+            raise "error sending funds in LPOTC"
+
+
 @external
 def receiveFundsFromLiquidation(
     _borrower: address,
@@ -719,11 +918,17 @@ def receiveCollateralFromLiquidation(
     assert msg.sender == self.liquidationsPeripheralContract, "msg.sender is not the BN addr"
     assert _borrower != empty(address), "_borrower is the zero address"
     assert _amount > 0, "amount should be higher than 0"
-    assert _amount <= self.fundsInvested, "amount more than invested"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert _amount <= fundsInvested, "amount more than invested"
 
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
 
-    self.fundsInvested -= _amount
-    self.collateralClaimsValue += _amount
+    self.poolAmounts = self._pack(fundsAvailable, fundsInvested - _amount)
+    self.lenderTotals = self._pack(totalAmountWithdrawn, collateralClaimsValue + _amount)
 
     log CollateralClaimReceipt(
         _borrower,
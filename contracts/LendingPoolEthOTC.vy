@@ -27,6 +27,16 @@ struct InvestorFunds:
     sharesBasisPoints: uint256
     activeForRewards: bool
 
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    collateralClaimsValue: uint256
+    currentAmountDeposited: uint256
+    totalAmountDeposited: uint256
+    totalAmountWithdrawn: uint256
+
 # Events
 
 
@@ -149,14 +159,14 @@ isPoolDeprecated: public(bool)
 
 # core
 
-poolFunds: public(InvestorFunds)
 lender: public(address)
 
-fundsAvailable: public(uint256)
-fundsInvested: public(uint256)
-totalFundsInvested: public(uint256)
-totalRewards: public(uint256)
-collateralClaimsValue: public(uint256)
+poolAmounts: uint256 # fundsAvailable (bits 0-127) and fundsInvested (128-255)
+poolTotals: uint256 # totalFundsInvested (bits 0-127) and totalRewards (128-255)
+lenderAmounts: uint256 # currentAmountDeposited (bits 0-127) and totalAmountDeposited (128-255)
+lenderTotals: uint256 # totalAmountWithdrawn (bits 0-127) and collateralClaimsValue (128-255)
+
+AMOUNT_MASK: constant(uint256) = 2**128 - 1
 
 
 ##### INTERNAL METHODS - VIEW #####
@@ -168,34 +178,102 @@ def _fundsAreAllowed(_owner: address, _spender: address, _amount: uint256) -> bo
     return _amount <= amountAllowed
 
 
+@pure
+@internal
+def _pack(_low: uint256, _high: uint256) -> uint256:
+    assert max(_low, _high) <= AMOUNT_MASK, "amount out of bounds"
+    return _low | (_high << 128)
+
+
+@pure
+@internal
+def _unpack(_value: uint256) -> (uint256, uint256):
+    return _value & AMOUNT_MASK, _value >> 128
+
+
+@view
+@internal
+def _poolState() -> PoolState:
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
+
+    return PoolState(
+        fundsAvailable=fundsAvailable,
+        fundsInvested=fundsInvested,
+        totalFundsInvested=totalFundsInvested,
+        totalRewards=totalRewards,
+        collateralClaimsValue=collateralClaimsValue,
+        currentAmountDeposited=currentAmountDeposited,
+        totalAmountDeposited=totalAmountDeposited,
+        totalAmountWithdrawn=totalAmountWithdrawn
+    )
+
+
+@view
+@internal
+def _poolFunds() -> InvestorFunds:
+    return InvestorFunds(
+        currentAmountDeposited=self.lenderAmounts & AMOUNT_MASK,
+        totalAmountDeposited=self.lenderAmounts >> 128,
+        totalAmountWithdrawn=self.lenderTotals & AMOUNT_MASK,
+        sharesBasisPoints=0,
+        activeForRewards=False
+    )
+
+
+@view
+@internal
+def _fundsAvailable() -> uint256:
+    return self.poolAmounts & AMOUNT_MASK
+
+
+@view
+@internal
+def _fundsInvested() -> uint256:
+    return self.poolAmounts >> 128
+
+
 @view
 @internal
 def _poolHasFundsToInvestAfterDeposit(_amount: uint256) -> bool:
-    return self.fundsAvailable + _amount > 0
+    return self._fundsAvailable() + _amount > 0
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterPayment(_amount: uint256, _rewards: uint256) -> bool:
-    return self.fundsAvailable + _amount + _rewards> 0
+    return self._fundsAvailable() + _amount + _rewards > 0
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterWithdraw(_amount: uint256) -> bool:
-    return self.fundsAvailable > _amount
+    return self._fundsAvailable() > _amount
 
 
 @view
 @internal
 def _poolHasFundsToInvestAfterInvestment(_amount: uint256) -> bool:
-    return self.fundsAvailable > _amount
+    return self._fundsAvailable() > _amount
 
 
 @view
 @internal
 def _computeWithdrawableAmount() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    return fundsAvailable + fundsInvested
 
 
 ##### INTERNAL METHODS - WRITE #####
@@ -208,10 +286,15 @@ def _deposit(_amount: uint256):
     assert self.isPoolActive, "pool is not active right now"
     assert _amount > 0, "_amount has to be higher than 0"
 
-    self.poolFunds.totalAmountDeposited += _amount
-    self.poolFunds.currentAmountDeposited += _amount
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    self.lenderAmounts = self._pack(currentAmountDeposited + _amount, totalAmountDeposited + _amount)
 
-    self.fundsAvailable += _amount
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    self.poolAmounts = self._pack(fundsAvailable + _amount, fundsInvested)
 
     log Deposit(msg.sender, msg.sender, _amount, erc20TokenContract)
 
@@ -220,12 +303,21 @@ def _deposit(_amount: uint256):
 def _withdraw_accounting(_amount: uint256):
     assert _amount > 0, "_amount has to be higher than 0"
     assert msg.sender == self.lender, "The sender is not the lender"
-    assert self.fundsAvailable >= _amount, "available funds less than amount"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert fundsAvailable >= _amount, "available funds less than amount"
 
-    self.poolFunds.currentAmountDeposited -= _amount
-    self.poolFunds.totalAmountWithdrawn += _amount
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
 
-    self.fundsAvailable -= _amount
+    self.lenderAmounts = self._pack(currentAmountDeposited - _amount, totalAmountDeposited)
+    self.lenderTotals = self._pack(totalAmountWithdrawn + _amount, collateralClaimsValue)
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested)
 
 
 
@@ -236,12 +328,17 @@ def _accountForSentFunds(_to: address, _receiver: address, _amount: uint256):
     assert msg.sender == self.loansContract, "msg.sender is not the loans addr"
     assert _to != empty(address), "_to is the zero address"
     assert _amount > 0, "_amount has to be higher than 0"
-    assert _amount <= self.fundsAvailable, "insufficient liquidity"
-    assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _amount, "Insufficient balance"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert _amount <= fundsAvailable, "insufficient liquidity"
+
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
 
-    self.fundsAvailable -= _amount
-    self.fundsInvested += _amount
-    self.totalFundsInvested += _amount
+    self.poolAmounts = self._pack(fundsAvailable - _amount, fundsInvested + _amount)
+    self.poolTotals = self._pack(totalFundsInvested + _amount, totalRewards)
 
     log FundsTransfer(_to, _to, _amount, erc20TokenContract)
 
@@ -251,7 +348,7 @@ def _receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256)
     assert msg.sender == self.loansContract, "msg.sender is not the loans addr"
     assert _borrower != empty(address), "_borrower is the zero address"
     assert _amount + _rewardsAmount > 0, "amount should be higher than 0"
-    assert self.fundsInvested >= _amount, "amount higher than invested"
+    assert self._fundsInvested() >= _amount, "amount higher than invested"
 
     rewardsProtocol: uint256 = _rewardsAmount * self.protocolFeesShare // 10000
     rewardsPool: uint256 = _rewardsAmount - rewardsProtocol
@@ -259,6 +356,24 @@ def _receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256)
     self._accountForReceivedFunds(_borrower, _amount, rewardsPool, rewardsProtocol, "loan")
 
 
+@internal
+def _addReceivedFunds(_amount: uint256, _rewardsPool: uint256):
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    totalFundsInvested: uint256 = 0
+    totalRewards: uint256 = 0
+    totalFundsInvested, totalRewards = self._unpack(self.poolTotals)
+    currentAmountDeposited: uint256 = 0
+    totalAmountDeposited: uint256 = 0
+    currentAmountDeposited, totalAmountDeposited = self._unpack(self.lenderAmounts)
+
+    # the pool rewards are credited to the lender deposit
+    self.poolAmounts = self._pack(fundsAvailable + _amount + _rewardsPool, fundsInvested - _amount)
+    self.poolTotals = self._pack(totalFundsInvested, totalRewards + _rewardsPool)
+    self.lenderAmounts = self._pack(currentAmountDeposited + _rewardsPool, totalAmountDeposited)
+
+
 @internal
 def _accountForReceivedFunds(
     _borrower: address,
@@ -268,10 +383,7 @@ def _accountForReceivedFunds(
     _origin: String[30]
 ):
 
-    self.fundsAvailable += _amount + _rewardsPool
-    self.fundsInvested -= _amount
-    self.totalRewards += _rewardsPool
-    self.poolFunds.currentAmountDeposited += _rewardsPool
+    self._addReceivedFunds(_amount, _rewardsPool)
 
     if _rewardsProtocol > 0:
         assert self.protocolWallet != empty(address), "protocolWallet is zero addr"
@@ -336,31 +448,31 @@ def lendingPoolCoreContract() -> address:
 @view
 @external
 def maxFundsInvestable() -> uint256:
-    return self.fundsAvailable
+    return self._fundsAvailable()
 
 
 @view
 @external
 def theoreticalMaxFundsInvestable() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    return self._computeWithdrawableAmount()
 
 
 @view
 @external
 def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
-    return self.fundsAvailable + self.fundsInvested + _amount
+    return self._computeWithdrawableAmount() + _amount
 
 
 @view
 @external
 def lenderFunds(_lender: address) -> InvestorFunds:
-    return self.poolFunds if _lender == self.lender else empty(InvestorFunds)
+    return self._poolFunds() if _lender == self.lender else empty(InvestorFunds)
 
 
 @view
 @external
 def funds(_lender: address) -> InvestorFunds:
-    return self.poolFunds if _lender == self.lender else empty(InvestorFunds)
+    return self._poolFunds() if _lender == self.lender else empty(InvestorFunds)
 
 
 @view
@@ -369,6 +481,20 @@ def lendersArray() -> DynArray[address, 2**0]:
   return [self.lender]
 
 
+@view
+@external
+def lendersLength() -> uint256:
+    return 1
+
+
+@view
+@external
+def lendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 2**0]:
+    if _offset == 0 and _limit > 0:
+        return [self.lender]
+    return []
+
+
 @view
 @external
 def lockedAmount(_lender: address) -> uint256:
@@ -384,25 +510,67 @@ def computeWithdrawableAmount(_lender: address) -> uint256:
 @view
 @external
 def fundsInPool() -> uint256:
-    return self.fundsAvailable + self.fundsInvested
+    return self._computeWithdrawableAmount()
 
 
 @view
 @external
 def currentAmountDeposited(_lender: address) -> uint256:
-    return self.poolFunds.currentAmountDeposited if _lender == self.lender else 0
+    return self.lenderAmounts & AMOUNT_MASK if _lender == self.lender else 0
 
 
 @view
 @external
 def totalAmountDeposited(_lender: address) -> uint256:
-    return self.poolFunds.totalAmountDeposited if _lender == self.lender else 0
+    return self.lenderAmounts >> 128 if _lender == self.lender else 0
 
 
 @view
 @external
 def totalAmountWithdrawn(_lender: address) -> uint256:
-    return self.poolFunds.totalAmountWithdrawn if _lender == self.lender else 0
+    return self.lenderTotals & AMOUNT_MASK if _lender == self.lender else 0
+
+
+@view
+@external
+def poolState() -> PoolState:
+    return self._poolState()
+
+
+@view
+@external
+def poolFunds() -> InvestorFunds:
+    return self._poolFunds()
+
+
+@view
+@external
+def fundsAvailable() -> uint256:
+    return self._fundsAvailable()
+
+
+@view
+@external
+def fundsInvested() -> uint256:
+    return self._fundsInvested()
+
+
+@view
+@external
+def totalFundsInvested() -> uint256:
+    return self.poolTotals & AMOUNT_MASK
+
+
+@view
+@external
+def totalRewards() -> uint256:
+    return self.poolTotals >> 128
+
+
+@view
+@external
+def collateralClaimsValue() -> uint256:
+    return self.lenderTotals >> 128
 
 
 
@@ -622,6 +790,7 @@ def sendFundsEth(_to: address, _amount: uint256):
     """
 
     self._accountForSentFunds(_to, self, _amount)
+    assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _amount, "Insufficient balance"
     self._unwrap_and_send(_to, _amount)
 
 
@@ -651,6 +820,42 @@ def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256):
     raise "not supported"
 
 
+@payable
+@external
+def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+
+    """
+    @notice Receives the payment of a loan and funds its refinancing loan in ETH, transferring only the difference between both
+    @dev Logs the `FundsReceipt` and `FundsTransfer` events. The value sent must match the amount owed by the borrower, if any
+    @param _borrower The wallet address of the borrower
+    @param _amount Value of the paid loans principal in wei
+    @param _rewardsAmount Value of the paid loans interest (including the protocol fee share) in wei
+    @param _newAmount Value of the new loans principal in wei
+    """
+
+    paymentAmount: uint256 = _amount + _rewardsAmount
+    if paymentAmount > _newAmount:
+        assert msg.value == paymentAmount - _newAmount, "recv amount not match partials"
+
+        log PaymentReceived(msg.sender, msg.sender, msg.value)
+
+        self._wrap(msg.value)
+    else:
+        assert msg.value == 0, "recv amount not match partials"
+
+    self._receiveFunds(_borrower, _amount, _rewardsAmount)
+    self._accountForSentFunds(_borrower, self, _newAmount)
+
+    if _newAmount > paymentAmount:
+        assert staticcall IERC20(erc20TokenContract).balanceOf(self) >= _newAmount - paymentAmount, "Insufficient balance"
+        self._unwrap_and_send(_borrower, _newAmount - paymentAmount)
+
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    raise "not supported"
+
+
 @external
 def receiveFundsFromLiquidation(
     _borrower: address,
@@ -709,11 +914,17 @@ def receiveCollateralFromLiquidation(
     assert msg.sender == self.liquidationsPeripheralContract, "msg.sender is not the BN addr"
     assert _borrower != empty(address), "_borrower is the zero address"
     assert _amount > 0, "amount should be higher than 0"
-    assert _amount <= self.fundsInvested, "amount more than invested"
+    fundsAvailable: uint256 = 0
+    fundsInvested: uint256 = 0
+    fundsAvailable, fundsInvested = self._unpack(self.poolAmounts)
+    assert _amount <= fundsInvested, "amount more than invested"
 
+    totalAmountWithdrawn: uint256 = 0
+    collateralClaimsValue: uint256 = 0
+    totalAmountWithdrawn, collateralClaimsValue = self._unpack(self.lenderTotals)
 
-    self.fundsInvested -= _amount
-    self.collateralClaimsValue += _amount
+    self.poolAmounts = self._pack(fundsAvailable, fundsInvested - _amount)
+    self.lenderTotals = self._pack(totalAmountWithdrawn, collateralClaimsValue + _amount)
 
     log CollateralClaimReceipt(
         _borrower,
@@ -15,6 +15,12 @@ struct InvestorLock:
     lockPeriodAmount: uint256
 
 
+struct LenderLock:
+    wallet: address
+    lockPeriodEnd: uint256
+    lockPeriodAmount: uint256
+
+
 struct LegacyInvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -90,6 +96,23 @@ def migrate(_lendingPoolCoreAddress: address, _lenders: DynArray[address, 100]):
     self.migrationDone = True
 
 
+@external
+def migrateLenders(_locks: DynArray[LenderLock, 256]):
+    assert not self.migrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+
+    for lock: LenderLock in _locks:
+        self.investorLocks[lock.wallet] = InvestorLock(lockPeriodEnd=lock.lockPeriodEnd, lockPeriodAmount=lock.lockPeriodAmount)
+
+
+@external
+def finishMigration():
+    assert not self.migrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+
+    self.migrationDone = True
+
+
 @external
 def proposeOwner(_address: address):
     assert msg.sender == self.owner, "msg.sender is not the owner"
@@ -149,3 +172,21 @@ def setInvestorLock(_lender: address, _amount: uint256, _lockPeriodEnd: uint256)
         lockPeriodEnd: _lockPeriodEnd,
         lockPeriodAmount: _amount
     })
+
+
+@external
+def lockDeposit(_lender: address, _amount: uint256, _lockPeriodDuration: uint256) -> InvestorLock:
+    # _amount should be passed in wei
+    # starts a new lock period if the current one has ended, otherwise adds the amount to it
+
+    assert msg.sender == self.lendingPoolPeripheral, "msg.sender is not LP peripheral"
+    assert _lender != empty(address), "The _address is the zero address"
+
+    investorLock: InvestorLock = self.investorLocks[_lender]
+    if investorLock.lockPeriodEnd <= block.timestamp:
+        investorLock = InvestorLock(lockPeriodEnd=block.timestamp + _lockPeriodDuration, lockPeriodAmount=_amount)
+    else:
+        investorLock.lockPeriodAmount += _amount
+
+    self.investorLocks[_lender] = investorLock
+    return investorLock
@@ -13,35 +13,39 @@ from ethereum.ercs import IERC20
 
 interface ILendingPoolCore:
     def funds(arg0: address) -> InvestorFunds: view
-    def fundsAvailable() -> uint256: view
-    def fundsInvested() -> uint256: view
-    def computeWithdrawableAmount(_lender: address) -> uint256: view
-    def deposit(_lender: address, _payer: address, _amount: uint256) -> bool: nonpayable
-    def withdraw(_lender: address, _wallet: address, _amount: uint256) -> bool: nonpayable
+    def poolState() -> PoolState: view
+    def depositChecked(
+        _lender: address,
+        _payer: address,
+        _amount: uint256,
+        _maxPoolShareEnabled: bool,
+        _maxPoolShare: uint256,
+        _maxCapitalEfficiency: uint256
+    ) -> PoolState: nonpayable
+    def withdrawChecked(_lender: address, _wallet: address, _amount: uint256, _lockedAmount: uint256) -> PoolState: nonpayable
     def sendFunds(_to: address, _amount: uint256) -> bool: nonpayable
     def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _investedAmount: uint256) -> bool: nonpayable
     def transferProtocolFees(_borrower: address, _protocolWallet: address, _amount: uint256) -> bool: nonpayable
+    def settleFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _investedAmount: uint256, _protocolFeesAmount: uint256) -> bool: nonpayable
+    def claimProtocolFees(_protocolWallet: address) -> bool: nonpayable
+    def protocolFeesAccrued() -> uint256: view
+    def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256, _protocolFeesAmount: uint256) -> bool: nonpayable
 
 interface ILendingPoolLock:
     def investorLocks(arg0: address) -> InvestorLock: view
-    def setInvestorLock(_lender: address, _amount: uint256, _lockPeriodEnd: uint256): nonpayable
+    def lockDeposit(_lender: address, _amount: uint256, _lockPeriodDuration: uint256) -> InvestorLock: nonpayable
 
 interface ILiquidityControls:
-    def lockPeriodDuration() -> uint256: view
     def lockPeriodEnabled() -> bool: view
-    def withinPoolShareLimit(
-        _lender: address,
-        _amount: uint256,
-        _lpPeripheralContractAddress: address,
-        _lpCoreContractAddress: address,
-        _fundsInvestable: uint256
-    ) -> bool: view
-    def outOfLockPeriod(_lender: address, _remainingAmount: uint256, _lpLockContractAddress: address) -> bool: view
+    def lenderLimits() -> LenderLimits: view
 
 interface IWETH:
     def deposit(): payable
     def withdraw(_amount: uint256): nonpayable
 
+interface IERC20Permit:
+    def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32): nonpayable
+
 
 # Structs
 
@@ -56,6 +60,21 @@ struct InvestorLock:
     lockPeriodEnd: uint256
     lockPeriodAmount: uint256
 
+struct LenderLimits:
+    maxPoolShareEnabled: bool
+    maxPoolShare: uint256
+    lockPeriodEnabled: bool
+    lockPeriodDuration: uint256
+
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    totalSharesBasisPoints: uint256
+    activeLenders: uint256
+    protocolFeesAccrued: uint256
+
 # Events
 
 event OwnerProposed:
@@ -84,6 +103,12 @@ event ProtocolWalletChanged:
     newValue: address
     erc20TokenContract: address
 
+event ProtocolFeesClaimed:
+    erc20TokenContractIndexed: indexed(address)
+    wallet: address
+    amount: uint256
+    erc20TokenContract: address
+
 event ProtocolFeesShareChanged:
     erc20TokenContractIndexed: indexed(address)
     currentValue: uint256
@@ -218,20 +243,12 @@ def _poolHasFundsToInvest(_fundsAvailable: uint256, _fundsInvested: uint256, _ca
     return _fundsInvested * 10000 // (_fundsAvailable + _fundsInvested) < _capitalEfficienty
 
 
-@view
-@internal
-def _poolHasFundsToInvestAfterDeposit(_amount: uint256) -> bool:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable() + _amount
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested()
-
-    return self._poolHasFundsToInvest(fundsAvailable, fundsInvested, self.maxCapitalEfficienty)
-
-
 @view
 @internal
 def _poolHasFundsToInvestAfterPayment(_amount: uint256, _rewards: uint256) -> bool:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable() + _amount + _rewards
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested() - _amount
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable + _amount + _rewards
+    fundsInvested: uint256 = poolState.fundsInvested - _amount
 
     return self._poolHasFundsToInvest(fundsAvailable, fundsInvested, self.maxCapitalEfficienty)
 
@@ -239,8 +256,9 @@ def _poolHasFundsToInvestAfterPayment(_amount: uint256, _rewards: uint256) -> bo
 @view
 @internal
 def _poolHasFundsToInvestAfterWithdraw(_amount: uint256) -> bool:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable() - _amount
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested()
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable - _amount
+    fundsInvested: uint256 = poolState.fundsInvested
 
     return self._poolHasFundsToInvest(fundsAvailable, fundsInvested, self.maxCapitalEfficienty)
 
@@ -248,74 +266,74 @@ def _poolHasFundsToInvestAfterWithdraw(_amount: uint256) -> bool:
 @view
 @internal
 def _poolHasFundsToInvestAfterInvestment(_amount: uint256) -> bool:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable() - _amount
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested() + _amount
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable - _amount
+    fundsInvested: uint256 = poolState.fundsInvested + _amount
 
     return self._poolHasFundsToInvest(fundsAvailable, fundsInvested, self.maxCapitalEfficienty)
 
 
-@view
+@pure
 @internal
-def _maxFundsInvestable() -> uint256:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable()
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested()
+def _computeMaxFundsInvestable(_fundsAvailable: uint256, _fundsInvested: uint256, _capitalEfficienty: uint256) -> uint256:
+    fundsBuffer: uint256 = (_fundsAvailable + _fundsInvested) * (10000 - _capitalEfficienty) // 10000
 
-    fundsBuffer: uint256 = (fundsAvailable + fundsInvested) * (10000 - self.maxCapitalEfficienty) // 10000
-
-    if fundsBuffer > fundsAvailable:
+    if fundsBuffer > _fundsAvailable:
         return 0
 
-    return fundsAvailable - fundsBuffer
+    return _fundsAvailable - fundsBuffer
 
 
 @view
 @internal
-def _theoreticalMaxFundsInvestable(_amount: uint256) -> uint256:
-    fundsAvailable: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable()
-    fundsInvested: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsInvested()
+def _maxFundsInvestable() -> uint256:
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable
+    fundsInvested: uint256 = poolState.fundsInvested
 
-    return (fundsAvailable + fundsInvested + _amount) * self.maxCapitalEfficienty // 10000
+    return self._computeMaxFundsInvestable(fundsAvailable, fundsInvested, self.maxCapitalEfficienty)
 
 
 @view
 @internal
-def _computeLockPeriodEnd(_lender: address) -> uint256:
-    lockPeriodEnd: uint256 = (staticcall ILendingPoolLock(self.lendingPoolLockContract).investorLocks(_lender)).lockPeriodEnd
-    if lockPeriodEnd <= block.timestamp:
-        lockPeriodEnd = block.timestamp + staticcall ILiquidityControls(self.liquidityControlsContract).lockPeriodDuration()
-    return lockPeriodEnd
+def _theoreticalMaxFundsInvestable(_amount: uint256) -> uint256:
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable
+    fundsInvested: uint256 = poolState.fundsInvested
 
+    return (fundsAvailable + fundsInvested + _amount) * self.maxCapitalEfficienty // 10000
 
-@view
-@internal
-def _computeLockPeriod(_lender: address, _amount: uint256) -> (uint256, uint256):
-    investorLock: InvestorLock = staticcall ILendingPoolLock(self.lendingPoolLockContract).investorLocks(msg.sender)
-    if investorLock.lockPeriodEnd <= block.timestamp:
-        return block.timestamp + staticcall ILiquidityControls(self.liquidityControlsContract).lockPeriodDuration(), _amount
-    else:
-        return investorLock.lockPeriodEnd, investorLock.lockPeriodAmount + _amount
 
 ##### INTERNAL METHODS - WRITE #####
 
 
+@internal
+def _permit(_erc20TokenContract: address, _owner: address, _spender: address, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    if staticcall IERC20(_erc20TokenContract).allowance(_owner, _spender) < _amount:
+        extcall IERC20Permit(_erc20TokenContract).permit(_owner, _spender, _amount, _deadline, convert(_v, uint8), convert(_r, bytes32), convert(_s, bytes32))
+
+
 @internal
 def _deposit(_amount: uint256, _payer: address):
     assert not self.isPoolDeprecated, "pool is deprecated, withdraw"
     assert self.isPoolActive, "pool is not active right now"
     assert _amount > 0, "_amount has to be higher than 0"
 
-    assert staticcall ILiquidityControls(self.liquidityControlsContract).withinPoolShareLimit(
-        msg.sender,
-        _amount,
-        self,
-        self.lendingPoolCoreContract,
-        self._theoreticalMaxFundsInvestable(_amount)
-    ), "max pool share surpassed"
-
     if self.whitelistEnabled and not self.whitelistedAddresses[msg.sender]:
         raise "msg.sender is not whitelisted"
 
-    if not self.isPoolInvesting and self._poolHasFundsToInvestAfterDeposit(_amount):
+    # the pool share limit is checked by the core, against the pool state including the deposit
+    limits: LenderLimits = staticcall ILiquidityControls(self.liquidityControlsContract).lenderLimits()
+    poolState: PoolState = extcall ILendingPoolCore(self.lendingPoolCoreContract).depositChecked(
+        msg.sender,
+        _payer,
+        _amount,
+        limits.maxPoolShareEnabled,
+        limits.maxPoolShare,
+        self.maxCapitalEfficienty
+    )
+
+    if not self.isPoolInvesting and self._poolHasFundsToInvest(poolState.fundsAvailable, poolState.fundsInvested, self.maxCapitalEfficienty):
         self.isPoolInvesting = True
 
         log InvestingStatusChanged(
@@ -324,14 +342,7 @@ def _deposit(_amount: uint256, _payer: address):
             erc20TokenContract
         )
 
-    lockPeriodEnd: uint256 = 0
-    lockPeriodAmount: uint256 = 0
-    lockPeriodEnd, lockPeriodAmount = self._computeLockPeriod(msg.sender, _amount)
-
-    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).deposit(msg.sender, _payer, _amount):
-        raise "error creating deposit"
-
-    extcall ILendingPoolLock(self.lendingPoolLockContract).setInvestorLock(msg.sender, lockPeriodAmount, lockPeriodEnd)
+    extcall ILendingPoolLock(self.lendingPoolLockContract).lockDeposit(msg.sender, _amount, limits.lockPeriodDuration)
 
     log Deposit(msg.sender, msg.sender, _amount, erc20TokenContract)
 
@@ -340,12 +351,16 @@ def _deposit(_amount: uint256, _payer: address):
 def _withdraw(_amount: uint256, _receiver: address):
     assert _amount > 0, "_amount has to be higher than 0"
 
-    withdrawableAmount: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).computeWithdrawableAmount(msg.sender)
-    assert withdrawableAmount >= _amount, "_amount more than withdrawable"
-    assert staticcall ILiquidityControls(self.liquidityControlsContract).outOfLockPeriod(msg.sender, withdrawableAmount - _amount, self.lendingPoolLockContract), "withdraw within lock period"
-    assert staticcall ILendingPoolCore(self.lendingPoolCoreContract).fundsAvailable() >= _amount, "available funds less than amount"
+    # the withdrawable amount and the lock are checked by the core, in the same frame as the withdrawal
+    lockedAmount: uint256 = 0
+    if staticcall ILiquidityControls(self.liquidityControlsContract).lockPeriodEnabled():
+        investorLock: InvestorLock = staticcall ILendingPoolLock(self.lendingPoolLockContract).investorLocks(msg.sender)
+        if investorLock.lockPeriodEnd > block.timestamp:
+            lockedAmount = investorLock.lockPeriodAmount
 
-    if self.isPoolInvesting and not self._poolHasFundsToInvestAfterWithdraw(_amount):
+    poolState: PoolState = extcall ILendingPoolCore(self.lendingPoolCoreContract).withdrawChecked(msg.sender, _receiver, _amount, lockedAmount)
+
+    if self.isPoolInvesting and not self._poolHasFundsToInvest(poolState.fundsAvailable, poolState.fundsInvested, self.maxCapitalEfficienty):
         self.isPoolInvesting = False
 
         log InvestingStatusChanged(
@@ -354,9 +369,6 @@ def _withdraw(_amount: uint256, _receiver: address):
             erc20TokenContract
         )
 
-    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).withdraw(msg.sender, _receiver, _amount):
-        raise "error withdrawing funds"
-
     log Withdrawal(msg.sender, msg.sender, _amount, erc20TokenContract)
 
 
@@ -416,13 +428,10 @@ def _transferReceivedFunds(
             erc20TokenContract
         )
 
-    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).receiveFunds(_payer, _amount, _rewardsPool, _investedAmount):
+    # the protocol fees are pulled into LPCore with the payment and accrued there until claimed
+    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).settleFunds(_payer, _amount, _rewardsPool, _investedAmount, _rewardsProtocol):
         raise "error receiving funds in LPCore"
 
-    if _rewardsProtocol > 0:
-        if not extcall ILendingPoolCore(self.lendingPoolCoreContract).transferProtocolFees(_payer, self.protocolWallet, _rewardsProtocol):
-            raise "error transferring protocol fees"
-
     log FundsReceipt(
         _borrower,
         _borrower,
@@ -435,6 +444,52 @@ def _transferReceivedFunds(
     )
 
 
+@internal
+def _refinanceFunds(_borrower: address, _payer: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    assert not self.isPoolDeprecated, "pool is deprecated"
+    assert self.isPoolActive, "pool is inactive"
+    assert msg.sender == self.loansContract, "msg.sender is not the loans addr"
+    assert _borrower != empty(address), "_borrower is the zero address"
+    assert _newAmount > 0, "_amount has to be higher than 0"
+
+    rewardsProtocol: uint256 = _rewardsAmount * self.protocolFeesShare // 10000
+    rewardsPool: uint256 = _rewardsAmount - rewardsProtocol
+
+    # the pool state as if the previous loan was paid, before the new loan is funded
+    poolState: PoolState = staticcall ILendingPoolCore(self.lendingPoolCoreContract).poolState()
+    fundsAvailable: uint256 = poolState.fundsAvailable + _amount + rewardsPool
+    fundsInvested: uint256 = poolState.fundsInvested - _amount
+
+    assert self.isPoolInvesting or self._poolHasFundsToInvest(fundsAvailable, fundsInvested, self.maxCapitalEfficienty), "max capital eff reached"
+    assert _newAmount <= self._computeMaxFundsInvestable(fundsAvailable, fundsInvested, self.maxCapitalEfficienty), "insufficient liquidity"
+
+    isPoolInvesting: bool = self._poolHasFundsToInvest(fundsAvailable - _newAmount, fundsInvested + _newAmount, self.maxCapitalEfficienty)
+    if isPoolInvesting != self.isPoolInvesting:
+        self.isPoolInvesting = isPoolInvesting
+
+        log InvestingStatusChanged(
+            erc20TokenContract,
+            isPoolInvesting,
+            erc20TokenContract
+        )
+
+    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).refinanceFunds(_payer, _amount, rewardsPool, _newAmount, rewardsProtocol):
+        raise "error refinancing funds in LPCore"
+
+    log FundsReceipt(
+        _borrower,
+        _borrower,
+        _amount,
+        rewardsPool,
+        rewardsProtocol,
+        _amount,
+        erc20TokenContract,
+        "loan"
+    )
+
+    log FundsTransfer(_borrower, _borrower, _newAmount, erc20TokenContract)
+
+
 @internal
 def _receiveFundsFromLiquidation(
     _borrower: address,
@@ -460,6 +515,23 @@ def _receiveFundsFromLiquidation(
     self._transferReceivedFunds(_borrower, _payer, _amount, rewardsPool, rewardsProtocol, _investedAmount, _origin)
 
 
+@internal
+def _claimProtocolFees(_protocolWallet: address):
+    amount: uint256 = staticcall ILendingPoolCore(self.lendingPoolCoreContract).protocolFeesAccrued()
+    if amount == 0:
+        return
+
+    if not extcall ILendingPoolCore(self.lendingPoolCoreContract).claimProtocolFees(_protocolWallet):
+        raise "error transferring protocol fees"
+
+    log ProtocolFeesClaimed(
+        erc20TokenContract,
+        _protocolWallet,
+        amount,
+        erc20TokenContract
+    )
+
+
 @internal
 def _unwrap_and_send(_to: address, _amount: uint256):
     extcall IWETH(erc20TokenContract).withdraw(_amount)
@@ -494,6 +566,12 @@ def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
     return self._theoreticalMaxFundsInvestable(_amount)
 
 
+@view
+@external
+def protocolFeesAccrued() -> uint256:
+    return staticcall ILendingPoolCore(self.lendingPoolCoreContract).protocolFeesAccrued()
+
+
 @view
 @external
 def lenderFunds(_lender: address) -> InvestorFunds:
@@ -605,6 +683,9 @@ def changeProtocolWallet(_address: address):
     assert _address != empty(address), "_address is the zero address"
     assert _address != self.protocolWallet, "new value is the same"
 
+    # fees accrued so far belong to the current wallet
+    self._claimProtocolFees(self.protocolWallet)
+
     log ProtocolWalletChanged(
         erc20TokenContract,
         self.protocolWallet,
@@ -799,6 +880,24 @@ def deposit(_amount: uint256):
     self._deposit(_amount, msg.sender)
 
 
+@external
+def depositWithPermit(_amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+
+    """
+    @notice Deposits the given amount of the ERC20 in the lending pool, approving it with an EIP-2612 permit signature
+    @dev Logs the `Deposit` event. The permit must approve the associated `LendingPoolCore` contract for at least `_amount`, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call
+    @param _amount Value to deposit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    """
+
+    self._permit(erc20TokenContract, msg.sender, self.lendingPoolCoreContract, _amount, _deadline, _v, _r, _s)
+    assert self._fundsAreAllowed(msg.sender, self.lendingPoolCoreContract, _amount), "not enough funds allowed"
+    self._deposit(_amount, msg.sender)
+
+
 
 @external
 @payable
@@ -899,6 +998,52 @@ def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256):
     self._receiveFunds(_borrower, _borrower, _amount, _rewardsAmount)
 
 
+@payable
+@external
+def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+
+    """
+    @notice Receives the payment of a loan and funds its refinancing loan in ETH, transferring only the difference between both
+    @dev Logs the `FundsReceipt`, `FundsTransfer` and, if it changes the pools investing status, the `InvestingStatusChanged` events. The value sent must match the amount owed by the borrower, if any
+    @param _borrower The wallet address of the borrower
+    @param _amount Value of the paid loans principal in wei
+    @param _rewardsAmount Value of the paid loans interest (including the protocol fee share) in wei
+    @param _newAmount Value of the new loans principal in wei
+    """
+
+    paymentAmount: uint256 = _amount + _rewardsAmount
+    if paymentAmount > _newAmount:
+        assert msg.value == paymentAmount - _newAmount, "recv amount not match partials"
+
+        log PaymentReceived(msg.sender, msg.sender, msg.value)
+
+        self._wrap_and_approve(self.lendingPoolCoreContract, msg.value)
+    else:
+        assert msg.value == 0, "recv amount not match partials"
+
+    self._refinanceFunds(_borrower, self, _amount, _rewardsAmount, _newAmount)
+
+    if _newAmount > paymentAmount:
+        self._unwrap_and_send(_borrower, _newAmount - paymentAmount)
+
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+
+    """
+    @notice Receives the payment of a loan and funds its refinancing loan in the pool ERC20, transferring only the difference between both
+    @dev Logs the `FundsReceipt`, `FundsTransfer` and, if it changes the pools investing status, the `InvestingStatusChanged` events
+    @param _borrower The wallet address of the borrower
+    @param _amount Value of the paid loans principal
+    @param _rewardsAmount Value of the paid loans interest (including the protocol fee share)
+    @param _newAmount Value of the new loans principal
+    """
+
+    if _amount + _rewardsAmount > _newAmount:
+        assert self._fundsAreAllowed(_borrower, self.lendingPoolCoreContract, _amount + _rewardsAmount - _newAmount), "insufficient liquidity"
+    self._refinanceFunds(_borrower, _borrower, _amount, _rewardsAmount, _newAmount)
+
+
 @external
 def receiveFundsFromLiquidation(
     _borrower: address,
@@ -952,3 +1097,15 @@ def receiveFundsFromLiquidationEth(
 
     self._wrap_and_approve(self.lendingPoolCoreContract, receivedAmount)
     self._receiveFundsFromLiquidation(_borrower, self, _amount, _rewardsAmount, _distributeToProtocol, _investedAmount, _origin)
+
+
+@external
+def claimProtocolFees():
+
+    """
+    @notice Transfers the protocol fees accrued in the pool to the protocol wallet
+    @dev Logs the `ProtocolFeesClaimed` event if there are fees to transfer
+    """
+
+    assert self.protocolWallet != empty(address), "protocolWallet is zero addr"
+    self._claimProtocolFees(self.protocolWallet)
@@ -11,6 +11,11 @@ interface ILoansCore:
 
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 struct Liquidation:
     lid: bytes32
     collateralAddress: address
@@ -29,6 +34,14 @@ struct Liquidation:
     erc20TokenContract: address
     inAuction: bool
 
+# storage representation of a Liquidation, the collateral is implicit in the liquidation key
+struct PackedLiquidation:
+    periods: uint256 # loansCoreContract (bits 0-159), startTime (160-207) and gracePeriodMaturity (208-255)
+    amounts: uint256 # principal (bits 0-84), interestAmount (85-169) and gracePeriodPrice (170-254)
+    loan: uint256 # borrower (bits 0-159), loanId (160-223) and apr (224-255)
+    token: uint256 # erc20TokenContract (bits 0-159), creation timestamp (160-207) and lenderPeriodMaturity (208-255)
+    auction: uint256 # lenderPeriodPrice (bits 0-84) and inAuction (85)
+
 
 # Events
 
@@ -56,9 +69,15 @@ proposedOwner: public(address)
 
 liquidationsPeripheralAddress: public(address)
 
-liquidations: HashMap[bytes32, Liquidation]
+liquidations: HashMap[bytes32, PackedLiquidation]
 liquidatedLoans: HashMap[bytes32, bool]
 
+TIMESTAMP_MASK: constant(uint256) = 2**48 - 1
+AMOUNT_MASK: constant(uint256) = 2**85 - 1
+ADDRESS_MASK: constant(uint256) = 2**160 - 1
+LOAN_ID_MASK: constant(uint256) = 2**64 - 1
+APR_MASK: constant(uint256) = 2**32 - 1
+
 
 ##### INTERNAL METHODS #####
 
@@ -80,58 +99,120 @@ def _computeLiquidatedLoansKey(_borrower: address, _loansCoreContract: address,
     return keccak256(_abi_encode(_borrower, _loansCoreContract, convert(_loanId, bytes32)))
 
 
+@view
+@internal
+def _packLiquidation(
+    _startTime: uint256,
+    _gracePeriodMaturity: uint256,
+    _lenderPeriodMaturity: uint256,
+    _principal: uint256,
+    _interestAmount: uint256,
+    _apr: uint256,
+    _gracePeriodPrice: uint256,
+    _lenderPeriodPrice: uint256,
+    _borrower: address,
+    _loanId: uint256,
+    _loansCoreContract: address,
+    _erc20TokenContract: address
+) -> PackedLiquidation:
+    assert max(_startTime, max(_gracePeriodMaturity, _lenderPeriodMaturity)) <= TIMESTAMP_MASK, "timestamp out of bounds"
+    assert max(max(_principal, _interestAmount), max(_gracePeriodPrice, _lenderPeriodPrice)) <= AMOUNT_MASK, "amount out of bounds"
+    assert _loanId <= LOAN_ID_MASK, "loanId out of bounds"
+    assert _apr <= APR_MASK, "apr out of bounds"
+
+    return PackedLiquidation(
+        periods=convert(_loansCoreContract, uint256) | (_startTime << 160) | (_gracePeriodMaturity << 208),
+        amounts=_principal | (_interestAmount << 85) | (_gracePeriodPrice << 170),
+        loan=convert(_borrower, uint256) | (_loanId << 160) | (_apr << 224),
+        token=convert(_erc20TokenContract, uint256) | (block.timestamp << 160) | (_lenderPeriodMaturity << 208),
+        auction=_lenderPeriodPrice
+    )
+
+
+@pure
+@internal
+def _unpackLiquidation(_collateralAddress: address, _tokenId: uint256, _liquidation: PackedLiquidation) -> Liquidation:
+    if _liquidation.periods == 0:
+        return empty(Liquidation)
+
+    return Liquidation(
+        lid=self._computeLiquidationId(_collateralAddress, _tokenId, (_liquidation.token >> 160) & TIMESTAMP_MASK),
+        collateralAddress=_collateralAddress,
+        tokenId=_tokenId,
+        startTime=(_liquidation.periods >> 160) & TIMESTAMP_MASK,
+        gracePeriodMaturity=_liquidation.periods >> 208,
+        lenderPeriodMaturity=_liquidation.token >> 208,
+        principal=_liquidation.amounts & AMOUNT_MASK,
+        interestAmount=(_liquidation.amounts >> 85) & AMOUNT_MASK,
+        apr=_liquidation.loan >> 224,
+        gracePeriodPrice=_liquidation.amounts >> 170,
+        lenderPeriodPrice=_liquidation.auction & AMOUNT_MASK,
+        borrower=convert(convert(_liquidation.loan & ADDRESS_MASK, uint160), address),
+        loanId=(_liquidation.loan >> 160) & LOAN_ID_MASK,
+        loansCoreContract=convert(convert(_liquidation.periods & ADDRESS_MASK, uint160), address),
+        erc20TokenContract=convert(convert(_liquidation.token & ADDRESS_MASK, uint160), address),
+        inAuction=_liquidation.auction >> 85 != 0
+    )
+
+
+@view
+@internal
+def _liquidationExists(_liquidationKey: bytes32) -> bool:
+    return (self.liquidations[_liquidationKey].periods >> 160) & TIMESTAMP_MASK > 0
+
+
 ##### EXTERNAL METHODS - VIEW #####
 
 @view
 @external
 def getLiquidation(_collateralAddress: address, _tokenId: uint256) -> Liquidation:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)]
+    return self._unpackLiquidation(_collateralAddress, _tokenId, self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)])
 
 
 @view
 @external
 def getLiquidationStartTime(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].startTime
+    return (self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].periods >> 160) & TIMESTAMP_MASK
 
 @view
 @external
 def getLiquidationGracePeriodMaturity(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].gracePeriodMaturity
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].periods >> 208
 
 @view
 @external
 def getLiquidationLenderPeriodMaturity(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].lenderPeriodMaturity
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].token >> 208
 
 @view
 @external
 def getLiquidationPrincipal(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].principal
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].amounts & AMOUNT_MASK
 
 @view
 @external
 def getLiquidationInterestAmount(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].interestAmount
+    return (self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].amounts >> 85) & AMOUNT_MASK
 
 @view
 @external
 def getLiquidationAPR(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].apr
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].loan >> 224
 
 @view
 @external
 def getLiquidationBorrower(_collateralAddress: address, _tokenId: uint256) -> address:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].borrower
+    return convert(convert(self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].loan & ADDRESS_MASK, uint160), address)
 
 @view
 @external
 def getLiquidationERC20Contract(_collateralAddress: address, _tokenId: uint256) -> address:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].erc20TokenContract
+    return convert(convert(self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].token & ADDRESS_MASK, uint160), address)
 
 @view
 @external
 def isLiquidationInAuction(_collateralAddress: address, _tokenId: uint256) -> bool:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].inAuction
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].auction >> 85 != 0
 
 
 @view
@@ -213,32 +294,75 @@ def addLiquidation(
     assert msg.sender == self.liquidationsPeripheralAddress, "msg.sender is not LiqPeriph addr"
 
     liquidationKey: bytes32 = self._computeLiquidationKey(_collateralAddress, _tokenId)
-    assert self.liquidations[liquidationKey].startTime == 0, "liquidation already exists"
+    assert not self._liquidationExists(liquidationKey), "liquidation already exists"
     assert not self.liquidatedLoans[self._computeLiquidatedLoansKey(_borrower, _loansCoreContract, _loanId)], "loan already liquidated"
 
-    lid: bytes32 = self._computeLiquidationId(_collateralAddress, _tokenId, block.timestamp)
-    self.liquidations[liquidationKey] = Liquidation(
-        {
-            lid: lid,
-            collateralAddress: _collateralAddress,
-            tokenId: _tokenId,
-            startTime: _startTime,
-            gracePeriodMaturity: _gracePeriodMaturity,
-            lenderPeriodMaturity: _lenderPeriodMaturity,
-            principal: _principal,
-            interestAmount: _interestAmount,
-            apr: _apr,
-            gracePeriodPrice: _gracePeriodPrice,
-            lenderPeriodPrice: _lenderPeriodPrice,
-            borrower: _borrower,
-            loanId: _loanId,
-            loansCoreContract: _loansCoreContract,
-            erc20TokenContract: _erc20TokenContract,
-            inAuction: False,
-        }
+    self.liquidations[liquidationKey] = self._packLiquidation(
+        _startTime,
+        _gracePeriodMaturity,
+        _lenderPeriodMaturity,
+        _principal,
+        _interestAmount,
+        _apr,
+        _gracePeriodPrice,
+        _lenderPeriodPrice,
+        _borrower,
+        _loanId,
+        _loansCoreContract,
+        _erc20TokenContract
     )
 
-    return lid
+    return self._computeLiquidationId(_collateralAddress, _tokenId, block.timestamp)
+
+
+@external
+def addLiquidations(
+    _collaterals: DynArray[Collateral, 100],
+    _startTime: uint256,
+    _gracePeriodMaturity: uint256,
+    _lenderPeriodMaturity: uint256,
+    _interestAmounts: DynArray[uint256, 100],
+    _apr: uint256,
+    _gracePeriodPrices: DynArray[uint256, 100],
+    _lenderPeriodPrices: DynArray[uint256, 100],
+    _borrower: address,
+    _loanId: uint256,
+    _loansCoreContract: address,
+    _erc20TokenContract: address
+) -> DynArray[bytes32, 100]:
+    assert msg.sender == self.liquidationsPeripheralAddress, "msg.sender is not LiqPeriph addr"
+    assert len(_interestAmounts) == len(_collaterals), "interest amounts length mismatch"
+    assert len(_gracePeriodPrices) == len(_collaterals), "prices length mismatch"
+    assert len(_lenderPeriodPrices) == len(_collaterals), "prices length mismatch"
+
+    liquidatedLoansKey: bytes32 = self._computeLiquidatedLoansKey(_borrower, _loansCoreContract, _loanId)
+    assert not self.liquidatedLoans[liquidatedLoansKey], "loan already liquidated"
+
+    lids: DynArray[bytes32, 100] = []
+    for i: uint256 in range(len(_collaterals), bound=100):
+        collateral: Collateral = _collaterals[i]
+        liquidationKey: bytes32 = self._computeLiquidationKey(collateral.contractAddress, collateral.tokenId)
+        assert not self._liquidationExists(liquidationKey), "liquidation already exists"
+
+        self.liquidations[liquidationKey] = self._packLiquidation(
+            _startTime,
+            _gracePeriodMaturity,
+            _lenderPeriodMaturity,
+            collateral.amount,
+            _interestAmounts[i],
+            _apr,
+            _gracePeriodPrices[i],
+            _lenderPeriodPrices[i],
+            _borrower,
+            _loanId,
+            _loansCoreContract,
+            _erc20TokenContract
+        )
+        lids.append(self._computeLiquidationId(collateral.contractAddress, collateral.tokenId, block.timestamp))
+
+    self.liquidatedLoans[liquidatedLoansKey] = True
+
+    return lids
 
 
 @external
@@ -254,6 +378,18 @@ def removeLiquidation(_collateralAddress: address, _tokenId: uint256):
 
     liquidationKey: bytes32 = self._computeLiquidationKey(_collateralAddress, _tokenId)
 
-    assert self.liquidations[liquidationKey].startTime > 0, "liquidation not found"
+    assert self._liquidationExists(liquidationKey), "liquidation not found"
+
+    self.liquidations[liquidationKey] = empty(PackedLiquidation)
+
+
+@external
+def removeLiquidations(_collaterals: DynArray[Collateral, 100]):
+    assert msg.sender == self.liquidationsPeripheralAddress, "msg.sender is not LiqPeriph addr"
+
+    for collateral: Collateral in _collaterals:
+        liquidationKey: bytes32 = self._computeLiquidationKey(collateral.contractAddress, collateral.tokenId)
+
+        assert self._liquidationExists(liquidationKey), "liquidation not found"
 
-    self.liquidations[liquidationKey] = empty(Liquidation)
+        self.liquidations[liquidationKey] = empty(PackedLiquidation)
@@ -10,7 +10,8 @@
 # Interfaces
 
 interface ILoans:
-    def getLoan(_borrower: address, _loanId: uint256) -> Loan: view
+    def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader: view
+    def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collateral, 100]: view
     def erc20TokenContract() -> address: view
 
 
@@ -39,7 +40,7 @@ interface ILendingPool:
 
 
 interface ICollateralVault:
-    def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256): nonpayable
+    def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]): nonpayable
 
 
 interface ISelf:
@@ -61,21 +62,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256 # parts per 10000, e.g. 2.5% is represented by 250 parts per 10000
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 struct InvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -98,6 +104,13 @@ struct Liquidation:
     loansCoreContract: address
     erc20TokenContract: address
 
+# storage representation of a Liquidation, the collateral is implicit in the liquidation key
+struct PackedLiquidation:
+    periods: uint256 # loansCoreContract (bits 0-159), startTime (160-207) and gracePeriodMaturity (208-255)
+    amounts: uint256 # principal (bits 0-84), interestAmount (85-169) and gracePeriodPrice (170-254)
+    loan: uint256 # borrower (bits 0-159), loanId (160-223) and apr (224-255)
+    token: uint256 # erc20TokenContract (bits 0-159) and creation timestamp (160-207)
+
 
 # Events
 
@@ -206,7 +219,7 @@ proposedOwner: public(address)
 
 gracePeriodDuration: public(uint256)
 
-liquidations: HashMap[bytes32, Liquidation]
+liquidations: HashMap[bytes32, PackedLiquidation]
 liquidatedLoans: HashMap[bytes32, bool]
 
 loansContract: public(ILoans)
@@ -214,6 +227,14 @@ lendingPoolContract: public(ILendingPool)
 collateralVaultContract: public(ICollateralVault)
 maxPenaltyFee: public(HashMap[address, uint256])
 
+MAX_BATCH_LOANS: constant(uint256) = 10
+
+TIMESTAMP_MASK: constant(uint256) = 2**48 - 1
+AMOUNT_MASK: constant(uint256) = 2**85 - 1
+ADDRESS_MASK: constant(uint256) = 2**160 - 1
+LOAN_ID_MASK: constant(uint256) = 2**64 - 1
+APR_MASK: constant(uint256) = 2**32 - 1
+
 ##### INTERNAL METHODS - VIEW #####
 
 @pure
@@ -240,10 +261,39 @@ def _isLoanLiquidated(_borrower: address, _loansCoreContract: address, _loanId:
     return self.liquidatedLoans[self._computeLiquidatedLoansKey(_borrower, _loansCoreContract, _loanId)]
 
 
+@pure
+@internal
+def _unpackLiquidation(_collateralAddress: address, _tokenId: uint256, _liquidation: PackedLiquidation) -> Liquidation:
+    if _liquidation.periods == 0:
+        return empty(Liquidation)
+
+    return Liquidation(
+        lid=self._computeLiquidationId(_collateralAddress, _tokenId, _liquidation.token >> 160),
+        collateralAddress=_collateralAddress,
+        tokenId=_tokenId,
+        startTime=(_liquidation.periods >> 160) & TIMESTAMP_MASK,
+        gracePeriodMaturity=_liquidation.periods >> 208,
+        principal=_liquidation.amounts & AMOUNT_MASK,
+        interestAmount=(_liquidation.amounts >> 85) & AMOUNT_MASK,
+        apr=_liquidation.loan >> 224,
+        gracePeriodPrice=_liquidation.amounts >> 170,
+        borrower=convert(convert(_liquidation.loan & ADDRESS_MASK, uint160), address),
+        loanId=(_liquidation.loan >> 160) & LOAN_ID_MASK,
+        loansCoreContract=convert(convert(_liquidation.periods & ADDRESS_MASK, uint160), address),
+        erc20TokenContract=convert(convert(_liquidation.token & ADDRESS_MASK, uint160), address)
+    )
+
+
 @view
 @internal
 def _getLiquidation(_collateralAddress: address, _tokenId: uint256) -> Liquidation:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)]
+    return self._unpackLiquidation(_collateralAddress, _tokenId, self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)])
+
+
+@view
+@internal
+def _liquidationExists(_liquidationKey: bytes32) -> bool:
+    return (self.liquidations[_liquidationKey].periods >> 160) & TIMESTAMP_MASK > 0
 
 
 @pure
@@ -263,6 +313,16 @@ def _computeNFTPrice(principal: uint256, interestAmount: uint256, _max_penalty_f
 def _computeLoanAPR(loanInterest: uint256, loanMaturity: uint256, loanStartTime: uint256) -> uint256:
     return loanInterest * 31536000 // (loanMaturity - loanStartTime) # 31536000 = 365 days * 24 hours * 60 minutes * 60 seconds
 
+@view
+@internal
+def _loanCollaterals(_loansCore: address, _borrower: address, _loanId: uint256, _loan: LoanHeader, _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    if _loan.collateralsHash == empty(bytes32):
+        return staticcall ILoans(_loansCore).getLoanCollaterals(_borrower, _loanId)
+
+    assert keccak256(_abi_encode(_collaterals)) == _loan.collateralsHash, "collaterals do not match loan"
+    return _collaterals
+
+
 @pure
 @internal
 def _computeLoanInterestAmount(principal: uint256, interest: uint256) -> uint256:
@@ -290,28 +350,21 @@ def _addLiquidation(
     _erc20TokenContract: address
 ) -> bytes32:
     liquidationKey: bytes32 = self._computeLiquidationKey(_collateralAddress, _tokenId)
-    assert self.liquidations[liquidationKey].startTime == 0, "liquidation already exists"
+    assert not self._liquidationExists(liquidationKey), "liquidation already exists"
     assert not self.liquidatedLoans[self._computeLiquidatedLoansKey(_borrower, _loansCoreContract, _loanId)], "loan already liquidated"
 
-    lid: bytes32 = self._computeLiquidationId(_collateralAddress, _tokenId, block.timestamp)
-    self.liquidations[liquidationKey] = Liquidation(
-        {
-            lid: lid,
-            collateralAddress: _collateralAddress,
-            tokenId: _tokenId,
-            startTime: _startTime,
-            gracePeriodMaturity: _gracePeriodMaturity,
-            principal: _principal,
-            interestAmount: _interestAmount,
-            apr: _apr,
-            gracePeriodPrice: _gracePeriodPrice,
-            borrower: _borrower,
-            loanId: _loanId,
-            loansCoreContract: _loansCoreContract,
-            erc20TokenContract: _erc20TokenContract,
-        }
+    assert max(_startTime, _gracePeriodMaturity) <= TIMESTAMP_MASK, "timestamp out of bounds"
+    assert max(_principal, max(_interestAmount, _gracePeriodPrice)) <= AMOUNT_MASK, "amount out of bounds"
+    assert _loanId <= LOAN_ID_MASK, "loanId out of bounds"
+    assert _apr <= APR_MASK, "apr out of bounds"
+
+    self.liquidations[liquidationKey] = PackedLiquidation(
+        periods=convert(_loansCoreContract, uint256) | (_startTime << 160) | (_gracePeriodMaturity << 208),
+        amounts=_principal | (_interestAmount << 85) | (_gracePeriodPrice << 170),
+        loan=convert(_borrower, uint256) | (_loanId << 160) | (_apr << 224),
+        token=convert(_erc20TokenContract, uint256) | (block.timestamp << 160)
     )
-    return lid
+    return self._computeLiquidationId(_collateralAddress, _tokenId, block.timestamp)
 
 
 @internal
@@ -319,11 +372,114 @@ def _addLoanToLiquidated(_borrower: address, _loansCoreContract: address, _loanI
     self.liquidatedLoans[self._computeLiquidatedLoansKey(_borrower, _loansCoreContract, _loanId)] = True
 
 
+@internal
+def _addLoanLiquidations(
+    _borrower: address,
+    _loanId: uint256,
+    _erc20TokenContract: address,
+    _collaterals: DynArray[Collateral, 100],
+    _loansContract: address,
+    _maxPenaltyFee: uint256,
+    _gracePeriodMaturity: uint256
+):
+    borrowerLoan: LoanHeader = staticcall ILoans(_loansContract).getLoanHeader(_borrower, _loanId)
+    assert borrowerLoan.defaulted, "loan is not defaulted"
+    assert not self._isLoanLiquidated(_borrower, _loansContract, _loanId), "loan already liquidated"
+
+    # APR from loan duration (maturity)
+    loanAPR: uint256 = self._computeLoanAPR(borrowerLoan.interest, borrowerLoan.maturity, borrowerLoan.startTime)
+
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(_loansContract, _borrower, _loanId, borrowerLoan, _collaterals)
+
+    for collateral: Collateral in collaterals:
+        principal: uint256 = collateral.amount
+        interestAmount: uint256 = self._computeLoanInterestAmount(principal, borrowerLoan.interest)
+
+        gracePeriodPrice: uint256 = self._computeNFTPrice(principal, interestAmount, _maxPenaltyFee)
+
+        lid: bytes32 = self._addLiquidation(
+            collateral.contractAddress,
+            collateral.tokenId,
+            block.timestamp,
+            _gracePeriodMaturity,
+            _gracePeriodMaturity,
+            principal,
+            interestAmount,
+            loanAPR,
+            gracePeriodPrice,
+            gracePeriodPrice,
+            _borrower,
+            _loanId,
+            _loansContract,
+            _erc20TokenContract
+        )
+
+        log LiquidationAdded(
+            _erc20TokenContract,
+            collateral.contractAddress,
+            lid,
+            collateral.contractAddress,
+            collateral.tokenId,
+            _erc20TokenContract,
+            gracePeriodPrice,
+            gracePeriodPrice,
+            _gracePeriodMaturity,
+            _gracePeriodMaturity,
+            _loansContract,
+            _loanId,
+            _borrower
+        )
+
+    self._addLoanToLiquidated(_borrower, _loansContract, _loanId)
+
+
 @internal
 def _removeLiquidation(_collateralAddress: address, _tokenId: uint256):
     liquidationKey: bytes32 = self._computeLiquidationKey(_collateralAddress, _tokenId)
-    assert self.liquidations[liquidationKey].startTime > 0, "liquidation not found"
-    self.liquidations[liquidationKey] = empty(Liquidation)
+    assert self._liquidationExists(liquidationKey), "liquidation not found"
+    self.liquidations[liquidationKey] = empty(PackedLiquidation)
+
+
+@internal
+def _claim(_collateralAddress: address, _tokenId: uint256) -> Liquidation:
+    liquidation: Liquidation = self._getLiquidation(_collateralAddress, _tokenId)
+    assert block.timestamp > liquidation.gracePeriodMaturity, "liquidation in grace period"
+
+    self._removeLiquidation(_collateralAddress, _tokenId)
+
+    log LiquidationRemoved(
+        liquidation.erc20TokenContract,
+        liquidation.collateralAddress,
+        liquidation.lid,
+        liquidation.collateralAddress,
+        liquidation.tokenId,
+        liquidation.erc20TokenContract,
+        liquidation.loansCoreContract,
+        liquidation.loanId,
+        liquidation.borrower
+    )
+
+    return liquidation
+
+
+@internal
+def _transferClaimedCollaterals(_liquidations: DynArray[Liquidation, 100], _collaterals: DynArray[Collateral, 100]):
+    extcall self.collateralVaultContract.transferCollateralsFromLiquidation(msg.sender, _collaterals)
+
+    for liquidation: Liquidation in _liquidations:
+        log NFTClaimed(
+            liquidation.erc20TokenContract,
+            liquidation.collateralAddress,
+            msg.sender,
+            liquidation.lid,
+            liquidation.collateralAddress,
+            liquidation.tokenId,
+            liquidation.gracePeriodPrice,
+            msg.sender,
+            liquidation.erc20TokenContract,
+            liquidation.loansCoreContract,
+            "OTC_CLAIM"
+        )
 
 
 ##### EXTERNAL METHODS - VIEW #####
@@ -338,43 +494,43 @@ def liquidationsCoreAddress() -> address:
 @view
 @external
 def getLiquidation(_collateralAddress: address, _tokenId: uint256) -> Liquidation:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)]
+    return self._getLiquidation(_collateralAddress, _tokenId)
 
 
 @view
 @external
 def getLiquidationStartTime(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].startTime
+    return (self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].periods >> 160) & TIMESTAMP_MASK
 
 @view
 @external
 def getLiquidationGracePeriodMaturity(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].gracePeriodMaturity
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].periods >> 208
 
 @view
 @external
 def getLiquidationPrincipal(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].principal
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].amounts & AMOUNT_MASK
 
 @view
 @external
 def getLiquidationInterestAmount(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].interestAmount
+    return (self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].amounts >> 85) & AMOUNT_MASK
 
 @view
 @external
 def getLiquidationAPR(_collateralAddress: address, _tokenId: uint256) -> uint256:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].apr
+    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].loan >> 224
 
 @view
 @external
 def getLiquidationBorrower(_collateralAddress: address, _tokenId: uint256) -> address:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].borrower
+    return convert(convert(self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].loan & ADDRESS_MASK, uint160), address)
 
 @view
 @external
 def getLiquidationERC20Contract(_collateralAddress: address, _tokenId: uint256) -> address:
-    return self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].erc20TokenContract
+    return convert(convert(self.liquidations[self._computeLiquidationKey(_collateralAddress, _tokenId)].token & ADDRESS_MASK, uint160), address)
 
 @view
 @external
@@ -480,77 +636,62 @@ def setMaxPenaltyFee(_erc20TokenContract: address, _fee: uint256):
 
 
 @external
-def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address):
-
-    borrowerLoan: Loan = staticcall self.loansContract.getLoan(_borrower, _loanId)
-    assert borrowerLoan.defaulted, "loan is not defaulted"
-    assert not self._isLoanLiquidated(_borrower, self.loansContract.address, _loanId), "loan already liquidated"
-
-    # APR from loan duration (maturity)
-    loanAPR: uint256 = self._computeLoanAPR(borrowerLoan.interest, borrowerLoan.maturity, borrowerLoan.startTime)
-
-    for collateral: Collateral in borrowerLoan.collaterals:
-        assert self._getLiquidation(collateral.contractAddress, collateral.tokenId).startTime == 0, "liquidation already exists"
-
-        principal: uint256 = collateral.amount
-        interestAmount: uint256 = self._computeLoanInterestAmount(principal, borrowerLoan.interest)
+def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100] = []):
+    self._addLoanLiquidations(
+        _borrower,
+        _loanId,
+        _erc20TokenContract,
+        _collaterals,
+        self.loansContract.address,
+        self.maxPenaltyFee[_erc20TokenContract],
+        block.timestamp + self.gracePeriodDuration
+    )
 
-        gracePeriodPrice: uint256 = self._computeNFTPrice(principal, interestAmount, self.maxPenaltyFee[_erc20TokenContract])
 
-        lid: bytes32 = self._addLiquidation(
-            collateral.contractAddress,
-            collateral.tokenId,
-            block.timestamp,
-            block.timestamp + self.gracePeriodDuration,
-            block.timestamp + self.gracePeriodDuration,
-            principal,
-            interestAmount,
-            loanAPR,
-            gracePeriodPrice,
-            gracePeriodPrice,
-            _borrower,
-            _loanId,
-            self.loansContract.address,
-            _erc20TokenContract
-        )
-
-        log LiquidationAdded(
-            _erc20TokenContract,
-            collateral.contractAddress,
-            lid,
-            collateral.contractAddress,
-            collateral.tokenId,
+@external
+def addLiquidations(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS], _erc20TokenContract: address):
+    """
+    @notice Creates the liquidations for the collaterals of several defaulted loans
+    @dev Logs the `LiquidationAdded` event for each collateral
+    @param _loans The defaulted loans, the collaterals are only required for loans created with a collaterals commitment
+    @param _erc20TokenContract The ERC20 contract of the loans
+    """
+    loansContract: address = self.loansContract.address
+    maxPenaltyFee: uint256 = self.maxPenaltyFee[_erc20TokenContract]
+    gracePeriodMaturity: uint256 = block.timestamp + self.gracePeriodDuration
+
+    for loan: LoanCollaterals in _loans:
+        self._addLoanLiquidations(
+            loan.borrower,
+            loan.loanId,
             _erc20TokenContract,
-            gracePeriodPrice,
-            gracePeriodPrice,
-            block.timestamp + self.gracePeriodDuration,
-            block.timestamp + self.gracePeriodDuration,
-            self.loansContract.address,
-            _loanId,
-            _borrower
+            loan.collaterals,
+            loansContract,
+            maxPenaltyFee,
+            gracePeriodMaturity
         )
 
-    self._addLoanToLiquidated(_borrower, self.loansContract.address, _loanId)
-
 
 @payable
 @external
-def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address):
+def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100] = []):
     receivedAmount: uint256 = msg.value
     ethPayment: bool = receivedAmount > 0
 
-    loan: Loan = staticcall self.loansContract.getLoan(msg.sender, _loanId)
+    loan: LoanHeader = staticcall self.loansContract.getLoanHeader(msg.sender, _loanId)
     assert loan.defaulted, "loan is not defaulted"
 
     if ethPayment:
         log PaymentReceived(msg.sender, msg.sender, receivedAmount)
     paidAmount: uint256 = 0
 
-    for collateral: Collateral in loan.collaterals:
-        liquidation: Liquidation = self._getLiquidation(collateral.contractAddress, collateral.tokenId)
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(self.loansContract.address, msg.sender, _loanId, loan, _collaterals)
 
+    liquidations: DynArray[Liquidation, 100] = []
+    principal: uint256 = 0
+    for collateral: Collateral in collaterals:
+        liquidation: Liquidation = self._getLiquidation(collateral.contractAddress, collateral.tokenId)
         assert block.timestamp <= liquidation.gracePeriodMaturity, "liquidation out of grace period"
-        assert not ethPayment or receivedAmount >= paidAmount + liquidation.gracePeriodPrice, "insufficient value received"
 
         self._removeLiquidation(collateral.contractAddress, collateral.tokenId)
 
@@ -566,43 +707,43 @@ def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: addres
             liquidation.borrower
         )
 
-        _lendingPoolPeripheral : address = self.lendingPoolContract.address
-
-        if ethPayment:
-            extcall self.lendingPoolContract.receiveFundsFromLiquidationEth(
-                liquidation.borrower,
-                liquidation.principal,
-                liquidation.gracePeriodPrice - liquidation.principal,
-                True,
-                "liquidation_grace_period",
-                value=liquidation.gracePeriodPrice
-            )
-            log PaymentSent(_lendingPoolPeripheral, _lendingPoolPeripheral, liquidation.gracePeriodPrice)
-            paidAmount += liquidation.gracePeriodPrice
-
-        else:
-            extcall self.lendingPoolContract.receiveFundsFromLiquidation(
-                liquidation.borrower,
-                liquidation.principal,
-                liquidation.gracePeriodPrice - liquidation.principal,
-                True,
-                "liquidation_grace_period"
-            )
-
-
-        extcall self.collateralVaultContract.transferCollateralFromLiquidation(
+        liquidations.append(liquidation)
+        principal += liquidation.principal
+        paidAmount += liquidation.gracePeriodPrice
+
+    assert not ethPayment or receivedAmount >= paidAmount, "insufficient value received"
+
+    # all the liquidations of a loan share the same pool, so the payment is settled once
+    _lendingPoolPeripheral : address = self.lendingPoolContract.address
+    if ethPayment:
+        extcall self.lendingPoolContract.receiveFundsFromLiquidationEth(
             msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId
+            principal,
+            paidAmount - principal,
+            True,
+            "liquidation_grace_period",
+            value=paidAmount
         )
+        log PaymentSent(_lendingPoolPeripheral, _lendingPoolPeripheral, paidAmount)
+    else:
+        extcall self.lendingPoolContract.receiveFundsFromLiquidation(
+            msg.sender,
+            principal,
+            paidAmount - principal,
+            True,
+            "liquidation_grace_period"
+        )
+
+    extcall self.collateralVaultContract.transferCollateralsFromLiquidation(msg.sender, collaterals)
 
+    for liquidation: Liquidation in liquidations:
         log NFTPurchased(
             liquidation.erc20TokenContract,
-            collateral.contractAddress,
+            liquidation.collateralAddress,
             msg.sender,
             liquidation.lid,
-            collateral.contractAddress,
-            collateral.tokenId,
+            liquidation.collateralAddress,
+            liquidation.tokenId,
             liquidation.gracePeriodPrice,
             msg.sender,
             liquidation.erc20TokenContract,
@@ -610,53 +751,62 @@ def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: addres
             "GRACE_PERIOD"
         )
 
-    excessAmount: uint256 = receivedAmount - paidAmount
-    if excessAmount > 0:
+    if ethPayment and receivedAmount > paidAmount:
+        excessAmount: uint256 = receivedAmount - paidAmount
         send(msg.sender, excessAmount)
-        log PaymentSent(msg.sender, msg.sender,excessAmount)
+        log PaymentSent(msg.sender, msg.sender, excessAmount)
 
 
 @external
 def claim(_collateralAddress: address, _tokenId: uint256):
-    liquidation: Liquidation = self._getLiquidation(_collateralAddress, _tokenId)
-    assert block.timestamp > liquidation.gracePeriodMaturity, "liquidation in grace period"
-
     assert self.lendingPoolContract.address != empty(address), "lendingPool not configured"
     assert (staticcall self.lendingPoolContract.lenderFunds(msg.sender)).currentAmountDeposited > 0, "msg.sender is not a lender"
 
-
-    self._removeLiquidation(_collateralAddress, _tokenId)
-
-    log LiquidationRemoved(
-        liquidation.erc20TokenContract,
-        liquidation.collateralAddress,
-        liquidation.lid,
-        liquidation.collateralAddress,
-        liquidation.tokenId,
-        liquidation.erc20TokenContract,
-        liquidation.loansCoreContract,
-        liquidation.loanId,
-        liquidation.borrower
-    )
-
-    extcall self.collateralVaultContract.transferCollateralFromLiquidation(msg.sender, _collateralAddress, _tokenId)
-
-    log NFTClaimed(
-        liquidation.erc20TokenContract,
-        _collateralAddress,
-        msg.sender,
-        liquidation.lid,
-        _collateralAddress,
-        _tokenId,
-        liquidation.gracePeriodPrice,
-        msg.sender,
-        liquidation.erc20TokenContract,
-        liquidation.loansCoreContract,
-        "OTC_CLAIM"
-    )
+    liquidation: Liquidation = self._claim(_collateralAddress, _tokenId)
+    self._transferClaimedCollaterals([liquidation], [Collateral(contractAddress=_collateralAddress, tokenId=_tokenId, amount=0)])
 
     extcall self.lendingPoolContract.receiveCollateralFromLiquidation(
         liquidation.borrower,
         liquidation.principal,
         "OTC_CLAIM"
     )
+
+
+@external
+def claimMany(_collaterals: DynArray[Collateral, 100]):
+
+    """
+    @notice Claims several liquidated NFTs, accounting for them in the lending pool once per borrower
+    @dev Logs the `LiquidationRemoved` and `NFTClaimed` events for each NFT
+    @param _collaterals The NFTs to claim, the `amount` of each collateral is ignored
+    """
+
+    assert len(_collaterals) > 0, "no collaterals to claim"
+    assert self.lendingPoolContract.address != empty(address), "lendingPool not configured"
+    assert (staticcall self.lendingPoolContract.lenderFunds(msg.sender)).currentAmountDeposited > 0, "msg.sender is not a lender"
+
+    liquidations: DynArray[Liquidation, 100] = []
+    borrowers: DynArray[address, 100] = []
+    principals: DynArray[uint256, 100] = []
+
+    for collateral: Collateral in _collaterals:
+        liquidation: Liquidation = self._claim(collateral.contractAddress, collateral.tokenId)
+        liquidations.append(liquidation)
+
+        if liquidation.borrower not in borrowers:
+            borrowers.append(liquidation.borrower)
+            principals.append(0)
+
+        for i: uint256 in range(len(borrowers), bound=100):
+            if borrowers[i] == liquidation.borrower:
+                principals[i] += liquidation.principal
+                break
+
+    self._transferClaimedCollaterals(liquidations, _collaterals)
+
+    for i: uint256 in range(len(borrowers), bound=100):
+        extcall self.lendingPoolContract.receiveCollateralFromLiquidation(
+            borrowers[i],
+            principals[i],
+            "OTC_CLAIM"
+        )
@@ -15,29 +15,26 @@ from ethereum.ercs import IERC721
 
 interface ILiquidationsCore:
     def getLiquidation(_collateralAddress: address, _tokenId: uint256) -> Liquidation: view
-    def getLiquidationStartTime(_collateralAddress: address, _tokenId: uint256) -> uint256: view
-    def isLoanLiquidated(_borrower: address, _loansCoreContract: address, _loanId: uint256) -> bool: view
-    def addLiquidation(
-        _collateralAddress: address,
-        _tokenId: uint256,
+    def addLiquidations(
+        _collaterals: DynArray[Collateral, 100],
         _startTime: uint256,
         _gracePeriodMaturity: uint256,
         _lenderPeriodMaturity: uint256,
-        _principal: uint256,
-        _interestAmount: uint256,
+        _interestAmounts: DynArray[uint256, 100],
         _apr: uint256,
-        _gracePeriodPrice: uint256,
-        _lenderPeriodPrice: uint256,
+        _gracePeriodPrices: DynArray[uint256, 100],
+        _lenderPeriodPrices: DynArray[uint256, 100],
         _borrower: address,
         _loanId: uint256,
         _loansCoreContract: address,
         _erc20TokenContract: address
-    ) -> bytes32: nonpayable
-    def addLoanToLiquidated(_borrower: address, _loansCoreContract: address, _loanId: uint256): nonpayable
+    ) -> DynArray[bytes32, 100]: nonpayable
     def removeLiquidation(_collateralAddress: address, _tokenId: uint256): nonpayable
+    def removeLiquidations(_collaterals: DynArray[Collateral, 100]): nonpayable
 
 interface ILoansCore:
-    def getLoan(_borrower: address, _loanId: uint256) -> Loan: view
+    def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader: view
+    def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collateral, 100]: view
 
 interface ILendingPoolPeripheral:
     def lenderFunds(_lender: address) -> InvestorFunds: view
@@ -64,6 +61,7 @@ interface ICollateralVaultPeripheral:
     def vaultAddress(_collateralAddress: address, _tokenId: uint256) -> address: view
     def isCollateralInVault(_collateralAddress: address, _tokenId: uint256) -> bool: view
     def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256): nonpayable
+    def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]): nonpayable
     def collateralVaultCoreDefaultAddress() -> address: view
 
 interface ISushiFactory:
@@ -100,6 +98,9 @@ interface CryptoPunksMarket:
 interface WrappedPunk:
     def burn(punkIndex: uint256): nonpayable
 
+interface IERC20Permit:
+    def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32): nonpayable
+
 
 # Structs
 
@@ -108,21 +109,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256 # parts per 10000, e.g. 2.5% is represented by 250 parts per 10000
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 struct InvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -311,6 +317,8 @@ wethAddress: immutable(address)
 
 maxPenaltyFee: public(HashMap[address, uint256])
 
+MAX_BATCH_LOANS: constant(uint256) = 10
+
 ##### INTERNAL METHODS - VIEW #####
 
 @pure
@@ -331,6 +339,16 @@ def _computeLoanAPR(loanInterest: uint256, loanMaturity: uint256, loanStartTime:
     return loanInterest * 31536000 // (loanMaturity - loanStartTime) # 31536000 = 365 days * 24 hours * 60 minutes * 60 seconds
 
 
+@view
+@internal
+def _loanCollaterals(_loansCore: address, _borrower: address, _loanId: uint256, _loan: LoanHeader, _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    if _loan.collateralsHash == empty(bytes32):
+        return staticcall ILoansCore(_loansCore).getLoanCollaterals(_borrower, _loanId)
+
+    assert keccak256(_abi_encode(_collaterals)) == _loan.collateralsHash, "collaterals do not match loan"
+    return _collaterals
+
+
 @pure
 @internal
 def _computeLoanInterestAmount(principal: uint256, interest: uint256) -> uint256:
@@ -425,34 +443,102 @@ def _removeLiquidationAndTransfer(_collateralAddress: address, _tokenId: uint256
 
     extcall ILiquidationsCore(self.liquidationsCoreAddress).removeLiquidation(_collateralAddress, _tokenId)
 
-    log LiquidationRemoved(
-        _liquidation.erc20TokenContract,
-        _liquidation.collateralAddress,
-        _liquidation.lid,
-        _liquidation.collateralAddress,
-        _liquidation.tokenId,
-        _liquidation.erc20TokenContract,
-        _liquidation.loansCoreContract,
-        _liquidation.loanId,
-        _liquidation.borrower
-    )
+    self._transferLiquidatedCollaterals([_liquidation], [Collateral(contractAddress=_collateralAddress, tokenId=_tokenId, amount=0)], _origin)
 
-    extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralAddress).transferCollateralFromLiquidation(msg.sender, _collateralAddress, _tokenId)
 
-    log NFTPurchased(
-        _liquidation.erc20TokenContract,
-        _collateralAddress,
-        msg.sender,
-        _liquidation.lid,
-        _collateralAddress,
-        _tokenId,
-        _liquidation.gracePeriodPrice,
-        msg.sender,
-        _liquidation.erc20TokenContract,
-        _liquidation.loansCoreContract,
-        _origin
+@internal
+def _transferLiquidatedCollaterals(_liquidations: DynArray[Liquidation, 100], _collaterals: DynArray[Collateral, 100], _origin: String[30]):
+    for liquidation: Liquidation in _liquidations:
+        log LiquidationRemoved(
+            liquidation.erc20TokenContract,
+            liquidation.collateralAddress,
+            liquidation.lid,
+            liquidation.collateralAddress,
+            liquidation.tokenId,
+            liquidation.erc20TokenContract,
+            liquidation.loansCoreContract,
+            liquidation.loanId,
+            liquidation.borrower
+        )
+
+    extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralAddress).transferCollateralsFromLiquidation(msg.sender, _collaterals)
+
+    for liquidation: Liquidation in _liquidations:
+        log NFTPurchased(
+            liquidation.erc20TokenContract,
+            liquidation.collateralAddress,
+            msg.sender,
+            liquidation.lid,
+            liquidation.collateralAddress,
+            liquidation.tokenId,
+            liquidation.gracePeriodPrice,
+            msg.sender,
+            liquidation.erc20TokenContract,
+            liquidation.loansCoreContract,
+            _origin
+        )
+
+
+@internal
+def _addLoanLiquidations(
+    _borrower: address,
+    _loanId: uint256,
+    _erc20TokenContract: address,
+    _collaterals: DynArray[Collateral, 100],
+    _loansCore: address,
+    _liquidationsCore: address,
+    _maxPenaltyFee: uint256,
+    _gracePeriodMaturity: uint256,
+    _lenderPeriodMaturity: uint256
+):
+    borrowerLoan: LoanHeader = staticcall ILoansCore(_loansCore).getLoanHeader(_borrower, _loanId)
+    assert borrowerLoan.defaulted, "loan is not defaulted"
+
+    # APR from loan duration (maturity)
+    loanAPR: uint256 = self._computeLoanAPR(borrowerLoan.interest, borrowerLoan.maturity, borrowerLoan.startTime)
+
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(_loansCore, _borrower, _loanId, borrowerLoan, _collaterals)
+
+    interestAmounts: DynArray[uint256, 100] = []
+    prices: DynArray[uint256, 100] = []
+    for collateral: Collateral in collaterals:
+        interestAmount: uint256 = self._computeLoanInterestAmount(collateral.amount, borrowerLoan.interest)
+        interestAmounts.append(interestAmount)
+        prices.append(self._computeNFTPrice(collateral.amount, interestAmount, _maxPenaltyFee))
+
+    # the core checks that neither the loan nor any of the collaterals are already liquidated
+    lids: DynArray[bytes32, 100] = extcall ILiquidationsCore(_liquidationsCore).addLiquidations(
+        collaterals,
+        block.timestamp,
+        _gracePeriodMaturity,
+        _lenderPeriodMaturity,
+        interestAmounts,
+        loanAPR,
+        prices,
+        prices,
+        _borrower,
+        _loanId,
+        _loansCore,
+        _erc20TokenContract
     )
 
+    for i: uint256 in range(len(collaterals), bound=100):
+        log LiquidationAdded(
+            _erc20TokenContract,
+            collaterals[i].contractAddress,
+            lids[i],
+            collaterals[i].contractAddress,
+            collaterals[i].tokenId,
+            _erc20TokenContract,
+            prices[i],
+            prices[i],
+            _gracePeriodMaturity,
+            _lenderPeriodMaturity,
+            _loansCore,
+            _loanId,
+            _borrower
+        )
+
 
 @internal
 def _swapWETHForERC20Token(_wethValue: uint256, _erc20MinValue: uint256, _erc20TokenContract: address) -> uint256:
@@ -465,6 +551,189 @@ def _swapWETHForERC20Token(_wethValue: uint256, _erc20MinValue: uint256, _erc20T
         block.timestamp
     ))[1]
 
+
+@internal
+def _permit(_erc20TokenContract: address, _owner: address, _spender: address, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    if staticcall IERC20(_erc20TokenContract).allowance(_owner, _spender) < _amount:
+        extcall IERC20Permit(_erc20TokenContract).permit(_owner, _spender, _amount, _deadline, convert(_v, uint8), convert(_r, bytes32), convert(_s, bytes32))
+
+
+@internal
+def _payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100], _receivedAmount: uint256):
+    receivedAmount: uint256 = _receivedAmount
+    ethPayment: bool = receivedAmount > 0
+
+    loansCore: address = self.loansCoreAddresses[_erc20TokenContract]
+    liquidationsCore: address = self.liquidationsCoreAddress
+
+    loan: LoanHeader = staticcall ILoansCore(loansCore).getLoanHeader(msg.sender, _loanId)
+    assert loan.defaulted, "loan is not defaulted"
+
+    if ethPayment:
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+    paidAmount: uint256 = 0
+
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(loansCore, msg.sender, _loanId, loan, _collaterals)
+
+    liquidations: DynArray[Liquidation, 100] = []
+    principal: uint256 = 0
+    for collateral: Collateral in collaterals:
+        liquidation: Liquidation = staticcall ILiquidationsCore(liquidationsCore).getLiquidation(collateral.contractAddress, collateral.tokenId)
+        assert block.timestamp <= liquidation.gracePeriodMaturity, "liquidation out of grace period"
+
+        liquidations.append(liquidation)
+        principal += liquidation.principal
+        paidAmount += liquidation.gracePeriodPrice
+
+    assert not ethPayment or receivedAmount >= paidAmount, "insufficient value received"
+
+    extcall ILiquidationsCore(liquidationsCore).removeLiquidations(collaterals)
+
+    # all the liquidations of a loan share the same pool, so the payment is settled once
+    lendingPoolPeripheral: address = self.lendingPoolPeripheralAddresses[_erc20TokenContract]
+    if ethPayment:
+        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidationEth(
+            msg.sender,
+            principal,
+            paidAmount - principal,
+            True,
+            principal,
+            "liquidation_grace_period",
+            value=paidAmount
+        )
+        log PaymentSent(lendingPoolPeripheral, lendingPoolPeripheral, paidAmount)
+    else:
+        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidation(
+            msg.sender,
+            principal,
+            paidAmount - principal,
+            True,
+            principal,
+            "liquidation_grace_period"
+        )
+
+    self._transferLiquidatedCollaterals(liquidations, collaterals, "GRACE_PERIOD")
+
+    if ethPayment and receivedAmount > paidAmount:
+        excessAmount: uint256 = receivedAmount - paidAmount
+        send(msg.sender, excessAmount)
+        log PaymentSent(msg.sender, msg.sender, excessAmount)
+
+
+@internal
+def _buyNFTLenderPeriod(_collateralAddress: address, _tokenId: uint256, _receivedAmount: uint256):
+    liquidation: Liquidation = staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidation(_collateralAddress, _tokenId)
+    assert block.timestamp > liquidation.gracePeriodMaturity, "liquidation in grace period"
+    assert block.timestamp <= liquidation.lenderPeriodMaturity, "liquidation out of lender period"
+    assert (staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]).lenderFunds(msg.sender)).currentAmountDeposited > 0, "msg.sender is not a lender"
+
+    lendingPoolPeripheral: address = self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]
+
+    receivedAmount: uint256 = _receivedAmount
+    ethPayment: bool = receivedAmount > 0
+    if ethPayment:
+        assert receivedAmount >= liquidation.lenderPeriodPrice, "insufficient value received"
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidationEth(
+            msg.sender,
+            liquidation.principal,
+            liquidation.lenderPeriodPrice - liquidation.principal,
+            True,
+            liquidation.principal,
+            "liquidation_lenders_period",
+            value=liquidation.lenderPeriodPrice
+        )
+        log PaymentSent(lendingPoolPeripheral, lendingPoolPeripheral, liquidation.lenderPeriodPrice)
+    else:
+        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidation(
+            msg.sender,
+            liquidation.principal,
+            liquidation.lenderPeriodPrice - liquidation.principal,
+            True,
+            liquidation.principal,
+            "liquidation_lenders_period"
+        )
+
+    self._removeLiquidationAndTransfer(_collateralAddress, _tokenId, liquidation, "LENDER_PERIOD")
+
+    if ethPayment:
+        excessAmount: uint256 = receivedAmount - liquidation.lenderPeriodPrice
+        if excessAmount > 0:
+            send(msg.sender, excessAmount)
+            log PaymentSent(msg.sender, msg.sender,excessAmount)
+
+
+@internal
+def _buyNFTsLenderPeriod(_collaterals: DynArray[Collateral, 100], _receivedAmount: uint256):
+    assert len(_collaterals) > 0, "no collaterals to buy"
+
+    receivedAmount: uint256 = _receivedAmount
+    ethPayment: bool = receivedAmount > 0
+    if ethPayment:
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+
+    liquidations: DynArray[Liquidation, 100] = []
+    erc20TokenContracts: DynArray[address, 100] = []
+    principals: DynArray[uint256, 100] = []
+    prices: DynArray[uint256, 100] = []
+    paidAmount: uint256 = 0
+
+    for collateral: Collateral in _collaterals:
+        liquidation: Liquidation = staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidation(collateral.contractAddress, collateral.tokenId)
+        assert block.timestamp > liquidation.gracePeriodMaturity, "liquidation in grace period"
+        assert block.timestamp <= liquidation.lenderPeriodMaturity, "liquidation out of lender period"
+
+        if liquidation.erc20TokenContract not in erc20TokenContracts:
+            assert (staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]).lenderFunds(msg.sender)).currentAmountDeposited > 0, "msg.sender is not a lender"
+            erc20TokenContracts.append(liquidation.erc20TokenContract)
+            principals.append(0)
+            prices.append(0)
+
+        for i: uint256 in range(len(erc20TokenContracts), bound=100):
+            if erc20TokenContracts[i] == liquidation.erc20TokenContract:
+                principals[i] += liquidation.principal
+                prices[i] += liquidation.lenderPeriodPrice
+                break
+
+        liquidations.append(liquidation)
+        paidAmount += liquidation.lenderPeriodPrice
+
+    assert not ethPayment or receivedAmount >= paidAmount, "insufficient value received"
+
+    extcall ILiquidationsCore(self.liquidationsCoreAddress).removeLiquidations(_collaterals)
+
+    for i: uint256 in range(len(erc20TokenContracts), bound=100):
+        lendingPoolPeripheral: address = self.lendingPoolPeripheralAddresses[erc20TokenContracts[i]]
+        if ethPayment:
+            extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidationEth(
+                msg.sender,
+                principals[i],
+                prices[i] - principals[i],
+                True,
+                principals[i],
+                "liquidation_lenders_period",
+                value=prices[i]
+            )
+            log PaymentSent(lendingPoolPeripheral, lendingPoolPeripheral, prices[i])
+        else:
+            extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidation(
+                msg.sender,
+                principals[i],
+                prices[i] - principals[i],
+                True,
+                principals[i],
+                "liquidation_lenders_period"
+            )
+
+    self._transferLiquidatedCollaterals(liquidations, _collaterals, "LENDER_PERIOD")
+
+    if ethPayment:
+        excessAmount: uint256 = receivedAmount - paidAmount
+        if excessAmount > 0:
+            send(msg.sender, excessAmount)
+            log PaymentSent(msg.sender, msg.sender, excessAmount)
+
+
 ##### EXTERNAL METHODS - VIEW #####
 
 @view
@@ -749,187 +1018,154 @@ def setMaxPenaltyFee(_erc20TokenContract: address, _fee: uint256):
 def addLiquidation(
     _borrower: address,
     _loanId: uint256,
-    _erc20TokenContract: address
+    _erc20TokenContract: address,
+    _collaterals: DynArray[Collateral, 100] = []
 ):
-    borrowerLoan: Loan = staticcall ILoansCore(self.loansCoreAddresses[_erc20TokenContract]).getLoan(_borrower, _loanId)
-    assert borrowerLoan.defaulted, "loan is not defaulted"
-    assert not staticcall ILiquidationsCore(self.liquidationsCoreAddress).isLoanLiquidated(_borrower, self.loansCoreAddresses[_erc20TokenContract], _loanId), "loan already liquidated"
+    gracePeriodMaturity: uint256 = block.timestamp + self.gracePeriodDuration
 
-    # APR from loan duration (maturity)
-    loanAPR: uint256 = self._computeLoanAPR(borrowerLoan.interest, borrowerLoan.maturity, borrowerLoan.startTime)
-
-    for collateral: Collateral in borrowerLoan.collaterals:
-        assert (staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidationStartTime(collateral.contractAddress, collateral.tokenId)) == 0, "liquidation already exists"
-
-        principal: uint256 = collateral.amount
-        interestAmount: uint256 = self._computeLoanInterestAmount(principal, borrowerLoan.interest)
-
-        gracePeriodPrice: uint256 = self._computeNFTPrice(principal, interestAmount, self.maxPenaltyFee[_erc20TokenContract])
-        unwrappedCollateralAddress: address = self._unwrappedCollateralAddressIfWrapped(collateral.contractAddress)
+    self._addLoanLiquidations(
+        _borrower,
+        _loanId,
+        _erc20TokenContract,
+        _collaterals,
+        self.loansCoreAddresses[_erc20TokenContract],
+        self.liquidationsCoreAddress,
+        self.maxPenaltyFee[_erc20TokenContract],
+        gracePeriodMaturity,
+        gracePeriodMaturity + self.lenderPeriodDuration
+    )
 
-        lid: bytes32 = extcall ILiquidationsCore(self.liquidationsCoreAddress).addLiquidation(
-            collateral.contractAddress,
-            collateral.tokenId,
-            block.timestamp,
-            block.timestamp + self.gracePeriodDuration,
-            block.timestamp + self.gracePeriodDuration + self.lenderPeriodDuration,
-            principal,
-            interestAmount,
-            loanAPR,
-            gracePeriodPrice,
-            gracePeriodPrice,
-            _borrower,
-            _loanId,
-            self.loansCoreAddresses[_erc20TokenContract],
-            _erc20TokenContract
-        )
 
-        log LiquidationAdded(
-            _erc20TokenContract,
-            collateral.contractAddress,
-            lid,
-            collateral.contractAddress,
-            collateral.tokenId,
+@external
+def addLiquidations(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS], _erc20TokenContract: address):
+    """
+    @notice Creates the liquidations for the collaterals of several defaulted loans
+    @dev Logs the `LiquidationAdded` event for each collateral
+    @param _loans The defaulted loans, the collaterals are only required for loans created with a collaterals commitment
+    @param _erc20TokenContract The ERC20 contract of the loans
+    """
+    loansCore: address = self.loansCoreAddresses[_erc20TokenContract]
+    liquidationsCore: address = self.liquidationsCoreAddress
+    maxPenaltyFee: uint256 = self.maxPenaltyFee[_erc20TokenContract]
+    gracePeriodMaturity: uint256 = block.timestamp + self.gracePeriodDuration
+    lenderPeriodMaturity: uint256 = gracePeriodMaturity + self.lenderPeriodDuration
+
+    for loan: LoanCollaterals in _loans:
+        self._addLoanLiquidations(
+            loan.borrower,
+            loan.loanId,
             _erc20TokenContract,
-            gracePeriodPrice,
-            gracePeriodPrice,
-            block.timestamp + self.gracePeriodDuration,
-            block.timestamp + self.gracePeriodDuration + self.lenderPeriodDuration,
-            self.loansCoreAddresses[_erc20TokenContract],
-            _loanId,
-            _borrower
+            loan.collaterals,
+            loansCore,
+            liquidationsCore,
+            maxPenaltyFee,
+            gracePeriodMaturity,
+            lenderPeriodMaturity
         )
 
-    extcall ILiquidationsCore(self.liquidationsCoreAddress).addLoanToLiquidated(_borrower, self.loansCoreAddresses[_erc20TokenContract], _loanId)
-
 
 @payable
 @external
-def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address):
-    receivedAmount: uint256 = msg.value
-    ethPayment: bool = receivedAmount > 0
+def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100] = []):
+    self._payLoanLiquidationsGracePeriod(_loanId, _erc20TokenContract, _collaterals, msg.value)
 
-    loan: Loan = staticcall ILoansCore(self.loansCoreAddresses[_erc20TokenContract]).getLoan(msg.sender, _loanId)
-    assert loan.defaulted, "loan is not defaulted"
-
-    if ethPayment:
-        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
-    paidAmount: uint256 = 0
-
-    for collateral: Collateral in loan.collaterals:
-        liquidation: Liquidation = staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidation(collateral.contractAddress, collateral.tokenId)
-
-        assert block.timestamp <= liquidation.gracePeriodMaturity, "liquidation out of grace period"
-        assert not ethPayment or receivedAmount >= paidAmount + liquidation.gracePeriodPrice, "insufficient value received"
-
-        extcall ILiquidationsCore(self.liquidationsCoreAddress).removeLiquidation(collateral.contractAddress, collateral.tokenId)
-
-        log LiquidationRemoved(
-            liquidation.erc20TokenContract,
-            liquidation.collateralAddress,
-            liquidation.lid,
-            liquidation.collateralAddress,
-            liquidation.tokenId,
-            liquidation.erc20TokenContract,
-            liquidation.loansCoreContract,
-            liquidation.loanId,
-            liquidation.borrower
-        )
 
-        _lendingPoolPeripheral : address = self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]
+@external
+def payLoanLiquidationsGracePeriodWithPermit(
+    _loanId: uint256,
+    _erc20TokenContract: address,
+    _amount: uint256,
+    _deadline: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _collaterals: DynArray[Collateral, 100] = []
+):
 
-        if ethPayment:
-            extcall ILendingPoolPeripheral(_lendingPoolPeripheral).receiveFundsFromLiquidationEth(
-                liquidation.borrower,
-                liquidation.principal,
-                liquidation.gracePeriodPrice - liquidation.principal,
-                True,
-                liquidation.principal,
-                "liquidation_grace_period",
-                value=liquidation.gracePeriodPrice
-            )
-            log PaymentSent(_lendingPoolPeripheral, _lendingPoolPeripheral, liquidation.gracePeriodPrice)
-            paidAmount += liquidation.gracePeriodPrice
+    """
+    @notice Pays the defaulted loan liquidations in the grace period in the pool ERC20, approving it with an EIP-2612 permit signature
+    @dev Logs the `LiquidationRemoved` and `NFTPurchased` events. The permit must approve the associated `LendingPoolCore` contract for at least the grace period price, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call
+    @param _loanId The id of the defaulted loan
+    @param _erc20TokenContract The pool ERC20 token
+    @param _amount The amount approved by the permit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
+    """
 
-        else:
-            extcall ILendingPoolPeripheral(_lendingPoolPeripheral).receiveFundsFromLiquidation(
-                liquidation.borrower,
-                liquidation.principal,
-                liquidation.gracePeriodPrice - liquidation.principal,
-                True,
-                liquidation.principal,
-                "liquidation_grace_period"
-            )
+    lendingPoolCore: address = staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[_erc20TokenContract]).lendingPoolCoreContract()
+    self._permit(_erc20TokenContract, msg.sender, lendingPoolCore, _amount, _deadline, _v, _r, _s)
+    self._payLoanLiquidationsGracePeriod(_loanId, _erc20TokenContract, _collaterals, 0)
 
 
-        extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralAddress).transferCollateralFromLiquidation(
-            msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId
-        )
+@payable
+@external
+def buyNFTLenderPeriod(_collateralAddress: address, _tokenId: uint256):
+    self._buyNFTLenderPeriod(_collateralAddress, _tokenId, msg.value)
 
-        log NFTPurchased(
-            liquidation.erc20TokenContract,
-            collateral.contractAddress,
-            msg.sender,
-            liquidation.lid,
-            collateral.contractAddress,
-            collateral.tokenId,
-            liquidation.gracePeriodPrice,
-            msg.sender,
-            liquidation.erc20TokenContract,
-            liquidation.loansCoreContract,
-            "GRACE_PERIOD"
-        )
 
-    excessAmount: uint256 = receivedAmount - paidAmount
-    if excessAmount > 0:
-        send(msg.sender, excessAmount)
-        log PaymentSent(msg.sender, msg.sender,excessAmount)
+@external
+def buyNFTLenderPeriodWithPermit(_collateralAddress: address, _tokenId: uint256, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+
+    """
+    @notice Buys an NFT in the lenders period in the pool ERC20, approving it with an EIP-2612 permit signature
+    @dev Logs the `LiquidationRemoved` and `NFTPurchased` events. The permit must approve the associated `LendingPoolCore` contract for at least the lenders period price, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call
+    @param _collateralAddress The NFT collection address
+    @param _tokenId The NFT token id
+    @param _amount The amount approved by the permit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    """
+
+    erc20TokenContract: address = (staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidation(_collateralAddress, _tokenId)).erc20TokenContract
+    lendingPoolCore: address = staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[erc20TokenContract]).lendingPoolCoreContract()
+    self._permit(erc20TokenContract, msg.sender, lendingPoolCore, _amount, _deadline, _v, _r, _s)
+    self._buyNFTLenderPeriod(_collateralAddress, _tokenId, 0)
 
 
 @payable
 @external
-def buyNFTLenderPeriod(_collateralAddress: address, _tokenId: uint256):
-    liquidation: Liquidation = staticcall ILiquidationsCore(self.liquidationsCoreAddress).getLiquidation(_collateralAddress, _tokenId)
-    assert block.timestamp > liquidation.gracePeriodMaturity, "liquidation in grace period"
-    assert block.timestamp <= liquidation.lenderPeriodMaturity, "liquidation out of lender period"
-    assert (staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]).lenderFunds(msg.sender)).currentAmountDeposited > 0, "msg.sender is not a lender"
+def buyNFTsLenderPeriod(_collaterals: DynArray[Collateral, 100]):
 
-    lendingPoolPeripheral: address = self.lendingPoolPeripheralAddresses[liquidation.erc20TokenContract]
+    """
+    @notice Buys several NFTs in the lenders period, settling the payment once per lending pool
+    @dev Logs the `LiquidationRemoved` and `NFTPurchased` events for each NFT. If paying in the pool ERC20, the associated `LendingPoolCore` contracts must be approved for the total price of the NFTs of each pool
+    @param _collaterals The NFTs to buy, the `amount` of each collateral is ignored
+    """
 
-    receivedAmount: uint256 = msg.value
-    ethPayment: bool = receivedAmount > 0
-    if ethPayment:
-        assert receivedAmount >= liquidation.lenderPeriodPrice, "insufficient value received"
-        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
-        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidationEth(
-            msg.sender,
-            liquidation.principal,
-            liquidation.lenderPeriodPrice - liquidation.principal,
-            True,
-            liquidation.principal,
-            "liquidation_lenders_period",
-            value=liquidation.lenderPeriodPrice
-        )
-        log PaymentSent(lendingPoolPeripheral, lendingPoolPeripheral, liquidation.lenderPeriodPrice)
-    else:
-        extcall ILendingPoolPeripheral(lendingPoolPeripheral).receiveFundsFromLiquidation(
-            msg.sender,
-            liquidation.principal,
-            liquidation.lenderPeriodPrice - liquidation.principal,
-            True,
-            liquidation.principal,
-            "liquidation_lenders_period"
-        )
+    self._buyNFTsLenderPeriod(_collaterals, msg.value)
 
-    self._removeLiquidationAndTransfer(_collateralAddress, _tokenId, liquidation, "LENDER_PERIOD")
 
-    if ethPayment:
-        excessAmount: uint256 = receivedAmount - liquidation.lenderPeriodPrice
-        if excessAmount > 0:
-            send(msg.sender, excessAmount)
-            log PaymentSent(msg.sender, msg.sender,excessAmount)
+@external
+def buyNFTsLenderPeriodWithPermit(
+    _collaterals: DynArray[Collateral, 100],
+    _erc20TokenContract: address,
+    _amount: uint256,
+    _deadline: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256
+):
+
+    """
+    @notice Buys several NFTs in the lenders period in the pool ERC20, approving it with an EIP-2612 permit signature
+    @dev Logs the `LiquidationRemoved` and `NFTPurchased` events for each NFT. The permit must approve the `LendingPoolCore` contract of the `_erc20TokenContract` pool for at least the total price of its NFTs, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call. NFTs of other pools need their `LendingPoolCore` contracts approved beforehand
+    @param _collaterals The NFTs to buy, the `amount` of each collateral is ignored
+    @param _erc20TokenContract The ERC20 token of the permit
+    @param _amount The amount approved by the permit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    """
+
+    lendingPoolCore: address = staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralAddresses[_erc20TokenContract]).lendingPoolCoreContract()
+    self._permit(_erc20TokenContract, msg.sender, lendingPoolCore, _amount, _deadline, _v, _r, _s)
+    self._buyNFTsLenderPeriod(_collaterals, 0)
 
 
 @external
@@ -31,6 +31,12 @@ struct InvestorLock:
     lockPeriodEnd: uint256
     lockPeriodAmount: uint256
 
+struct LenderLimits:
+    maxPoolShareEnabled: bool
+    maxPoolShare: uint256
+    lockPeriodEnabled: bool
+    lockPeriodDuration: uint256
+
 # Events
 
 event MaxPoolShareFlagChanged:
@@ -76,6 +82,29 @@ maxCollectionBorrowableAmountEnabled: public(bool)
 
 ##### INTERNAL METHODS - VIEW #####
 
+@view
+@internal
+def _withinLoansPoolShareLimit(_borrower: address, _amount: uint256, _loansCoreContractAddress: address, _lpPeripheralContractAddress: address) -> bool:
+    if not self.maxLoansPoolShareEnabled:
+        return True
+
+    borrowedAmount: uint256 = staticcall ILoansCore(_loansCoreContractAddress).borrowedAmount(_borrower)
+    fundsInvestable: uint256 = staticcall ILendingPoolPeripheral(_lpPeripheralContractAddress).theoreticalMaxFundsInvestable()
+
+    return (borrowedAmount + _amount) * 10000 // fundsInvestable <= self.maxLoansPoolShare
+
+
+@view
+@internal
+def _withinCollectionShareLimit(_amount: uint256, _collectionAddress: address, _loansCoreContractAddress: address) -> bool:
+    maxCollectionBorrowableAmount: uint256 = self.maxCollectionBorrowableAmount[_collectionAddress]
+    if maxCollectionBorrowableAmount == 0:
+        return True
+
+    collectionBorrowedAmount: uint256 = staticcall ILoansCore(_loansCoreContractAddress).collectionsBorrowedAmount(_collectionAddress)
+
+    return collectionBorrowedAmount + _amount <= maxCollectionBorrowableAmount
+
 
 ##### INTERNAL METHODS - WRITE #####
 
@@ -102,13 +131,7 @@ def withinPoolShareLimit(_lender: address, _amount: uint256, _lpPeripheralContra
 @view
 @external
 def withinLoansPoolShareLimit(_borrower: address, _amount: uint256, _loansCoreContractAddress: address, _lpPeripheralContractAddress: address) -> bool:
-    if not self.maxLoansPoolShareEnabled:
-        return True
-
-    borrowedAmount: uint256 = staticcall ILoansCore(_loansCoreContractAddress).borrowedAmount(_borrower)
-    fundsInvestable: uint256 = staticcall ILendingPoolPeripheral(_lpPeripheralContractAddress).theoreticalMaxFundsInvestable()
-
-    return (borrowedAmount + _amount) * 10000 // fundsInvestable <= self.maxLoansPoolShare
+    return self._withinLoansPoolShareLimit(_borrower, _amount, _loansCoreContractAddress, _lpPeripheralContractAddress)
 
 
 @view
@@ -127,12 +150,49 @@ def withinCollectionShareLimit(_amount: uint256, _collectionAddress: address, _l
     if not self.maxCollectionBorrowableAmountEnabled:
         return True
 
-    if self.maxCollectionBorrowableAmount[_collectionAddress] == 0:
-        return True
+    return self._withinCollectionShareLimit(_amount, _collectionAddress, _loansCoreContractAddress)
 
-    collectionBorrowedAmount: uint256 = staticcall ILoansCore(_loansCoreContractAddress).collectionsBorrowedAmount(_collectionAddress)
 
-    return collectionBorrowedAmount + _amount <= self.maxCollectionBorrowableAmount[_collectionAddress]
+@view
+@external
+def lenderLimits() -> LenderLimits:
+    """
+    @notice Returns every parameter applicable to lender deposits and withdrawals in a single call
+    """
+    return LenderLimits(
+        maxPoolShareEnabled=self.maxPoolShareEnabled,
+        maxPoolShare=self.maxPoolShare,
+        lockPeriodEnabled=self.lockPeriodEnabled,
+        lockPeriodDuration=self.lockPeriodDuration
+    )
+
+
+@view
+@external
+def checkReserveLimits(
+    _borrower: address,
+    _amount: uint256,
+    _collections: DynArray[address, 100],
+    _amounts: DynArray[uint256, 100],
+    _loansCoreContractAddress: address,
+    _lpPeripheralContractAddress: address
+) -> (bool, bool):
+    """
+    @notice Evaluates every limit applicable to a new loan in a single call
+    @dev `_collections` and `_amounts` are the loan amounts aggregated per collection, with matching indexes
+    """
+    assert len(_collections) == len(_amounts), "collections and amounts differ"
+
+    withinLoansPoolShare: bool = self._withinLoansPoolShareLimit(_borrower, _amount, _loansCoreContractAddress, _lpPeripheralContractAddress)
+
+    if not self.maxCollectionBorrowableAmountEnabled:
+        return withinLoansPoolShare, True
+
+    for i: uint256 in range(len(_collections), bound=100):
+        if not self._withinCollectionShareLimit(_amounts[i], _collections[i], _loansCoreContractAddress):
+            return withinLoansPoolShare, False
+
+    return withinLoansPoolShare, True
 
 
 ##### EXTERNAL METHODS - NON-VIEW #####
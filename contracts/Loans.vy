@@ -14,34 +14,28 @@ from ethereum.ercs import IERC20
 
 interface ILoansCore:
     def isLoanCreated(_borrower: address, _loanId: uint256) -> bool: view
-    def isLoanStarted(_borrower: address, _loanId: uint256) -> bool: view
-    def getLoan(_borrower: address, _loanId: uint256) -> Loan: view
-    def addCollateralToLoan(_borrower: address, _collateral: Collateral, _loanId: uint256): nonpayable
-    def removeCollateralFromLoan(_borrower: address, _collateral: Collateral, _loanId: uint256): nonpayable
-    def updateCollaterals(_collateral: Collateral, _toRemove: bool): nonpayable
-    def addLoan(_borrower: address, _amount: uint256, _interest: uint256, _maturity: uint256, _collaterals: DynArray[Collateral, 100]) -> uint256: nonpayable
-    def updateLoanStarted(_borrower: address, _loanId: uint256): nonpayable
-    def updateLoanPaidAmount(_borrower: address, _loanId: uint256, _paidPrincipal: uint256, _paidInterestAmount: uint256): nonpayable
-    def updatePaidLoan(_borrower: address, _loanId: uint256): nonpayable
-    def updateDefaultedLoan(_borrower: address, _loanId: uint256): nonpayable
-    def updateHighestSingleCollateralLoan(_borrower: address, _loanId: uint256): nonpayable
-    def updateHighestCollateralBundleLoan(_borrower: address, _loanId: uint256): nonpayable
-    def updateHighestRepayment(_borrower: address, _loanId: uint256): nonpayable
-    def updateHighestDefaultedLoan(_borrower: address, _loanId: uint256): nonpayable
+    def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader: view
+    def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collateral, 100]: view
+    def startLoan(_borrower: address, _amount: uint256, _interest: uint256, _maturity: uint256, _collaterals: DynArray[Collateral, 100]) -> uint256: nonpayable
+    def closeLoan(_borrower: address, _loanId: uint256, _paidPrincipal: uint256, _paidInterestAmount: uint256, _collaterals: DynArray[Collateral, 100]): nonpayable
+    def defaultLoan(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]): nonpayable
 
 interface ICollateralVaultPeripheral:
-    def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _createDelegation: bool): nonpayable
-    def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address): nonpayable
+    def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool): nonpayable
+    def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address): nonpayable
     def isCollateralApprovedForVault(_borrower: address, _collateralAddress: address, _tokenId: uint256) -> bool: view
     def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool): nonpayable
+    def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool): nonpayable
 
 interface ILiquidityControls:
-    def withinLoansPoolShareLimit(_borrower: address, _amount: uint256, _loansCoreContractAddress: address, _lpPeripheralContractAddress: address) -> bool: view
-    def withinCollectionShareLimit(_amount: uint256, _collectionAddress: address, _loansCoreContractAddress: address, _lpCoreContractAddress: address) -> bool: view
+    def checkReserveLimits(_borrower: address, _amount: uint256, _collections: DynArray[address, 100], _amounts: DynArray[uint256, 100], _loansCoreContractAddress: address, _lpPeripheralContractAddress: address) -> (bool, bool): view
 
 interface IERC20Symbol:
     def symbol() -> String[100]: view
 
+interface IERC20Permit:
+    def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32): nonpayable
+
 interface ILendingPoolPeripheral:
     def maxFundsInvestable() -> uint256: view
     def erc20TokenContract() -> address: view
@@ -49,10 +43,13 @@ interface ILendingPoolPeripheral:
     def sendFunds(_to: address, _amount: uint256): nonpayable
     def receiveFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256): payable
     def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256): payable
+    def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256): payable
+    def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256): nonpayable
     def lendingPoolCoreContract() -> address: view
 
 interface ILiquidationsPeripheral:
-    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address): nonpayable
+    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]): nonpayable
+    def addLiquidations(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS], _erc20TokenContract: address): nonpayable
 
 # Structs
 
@@ -61,21 +58,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256 # parts per 10000, e.g. 2.5% is represented by 250 parts per 10000
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 
 struct EIP712Domain:
     name: String[100]
@@ -179,6 +181,13 @@ event LoanDefaulted:
     amount: uint256
     erc20TokenContract: address
 
+event LoanRefinanced:
+    walletIndexed: indexed(address)
+    wallet: address
+    loanId: uint256
+    newLoanId: uint256
+    erc20TokenContract: address
+
 event PaymentSent:
     walletIndexed: indexed(address)
     wallet: address
@@ -209,7 +218,10 @@ liquidityControlsContract: public(address)
 genesisContract: public(address)
 isPayable: public(bool)
 
-collectionsAmount: HashMap[address, uint256] # aux variable
+# resolved from lendingPoolPeripheralContract, refreshed by setLendingPoolPeripheralAddress
+erc20TokenContract: public(address)
+lendingPoolCoreContract: public(address)
+erc20TokenSymbol: public(String[100])
 
 ZHARTA_DOMAIN_NAME: constant(String[6]) = "Zharta"
 ZHARTA_DOMAIN_VERSION: constant(String[1]) = "1"
@@ -226,6 +238,7 @@ reserve_message_typehash: bytes32
 reserve_sig_domain_separator: bytes32
 
 MINIMUM_INTEREST_PERIOD: constant(uint256) = 604800  # 7 days
+MAX_BATCH_LOANS: constant(uint256) = 10
 
 
 @deploy
@@ -246,7 +259,7 @@ def __init__(
     self.admin = msg.sender
     self.interestAccrualPeriod = _interestAccrualPeriod
     self.loansCoreContract = _loansCoreContract
-    self.lendingPoolPeripheralContract = _lendingPoolPeripheralContract
+    self._setLendingPoolPeripheral(_lendingPoolPeripheralContract)
     self.collateralVaultPeripheralContract = _collateralVaultPeripheralContract
     self.genesisContract = _genesisContract
     self.isAcceptingLoans = True
@@ -263,6 +276,20 @@ def __init__(
     )
 
 
+@internal
+def _permit(_erc20TokenContract: address, _owner: address, _spender: address, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    if staticcall IERC20(_erc20TokenContract).allowance(_owner, _spender) < _amount:
+        extcall IERC20Permit(_erc20TokenContract).permit(_owner, _spender, _amount, _deadline, convert(_v, uint8), convert(_r, bytes32), convert(_s, bytes32))
+
+
+@internal
+def _setLendingPoolPeripheral(_address: address):
+    self.lendingPoolPeripheralContract = _address
+    self.erc20TokenContract = staticcall ILendingPoolPeripheral(_address).erc20TokenContract()
+    self.lendingPoolCoreContract = staticcall ILendingPoolPeripheral(_address).lendingPoolCoreContract()
+    self.erc20TokenSymbol = staticcall IERC20Symbol(self.erc20TokenContract).symbol()
+
+
 @pure
 @internal
 def _collateralsAmounts(_collaterals: DynArray[Collateral, 100]) -> uint256:
@@ -273,29 +300,45 @@ def _collateralsAmounts(_collaterals: DynArray[Collateral, 100]) -> uint256:
     return sumAmount
 
 
+@pure
 @internal
-def _withinCollectionShareLimit(_collaterals: DynArray[Collateral, 100]) -> bool:
-    collections: DynArray[address, 100] = empty(DynArray[address, 100])
-
+def _collectionsAmounts(_collaterals: DynArray[Collateral, 100]) -> (DynArray[address, 100], DynArray[uint256, 100]):
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
     for collateral: Collateral in _collaterals:
-        if collateral.contractAddress not in collections:
+        found: bool = False
+        for i: uint256 in range(len(collections), bound=100):
+            if collections[i] == collateral.contractAddress:
+                amounts[i] += collateral.amount
+                found = True
+                break
+        if not found:
             collections.append(collateral.contractAddress)
-            self.collectionsAmount[collateral.contractAddress] = 0
+            amounts.append(collateral.amount)
+    return collections, amounts
 
-        self.collectionsAmount[collateral.contractAddress] += collateral.amount
 
-    for collection: address in collections:
-        result: bool = staticcall ILiquidityControls(self.liquidityControlsContract).withinCollectionShareLimit(
-            self.collectionsAmount[collection],
-            collection,
-            self.loansCoreContract,
-            staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).lendingPoolCoreContract()
-        )
-        if not result:
-            return False
+@view
+@internal
+def _loanCollaterals(_borrower: address, _loanId: uint256, _loan: LoanHeader, _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    if _loan.collateralsHash == empty(bytes32):
+        return staticcall ILoansCore(self.loansCoreContract).getLoanCollaterals(_borrower, _loanId)
+
+    assert keccak256(_abi_encode(_collaterals)) == _loan.collateralsHash, "collaterals do not match loan"
+    return _collaterals
 
+
+@pure
+@internal
+def _sameCollaterals(_collaterals: DynArray[Collateral, 100], _otherCollaterals: DynArray[Collateral, 100]) -> bool:
+    if len(_collaterals) != len(_otherCollaterals):
+        return False
+    for i: uint256 in range(len(_collaterals), bound=100):
+        if _collaterals[i].contractAddress != _otherCollaterals[i].contractAddress or _collaterals[i].tokenId != _otherCollaterals[i].tokenId:
+            return False
     return True
 
+
 @pure
 @internal
 def _loanPayableAmount(
@@ -309,12 +352,65 @@ def _loanPayableAmount(
     return (_amount - _paidAmount) * (10000 * _maxLoanDuration + _interest * (max(_timePassed + _interestAccrualPeriod, MINIMUM_INTEREST_PERIOD))) // (10000 * _maxLoanDuration)
 
 
+@view
+@internal
+def _loanPaymentAmount(_loan: LoanHeader) -> uint256:
+    # compute days passed in seconds
+    timePassed: uint256 = self._computePeriodPassedInSeconds(
+        block.timestamp,
+        _loan.startTime,
+        self.interestAccrualPeriod
+    )
+
+    # pro-rata computation of max amount payable based on actual loan duration in days
+    return self._loanPayableAmount(
+        _loan.amount,
+        _loan.paidPrincipal,
+        _loan.interest,
+        _loan.maturity - _loan.startTime,
+        timePassed,
+        self.interestAccrualPeriod
+    )
+
+
 @pure
 @internal
 def _computePeriodPassedInSeconds(_recentTimestamp: uint256, _olderTimestamp: uint256, _period: uint256) -> uint256:
     return (_recentTimestamp - _olderTimestamp) - ((_recentTimestamp - _olderTimestamp) % _period)
 
 
+@view
+@internal
+def _activeLoan(_loanId: uint256) -> LoanHeader:
+    loan: LoanHeader = staticcall ILoansCore(self.loansCoreContract).getLoanHeader(msg.sender, _loanId)
+    assert loan.started, "loan not found"
+    assert block.timestamp <= loan.maturity, "loan maturity reached"
+    assert not loan.paid, "loan already paid"
+    return loan
+
+
+@internal
+def _closeLoan(_loanId: uint256, _loan: LoanHeader, _paidInterestAmount: uint256, _collaterals: DynArray[Collateral, 100]):
+    erc20TokenContract: address = self.erc20TokenContract
+    extcall ILoansCore(self.loansCoreContract).closeLoan(msg.sender, _loanId, _loan.amount, _paidInterestAmount, _collaterals)
+
+    log LoanPayment(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        _loan.amount,
+        _paidInterestAmount,
+        erc20TokenContract
+    )
+
+    log LoanPaid(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        erc20TokenContract
+    )
+
+
 @internal
 def _recoverReserveSigner(
     _borrower: address,
@@ -368,22 +464,34 @@ def _reserve(
     _genesisToken: uint256,
     _v: uint256,
     _r: uint256,
-    _s: uint256
+    _s: uint256,
+    _refinancing: bool,
+    _returnedAmount: uint256
 ) -> uint256:
+    # _returnedAmount is the principal paid back to the pool in the same transaction, when refinancing
     assert not self.isDeprecated, "contract is deprecated"
     assert self.isAcceptingLoans, "contract is not accepting loans"
     assert block.timestamp < _maturity, "maturity is in the past"
     assert block.timestamp <= _deadline, "deadline has passed"
     assert self._collateralsAmounts(_collaterals) == _amount, "amount in collats != than amount"
-    assert (staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).maxFundsInvestable()) >= _amount, "insufficient liquidity"
+    assert (staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).maxFundsInvestable()) + _returnedAmount >= _amount, "insufficient liquidity"
 
-    assert staticcall ILiquidityControls(self.liquidityControlsContract).withinLoansPoolShareLimit(
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
+    collections, amounts = self._collectionsAmounts(_collaterals)
+
+    withinLoansPoolShare: bool = False
+    withinCollectionShare: bool = False
+    withinLoansPoolShare, withinCollectionShare = staticcall ILiquidityControls(self.liquidityControlsContract).checkReserveLimits(
         msg.sender,
         _amount,
+        collections,
+        amounts,
         self.loansCoreContract,
         self.lendingPoolPeripheralContract
-    ), "max loans pool share surpassed"
-    assert self._withinCollectionShareLimit(_collaterals), "max collection share surpassed"
+    )
+    assert withinLoansPoolShare, "max loans pool share surpassed"
+    assert withinCollectionShare, "max collection share surpassed"
 
     assert not staticcall ILoansCore(self.loansCoreContract).isLoanCreated(msg.sender, _nonce), "loan already created"
     if _nonce > 0:
@@ -394,7 +502,7 @@ def _reserve(
 
     assert _genesisToken == 0 or staticcall IERC721(self.genesisContract).ownerOf(_genesisToken) == msg.sender, "genesisToken not owned"
 
-    newLoanId: uint256 = extcall ILoansCore(self.loansCoreContract).addLoan(
+    newLoanId: uint256 = extcall ILoansCore(self.loansCoreContract).startLoan(
         msg.sender,
         _amount,
         _interest,
@@ -402,15 +510,20 @@ def _reserve(
         _collaterals
     )
 
-    for collateral: Collateral in _collaterals:
-        extcall ILoansCore(self.loansCoreContract).addCollateralToLoan(msg.sender, collateral, newLoanId)
-        extcall ILoansCore(self.loansCoreContract).updateCollaterals(collateral, False)
-
-        extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).storeCollateral(
+    erc20TokenContract: address = self.erc20TokenContract
+    if not _refinancing:
+        extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).storeCollaterals(
             msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId,
-            staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+            _collaterals,
+            erc20TokenContract,
+            _delegations
+        )
+    else:
+        # the collaterals are already in the vault, their delegations may have been set by the previous loan
+        extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).setCollateralDelegations(
+            msg.sender,
+            _collaterals,
+            erc20TokenContract,
             _delegations
         )
 
@@ -418,7 +531,7 @@ def _reserve(
         msg.sender,
         msg.sender,
         newLoanId,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        erc20TokenContract,
         _interest * 365 * 86400 // (_maturity - block.timestamp),
         _amount,
         _maturity - block.timestamp,
@@ -426,13 +539,50 @@ def _reserve(
         _genesisToken
     )
 
-    extcall ILoansCore(self.loansCoreContract).updateLoanStarted(msg.sender, newLoanId)
-    extcall ILoansCore(self.loansCoreContract).updateHighestSingleCollateralLoan(msg.sender, newLoanId)
-    extcall ILoansCore(self.loansCoreContract).updateHighestCollateralBundleLoan(msg.sender, newLoanId)
-
     return newLoanId
 
 
+@internal
+def _refinance(
+    _loanId: uint256,
+    _amount: uint256,
+    _interest: uint256,
+    _maturity: uint256,
+    _collaterals: DynArray[Collateral, 100],
+    _delegations: bool,
+    _deadline: uint256,
+    _nonce: uint256,
+    _genesisToken: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _loanCollaterals: DynArray[Collateral, 100]
+) -> (uint256, uint256, uint256):
+    loan: LoanHeader = self._activeLoan(_loanId)
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(msg.sender, _loanId, loan, _loanCollaterals)
+    assert self._sameCollaterals(collaterals, _collaterals), "collaterals do not match loan"
+
+    paymentAmount: uint256 = self._loanPaymentAmount(loan)
+    paidInterestAmount: uint256 = paymentAmount - loan.amount
+    erc20TokenContract: address = self.erc20TokenContract
+
+    # the collaterals stay in the vault, to be used by the new loan
+    self._closeLoan(_loanId, loan, paidInterestAmount, collaterals)
+
+    # limits are checked with the previous loan already closed, as its principal is settled in the same transaction
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, True, loan.amount)
+
+    log LoanRefinanced(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        newLoanId,
+        erc20TokenContract
+    )
+
+    return newLoanId, loan.amount, paidInterestAmount
+
+
 @external
 def proposeOwner(_address: address):
     assert msg.sender == self.owner, "msg.sender is not the owner"
@@ -447,7 +597,7 @@ def proposeOwner(_address: address):
         _address,
         self.owner,
         _address,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
 
@@ -460,7 +610,7 @@ def claimOwnership():
         self.proposedOwner,
         self.owner,
         self.proposedOwner,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
     self.owner = self.proposedOwner
@@ -478,10 +628,10 @@ def changeInterestAccrualPeriod(_value: uint256):
     assert _value != self.interestAccrualPeriod, "_value is the same"
 
     log InterestAccrualPeriodChanged(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         self.interestAccrualPeriod,
         _value,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
     self.interestAccrualPeriod = _value
@@ -494,13 +644,13 @@ def setLendingPoolPeripheralAddress(_address: address):
     assert self.lendingPoolPeripheralContract != _address, "new LPPeriph addr is the same"
 
     log LendingPoolPeripheralAddressSet(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         self.lendingPoolPeripheralContract,
         _address,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
-    self.lendingPoolPeripheralContract = _address
+    self._setLendingPoolPeripheral(_address)
 
 
 @external
@@ -510,10 +660,10 @@ def setCollateralVaultPeripheralAddress(_address: address):
     assert self.collateralVaultPeripheralContract != _address, "new LPCore addr is the same"
 
     log CollateralVaultPeripheralAddressSet(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         self.collateralVaultPeripheralContract,
         _address,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
     self.collateralVaultPeripheralContract = _address
@@ -526,10 +676,10 @@ def setLiquidationsPeripheralAddress(_address: address):
     assert self.liquidationsPeripheralContract != _address, "new LPCore addr is the same"
 
     log LiquidationsPeripheralAddressSet(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         self.liquidationsPeripheralContract,
         _address,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
     self.liquidationsPeripheralContract = _address
@@ -542,10 +692,10 @@ def setLiquidityControlsAddress(_address: address):
     assert _address != self.liquidityControlsContract, "new value is the same"
 
     log LiquidityControlsAddressSet(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         self.liquidityControlsContract,
         _address,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
     self.liquidityControlsContract = _address
@@ -559,9 +709,9 @@ def changeContractStatus(_flag: bool):
     self.isAcceptingLoans = _flag
 
     log ContractStatusChanged(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+        self.erc20TokenContract,
         _flag,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
 
@@ -574,21 +724,15 @@ def deprecate():
     self.isAcceptingLoans = False
 
     log ContractDeprecated(
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract,
+        self.erc20TokenContract
     )
 
 
-@view
-@external
-def erc20TokenSymbol() -> String[100]:
-    return staticcall IERC20Symbol(staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()).symbol()
-
-
 @view
 @external
 def getLoanPayableAmount(_borrower: address, _loanId: uint256, _timestamp: uint256) -> uint256:
-    loan: Loan = staticcall ILoansCore(self.loansCoreContract).getLoan(_borrower, _loanId)
+    loan: LoanHeader = staticcall ILoansCore(self.loansCoreContract).getLoanHeader(_borrower, _loanId)
 
     if loan.paid:
         return 0
@@ -644,7 +788,7 @@ def reserve(
     @return The loan id
     """
 
-    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s)
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, False, 0)
 
     extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).sendFunds(
         msg.sender,
@@ -684,7 +828,7 @@ def reserveEth(
     @return The loan id
     """
 
-    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s)
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, False, 0)
 
     extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).sendFundsEth(
         msg.sender,
@@ -696,42 +840,90 @@ def reserveEth(
 
 @payable
 @external
-def pay(_loanId: uint256):
-
+def refinance(
+    _loanId: uint256,
+    _amount: uint256,
+    _interest: uint256,
+    _maturity: uint256,
+    _collaterals: DynArray[Collateral, 100],
+    _delegations: bool,
+    _deadline: uint256,
+    _nonce: uint256,
+    _genesisToken: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _loanCollaterals: DynArray[Collateral, 100] = []
+) -> uint256:
     """
-    @notice Closes an active loan by paying the full amount
-    @dev Logs the `LoanPayment` and `LoanPaid` events. The associated `LendingPoolCore` contract must be approved for the payment amount
-    @param _loanId The id of the loan to settle
+    @notice Pays an active loan and creates a new one over the same collaterals, which are kept in the vault. The new loan message must be signed by the contract admin.
+    @dev Logs the `LoanPayment`, `LoanPaid`, `LoanCreated` and `LoanRefinanced` events. Only the difference between the payment amount and the new loan amount is transferred. For ETH loans the difference owed must be sent as value and any excess is returned, otherwise the associated `LendingPoolCore` contract must be approved for it
+    @param _loanId The id of the loan to refinance
+    @param _amount The new loan amount in wei
+    @param _interest The new loan interest rate in bps (1/1000) for the loan duration
+    @param _maturity The new loan maturity in unix epoch format
+    @param _collaterals The collaterals of the loan being refinanced, their amounts may change
+    @param _delegations Wether to set the requesting wallet as a delegate for all collaterals
+    @param _deadline The deadline of validity for the signed message in unix epoch format
+    @param _genesisToken The optional Genesis Pass token used to determine the loan conditions, must be > 0
+    @param _v recovery id for public key recover
+    @param _r r value in ECDSA signature
+    @param _s s value in ECDSA signature
+    @param _loanCollaterals The collaterals of the loan being refinanced, only required if it was created with a collaterals commitment
+    @return The new loan id
     """
 
     receivedAmount: uint256 = msg.value
     if not self.isPayable:
         assert receivedAmount == 0, "no ETH allowed for this loan"
 
-    assert staticcall ILoansCore(self.loansCoreContract).isLoanStarted(msg.sender, _loanId), "loan not found"
+    newLoanId: uint256 = 0
+    paidPrincipal: uint256 = 0
+    paidInterestAmount: uint256 = 0
+    newLoanId, paidPrincipal, paidInterestAmount = self._refinance(_loanId, _amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, _loanCollaterals)
 
-    loan: Loan = staticcall ILoansCore(self.loansCoreContract).getLoan(msg.sender, _loanId)
-    assert block.timestamp <= loan.maturity, "loan maturity reached"
-    assert not loan.paid, "loan already paid"
+    dueAmount: uint256 = 0
+    if paidPrincipal + paidInterestAmount > _amount:
+        dueAmount = paidPrincipal + paidInterestAmount - _amount
 
-    # compute days passed in seconds
-    timePassed: uint256 = self._computePeriodPassedInSeconds(
-        block.timestamp,
-        loan.startTime,
-        self.interestAccrualPeriod
-    )
+    if not self.isPayable:
+        if dueAmount > 0:
+            erc20TokenContract: address = self.erc20TokenContract
+            assert staticcall IERC20(erc20TokenContract).balanceOf(msg.sender) >= dueAmount, "insufficient balance"
+            assert (staticcall IERC20(erc20TokenContract).allowance(
+                    msg.sender,
+                    self.lendingPoolCoreContract
+            )) >= dueAmount, "insufficient allowance"
+        extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).refinanceFunds(msg.sender, paidPrincipal, paidInterestAmount, _amount)
+        return newLoanId
+
+    assert receivedAmount >= dueAmount, "insufficient value received"
+    if receivedAmount > 0:
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
 
-    # pro-rata computation of max amount payable based on actual loan duration in days
-    paymentAmount: uint256 = self._loanPayableAmount(
-        loan.amount,
-        loan.paidPrincipal,
-        loan.interest,
-        loan.maturity - loan.startTime,
-        timePassed,
-        self.interestAccrualPeriod
-    )
+    extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).refinanceFundsEth(msg.sender, paidPrincipal, paidInterestAmount, _amount, value=dueAmount)
+    if dueAmount > 0:
+        log PaymentSent(self.lendingPoolPeripheralContract, self.lendingPoolPeripheralContract, dueAmount)
 
-    erc20TokenContract: address = staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+    if receivedAmount > dueAmount:
+        send(msg.sender, receivedAmount - dueAmount)
+        log PaymentSent(msg.sender, msg.sender, receivedAmount - dueAmount)
+
+    return newLoanId
+
+
+@internal
+def _pay(_loanId: uint256, _collaterals: DynArray[Collateral, 100], _receivedAmount: uint256):
+    receivedAmount: uint256 = _receivedAmount
+    if not self.isPayable:
+        assert receivedAmount == 0, "no ETH allowed for this loan"
+
+    loan: LoanHeader = self._activeLoan(_loanId)
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(msg.sender, _loanId, loan, _collaterals)
+
+    paymentAmount: uint256 = self._loanPaymentAmount(loan)
+
+    erc20TokenContract: address = self.erc20TokenContract
     excessAmount: uint256 = 0
 
     if receivedAmount > 0:
@@ -742,14 +934,12 @@ def pay(_loanId: uint256):
         assert staticcall IERC20(erc20TokenContract).balanceOf(msg.sender) >= paymentAmount, "insufficient balance"
         assert (staticcall IERC20(erc20TokenContract).allowance(
                 msg.sender,
-                staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).lendingPoolCoreContract()
+                self.lendingPoolCoreContract
         )) >= paymentAmount, "insufficient allowance"
 
     paidInterestAmount: uint256 = paymentAmount - loan.amount
 
-    extcall ILoansCore(self.loansCoreContract).updateLoanPaidAmount(msg.sender, _loanId, loan.amount, paidInterestAmount)
-    extcall ILoansCore(self.loansCoreContract).updatePaidLoan(msg.sender, _loanId)
-    extcall ILoansCore(self.loansCoreContract).updateHighestRepayment(msg.sender, _loanId)
+    self._closeLoan(_loanId, loan, paidInterestAmount, collaterals)
 
     if receivedAmount > 0:
         extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).receiveFundsEth(msg.sender, loan.amount, paidInterestAmount, value=paymentAmount)
@@ -757,65 +947,188 @@ def pay(_loanId: uint256):
     else:
         extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).receiveFunds(msg.sender, loan.amount, paidInterestAmount)
 
-    for collateral: Collateral in loan.collaterals:
-        extcall ILoansCore(self.loansCoreContract).removeCollateralFromLoan(msg.sender, collateral, _loanId)
-        extcall ILoansCore(self.loansCoreContract).updateCollaterals(collateral, True)
-
-        extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).transferCollateralFromLoan(
-            msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId,
-            erc20TokenContract
-        )
+    extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).transferCollateralsFromLoan(msg.sender, collaterals, erc20TokenContract)
 
     if excessAmount > 0:
         send(msg.sender, excessAmount)
         log PaymentSent(msg.sender, msg.sender,excessAmount)
 
-    log LoanPayment(
-        msg.sender,
-        msg.sender,
-        _loanId,
-        loan.amount,
-        paidInterestAmount,
-        erc20TokenContract
-    )
 
-    log LoanPaid(
-        msg.sender,
-        msg.sender,
-        _loanId,
-        erc20TokenContract
-    )
+@payable
+@external
+def pay(_loanId: uint256, _collaterals: DynArray[Collateral, 100] = []):
+
+    """
+    @notice Closes an active loan by paying the full amount
+    @dev Logs the `LoanPayment` and `LoanPaid` events. The associated `LendingPoolCore` contract must be approved for the payment amount
+    @param _loanId The id of the loan to settle
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
+    """
+
+    self._pay(_loanId, _collaterals, msg.value)
 
 
 @external
-def settleDefault(_borrower: address, _loanId: uint256):
+def payWithPermit(_loanId: uint256, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256, _collaterals: DynArray[Collateral, 100] = []):
+
+    """
+    @notice Closes an active loan by paying the full amount in the pool ERC20, approving it with an EIP-2612 permit signature
+    @dev Logs the `LoanPayment` and `LoanPaid` events. The permit must approve the associated `LendingPoolCore` contract for at least the payment amount, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call
+    @param _loanId The id of the loan to settle
+    @param _amount The amount approved by the permit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
+    """
+
+    self._permit(self.erc20TokenContract, msg.sender, self.lendingPoolCoreContract, _amount, _deadline, _v, _r, _s)
+    self._pay(_loanId, _collaterals, 0)
+
+
+@internal
+def _payMany(_loanIds: DynArray[uint256, MAX_BATCH_LOANS], _collaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS], _receivedAmount: uint256):
+    assert len(_loanIds) > 0, "no loans to pay"
+    assert len(_collaterals) == 0 or len(_collaterals) == len(_loanIds), "collaterals length mismatch"
+
+    receivedAmount: uint256 = _receivedAmount
+    if not self.isPayable:
+        assert receivedAmount == 0, "no ETH allowed for this loan"
+
+    loans: DynArray[LoanHeader, MAX_BATCH_LOANS] = []
+    paymentAmounts: DynArray[uint256, MAX_BATCH_LOANS] = []
+    paidLoanIds: DynArray[uint256, MAX_BATCH_LOANS] = []
+    totalPrincipal: uint256 = 0
+    totalPaymentAmount: uint256 = 0
+
+    for loanId: uint256 in _loanIds:
+        assert loanId not in paidLoanIds, "duplicated loan id"
+        loan: LoanHeader = self._activeLoan(loanId)
+
+        paymentAmount: uint256 = self._loanPaymentAmount(loan)
+        loans.append(loan)
+        paymentAmounts.append(paymentAmount)
+        paidLoanIds.append(loanId)
+        totalPrincipal += loan.amount
+        totalPaymentAmount += paymentAmount
+
+    erc20TokenContract: address = self.erc20TokenContract
+    excessAmount: uint256 = 0
+
+    if receivedAmount > 0:
+        assert receivedAmount >= totalPaymentAmount, "insufficient value received"
+        excessAmount = receivedAmount - totalPaymentAmount
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+    else:
+        assert staticcall IERC20(erc20TokenContract).balanceOf(msg.sender) >= totalPaymentAmount, "insufficient balance"
+        assert (staticcall IERC20(erc20TokenContract).allowance(
+                msg.sender,
+                self.lendingPoolCoreContract
+        )) >= totalPaymentAmount, "insufficient allowance"
+
+    # the loans are closed first and the collaterals of all of them are released after the payment
+    releasedCollaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS] = []
+    for i: uint256 in range(len(_loanIds), bound=MAX_BATCH_LOANS):
+        loanId: uint256 = _loanIds[i]
+        loan: LoanHeader = loans[i]
+        paidInterestAmount: uint256 = paymentAmounts[i] - loan.amount
+
+        loanCollaterals: DynArray[Collateral, 100] = []
+        if len(_collaterals) > 0:
+            loanCollaterals = _collaterals[i]
+        collaterals: DynArray[Collateral, 100] = self._loanCollaterals(msg.sender, loanId, loan, loanCollaterals)
+
+        self._closeLoan(loanId, loan, paidInterestAmount, collaterals)
+
+        releasedCollaterals.append(collaterals)
+
+    if receivedAmount > 0:
+        extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).receiveFundsEth(msg.sender, totalPrincipal, totalPaymentAmount - totalPrincipal, value=totalPaymentAmount)
+        log PaymentSent(self.lendingPoolPeripheralContract, self.lendingPoolPeripheralContract, totalPaymentAmount)
+    else:
+        extcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).receiveFunds(msg.sender, totalPrincipal, totalPaymentAmount - totalPrincipal)
+
+    # the vault takes up to 100 collaterals per call, so the loans' collaterals are released in batches of that size
+    batch: DynArray[Collateral, 100] = []
+    for released: DynArray[Collateral, 100] in releasedCollaterals:
+        if len(batch) + len(released) > 100:
+            extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).transferCollateralsFromLoan(msg.sender, batch, erc20TokenContract)
+            batch = []
+        for collateral: Collateral in released:
+            batch.append(collateral)
+    extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).transferCollateralsFromLoan(msg.sender, batch, erc20TokenContract)
+
+    if excessAmount > 0:
+        send(msg.sender, excessAmount)
+        log PaymentSent(msg.sender, msg.sender, excessAmount)
+
+
+@payable
+@external
+def payMany(_loanIds: DynArray[uint256, MAX_BATCH_LOANS], _collaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS] = []):
+
+    """
+    @notice Closes several active loans by paying the full amount of each one with a single funds transfer
+    @dev Logs the `LoanPayment` and `LoanPaid` events for each loan. The associated `LendingPoolCore` contract must be approved for the total payment amount
+    @param _loanIds The ids of the loans to settle
+    @param _collaterals The collaterals of each loan in the same order as `_loanIds`, only required if the loans were created with a collaterals commitment
+    """
+
+    self._payMany(_loanIds, _collaterals, msg.value)
+
+
+@external
+def payManyWithPermit(
+    _loanIds: DynArray[uint256, MAX_BATCH_LOANS],
+    _amount: uint256,
+    _deadline: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _collaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS] = []
+):
+
+    """
+    @notice Closes several active loans by paying the full amount of each one in the pool ERC20, approving it with an EIP-2612 permit signature
+    @dev Logs the `LoanPayment` and `LoanPaid` events for each loan. The permit must approve the associated `LendingPoolCore` contract for at least the total payment amount, and is not used if that allowance is already in place. WETH does not support permit, so WETH pools need the approve-based call
+    @param _loanIds The ids of the loans to settle
+    @param _amount The amount approved by the permit
+    @param _deadline The deadline of the permit
+    @param _v The permit signature v
+    @param _r The permit signature r
+    @param _s The permit signature s
+    @param _collaterals The collaterals of each loan in the same order as `_loanIds`, only required if the loans were created with a collaterals commitment
+    """
+
+    self._permit(self.erc20TokenContract, msg.sender, self.lendingPoolCoreContract, _amount, _deadline, _v, _r, _s)
+    self._payMany(_loanIds, _collaterals, 0)
+
+
+@external
+def settleDefault(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100] = []):
     """
     @notice Settles an active loan as defaulted
     @dev Logs the `LoanDefaulted` event, removes the collaterals from the loan and creates a liquidation
     @param _borrower The wallet address of the borrower
     @param _loanId The id of the loan to settle
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
     """
     assert msg.sender == self.admin, "msg.sender is not the admin"
-    assert staticcall ILoansCore(self.loansCoreContract).isLoanStarted(_borrower, _loanId), "loan not found"
-
-    loan: Loan = staticcall ILoansCore(self.loansCoreContract).getLoan(_borrower, _loanId)
+    loan: LoanHeader = staticcall ILoansCore(self.loansCoreContract).getLoanHeader(_borrower, _loanId)
+    assert loan.started, "loan not found"
     assert not loan.paid, "loan already paid"
     assert block.timestamp > loan.maturity, "loan is within maturity period"
     assert self.liquidationsPeripheralContract != empty(address), "BNPeriph is the zero address"
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(_borrower, _loanId, loan, _collaterals)
 
-    extcall ILoansCore(self.loansCoreContract).updateDefaultedLoan(_borrower, _loanId)
-    extcall ILoansCore(self.loansCoreContract).updateHighestDefaultedLoan(_borrower, _loanId)
-
-    for collateral: Collateral in loan.collaterals:
-        extcall ILoansCore(self.loansCoreContract).removeCollateralFromLoan(_borrower, collateral, _loanId)
-        extcall ILoansCore(self.loansCoreContract).updateCollaterals(collateral, True)
+    extcall ILoansCore(self.loansCoreContract).defaultLoan(_borrower, _loanId, collaterals)
 
     extcall ILiquidationsPeripheral(self.liquidationsPeripheralContract).addLiquidation(
         _borrower,
         _loanId,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract,
+        collaterals
     )
 
     log LoanDefaulted(
@@ -823,12 +1136,49 @@ def settleDefault(_borrower: address, _loanId: uint256):
         _borrower,
         _loanId,
         loan.amount,
-        staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract()
+        self.erc20TokenContract
     )
 
 
 @external
-def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool):
+def settleDefaults(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS]):
+    """
+    @notice Settles several active loans as defaulted, skipping the ones already defaulted or paid
+    @dev Logs the `LoanDefaulted` event for each settled loan, removes the collaterals from the loans and creates the liquidations in a single call
+    @param _loans The loans to settle, the collaterals are only required for loans created with a collaterals commitment
+    """
+    assert msg.sender == self.admin, "msg.sender is not the admin"
+    assert self.liquidationsPeripheralContract != empty(address), "BNPeriph is the zero address"
+
+    erc20TokenContract: address = self.erc20TokenContract
+    defaultedLoans: DynArray[LoanCollaterals, MAX_BATCH_LOANS] = []
+
+    for entry: LoanCollaterals in _loans:
+        loan: LoanHeader = staticcall ILoansCore(self.loansCoreContract).getLoanHeader(entry.borrower, entry.loanId)
+        assert loan.started, "loan not found"
+        if loan.defaulted or loan.paid:
+            continue
+        assert block.timestamp > loan.maturity, "loan is within maturity period"
+        collaterals: DynArray[Collateral, 100] = self._loanCollaterals(entry.borrower, entry.loanId, loan, entry.collaterals)
+
+        extcall ILoansCore(self.loansCoreContract).defaultLoan(entry.borrower, entry.loanId, collaterals)
+
+        defaultedLoans.append(LoanCollaterals({borrower: entry.borrower, loanId: entry.loanId, collaterals: collaterals}))
+
+        log LoanDefaulted(
+            entry.borrower,
+            entry.borrower,
+            entry.loanId,
+            loan.amount,
+            erc20TokenContract
+        )
+
+    if len(defaultedLoans) > 0:
+        extcall ILiquidationsPeripheral(self.liquidationsPeripheralContract).addLiquidations(defaultedLoans, erc20TokenContract)
+
+
+@external
+def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool, _collaterals: DynArray[Collateral, 100] = []):
 
     """
     @notice Sets / unsets a delegation for some collateral of a given loan. Only available to unpaid loans until maturity is reached
@@ -836,19 +1186,21 @@ def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint2
     @param _collateralAddress The contract address of the collateral
     @param _tokenId The token id of the collateral
     @param _value Wether to set or unset the token delegation
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
     """
 
-    loan: Loan = staticcall ILoansCore(self.loansCoreContract).getLoan(msg.sender, _loanId)
+    loan: LoanHeader = staticcall ILoansCore(self.loansCoreContract).getLoanHeader(msg.sender, _loanId)
     assert loan.amount > 0, "invalid loan id"
     assert block.timestamp <= loan.maturity, "loan maturity reached"
     assert not loan.paid, "loan already paid"
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(msg.sender, _loanId, loan, _collaterals)
 
-    for collateral: Collateral in loan.collaterals:
+    for collateral: Collateral in collaterals:
         if collateral.contractAddress ==_collateralAddress and collateral.tokenId == _tokenId:
             extcall ICollateralVaultPeripheral(self.collateralVaultPeripheralContract).setCollateralDelegation(
                 msg.sender,
                 _collateralAddress,
                 _tokenId,
-                staticcall ILendingPoolPeripheral(self.lendingPoolPeripheralContract).erc20TokenContract(),
+                self.erc20TokenContract,
                 _value
             )
@@ -9,6 +9,10 @@ interface ILoansPeripheral:
 interface ILendingPoolPeripheral:
     def erc20TokenContract() -> address: view
 
+interface ILegacyLoansCore:
+    def collateralsUsed(arg0: bytes32) -> bool: view
+    def collateralsData(arg0: bytes32) -> Collateral: view
+
 
 # Structs
 
@@ -32,11 +36,41 @@ struct Loan:
     defaulted: bool
     canceled: bool
 
+# a Loan without its collaterals, as returned by getLoanHeader
+struct LoanHeader:
+    id: uint256
+    amount: uint256
+    interest: uint256
+    maturity: uint256
+    startTime: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    collateralsHash: bytes32
+    started: bool
+    invalidated: bool
+    paid: bool
+    defaulted: bool
+    canceled: bool
+
+# storage representation of a Loan, the id is implicit in the loan position
+struct PackedLoan:
+    amount: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    terms: uint256 # status flags (bits 0-7), interest (8-39), maturity (40-103) and startTime (104-167)
+    collaterals: DynArray[Collateral, 100]
+    collateralsHash: bytes32 # commitment to the collaterals, set instead of collaterals if collateralsCommitment is on
+
+struct TopStatsEntry:
+    borrower: address
+    loanId: uint256
+    amount: uint256
+
 struct TopStats:
-    highestSingleCollateralLoan: Loan
-    highestCollateralBundleLoan: Loan
-    highestRepayment: Loan
-    highestDefaultedLoan: Loan
+    highestSingleCollateralLoan: TopStatsEntry
+    highestCollateralBundleLoan: TopStatsEntry
+    highestRepayment: TopStatsEntry
+    highestDefaultedLoan: TopStatsEntry
 
 
 # Events
@@ -61,6 +95,11 @@ event LoansPeripheralAddressSet:
     newValue: address
     erc20TokenContract: address
 
+event CollateralsCommitmentChanged:
+    erc20TokenContractIndexed: indexed(address)
+    value: bool
+    erc20TokenContract: address
+
 
 # Global variables
 
@@ -69,7 +108,7 @@ proposedOwner: public(address)
 
 loansPeripheral: public(address)
 
-loans: HashMap[address, DynArray[Loan, 2**16]]
+loans: HashMap[address, DynArray[PackedLoan, 2**16]]
 borrowedAmount: public(HashMap[address, uint256])
 ongoingLoans: public(HashMap[address, uint256])
 
@@ -77,15 +116,33 @@ ongoingLoans: public(HashMap[address, uint256])
 collateralsInLoans: public(HashMap[bytes32, HashMap[address, uint256]]) # given a collateral and a borrower, what is the loan id
 collateralsInLoansUsed: public(HashMap[bytes32, HashMap[address, HashMap[uint256, bool]]]) # given a collateral, a borrower and a loan id, is the collateral still used in that loan id
 collateralKeys: DynArray[bytes32, 2**20] # array of collaterals expressed by their keys
+collateralKeysIndex: HashMap[bytes32, uint256] # given a collateral key, its position in collateralKeys plus one (0 if unknown)
 collateralsUsed: public(HashMap[bytes32, bool]) # given a collateral, is it being used in a loan
 collateralsData: public(HashMap[bytes32, Collateral]) # given a collateral key, what is its data
 collateralsIdsByAddress: HashMap[address, DynArray[uint256, 2**20]] # given a collateral address, what are the token ids that were already in a loan
 
 collectionsBorrowedAmount: public(HashMap[address, uint256])
 
+collateralsMigrationDone: public(bool)
+
+# if set, new loans keep a hash of their collaterals instead of the collaterals list
+collateralsCommitment: public(bool)
+
 # Stats
 topStats: TopStats
 
+LOAN_STARTED: constant(uint256) = 1
+LOAN_INVALIDATED: constant(uint256) = 2
+LOAN_PAID: constant(uint256) = 4
+LOAN_DEFAULTED: constant(uint256) = 8
+LOAN_CANCELED: constant(uint256) = 16
+
+STATUS_MASK: constant(uint256) = 2**8 - 1
+INTEREST_MASK: constant(uint256) = 2**32 - 1
+TIMESTAMP_MASK: constant(uint256) = 2**64 - 1
+
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
 
 ##### INTERNAL METHODS #####
 
@@ -95,20 +152,191 @@ def _isLoanCreated(_borrower: address, _loanId: uint256) -> bool:
     return _loanId < len(self.loans[_borrower])
 
 
+@pure
+@internal
+def _packLoanTerms(_interest: uint256, _maturity: uint256, _startTime: uint256, _status: uint256) -> uint256:
+    assert _interest <= INTEREST_MASK, "interest out of bounds"
+    assert _maturity <= TIMESTAMP_MASK, "maturity out of bounds"
+    return _status | (_interest << 8) | (_maturity << 40) | (_startTime << 104)
+
+
+@pure
+@internal
+def _termsInterest(_terms: uint256) -> uint256:
+    return (_terms >> 8) & INTEREST_MASK
+
+
+@pure
+@internal
+def _termsMaturity(_terms: uint256) -> uint256:
+    return (_terms >> 40) & TIMESTAMP_MASK
+
+
+@pure
+@internal
+def _termsStartTime(_terms: uint256) -> uint256:
+    return (_terms >> 104) & TIMESTAMP_MASK
+
+
+@pure
+@internal
+def _computeCollateralsHash(_collaterals: DynArray[Collateral, 100]) -> bytes32:
+    return keccak256(_abi_encode(_collaterals))
+
+
+@pure
+@internal
+def _packLoan(_loan: Loan, _commitCollaterals: bool) -> PackedLoan:
+    status: uint256 = 0
+    if _loan.started:
+        status |= LOAN_STARTED
+    if _loan.invalidated:
+        status |= LOAN_INVALIDATED
+    if _loan.paid:
+        status |= LOAN_PAID
+    if _loan.defaulted:
+        status |= LOAN_DEFAULTED
+    if _loan.canceled:
+        status |= LOAN_CANCELED
+
+    if _commitCollaterals:
+        return PackedLoan(
+            {
+                amount: _loan.amount,
+                paidPrincipal: _loan.paidPrincipal,
+                paidInterestAmount: _loan.paidInterestAmount,
+                terms: self._packLoanTerms(_loan.interest, _loan.maturity, _loan.startTime, status),
+                collaterals: empty(DynArray[Collateral, 100]),
+                collateralsHash: self._computeCollateralsHash(_loan.collaterals),
+            }
+        )
+
+    return PackedLoan(
+        {
+            amount: _loan.amount,
+            paidPrincipal: _loan.paidPrincipal,
+            paidInterestAmount: _loan.paidInterestAmount,
+            terms: self._packLoanTerms(_loan.interest, _loan.maturity, _loan.startTime, status),
+            collaterals: _loan.collaterals,
+            collateralsHash: empty(bytes32),
+        }
+    )
+
+
+@pure
+@internal
+def _unpackLoan(_loanId: uint256, _loan: PackedLoan) -> Loan:
+    return Loan(
+        {
+            id: _loanId,
+            amount: _loan.amount,
+            interest: self._termsInterest(_loan.terms),
+            maturity: self._termsMaturity(_loan.terms),
+            startTime: self._termsStartTime(_loan.terms),
+            collaterals: _loan.collaterals,
+            paidPrincipal: _loan.paidPrincipal,
+            paidInterestAmount: _loan.paidInterestAmount,
+            started: _loan.terms & LOAN_STARTED != 0,
+            invalidated: _loan.terms & LOAN_INVALIDATED != 0,
+            paid: _loan.terms & LOAN_PAID != 0,
+            defaulted: _loan.terms & LOAN_DEFAULTED != 0,
+            canceled: _loan.terms & LOAN_CANCELED != 0,
+        }
+    )
+
+
+@pure
+@internal
+def _loanCollaterals(_loan: PackedLoan, _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    if _loan.collateralsHash == empty(bytes32):
+        return _loan.collaterals
+
+    assert self._computeCollateralsHash(_collaterals) == _loan.collateralsHash, "collaterals do not match loan"
+    return _collaterals
+
+
 @view
 @internal
-def _isLoanStarted(_borrower: address, _loanId: uint256) -> bool:
+def _getLoan(_borrower: address, _loanId: uint256) -> Loan:
+    return self._unpackLoan(_loanId, self.loans[_borrower][_loanId])
+
+
+@view
+@internal
+def _getLoanHeader(_borrower: address, _loanId: uint256, _terms: uint256) -> LoanHeader:
+    return LoanHeader(
+        {
+            id: _loanId,
+            amount: self.loans[_borrower][_loanId].amount,
+            interest: self._termsInterest(_terms),
+            maturity: self._termsMaturity(_terms),
+            startTime: self._termsStartTime(_terms),
+            paidPrincipal: self.loans[_borrower][_loanId].paidPrincipal,
+            paidInterestAmount: self.loans[_borrower][_loanId].paidInterestAmount,
+            collateralsHash: self.loans[_borrower][_loanId].collateralsHash,
+            started: _terms & LOAN_STARTED != 0,
+            invalidated: _terms & LOAN_INVALIDATED != 0,
+            paid: _terms & LOAN_PAID != 0,
+            defaulted: _terms & LOAN_DEFAULTED != 0,
+            canceled: _terms & LOAN_CANCELED != 0,
+        }
+    )
+
+
+@pure
+@internal
+def _topStatsEntry(_borrower: address, _loanId: uint256, _amount: uint256) -> TopStatsEntry:
+    return TopStatsEntry(
+        {
+            borrower: _borrower,
+            loanId: _loanId,
+            amount: _amount,
+        }
+    )
+
+
+@view
+@internal
+def _resolveTopStatsEntry(_entry: TopStatsEntry) -> Loan:
+    if _entry.borrower == empty(address):
+        return empty(Loan)
+    return self._getLoan(_entry.borrower, _entry.loanId)
+
+
+@view
+@internal
+def _resolveTopStatsHeader(_entry: TopStatsEntry) -> LoanHeader:
+    if _entry.borrower == empty(address):
+        return empty(LoanHeader)
+    return self._getLoanHeader(_entry.borrower, _entry.loanId, self.loans[_entry.borrower][_entry.loanId].terms)
+
+
+@pure
+@internal
+def _pageLength(_length: uint256, _offset: uint256, _limit: uint256) -> uint256:
+    if _offset >= _length:
+        return 0
+    return min(min(_limit, _length - _offset), MAX_PAGE_SIZE)
+
+
+@view
+@internal
+def _loanTerms(_borrower: address, _loanId: uint256) -> uint256:
     if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].started
-    return False
+        return self.loans[_borrower][_loanId].terms
+    return 0
+
+
+@view
+@internal
+def _isLoanStarted(_borrower: address, _loanId: uint256) -> bool:
+    return self._loanTerms(_borrower, _loanId) & LOAN_STARTED != 0
 
 
 @view
 @internal
 def _isLoanInvalidated(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].invalidated
-    return False
+    return self._loanTerms(_borrower, _loanId) & LOAN_INVALIDATED != 0
 
 
 @pure
@@ -130,25 +358,79 @@ def _removeCollateralFromLoan(_borrower: address, _collateral: Collateral, _loan
   self.collateralsInLoansUsed[key][_borrower][_loanId] = False
 
 
+@internal
+def _registerCollateral(_key: bytes32, _collateral: Collateral):
+  # a collateral key is new iff its token id was never seen for the collection, so the key index
+  # also tells whether the token id is already in collateralsIdsByAddress
+  self.collateralKeys.append(_key)
+  self.collateralKeysIndex[_key] = len(self.collateralKeys)
+  self.collateralsData[_key] = _collateral
+  self.collateralsIdsByAddress[_collateral.contractAddress].append(_collateral.tokenId)
+
+
 @internal
 def _updateCollaterals(_collateral: Collateral, _toRemove: bool):
   key: bytes32 = self._computeCollateralKey(_collateral.contractAddress, _collateral.tokenId)
 
-  if key not in self.collateralKeys and not _toRemove:
-    self.collateralKeys.append(key)
-    self.collateralsUsed[key] = True
-    self.collateralsData[key] = _collateral
-  elif key in self.collateralKeys:
+  if self.collateralKeysIndex[key] == 0:
+    if not _toRemove:
+      self._registerCollateral(key, _collateral)
+      self.collateralsUsed[key] = True
+  else:
     self.collateralsUsed[key] = not _toRemove
 
-  if _collateral.tokenId not in self.collateralsIdsByAddress[_collateral.contractAddress] and not _toRemove:
-    self.collateralsIdsByAddress[_collateral.contractAddress].append(_collateral.tokenId)
+
+@pure
+@internal
+def _collectionsAmounts(_collaterals: DynArray[Collateral, 100]) -> (DynArray[address, 100], DynArray[uint256, 100]):
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
+
+    for collateral: Collateral in _collaterals:
+        found: bool = False
+        for i: uint256 in range(len(collections), bound=100):
+            if collections[i] == collateral.contractAddress:
+                amounts[i] += collateral.amount
+                found = True
+                break
+        if not found:
+            collections.append(collateral.contractAddress)
+            amounts.append(collateral.amount)
+
+    return collections, amounts
+
+
+@internal
+def _increaseCollectionsBorrowedAmount(_collaterals: DynArray[Collateral, 100]):
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
+    collections, amounts = self._collectionsAmounts(_collaterals)
+
+    for i: uint256 in range(len(collections), bound=100):
+        self.collectionsBorrowedAmount[collections[i]] += amounts[i]
+
+
+@internal
+def _decreaseCollectionsBorrowedAmount(_collaterals: DynArray[Collateral, 100]):
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
+    collections, amounts = self._collectionsAmounts(_collaterals)
+
+    for i: uint256 in range(len(collections), bound=100):
+        self.collectionsBorrowedAmount[collections[i]] -= amounts[i]
+
+
+@internal
+def _releaseCollaterals(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]):
+    for collateral: Collateral in _collaterals:
+        self._removeCollateralFromLoan(_borrower, collateral, _loanId)
+        self._updateCollaterals(collateral, True)
 
 
 @internal
-def _addLoan(_borrower: address, _loan: Loan) -> bool:
+def _addLoan(_borrower: address, _loan: Loan, _commitCollaterals: bool) -> bool:
     if _loan.id == len(self.loans[_borrower]):
-        self.loans[_borrower].append(_loan)
+        self.loans[_borrower].append(self._packLoan(_loan, _commitCollaterals))
         self.ongoingLoans[_borrower] += 1
         return True
     return False
@@ -161,6 +443,29 @@ def __init__():
     self.owner = msg.sender
 
 
+@external
+def migrateCollaterals(_from: address, _keys: DynArray[bytes32, 256]):
+    assert not self.collateralsMigrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert _from.is_contract, "LoansCore is not a contract"
+
+    for key: bytes32 in _keys:
+        if self.collateralKeysIndex[key] != 0:
+            continue
+        collateral: Collateral = staticcall ILegacyLoansCore(_from).collateralsData(key)
+        assert key == self._computeCollateralKey(collateral.contractAddress, collateral.tokenId), "collateral not found"
+        self._registerCollateral(key, collateral)
+        self.collateralsUsed[key] = staticcall ILegacyLoansCore(_from).collateralsUsed(key)
+
+
+@external
+def finishCollateralsMigration():
+    assert not self.collateralsMigrationDone, "migration already done"
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+
+    self.collateralsMigrationDone = True
+
+
 @external
 def proposeOwner(_address: address):
     assert msg.sender == self.owner, "msg.sender is not the owner"
@@ -219,6 +524,24 @@ def setLoansPeripheral(_address: address):
     self.loansPeripheral = _address
 
 
+@external
+def changeCollateralsCommitment(_flag: bool):
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert self.collateralsCommitment != _flag, "new value is the same"
+
+    self.collateralsCommitment = _flag
+
+    log CollateralsCommitmentChanged(
+        staticcall ILendingPoolPeripheral(
+            staticcall ILoansPeripheral(self.loansPeripheral).lendingPoolPeripheralContract()
+        ).erc20TokenContract(),
+        _flag,
+        staticcall ILendingPoolPeripheral(
+            staticcall ILoansPeripheral(self.loansPeripheral).lendingPoolPeripheralContract()
+        ).erc20TokenContract()
+    )
+
+
 @view
 @external
 def isLoanCreated(_borrower: address, _loanId: uint256) -> bool:
@@ -242,17 +565,13 @@ def getLoanAmount(_borrower: address, _loanId: uint256) -> uint256:
 @view
 @external
 def getLoanMaturity(_borrower: address, _loanId: uint256) -> uint256:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].maturity
-    return 0
+    return self._termsMaturity(self._loanTerms(_borrower, _loanId))
 
 
 @view
 @external
 def getLoanInterest(_borrower: address, _loanId: uint256) -> uint256:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].interest
-    return 0
+    return self._termsInterest(self._loanTerms(_borrower, _loanId))
 
 
 @view
@@ -267,7 +586,7 @@ def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collate
 @external
 def getLoanStartTime(_borrower: address, _loanId: uint256) -> uint256:
     if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].startTime
+        return self._termsStartTime(self.loans[_borrower][_loanId].terms)
     return max_value(uint256)
 
 
@@ -290,48 +609,46 @@ def getLoanPaidInterestAmount(_borrower: address, _loanId: uint256) -> uint256:
 @view
 @external
 def getLoanStarted(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].started
-    return False
+    return self._loanTerms(_borrower, _loanId) & LOAN_STARTED != 0
 
 
 @view
 @external
 def getLoanInvalidated(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].invalidated
-    return False
+    return self._loanTerms(_borrower, _loanId) & LOAN_INVALIDATED != 0
 
 
 @view
 @external
 def getLoanPaid(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].paid
-    return False
+    return self._loanTerms(_borrower, _loanId) & LOAN_PAID != 0
 
 
 @view
 @external
 def getLoanDefaulted(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].defaulted
-    return False
+    return self._loanTerms(_borrower, _loanId) & LOAN_DEFAULTED != 0
 
 
 @view
 @external
 def getLoanCanceled(_borrower: address, _loanId: uint256) -> bool:
+    return self._loanTerms(_borrower, _loanId) & LOAN_CANCELED != 0
+
+
+@view
+@external
+def getLoanCollateralsHash(_borrower: address, _loanId: uint256) -> bytes32:
     if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].canceled
-    return False
+        return self.loans[_borrower][_loanId].collateralsHash
+    return empty(bytes32)
 
 
 @view
 @external
 def getPendingLoan(_borrower: address, _loanId: uint256) -> Loan:
   if self._isLoanCreated(_borrower, _loanId) and not self._isLoanStarted(_borrower, _loanId) and not self._isLoanInvalidated(_borrower, _loanId):
-    return self.loans[_borrower][_loanId]
+    return self._getLoan(_borrower, _loanId)
   return empty(Loan)
 
 
@@ -339,32 +656,67 @@ def getPendingLoan(_borrower: address, _loanId: uint256) -> Loan:
 @external
 def getLoan(_borrower: address, _loanId: uint256) -> Loan:
   if self._isLoanStarted(_borrower, _loanId) or self._isLoanInvalidated(_borrower, _loanId):
-    return self.loans[_borrower][_loanId]
+    return self._getLoan(_borrower, _loanId)
   return empty(Loan)
 
 
+@view
+@external
+def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader:
+    terms: uint256 = self._loanTerms(_borrower, _loanId)
+    if terms & (LOAN_STARTED | LOAN_INVALIDATED) != 0:
+        return self._getLoanHeader(_borrower, _loanId, terms)
+    return empty(LoanHeader)
+
+
+# loans created while collateralsCommitment is on only keep the hash of their collaterals, so the
+# getHighest* views return them with no collaterals; the getHighest*Header views expose that hash
 @view
 @external
 def getHighestSingleCollateralLoan() -> Loan:
-    return self.topStats.highestSingleCollateralLoan
+    return self._resolveTopStatsEntry(self.topStats.highestSingleCollateralLoan)
 
 
 @view
 @external
 def getHighestCollateralBundleLoan() -> Loan:
-    return self.topStats.highestCollateralBundleLoan
+    return self._resolveTopStatsEntry(self.topStats.highestCollateralBundleLoan)
 
 
 @view
 @external
 def getHighestRepayment() -> Loan:
-    return self.topStats.highestRepayment
+    return self._resolveTopStatsEntry(self.topStats.highestRepayment)
 
 
 @view
 @external
 def getHighestDefaultedLoan() -> Loan:
-    return self.topStats.highestDefaultedLoan
+    return self._resolveTopStatsEntry(self.topStats.highestDefaultedLoan)
+
+
+@view
+@external
+def getHighestSingleCollateralLoanHeader() -> LoanHeader:
+    return self._resolveTopStatsHeader(self.topStats.highestSingleCollateralLoan)
+
+
+@view
+@external
+def getHighestCollateralBundleLoanHeader() -> LoanHeader:
+    return self._resolveTopStatsHeader(self.topStats.highestCollateralBundleLoan)
+
+
+@view
+@external
+def getHighestRepaymentHeader() -> LoanHeader:
+    return self._resolveTopStatsHeader(self.topStats.highestRepayment)
+
+
+@view
+@external
+def getHighestDefaultedLoanHeader() -> LoanHeader:
+    return self._resolveTopStatsHeader(self.topStats.highestDefaultedLoan)
 
 
 @view
@@ -379,6 +731,36 @@ def getCollateralsIdsByAddress(_address: address) -> DynArray[uint256, 2**20]:
   return self.collateralsIdsByAddress[_address]
 
 
+@view
+@external
+def collateralKeysLength() -> uint256:
+    return len(self.collateralKeys)
+
+
+@view
+@external
+def collateralKeysPage(_offset: uint256, _limit: uint256) -> DynArray[bytes32, MAX_PAGE_SIZE]:
+    page: DynArray[bytes32, MAX_PAGE_SIZE] = []
+    for i: uint256 in range(self._pageLength(len(self.collateralKeys), _offset, _limit), bound=MAX_PAGE_SIZE):
+        page.append(self.collateralKeys[_offset + i])
+    return page
+
+
+@view
+@external
+def getCollateralsIdsByAddressLength(_address: address) -> uint256:
+    return len(self.collateralsIdsByAddress[_address])
+
+
+@view
+@external
+def getCollateralsIdsByAddressPage(_address: address, _offset: uint256, _limit: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    page: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i: uint256 in range(self._pageLength(len(self.collateralsIdsByAddress[_address]), _offset, _limit), bound=MAX_PAGE_SIZE):
+        page.append(self.collateralsIdsByAddress[_address][_offset + i])
+    return page
+
+
 @external
 def addCollateralToLoan(_borrower: address, _collateral: Collateral, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
@@ -430,7 +812,7 @@ def addLoan(
         }
     )
 
-    result: bool = self._addLoan(_borrower, newLoan)
+    result: bool = self._addLoan(_borrower, newLoan, False)
     if not result:
         raise "adding loan for borrower failed"
 
@@ -441,8 +823,13 @@ def addLoan(
 def updateLoanStarted(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    self.loans[_borrower][_loanId].startTime = block.timestamp
-    self.loans[_borrower][_loanId].started = True
+    terms: uint256 = self.loans[_borrower][_loanId].terms
+    self.loans[_borrower][_loanId].terms = self._packLoanTerms(
+        self._termsInterest(terms),
+        self._termsMaturity(terms),
+        block.timestamp,
+        (terms & STATUS_MASK) | LOAN_STARTED
+    )
 
     self.borrowedAmount[_borrower] += self.loans[_borrower][_loanId].amount
 
@@ -462,7 +849,7 @@ def updateLoanPaidAmount(_borrower: address, _loanId: uint256, _paidPrincipal: u
 def updatePaidLoan(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    self.loans[_borrower][_loanId].paid = True
+    self.loans[_borrower][_loanId].terms |= LOAN_PAID
 
     self.borrowedAmount[_borrower] -= self.loans[_borrower][_loanId].amount
 
@@ -476,7 +863,7 @@ def updatePaidLoan(_borrower: address, _loanId: uint256):
 def updateDefaultedLoan(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    self.loans[_borrower][_loanId].defaulted = True
+    self.loans[_borrower][_loanId].terms |= LOAN_DEFAULTED
 
     self.borrowedAmount[_borrower] -= self.loans[_borrower][_loanId].amount
 
@@ -490,29 +877,127 @@ def updateDefaultedLoan(_borrower: address, _loanId: uint256):
 def updateHighestSingleCollateralLoan(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    if len(self.loans[_borrower][_loanId].collaterals) == 1 and self.topStats.highestSingleCollateralLoan.amount < self.loans[_borrower][_loanId].amount:
-        self.topStats.highestSingleCollateralLoan = self.loans[_borrower][_loanId]
+    amount: uint256 = self.loans[_borrower][_loanId].amount
+    if len(self.loans[_borrower][_loanId].collaterals) == 1 and self.topStats.highestSingleCollateralLoan.amount < amount:
+        self.topStats.highestSingleCollateralLoan = self._topStatsEntry(_borrower, _loanId, amount)
 
 
 @external
 def updateHighestCollateralBundleLoan(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    if len(self.loans[_borrower][_loanId].collaterals) > 1 and self.topStats.highestCollateralBundleLoan.amount < self.loans[_borrower][_loanId].amount:
-        self.topStats.highestCollateralBundleLoan = self.loans[_borrower][_loanId]
+    amount: uint256 = self.loans[_borrower][_loanId].amount
+    if len(self.loans[_borrower][_loanId].collaterals) > 1 and self.topStats.highestCollateralBundleLoan.amount < amount:
+        self.topStats.highestCollateralBundleLoan = self._topStatsEntry(_borrower, _loanId, amount)
 
 
 @external
 def updateHighestRepayment(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    if self.topStats.highestRepayment.amount < self.loans[_borrower][_loanId].amount:
-        self.topStats.highestRepayment = self.loans[_borrower][_loanId]
+    amount: uint256 = self.loans[_borrower][_loanId].amount
+    if self.topStats.highestRepayment.amount < amount:
+        self.topStats.highestRepayment = self._topStatsEntry(_borrower, _loanId, amount)
 
 
 @external
 def updateHighestDefaultedLoan(_borrower: address, _loanId: uint256):
     assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
 
-    if self.topStats.highestDefaultedLoan.amount < self.loans[_borrower][_loanId].amount:
-        self.topStats.highestDefaultedLoan = self.loans[_borrower][_loanId]
+    amount: uint256 = self.loans[_borrower][_loanId].amount
+    if self.topStats.highestDefaultedLoan.amount < amount:
+        self.topStats.highestDefaultedLoan = self._topStatsEntry(_borrower, _loanId, amount)
+
+
+@external
+def startLoan(
+    _borrower: address,
+    _amount: uint256,
+    _interest: uint256,
+    _maturity: uint256,
+    _collaterals: DynArray[Collateral, 100]
+) -> uint256:
+    assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
+    assert self.collateralsMigrationDone, "migration not done"
+
+    newLoan: Loan = Loan(
+        {
+            id: len(self.loans[_borrower]),
+            amount: _amount,
+            interest: _interest,
+            maturity: _maturity,
+            startTime: block.timestamp,
+            collaterals: _collaterals,
+            paidPrincipal: 0,
+            paidInterestAmount: 0,
+            started: True,
+            invalidated: False,
+            paid: False,
+            defaulted: False,
+            canceled: False,
+        }
+    )
+
+    result: bool = self._addLoan(_borrower, newLoan, self.collateralsCommitment)
+    if not result:
+        raise "adding loan for borrower failed"
+
+    for collateral: Collateral in _collaterals:
+        self._addCollateralToLoan(_borrower, collateral, newLoan.id)
+        self._updateCollaterals(collateral, False)
+
+    self.borrowedAmount[_borrower] += _amount
+    self._increaseCollectionsBorrowedAmount(_collaterals)
+
+    if len(_collaterals) == 1 and self.topStats.highestSingleCollateralLoan.amount < _amount:
+        self.topStats.highestSingleCollateralLoan = self._topStatsEntry(_borrower, newLoan.id, _amount)
+    if len(_collaterals) > 1 and self.topStats.highestCollateralBundleLoan.amount < _amount:
+        self.topStats.highestCollateralBundleLoan = self._topStatsEntry(_borrower, newLoan.id, _amount)
+
+    return newLoan.id
+
+
+@external
+def closeLoan(
+    _borrower: address,
+    _loanId: uint256,
+    _paidPrincipal: uint256,
+    _paidInterestAmount: uint256,
+    _collaterals: DynArray[Collateral, 100]
+):
+    assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
+    assert self._isLoanStarted(_borrower, _loanId), "loan not found"
+
+    loan: PackedLoan = self.loans[_borrower][_loanId]
+    self.loans[_borrower][_loanId].paidPrincipal = loan.paidPrincipal + _paidPrincipal
+    self.loans[_borrower][_loanId].paidInterestAmount = loan.paidInterestAmount + _paidInterestAmount
+    self.loans[_borrower][_loanId].terms = loan.terms | LOAN_PAID
+
+    self.borrowedAmount[_borrower] -= loan.amount
+    self.ongoingLoans[_borrower] -= 1
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(loan, _collaterals)
+    self._decreaseCollectionsBorrowedAmount(collaterals)
+
+    self._releaseCollaterals(_borrower, _loanId, collaterals)
+
+    if self.topStats.highestRepayment.amount < loan.amount:
+        self.topStats.highestRepayment = self._topStatsEntry(_borrower, _loanId, loan.amount)
+
+
+@external
+def defaultLoan(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]):
+    assert msg.sender == self.loansPeripheral, "msg.sender is not the loans addr"
+    assert self._isLoanStarted(_borrower, _loanId), "loan not found"
+
+    loan: PackedLoan = self.loans[_borrower][_loanId]
+    self.loans[_borrower][_loanId].terms = loan.terms | LOAN_DEFAULTED
+
+    self.borrowedAmount[_borrower] -= loan.amount
+    self.ongoingLoans[_borrower] -= 1
+    collaterals: DynArray[Collateral, 100] = self._loanCollaterals(loan, _collaterals)
+    self._decreaseCollectionsBorrowedAmount(collaterals)
+
+    self._releaseCollaterals(_borrower, _loanId, collaterals)
+
+    if self.topStats.highestDefaultedLoan.amount < loan.amount:
+        self.topStats.highestDefaultedLoan = self._topStatsEntry(_borrower, _loanId, loan.amount)
@@ -12,10 +12,11 @@ from ethereum.ercs import IERC721
 from ethereum.ercs import IERC20
 
 interface ICollateralVault:
-    def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _createDelegation: bool): nonpayable
-    def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address): nonpayable
+    def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool): nonpayable
+    def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address): nonpayable
     def isCollateralApprovedForVault(_borrower: address, _collateralAddress: address, _tokenId: uint256) -> bool: view
     def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool): nonpayable
+    def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool): nonpayable
 
 interface IERC20Symbol:
     def symbol() -> String[100]: view
@@ -27,9 +28,12 @@ interface ILendingPool:
     def sendFunds(_to: address, _amount: uint256): nonpayable
     def receiveFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256): payable
     def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256): payable
+    def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256): payable
+    def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256): nonpayable
 
 interface ILiquidations:
-    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address): nonpayable
+    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]): nonpayable
+    def addLiquidations(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS], _erc20TokenContract: address): nonpayable
 
 interface ISelf:
     def initialize(
@@ -64,6 +68,36 @@ struct Loan:
     defaulted: bool
     canceled: bool
 
+# a Loan without its collaterals, as returned by getLoanHeader
+struct LoanHeader:
+    id: uint256
+    amount: uint256
+    interest: uint256
+    maturity: uint256
+    startTime: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    collateralsHash: bytes32
+    started: bool
+    invalidated: bool
+    paid: bool
+    defaulted: bool
+    canceled: bool
+
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
+# storage representation of a Loan, the id is implicit in the loan position
+struct PackedLoan:
+    amount: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    terms: uint256 # status flags (bits 0-7), interest (8-39), maturity (40-103) and startTime (104-167)
+    collaterals: DynArray[Collateral, 100]
+    collateralsHash: bytes32 # commitment to the collaterals, set instead of collaterals if collateralsCommitment is on
+
 
 struct EIP712Domain:
     name: String[100]
@@ -145,6 +179,11 @@ event ContractStatusChanged:
     value: bool
     erc20TokenContract: address
 
+event CollateralsCommitmentChanged:
+    erc20TokenContractIndexed: indexed(address)
+    value: bool
+    erc20TokenContract: address
+
 event ContractDeprecated:
     erc20TokenContractIndexed: indexed(address)
     erc20TokenContract: address
@@ -181,6 +220,13 @@ event LoanDefaulted:
     amount: uint256
     erc20TokenContract: address
 
+event LoanRefinanced:
+    walletIndexed: indexed(address)
+    wallet: address
+    loanId: uint256
+    newLoanId: uint256
+    erc20TokenContract: address
+
 event PaymentSent:
     walletIndexed: indexed(address)
     wallet: address
@@ -210,7 +256,10 @@ liquidationsContract: public(ILiquidations)
 genesisContract: public(IERC721)
 isPayable: public(bool)
 
-loans: HashMap[address, DynArray[Loan, 2**16]]
+loans: HashMap[address, DynArray[PackedLoan, 2**16]]
+
+# if set, new loans keep a hash of their collaterals instead of the collaterals list
+collateralsCommitment: public(bool)
 
 ZHARTA_DOMAIN_NAME: constant(String[6]) = "Zharta"
 ZHARTA_DOMAIN_VERSION: constant(String[1]) = "1"
@@ -227,6 +276,16 @@ reserve_message_typehash: bytes32
 reserve_sig_domain_separator: bytes32
 
 MINIMUM_INTEREST_PERIOD: constant(uint256) = 604800  # 7 days
+MAX_BATCH_LOANS: constant(uint256) = 10
+
+LOAN_STARTED: constant(uint256) = 1
+LOAN_INVALIDATED: constant(uint256) = 2
+LOAN_PAID: constant(uint256) = 4
+LOAN_DEFAULTED: constant(uint256) = 8
+LOAN_CANCELED: constant(uint256) = 16
+
+INTEREST_MASK: constant(uint256) = 2**32 - 1
+TIMESTAMP_MASK: constant(uint256) = 2**64 - 1
 
 
 @deploy
@@ -320,12 +379,90 @@ def _are_collaterals_owned(_borrower: address, _collaterals: DynArray[Collateral
     return True
 
 
+@pure
+@internal
+def _pack_loan_terms(_interest: uint256, _maturity: uint256, _startTime: uint256, _status: uint256) -> uint256:
+    assert _interest <= INTEREST_MASK, "interest out of bounds"
+    assert _maturity <= TIMESTAMP_MASK, "maturity out of bounds"
+    return _status | (_interest << 8) | (_maturity << 40) | (_startTime << 104)
+
+
+@pure
+@internal
+def _terms_interest(_terms: uint256) -> uint256:
+    return (_terms >> 8) & INTEREST_MASK
+
+
+@pure
+@internal
+def _terms_maturity(_terms: uint256) -> uint256:
+    return (_terms >> 40) & TIMESTAMP_MASK
+
+
+@pure
+@internal
+def _terms_start_time(_terms: uint256) -> uint256:
+    return (_terms >> 104) & TIMESTAMP_MASK
+
+
+@view
+@internal
+def _loan_terms(_borrower: address, _loanId: uint256) -> uint256:
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].terms
+    return 0
+
+
 @view
 @internal
 def _get_loan(_borrower: address, _loanId: uint256) -> Loan:
-  if self._is_loan_created(_borrower, _loanId):
-    return self.loans[_borrower][_loanId]
-  return empty(Loan)
+  if not self._is_loan_created(_borrower, _loanId):
+    return empty(Loan)
+
+  loan: PackedLoan = self.loans[_borrower][_loanId]
+  return Loan(
+      {
+          id: _loanId,
+          amount: loan.amount,
+          interest: self._terms_interest(loan.terms),
+          maturity: self._terms_maturity(loan.terms),
+          startTime: self._terms_start_time(loan.terms),
+          collaterals: loan.collaterals,
+          paidPrincipal: loan.paidPrincipal,
+          paidInterestAmount: loan.paidInterestAmount,
+          started: loan.terms & LOAN_STARTED != 0,
+          invalidated: loan.terms & LOAN_INVALIDATED != 0,
+          paid: loan.terms & LOAN_PAID != 0,
+          defaulted: loan.terms & LOAN_DEFAULTED != 0,
+          canceled: loan.terms & LOAN_CANCELED != 0,
+      }
+  )
+
+
+@view
+@internal
+def _get_loan_header(_borrower: address, _loanId: uint256) -> LoanHeader:
+  if not self._is_loan_created(_borrower, _loanId):
+    return empty(LoanHeader)
+
+  terms: uint256 = self.loans[_borrower][_loanId].terms
+  return LoanHeader(
+      {
+          id: _loanId,
+          amount: self.loans[_borrower][_loanId].amount,
+          interest: self._terms_interest(terms),
+          maturity: self._terms_maturity(terms),
+          startTime: self._terms_start_time(terms),
+          paidPrincipal: self.loans[_borrower][_loanId].paidPrincipal,
+          paidInterestAmount: self.loans[_borrower][_loanId].paidInterestAmount,
+          collateralsHash: self.loans[_borrower][_loanId].collateralsHash,
+          started: terms & LOAN_STARTED != 0,
+          invalidated: terms & LOAN_INVALIDATED != 0,
+          paid: terms & LOAN_PAID != 0,
+          defaulted: terms & LOAN_DEFAULTED != 0,
+          canceled: terms & LOAN_CANCELED != 0,
+      }
+  )
 
 
 @internal
@@ -337,27 +474,44 @@ def _add_loan(
     _collaterals: DynArray[Collateral, 100]
 ) -> uint256:
 
-    new_loan: Loan = Loan(
+    new_loan: PackedLoan = PackedLoan(
         {
-            id: len(self.loans[_borrower]),
             amount: _amount,
-            interest: _interest,
-            maturity: _maturity,
-            startTime: block.timestamp,
-            collaterals: _collaterals,
             paidPrincipal: 0,
             paidInterestAmount: 0,
-            started: True,
-            invalidated: False,
-            paid: False,
-            defaulted: False,
-            canceled: False,
+            terms: self._pack_loan_terms(_interest, _maturity, block.timestamp, LOAN_STARTED),
+            collaterals: _collaterals,
+            collateralsHash: empty(bytes32),
         }
     )
+    if self.collateralsCommitment:
+        new_loan.collaterals = empty(DynArray[Collateral, 100])
+        new_loan.collateralsHash = keccak256(_abi_encode(_collaterals))
 
+    new_loan_id: uint256 = len(self.loans[_borrower])
     self.loans[_borrower].append(new_loan)
 
-    return new_loan.id
+    return new_loan_id
+
+
+@view
+@internal
+def _active_loan(_loanId: uint256) -> LoanHeader:
+    loan: LoanHeader = self._get_loan_header(msg.sender, _loanId)
+    assert loan.started, "loan not found"
+    assert block.timestamp <= loan.maturity, "loan maturity reached"
+    assert not loan.paid, "loan already paid"
+    return loan
+
+
+@view
+@internal
+def _loan_collaterals(_borrower: address, _loanId: uint256, _loan: LoanHeader, _collaterals: DynArray[Collateral, 100]) -> DynArray[Collateral, 100]:
+    if _loan.collateralsHash == empty(bytes32):
+        return self.loans[_borrower][_loanId].collaterals
+
+    assert keccak256(_abi_encode(_collaterals)) == _loan.collateralsHash, "collaterals do not match loan"
+    return _collaterals
 
 
 @internal
@@ -368,12 +522,36 @@ def _update_loan_paid_amount(_borrower: address, _loanId: uint256, _paidPrincipa
 
 @internal
 def _update_paid_loan(_borrower: address, _loanId: uint256):
-    self.loans[_borrower][_loanId].paid = True
+    self.loans[_borrower][_loanId].terms |= LOAN_PAID
 
 
 @internal
 def _update_defaulted_loan(_borrower: address, _loanId: uint256):
-    self.loans[_borrower][_loanId].defaulted = True
+    self.loans[_borrower][_loanId].terms |= LOAN_DEFAULTED
+
+
+@internal
+def _close_loan(_loanId: uint256, _loan: LoanHeader, _paidInterestAmount: uint256):
+    erc20TokenContract: address = self.erc20TokenContract
+    self._update_loan_paid_amount(msg.sender, _loanId, _loan.amount, _paidInterestAmount)
+    self._update_paid_loan(msg.sender, _loanId)
+
+    log LoanPayment(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        _loan.amount,
+        _paidInterestAmount,
+        erc20TokenContract
+    )
+
+    log LoanPaid(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        erc20TokenContract
+    )
+
 
 @view
 @internal
@@ -398,6 +576,17 @@ def _collaterals_amounts(_collaterals: DynArray[Collateral, 100]) -> uint256:
     return sumAmount
 
 
+@pure
+@internal
+def _same_collaterals(_collaterals: DynArray[Collateral, 100], _otherCollaterals: DynArray[Collateral, 100]) -> bool:
+    if len(_collaterals) != len(_otherCollaterals):
+        return False
+    for i: uint256 in range(len(_collaterals), bound=100):
+        if _collaterals[i].contractAddress != _otherCollaterals[i].contractAddress or _collaterals[i].tokenId != _otherCollaterals[i].tokenId:
+            return False
+    return True
+
+
 @pure
 @internal
 def _loan_payable_amount(
@@ -411,6 +600,27 @@ def _loan_payable_amount(
     return (_amount - _paidAmount) * (10000 * _maxLoanDuration + _interest * (max(_timePassed + _interestAccrualPeriod, MINIMUM_INTEREST_PERIOD))) // (10000 * _maxLoanDuration)
 
 
+@view
+@internal
+def _loan_payment_amount(_loan: LoanHeader) -> uint256:
+    # compute days passed in seconds
+    timePassed: uint256 = self._compute_period_passed_in_seconds(
+        block.timestamp,
+        _loan.startTime,
+        self.interestAccrualPeriod
+    )
+
+    # pro-rata computation of max amount payable based on actual loan duration in days
+    return self._loan_payable_amount(
+        _loan.amount,
+        _loan.paidPrincipal,
+        _loan.interest,
+        _loan.maturity - _loan.startTime,
+        timePassed,
+        self.interestAccrualPeriod
+    )
+
+
 @pure
 @internal
 def _compute_period_passed_in_seconds(_recentTimestamp: uint256, _olderTimestamp: uint256, _period: uint256) -> uint256:
@@ -470,14 +680,17 @@ def _reserve(
     _genesisToken: uint256,
     _v: uint256,
     _r: uint256,
-    _s: uint256
+    _s: uint256,
+    _refinancing: bool,
+    _returnedAmount: uint256
 ) -> uint256:
+    # _returnedAmount is the principal paid back to the pool in the same transaction, when refinancing
     assert not self.isDeprecated, "contract is deprecated"
     assert self.isAcceptingLoans, "contract is not accepting loans"
     assert block.timestamp < _maturity, "maturity is in the past"
     assert block.timestamp <= _deadline, "deadline has passed"
     assert self._collaterals_amounts(_collaterals) == _amount, "amount in collats != than amount"
-    assert (staticcall self.lendingPoolContract.maxFundsInvestable()) >= _amount, "insufficient liquidity"
+    assert (staticcall self.lendingPoolContract.maxFundsInvestable()) + _returnedAmount >= _amount, "insufficient liquidity"
 
     assert not self._is_loan_created(msg.sender, _nonce), "loan already created"
     if _nonce > 0:
@@ -490,12 +703,18 @@ def _reserve(
 
     newLoanId: uint256 = self._add_loan(msg.sender, _amount, _interest, _maturity, _collaterals)
 
-    for collateral: Collateral in _collaterals:
-
-        extcall self.collateralVaultContract.storeCollateral(
+    if not _refinancing:
+        extcall self.collateralVaultContract.storeCollaterals(
             msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId,
+            _collaterals,
+            self.erc20TokenContract,
+            _delegations
+        )
+    else:
+        # the collaterals are already in the vault, their delegations may have been set by the previous loan
+        extcall self.collateralVaultContract.setCollateralDelegations(
+            msg.sender,
+            _collaterals,
             self.erc20TokenContract,
             _delegations
         )
@@ -515,6 +734,47 @@ def _reserve(
     return newLoanId
 
 
+@internal
+def _refinance(
+    _loanId: uint256,
+    _amount: uint256,
+    _interest: uint256,
+    _maturity: uint256,
+    _collaterals: DynArray[Collateral, 100],
+    _delegations: bool,
+    _deadline: uint256,
+    _nonce: uint256,
+    _genesisToken: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _loanCollaterals: DynArray[Collateral, 100]
+) -> (uint256, uint256, uint256):
+    loan: LoanHeader = self._active_loan(_loanId)
+    collaterals: DynArray[Collateral, 100] = self._loan_collaterals(msg.sender, _loanId, loan, _loanCollaterals)
+    assert self._same_collaterals(collaterals, _collaterals), "collaterals do not match loan"
+
+    paymentAmount: uint256 = self._loan_payment_amount(loan)
+    paidInterestAmount: uint256 = paymentAmount - loan.amount
+    erc20TokenContract: address = self.erc20TokenContract
+
+    # the collaterals stay in the vault, to be used by the new loan
+    self._close_loan(_loanId, loan, paidInterestAmount)
+
+    # limits are checked with the previous loan already closed, as its principal is settled in the same transaction
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, True, loan.amount)
+
+    log LoanRefinanced(
+        msg.sender,
+        msg.sender,
+        _loanId,
+        newLoanId,
+        erc20TokenContract
+    )
+
+    return newLoanId, loan.amount, paidInterestAmount
+
+
 ##### EXTERNAL METHODS #####
 
 @view
@@ -525,75 +785,89 @@ def loansCoreContract() -> address:
 @view
 @external
 def getLoanAmount(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).amount
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].amount
+    return 0
 
 
 @view
 @external
 def getLoanMaturity(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).maturity
+    return self._terms_maturity(self._loan_terms(_borrower, _loanId))
 
 
 @view
 @external
 def getLoanInterest(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).interest
+    return self._terms_interest(self._loan_terms(_borrower, _loanId))
 
 
 @view
 @external
 def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collateral, 100]:
-    return self._get_loan(_borrower, _loanId).collaterals
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].collaterals
+    return empty(DynArray[Collateral, 100])
 
 
 @view
 @external
 def getLoanStartTime(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).startTime
+    return self._terms_start_time(self._loan_terms(_borrower, _loanId))
 
 
 @view
 @external
 def getLoanPaidPrincipal(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).paidPrincipal
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].paidPrincipal
+    return 0
 
 
 @view
 @external
 def getLoanPaidInterestAmount(_borrower: address, _loanId: uint256) -> uint256:
-    return self._get_loan(_borrower, _loanId).paidInterestAmount
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].paidInterestAmount
+    return 0
 
 
 @view
 @external
 def getLoanStarted(_borrower: address, _loanId: uint256) -> bool:
-    return self._get_loan(_borrower, _loanId).started
+    return self._loan_terms(_borrower, _loanId) & LOAN_STARTED != 0
 
 
 @view
 @external
 def getLoanInvalidated(_borrower: address, _loanId: uint256) -> bool:
-    return self._get_loan(_borrower, _loanId).invalidated
+    return self._loan_terms(_borrower, _loanId) & LOAN_INVALIDATED != 0
 
 
 @view
 @external
 def getLoanPaid(_borrower: address, _loanId: uint256) -> bool:
-    return self._get_loan(_borrower, _loanId).paid
+    return self._loan_terms(_borrower, _loanId) & LOAN_PAID != 0
 
 
 @view
 @external
 def getLoanDefaulted(_borrower: address, _loanId: uint256) -> bool:
-    return self._get_loan(_borrower, _loanId).defaulted
+    return self._loan_terms(_borrower, _loanId) & LOAN_DEFAULTED != 0
 
 
 @view
 @external
 def getLoanCanceled(_borrower: address, _loanId: uint256) -> bool:
-    if _loanId < len(self.loans[_borrower]):
-        return self.loans[_borrower][_loanId].canceled
-    return False
+    return self._loan_terms(_borrower, _loanId) & LOAN_CANCELED != 0
+
+
+@view
+@external
+def getLoanCollateralsHash(_borrower: address, _loanId: uint256) -> bytes32:
+    if self._is_loan_created(_borrower, _loanId):
+        return self.loans[_borrower][_loanId].collateralsHash
+    return empty(bytes32)
 
 
 @view
@@ -602,6 +876,12 @@ def getLoan(_borrower: address, _loanId: uint256) -> Loan:
     return self._get_loan(_borrower, _loanId)
 
 
+@view
+@external
+def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader:
+    return self._get_loan_header(_borrower, _loanId)
+
+
 @external
 def proposeOwner(_address: address):
     assert msg.sender == self.owner, "msg.sender is not the owner"
@@ -723,6 +1003,20 @@ def changeContractStatus(_flag: bool):
     )
 
 
+@external
+def changeCollateralsCommitment(_flag: bool):
+    assert msg.sender == self.owner, "msg.sender is not the owner"
+    assert self.collateralsCommitment != _flag, "new value is the same"
+
+    self.collateralsCommitment = _flag
+
+    log CollateralsCommitmentChanged(
+        self.erc20TokenContract,
+        _flag,
+        self.erc20TokenContract
+    )
+
+
 @external
 def deprecate():
     assert msg.sender == self.owner, "msg.sender is not the owner"
@@ -746,7 +1040,7 @@ def erc20TokenSymbol() -> String[100]:
 @view
 @external
 def getLoanPayableAmount(_borrower: address, _loanId: uint256, _timestamp: uint256) -> uint256:
-    loan: Loan = self._get_loan(_borrower, _loanId)
+    loan: LoanHeader = self._get_loan_header(_borrower, _loanId)
 
     if loan.paid:
         return 0
@@ -802,7 +1096,7 @@ def reserve(
     @return The loan id
     """
 
-    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s)
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, False, 0)
 
     extcall self.lendingPoolContract.sendFunds(msg.sender, _amount)
 
@@ -839,7 +1133,7 @@ def reserveEth(
     @return The loan id
     """
 
-    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s)
+    newLoanId: uint256 = self._reserve(_amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, False, 0)
 
     extcall self.lendingPoolContract.sendFundsEth(msg.sender, _amount)
 
@@ -848,40 +1142,97 @@ def reserveEth(
 
 @payable
 @external
-def pay(_loanId: uint256):
+def refinance(
+    _loanId: uint256,
+    _amount: uint256,
+    _interest: uint256,
+    _maturity: uint256,
+    _collaterals: DynArray[Collateral, 100],
+    _delegations: bool,
+    _deadline: uint256,
+    _nonce: uint256,
+    _genesisToken: uint256,
+    _v: uint256,
+    _r: uint256,
+    _s: uint256,
+    _loanCollaterals: DynArray[Collateral, 100] = []
+) -> uint256:
+    """
+    @notice Pays an active loan and creates a new one over the same collaterals, which are kept in the vault. The new loan message must be signed by the contract admin.
+    @dev Logs the `LoanPayment`, `LoanPaid`, `LoanCreated` and `LoanRefinanced` events. Only the difference between the payment amount and the new loan amount is transferred. For ETH loans the difference owed must be sent as value and any excess is returned, otherwise the lending pool must be approved for it
+    @param _loanId The id of the loan to refinance
+    @param _amount The new loan amount in wei
+    @param _interest The new loan interest rate in bps (1/1000) for the loan duration
+    @param _maturity The new loan maturity in unix epoch format
+    @param _collaterals The collaterals of the loan being refinanced, their amounts may change
+    @param _delegations Wether to set the requesting wallet as a delegate for all collaterals
+    @param _deadline The deadline of validity for the signed message in unix epoch format
+    @param _genesisToken The optional Genesis Pass token used to determine the loan conditions, must be > 0
+    @param _v recovery id for public key recover
+    @param _r r value in ECDSA signature
+    @param _s s value in ECDSA signature
+    @param _loanCollaterals The collaterals of the loan being refinanced, only required if it was created with a collaterals commitment
+    @return The new loan id
+    """
+
+    receivedAmount: uint256 = msg.value
+    if not self.isPayable:
+        assert receivedAmount == 0, "no ETH allowed for this loan"
+
+    newLoanId: uint256 = 0
+    paidPrincipal: uint256 = 0
+    paidInterestAmount: uint256 = 0
+    newLoanId, paidPrincipal, paidInterestAmount = self._refinance(_loanId, _amount, _interest, _maturity, _collaterals, _delegations, _deadline, _nonce, _genesisToken, _v, _r, _s, _loanCollaterals)
+
+    dueAmount: uint256 = 0
+    if paidPrincipal + paidInterestAmount > _amount:
+        dueAmount = paidPrincipal + paidInterestAmount - _amount
+
+    if not self.isPayable:
+        if dueAmount > 0:
+            erc20TokenContract: address = self.erc20TokenContract
+            assert (staticcall IERC20(erc20TokenContract).balanceOf(msg.sender)) >= dueAmount, "insufficient balance"
+            assert (staticcall IERC20(erc20TokenContract).allowance(
+                    msg.sender,
+                    self.lendingPoolContract.address
+            )) >= dueAmount, "insufficient allowance"
+        extcall self.lendingPoolContract.refinanceFunds(msg.sender, paidPrincipal, paidInterestAmount, _amount)
+        return newLoanId
+
+    assert receivedAmount >= dueAmount, "insufficient value received"
+    if receivedAmount > 0:
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+
+    extcall self.lendingPoolContract.refinanceFundsEth(msg.sender, paidPrincipal, paidInterestAmount, _amount, value=dueAmount)
+    if dueAmount > 0:
+        log PaymentSent(self.lendingPoolContract.address, self.lendingPoolContract.address, dueAmount)
+
+    if receivedAmount > dueAmount:
+        send(msg.sender, receivedAmount - dueAmount)
+        log PaymentSent(msg.sender, msg.sender, receivedAmount - dueAmount)
+
+    return newLoanId
+
+
+@payable
+@external
+def pay(_loanId: uint256, _collaterals: DynArray[Collateral, 100] = []):
 
     """
     @notice Closes an active loan by paying the full amount
     @dev Logs the `LoanPayment` and `LoanPaid` events. The associated `LendingPoolCore` contract must be approved for the payment amount
     @param _loanId The id of the loan to settle
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
     """
 
     receivedAmount: uint256 = msg.value
     if not self.isPayable:
         assert receivedAmount == 0, "no ETH allowed for this loan"
 
-    assert self._is_loan_created(msg.sender, _loanId), "loan not found"
+    loan: LoanHeader = self._active_loan(_loanId)
+    collaterals: DynArray[Collateral, 100] = self._loan_collaterals(msg.sender, _loanId, loan, _collaterals)
 
-    loan: Loan = self._get_loan(msg.sender, _loanId)
-    assert block.timestamp <= loan.maturity, "loan maturity reached"
-    assert not loan.paid, "loan already paid"
-
-    # compute days passed in seconds
-    timePassed: uint256 = self._compute_period_passed_in_seconds(
-        block.timestamp,
-        loan.startTime,
-        self.interestAccrualPeriod
-    )
-
-    # pro-rata computation of max amount payable based on actual loan duration in days
-    paymentAmount: uint256 = self._loan_payable_amount(
-        loan.amount,
-        loan.paidPrincipal,
-        loan.interest,
-        loan.maturity - loan.startTime,
-        timePassed,
-        self.interestAccrualPeriod
-    )
+    paymentAmount: uint256 = self._loan_payment_amount(loan)
 
     erc20TokenContract: address = self.erc20TokenContract
     excessAmount: uint256 = 0
@@ -899,8 +1250,7 @@ def pay(_loanId: uint256):
 
     paidInterestAmount: uint256 = paymentAmount - loan.amount
 
-    self._update_loan_paid_amount(msg.sender, _loanId, loan.amount, paidInterestAmount)
-    self._update_paid_loan(msg.sender, _loanId)
+    self._close_loan(_loanId, loan, paidInterestAmount)
 
     if receivedAmount > 0:
         extcall self.lendingPoolContract.receiveFundsEth(msg.sender, loan.amount, paidInterestAmount, value=paymentAmount)
@@ -908,57 +1258,123 @@ def pay(_loanId: uint256):
     else:
         extcall self.lendingPoolContract.receiveFunds(msg.sender, loan.amount, paidInterestAmount)
 
-    for collateral: Collateral in loan.collaterals:
-        extcall self.collateralVaultContract.transferCollateralFromLoan(
-            msg.sender,
-            collateral.contractAddress,
-            collateral.tokenId,
-            erc20TokenContract
-        )
+    extcall self.collateralVaultContract.transferCollateralsFromLoan(msg.sender, collaterals, erc20TokenContract)
 
     if excessAmount > 0:
         send(msg.sender, excessAmount)
         log PaymentSent(msg.sender, msg.sender,excessAmount)
 
-    log LoanPayment(
-        msg.sender,
-        msg.sender,
-        _loanId,
-        loan.amount,
-        paidInterestAmount,
-        erc20TokenContract
-    )
 
-    log LoanPaid(
-        msg.sender,
-        msg.sender,
-        _loanId,
-        erc20TokenContract
-    )
+@payable
+@external
+def payMany(_loanIds: DynArray[uint256, MAX_BATCH_LOANS], _collaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS] = []):
+
+    """
+    @notice Closes several active loans by paying the full amount of each one with a single funds transfer
+    @dev Logs the `LoanPayment` and `LoanPaid` events for each loan. The associated `LendingPoolCore` contract must be approved for the total payment amount
+    @param _loanIds The ids of the loans to settle
+    @param _collaterals The collaterals of each loan in the same order as `_loanIds`, only required if the loans were created with a collaterals commitment
+    """
+
+    assert len(_loanIds) > 0, "no loans to pay"
+    assert len(_collaterals) == 0 or len(_collaterals) == len(_loanIds), "collaterals length mismatch"
+
+    receivedAmount: uint256 = msg.value
+    if not self.isPayable:
+        assert receivedAmount == 0, "no ETH allowed for this loan"
+
+    loans: DynArray[LoanHeader, MAX_BATCH_LOANS] = []
+    paymentAmounts: DynArray[uint256, MAX_BATCH_LOANS] = []
+    paidLoanIds: DynArray[uint256, MAX_BATCH_LOANS] = []
+    totalPrincipal: uint256 = 0
+    totalPaymentAmount: uint256 = 0
+
+    for loanId: uint256 in _loanIds:
+        assert loanId not in paidLoanIds, "duplicated loan id"
+        loan: LoanHeader = self._active_loan(loanId)
+
+        paymentAmount: uint256 = self._loan_payment_amount(loan)
+        loans.append(loan)
+        paymentAmounts.append(paymentAmount)
+        paidLoanIds.append(loanId)
+        totalPrincipal += loan.amount
+        totalPaymentAmount += paymentAmount
+
+    erc20TokenContract: address = self.erc20TokenContract
+    excessAmount: uint256 = 0
+
+    if receivedAmount > 0:
+        assert receivedAmount >= totalPaymentAmount, "insufficient value received"
+        excessAmount = receivedAmount - totalPaymentAmount
+        log PaymentReceived(msg.sender, msg.sender, receivedAmount)
+    else:
+        assert (staticcall IERC20(erc20TokenContract).balanceOf(msg.sender)) >= totalPaymentAmount, "insufficient balance"
+        assert (staticcall IERC20(erc20TokenContract).allowance(
+                msg.sender,
+                self.lendingPoolContract.address
+        )) >= totalPaymentAmount, "insufficient allowance"
+
+    # the loans are closed first and the collaterals of all of them are released after the payment
+    releasedCollaterals: DynArray[DynArray[Collateral, 100], MAX_BATCH_LOANS] = []
+    for i: uint256 in range(len(_loanIds), bound=MAX_BATCH_LOANS):
+        loanId: uint256 = _loanIds[i]
+        loan: LoanHeader = loans[i]
+        paidInterestAmount: uint256 = paymentAmounts[i] - loan.amount
+
+        loanCollaterals: DynArray[Collateral, 100] = []
+        if len(_collaterals) > 0:
+            loanCollaterals = _collaterals[i]
+        collaterals: DynArray[Collateral, 100] = self._loan_collaterals(msg.sender, loanId, loan, loanCollaterals)
+
+        self._close_loan(loanId, loan, paidInterestAmount)
+
+        releasedCollaterals.append(collaterals)
+
+    if receivedAmount > 0:
+        extcall self.lendingPoolContract.receiveFundsEth(msg.sender, totalPrincipal, totalPaymentAmount - totalPrincipal, value=totalPaymentAmount)
+        log PaymentSent(self.lendingPoolContract.address, self.lendingPoolContract.address, totalPaymentAmount)
+    else:
+        extcall self.lendingPoolContract.receiveFunds(msg.sender, totalPrincipal, totalPaymentAmount - totalPrincipal)
+
+    # the vault takes up to 100 collaterals per call, so the loans' collaterals are released in batches of that size
+    batch: DynArray[Collateral, 100] = []
+    for released: DynArray[Collateral, 100] in releasedCollaterals:
+        if len(batch) + len(released) > 100:
+            extcall self.collateralVaultContract.transferCollateralsFromLoan(msg.sender, batch, erc20TokenContract)
+            batch = []
+        for collateral: Collateral in released:
+            batch.append(collateral)
+    extcall self.collateralVaultContract.transferCollateralsFromLoan(msg.sender, batch, erc20TokenContract)
+
+    if excessAmount > 0:
+        send(msg.sender, excessAmount)
+        log PaymentSent(msg.sender, msg.sender, excessAmount)
 
 
 @external
-def settleDefault(_borrower: address, _loanId: uint256):
+def settleDefault(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100] = []):
     """
     @notice Settles an active loan as defaulted
     @dev Logs the `LoanDefaulted` event, removes the collaterals from the loan and creates a liquidation
     @param _borrower The wallet address of the borrower
     @param _loanId The id of the loan to settle
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
     """
     assert msg.sender == self.admin, "msg.sender is not the admin"
-    assert self._is_loan_created(_borrower, _loanId), "loan not found"
-
-    loan: Loan = self._get_loan(_borrower, _loanId)
+    loan: LoanHeader = self._get_loan_header(_borrower, _loanId)
+    assert loan.started, "loan not found"
     assert not loan.paid, "loan already paid"
     assert block.timestamp > loan.maturity, "loan is within maturity period"
     assert self.liquidationsContract.address != empty(address), "BNPeriph is the zero address"
+    collaterals: DynArray[Collateral, 100] = self._loan_collaterals(_borrower, _loanId, loan, _collaterals)
 
     self._update_defaulted_loan(_borrower, _loanId)
 
     extcall self.liquidationsContract.addLiquidation(
         _borrower,
         _loanId,
-        self.erc20TokenContract
+        self.erc20TokenContract,
+        collaterals
     )
 
     log LoanDefaulted(
@@ -971,7 +1387,44 @@ def settleDefault(_borrower: address, _loanId: uint256):
 
 
 @external
-def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool):
+def settleDefaults(_loans: DynArray[LoanCollaterals, MAX_BATCH_LOANS]):
+    """
+    @notice Settles several active loans as defaulted, skipping the ones already defaulted or paid
+    @dev Logs the `LoanDefaulted` event for each settled loan, removes the collaterals from the loans and creates the liquidations in a single call
+    @param _loans The loans to settle, the collaterals are only required for loans created with a collaterals commitment
+    """
+    assert msg.sender == self.admin, "msg.sender is not the admin"
+    assert self.liquidationsContract.address != empty(address), "BNPeriph is the zero address"
+
+    erc20TokenContract: address = self.erc20TokenContract
+    defaultedLoans: DynArray[LoanCollaterals, MAX_BATCH_LOANS] = []
+
+    for entry: LoanCollaterals in _loans:
+        loan: LoanHeader = self._get_loan_header(entry.borrower, entry.loanId)
+        assert loan.started, "loan not found"
+        if loan.defaulted or loan.paid:
+            continue
+        assert block.timestamp > loan.maturity, "loan is within maturity period"
+        collaterals: DynArray[Collateral, 100] = self._loan_collaterals(entry.borrower, entry.loanId, loan, entry.collaterals)
+
+        self._update_defaulted_loan(entry.borrower, entry.loanId)
+
+        defaultedLoans.append(LoanCollaterals({borrower: entry.borrower, loanId: entry.loanId, collaterals: collaterals}))
+
+        log LoanDefaulted(
+            entry.borrower,
+            entry.borrower,
+            entry.loanId,
+            loan.amount,
+            erc20TokenContract
+        )
+
+    if len(defaultedLoans) > 0:
+        extcall self.liquidationsContract.addLiquidations(defaultedLoans, erc20TokenContract)
+
+
+@external
+def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool, _collaterals: DynArray[Collateral, 100] = []):
 
     """
     @notice Sets / unsets a delegation for some collateral of a given loan. Only available to unpaid loans until maturity is reached
@@ -979,14 +1432,16 @@ def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint2
     @param _collateralAddress The contract address of the collateral
     @param _tokenId The token id of the collateral
     @param _value Wether to set or unset the token delegation
+    @param _collaterals The loan collaterals, only required if the loan was created with a collaterals commitment
     """
 
-    loan: Loan = self._get_loan(msg.sender, _loanId)
+    loan: LoanHeader = self._get_loan_header(msg.sender, _loanId)
     assert loan.amount > 0, "invalid loan id"
     assert block.timestamp <= loan.maturity, "loan maturity reached"
     assert not loan.paid, "loan already paid"
+    collaterals: DynArray[Collateral, 100] = self._loan_collaterals(msg.sender, _loanId, loan, _collaterals)
 
-    for collateral: Collateral in loan.collaterals:
+    for collateral: Collateral in collaterals:
         if collateral.contractAddress ==_collateralAddress and collateral.tokenId == _tokenId:
             extcall self.collateralVaultContract.setCollateralDelegation(
                 msg.sender,
@@ -44,6 +44,14 @@ event DelegateForToken:
     tokenId: uint256
     value: bool
 
+event DelegateERC721:
+    vault: address
+    delegate: address
+    contract: address
+    tokenId: uint256
+    rights: bytes32
+    enable: bool
+
 event RevokeAllDelegates:
     vault: address
 
@@ -243,6 +251,13 @@ def checkDelegateForToken(delegate: address, vault: address , contract: address
     return self._checkDelegateForToken(delegate, vault, contract, tokenId)
 
 
+@view
+@external
+def checkDelegateForERC721(to: address, _from: address, contract: address, tokenId: uint256, rights: bytes32) -> bool:
+    # delegate.xyz v2 read, rights are not tracked by the mock
+    return self._checkDelegateForToken(to, _from, contract, tokenId)
+
+
 @view
 @external
 def getDelegationsByDelegate(delegate: address) -> DynArray[DelegationInfo, 2**10]:
@@ -294,6 +309,26 @@ def delegateForToken(delegate: address, contract: address, tokenId: uint256, _va
     log DelegateForToken(msg.sender, delegate, contract, tokenId, _value)
 
 
+@payable
+@external
+def delegateERC721(to: address, contract: address, tokenId: uint256, rights: bytes32, enable: bool) -> bytes32:
+    # delegate.xyz v2 token delegation, stored as a token level delegation
+    delegationHash: bytes32 = self._computeTokenDelegationHash(msg.sender, to, contract, tokenId)
+    self._setDelegationValues(to, delegationHash, enable, DelegationType.TOKEN, msg.sender, contract, tokenId)
+    log DelegateERC721(msg.sender, to, contract, tokenId, rights, enable)
+    return delegationHash
+
+
+@payable
+@external
+def multicall(data: DynArray[Bytes[1024], 100]) -> DynArray[Bytes[32], 100]:
+    # delegate.xyz v2 batching, each call is delegated to this contract so msg.sender is kept
+    results: DynArray[Bytes[32], 100] = []
+    for _call: Bytes[1024] in data:
+        results.append(raw_call(self, _call, max_outsize=32, is_delegate_call=True))
+    return results
+
+
 @external
 def revokeAllDelegates():
     self.vaultVersion[msg.sender] += 1
@@ -1,5 +1,10 @@
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 # Events
 
 event OwnershipTransferred:
@@ -18,6 +23,11 @@ event CollateralVaultPeripheralAddressSet:
     currentValue: address
     newValue: address
 
+event DelegationRegistrySet:
+    currentValue: address
+    newValue: address
+    version: uint256
+
 # Functions
 
 @view
@@ -40,6 +50,16 @@ def collateralVaultPeripheralAddress() -> address:
 def delegationRegistry() -> IDelegationRegistry:
     pass
 
+@view
+@external
+def delegationRegistryVersion() -> uint256:
+    pass
+
+@view
+@external
+def previousDelegationRegistry() -> IDelegationRegistry:
+    pass
+
 @view
 @external
 def vaultName() -> String[30]:
@@ -77,14 +97,30 @@ def claimOwnership():
 def setCollateralVaultPeripheralAddress(_address: address):
     pass
 
+@external
+def setDelegationRegistry(_address: address, _version: uint256):
+    pass
+
 @external
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegateWallet: address):
     pass
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegateWallet: address):
+    pass
+
 @external
 def transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegateWallet: address):
     pass
 
+@external
+def transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegateWallet: address):
+    pass
+
 @external
 def setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
+    pass
+
+@external
+def setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
     pass
\ No newline at end of file
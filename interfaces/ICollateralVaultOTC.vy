@@ -1,5 +1,10 @@
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 struct Offer:
     isForSale: bool
     punkIndex: uint256
@@ -105,6 +110,11 @@ def cryptoPunksMarketAddress() -> CryptoPunksMarket:
 def delegationRegistry() -> IDelegationRegistry:
     pass
 
+@view
+@external
+def delegationRegistryVersion() -> uint256:
+    pass
+
 @view
 @external
 def onERC721Received(_operator: address, _from: address, _tokenId: uint256, _data: Bytes[1024]) -> bytes4:
@@ -153,18 +163,34 @@ def setLiquidationsPeripheralAddress(_address: address):
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _createDelegation: bool):
     pass
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+    pass
+
 @external
 def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address):
     pass
 
+@external
+def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address):
+    pass
+
 @external
 def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256):
     pass
 
+@external
+def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]):
+    pass
+
 @external
 def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool):
     pass
 
+@external
+def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool):
+    pass
+
 @view
 @external
 def collateralSupportsDelegation(_collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address) -> bool:
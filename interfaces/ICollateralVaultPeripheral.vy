@@ -1,5 +1,10 @@
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 # Events
 
 event OwnershipTransferred:
@@ -148,18 +153,34 @@ def setLiquidationsPeripheralAddress(_address: address):
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _createDelegation: bool):
     pass
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+    pass
+
 @external
 def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address):
     pass
 
+@external
+def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address):
+    pass
+
 @external
 def transferCollateralFromLiquidation(_wallet: address, _collateralAddress: address, _tokenId: uint256):
     pass
 
+@external
+def transferCollateralsFromLiquidation(_wallet: address, _collaterals: DynArray[Collateral, 100]):
+    pass
+
 @external
 def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool):
     pass
 
+@external
+def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool):
+    pass
+
 @view
 @external
 def collateralSupportsDelegation(_collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address) -> bool:
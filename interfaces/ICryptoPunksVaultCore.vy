@@ -1,5 +1,10 @@
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 struct Offer:
     isForSale: bool
     punkIndex: uint256
@@ -25,6 +30,11 @@ event CollateralVaultPeripheralAddressSet:
     currentValue: address
     newValue: address
 
+event DelegationRegistrySet:
+    currentValue: address
+    newValue: address
+    version: uint256
+
 # Functions
 
 @view
@@ -52,6 +62,16 @@ def cryptoPunksMarketAddress() -> address:
 def delegationRegistry() -> IDelegationRegistry:
     pass
 
+@view
+@external
+def delegationRegistryVersion() -> uint256:
+    pass
+
+@view
+@external
+def previousDelegationRegistry() -> IDelegationRegistry:
+    pass
+
 @view
 @external
 def vaultName() -> String[30]:
@@ -84,14 +104,30 @@ def claimOwnership():
 def setCollateralVaultPeripheralAddress(_address: address):
     pass
 
+@external
+def setDelegationRegistry(_address: address, _version: uint256):
+    pass
+
 @external
 def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address):
     pass
 
+@external
+def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address):
+    pass
+
 @external
 def transferCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _delegate_wallet: address):
     pass
 
+@external
+def transferCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _delegate_wallet: address):
+    pass
+
 @external
 def setDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _value: bool):
+    pass
+
+@external
+def setDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _value: bool):
     pass
\ No newline at end of file
@@ -7,6 +7,27 @@ struct InvestorFunds:
     sharesBasisPoints: uint256
     activeForRewards: bool
 
+struct PackedInvestorFunds:
+    amounts: uint256
+    totals: uint256
+
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    totalSharesBasisPoints: uint256
+    activeLenders: uint256
+    protocolFeesAccrued: uint256
+
+struct LenderFunds:
+    wallet: address
+    currentAmountDeposited: uint256
+    totalAmountDeposited: uint256
+    totalAmountWithdrawn: uint256
+    sharesBasisPoints: uint256
+    activeForRewards: bool
+
 # Events
 
 event OwnerProposed:
@@ -53,17 +74,52 @@ def erc20TokenContract() -> address:
 
 @view
 @external
-def funds(arg0: address) -> InvestorFunds:
+def protocolFeesAccrued() -> uint256:
     pass
 
 @view
 @external
-def knownLenders(arg0: address) -> bool:
+def migrationDone() -> bool:
     pass
 
 @view
 @external
-def activeLenders() -> uint256:
+def lendersArray() -> DynArray[address, 1125899906842624]:
+    pass
+
+@view
+@external
+def lendersLength() -> uint256:
+    pass
+
+@view
+@external
+def lendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 1000]:
+    pass
+
+@view
+@external
+def activeLendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 1000]:
+    pass
+
+@view
+@external
+def inactiveLendersLength() -> uint256:
+    pass
+
+@view
+@external
+def inactiveLendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 1000]:
+    pass
+
+@view
+@external
+def knownLenders(_lender: address) -> bool:
+    pass
+
+@view
+@external
+def poolState() -> PoolState:
     pass
 
 @view
@@ -93,12 +149,12 @@ def totalSharesBasisPoints() -> uint256:
 
 @view
 @external
-def migrationDone() -> bool:
+def activeLenders() -> uint256:
     pass
 
 @view
 @external
-def lendersArray() -> DynArray[address, 1125899906842624]:
+def funds(_lender: address) -> InvestorFunds:
     pass
 
 @view
@@ -140,6 +196,14 @@ def activeForRewards(_lender: address) -> bool:
 def migrateLender(_wallet: address, _currentAmountDeposited: uint256, _totalAmountDeposited: uint256, _totalAmountWithdrawn: uint256, _sharesBasisPoints: uint256, _activeForRewards: bool):
     pass
 
+@external
+def migrateLenders(_lenders: DynArray[LenderFunds, 256]):
+    pass
+
+@external
+def migrateLegacyLenders(_from: address, _lenders: DynArray[address, 256]):
+    pass
+
 @external
 def migrate(_from: address):
     pass
@@ -164,6 +228,14 @@ def deposit(_lender: address, _payer: address, _amount: uint256) -> bool:
 def withdraw(_lender: address, _wallet: address, _amount: uint256) -> bool:
     pass
 
+@external
+def depositChecked(_lender: address, _payer: address, _amount: uint256, _maxPoolShareEnabled: bool, _maxPoolShare: uint256, _maxCapitalEfficiency: uint256) -> PoolState:
+    pass
+
+@external
+def withdrawChecked(_lender: address, _wallet: address, _amount: uint256, _lockedAmount: uint256) -> PoolState:
+    pass
+
 @external
 def sendFunds(_to: address, _amount: uint256) -> bool:
     pass
@@ -174,4 +246,16 @@ def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256,
 
 @external
 def transferProtocolFees(_borrower: address, _protocolWallet: address, _amount: uint256) -> bool:
+    pass
+
+@external
+def settleFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _investedAmount: uint256, _protocolFeesAmount: uint256) -> bool:
+    pass
+
+@external
+def claimProtocolFees(_protocolWallet: address) -> bool:
+    pass
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256, _protocolFeesAmount: uint256) -> bool:
     pass
\ No newline at end of file
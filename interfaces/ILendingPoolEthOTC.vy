@@ -7,6 +7,16 @@ struct InvestorFunds:
     sharesBasisPoints: uint256
     activeForRewards: bool
 
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    collateralClaimsValue: uint256
+    currentAmountDeposited: uint256
+    totalAmountDeposited: uint256
+    totalAmountWithdrawn: uint256
+
 # Events
 
 event ProxyCreated:
@@ -157,102 +167,117 @@ def isPoolDeprecated() -> bool:
 
 @view
 @external
-def poolFunds() -> InvestorFunds:
+def lender() -> address:
     pass
 
 @view
 @external
-def lender() -> address:
+def lendingPoolCoreContract() -> address:
     pass
 
 @view
 @external
-def fundsAvailable() -> uint256:
+def maxFundsInvestable() -> uint256:
     pass
 
 @view
 @external
-def fundsInvested() -> uint256:
+def theoreticalMaxFundsInvestable() -> uint256:
     pass
 
 @view
 @external
-def totalFundsInvested() -> uint256:
+def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
     pass
 
 @view
 @external
-def totalRewards() -> uint256:
+def lenderFunds(_lender: address) -> InvestorFunds:
     pass
 
 @view
 @external
-def collateralClaimsValue() -> uint256:
+def funds(_lender: address) -> InvestorFunds:
     pass
 
 @view
 @external
-def lendingPoolCoreContract() -> address:
+def lendersArray() -> DynArray[address, 1]:
     pass
 
 @view
 @external
-def maxFundsInvestable() -> uint256:
+def lendersLength() -> uint256:
     pass
 
 @view
 @external
-def theoreticalMaxFundsInvestable() -> uint256:
+def lendersPage(_offset: uint256, _limit: uint256) -> DynArray[address, 1]:
     pass
 
 @view
 @external
-def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
+def lockedAmount(_lender: address) -> uint256:
     pass
 
 @view
 @external
-def lenderFunds(_lender: address) -> InvestorFunds:
+def computeWithdrawableAmount(_lender: address) -> uint256:
     pass
 
 @view
 @external
-def funds(_lender: address) -> InvestorFunds:
+def fundsInPool() -> uint256:
     pass
 
 @view
 @external
-def lendersArray() -> DynArray[address, 1]:
+def currentAmountDeposited(_lender: address) -> uint256:
     pass
 
 @view
 @external
-def lockedAmount(_lender: address) -> uint256:
+def totalAmountDeposited(_lender: address) -> uint256:
     pass
 
 @view
 @external
-def computeWithdrawableAmount(_lender: address) -> uint256:
+def totalAmountWithdrawn(_lender: address) -> uint256:
     pass
 
 @view
 @external
-def fundsInPool() -> uint256:
+def poolState() -> PoolState:
     pass
 
 @view
 @external
-def currentAmountDeposited(_lender: address) -> uint256:
+def poolFunds() -> InvestorFunds:
     pass
 
 @view
 @external
-def totalAmountDeposited(_lender: address) -> uint256:
+def fundsAvailable() -> uint256:
     pass
 
 @view
 @external
-def totalAmountWithdrawn(_lender: address) -> uint256:
+def fundsInvested() -> uint256:
+    pass
+
+@view
+@external
+def totalFundsInvested() -> uint256:
+    pass
+
+@view
+@external
+def totalRewards() -> uint256:
+    pass
+
+@view
+@external
+def collateralClaimsValue() -> uint256:
     pass
 
 @external
@@ -329,6 +354,15 @@ def receiveFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint25
 def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256):
     pass
 
+@payable
+@external
+def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    pass
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    pass
+
 @external
 def receiveFundsFromLiquidation(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _distributeToProtocol: bool, _origin: String[30]):
     pass
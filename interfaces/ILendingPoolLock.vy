@@ -4,6 +4,11 @@ struct InvestorLock:
     lockPeriodEnd: uint256
     lockPeriodAmount: uint256
 
+struct LenderLock:
+    wallet: address
+    lockPeriodEnd: uint256
+    lockPeriodAmount: uint256
+
 struct LegacyInvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -65,6 +70,14 @@ def investorLocks(arg0: address) -> InvestorLock:
 def migrate(_lendingPoolCoreAddress: address, _lenders: DynArray[address, 100]):
     pass
 
+@external
+def migrateLenders(_locks: DynArray[LenderLock, 256]):
+    pass
+
+@external
+def finishMigration():
+    pass
+
 @external
 def proposeOwner(_address: address):
     pass
@@ -79,4 +92,8 @@ def setLendingPoolPeripheralAddress(_address: address):
 
 @external
 def setInvestorLock(_lender: address, _amount: uint256, _lockPeriodEnd: uint256):
+    pass
+
+@external
+def lockDeposit(_lender: address, _amount: uint256, _lockPeriodDuration: uint256) -> InvestorLock:
     pass
\ No newline at end of file
@@ -11,6 +11,21 @@ struct InvestorLock:
     lockPeriodEnd: uint256
     lockPeriodAmount: uint256
 
+struct LenderLimits:
+    maxPoolShareEnabled: bool
+    maxPoolShare: uint256
+    lockPeriodEnabled: bool
+    lockPeriodDuration: uint256
+
+struct PoolState:
+    fundsAvailable: uint256
+    fundsInvested: uint256
+    totalFundsInvested: uint256
+    totalRewards: uint256
+    totalSharesBasisPoints: uint256
+    activeLenders: uint256
+    protocolFeesAccrued: uint256
+
 # Events
 
 event OwnerProposed:
@@ -39,6 +54,12 @@ event ProtocolWalletChanged:
     newValue: address
     erc20TokenContract: address
 
+event ProtocolFeesClaimed:
+    erc20TokenContractIndexed: indexed(address)
+    wallet: address
+    amount: uint256
+    erc20TokenContract: address
+
 event ProtocolFeesShareChanged:
     erc20TokenContractIndexed: indexed(address)
     currentValue: uint256
@@ -227,6 +248,11 @@ def theoreticalMaxFundsInvestable() -> uint256:
 def theoreticalMaxFundsInvestableAfterDeposit(_amount: uint256) -> uint256:
     pass
 
+@view
+@external
+def protocolFeesAccrued() -> uint256:
+    pass
+
 @view
 @external
 def lenderFunds(_lender: address) -> InvestorFunds:
@@ -293,6 +319,10 @@ def deprecate():
 def deposit(_amount: uint256):
     pass
 
+@external
+def depositWithPermit(_amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    pass
+
 @external
 @payable
 def depositEth():
@@ -323,6 +353,15 @@ def receiveFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint25
 def receiveFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256):
     pass
 
+@payable
+@external
+def refinanceFundsEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    pass
+
+@external
+def refinanceFunds(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _newAmount: uint256):
+    pass
+
 @external
 def receiveFundsFromLiquidation(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _distributeToProtocol: bool, _investedAmount: uint256, _origin: String[30]):
     pass
@@ -330,4 +369,8 @@ def receiveFundsFromLiquidation(_borrower: address, _amount: uint256, _rewardsAm
 @payable
 @external
 def receiveFundsFromLiquidationEth(_borrower: address, _amount: uint256, _rewardsAmount: uint256, _distributeToProtocol: bool, _investedAmount: uint256, _origin: String[30]):
+    pass
+
+@external
+def claimProtocolFees():
     pass
\ No newline at end of file
@@ -1,5 +1,10 @@
 # Structs
 
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
 struct Liquidation:
     lid: bytes32
     collateralAddress: address
@@ -124,10 +129,18 @@ def setLiquidationsPeripheralAddress(_address: address):
 def addLiquidation(_collateralAddress: address, _tokenId: uint256, _startTime: uint256, _gracePeriodMaturity: uint256, _lenderPeriodMaturity: uint256, _principal: uint256, _interestAmount: uint256, _apr: uint256, _gracePeriodPrice: uint256, _lenderPeriodPrice: uint256, _borrower: address, _loanId: uint256, _loansCoreContract: address, _erc20TokenContract: address) -> bytes32:
     pass
 
+@external
+def addLiquidations(_collaterals: DynArray[Collateral, 100], _startTime: uint256, _gracePeriodMaturity: uint256, _lenderPeriodMaturity: uint256, _interestAmounts: DynArray[uint256, 100], _apr: uint256, _gracePeriodPrices: DynArray[uint256, 100], _lenderPeriodPrices: DynArray[uint256, 100], _borrower: address, _loanId: uint256, _loansCoreContract: address, _erc20TokenContract: address) -> DynArray[bytes32, 100]:
+    pass
+
 @external
 def addLoanToLiquidated(_borrower: address, _loansCoreContract: address, _loanId: uint256):
     pass
 
 @external
 def removeLiquidation(_collateralAddress: address, _tokenId: uint256):
+    pass
+
+@external
+def removeLiquidations(_collaterals: DynArray[Collateral, 100]):
     pass
\ No newline at end of file
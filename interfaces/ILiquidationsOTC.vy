@@ -5,21 +5,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 struct InvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -253,14 +258,22 @@ def setMaxPenaltyFee(_erc20TokenContract: address, _fee: uint256):
     pass
 
 @external
-def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address):
+def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def addLiquidations(_loans: DynArray[LoanCollaterals, 10], _erc20TokenContract: address):
     pass
 
 @payable
 @external
-def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address):
+def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]):
     pass
 
 @external
 def claim(_collateralAddress: address, _tokenId: uint256):
+    pass
+
+@external
+def claimMany(_collaterals: DynArray[Collateral, 100]):
     pass
\ No newline at end of file
@@ -5,21 +5,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 struct InvestorFunds:
     currentAmountDeposited: uint256
     totalAmountDeposited: uint256
@@ -344,12 +349,20 @@ def setMaxPenaltyFee(_erc20TokenContract: address, _fee: uint256):
     pass
 
 @external
-def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address):
+def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def addLiquidations(_loans: DynArray[LoanCollaterals, 10], _erc20TokenContract: address):
     pass
 
 @payable
 @external
-def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address):
+def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def payLoanLiquidationsGracePeriodWithPermit(_loanId: uint256, _erc20TokenContract: address, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256, _collaterals: DynArray[Collateral, 100]):
     pass
 
 @payable
@@ -357,6 +370,19 @@ def payLoanLiquidationsGracePeriod(_loanId: uint256, _erc20TokenContract: addres
 def buyNFTLenderPeriod(_collateralAddress: address, _tokenId: uint256):
     pass
 
+@external
+def buyNFTLenderPeriodWithPermit(_collateralAddress: address, _tokenId: uint256, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    pass
+
+@payable
+@external
+def buyNFTsLenderPeriod(_collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def buyNFTsLenderPeriodWithPermit(_collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256):
+    pass
+
 @external
 def liquidateNFTX(_collateralAddress: address, _tokenId: uint256):
     pass
@@ -4,6 +4,12 @@ struct InvestorLock:
     lockPeriodEnd: uint256
     lockPeriodAmount: uint256
 
+struct LenderLimits:
+    maxPoolShareEnabled: bool
+    maxPoolShare: uint256
+    lockPeriodEnabled: bool
+    lockPeriodDuration: uint256
+
 # Events
 
 event MaxPoolShareFlagChanged:
@@ -98,6 +104,16 @@ def outOfLockPeriod(_lender: address, _remainingAmount: uint256, _lpLockContract
 def withinCollectionShareLimit(_amount: uint256, _collectionAddress: address, _loansCoreContractAddress: address, _lpCoreContractAddress: address) -> bool:
     pass
 
+@view
+@external
+def lenderLimits() -> LenderLimits:
+    pass
+
+@view
+@external
+def checkReserveLimits(_borrower: address, _amount: uint256, _collections: DynArray[address, 100], _amounts: DynArray[uint256, 100], _loansCoreContractAddress: address, _lpPeripheralContractAddress: address) -> (bool, bool):
+    pass
+
 @external
 def changeMaxPoolShareConditions(_flag: bool, _value: uint256):
     pass
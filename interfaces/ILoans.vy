@@ -5,21 +5,26 @@ struct Collateral:
     tokenId: uint256
     amount: uint256
 
-struct Loan:
+struct LoanHeader:
     id: uint256
     amount: uint256
     interest: uint256
     maturity: uint256
     startTime: uint256
-    collaterals: DynArray[Collateral, 100]
     paidPrincipal: uint256
     paidInterestAmount: uint256
+    collateralsHash: bytes32
     started: bool
     invalidated: bool
     paid: bool
     defaulted: bool
     canceled: bool
 
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
 struct EIP712Domain:
     name: String[100]
     version: String[10]
@@ -121,6 +126,13 @@ event LoanDefaulted:
     amount: uint256
     erc20TokenContract: address
 
+event LoanRefinanced:
+    walletIndexed: indexed(address)
+    wallet: address
+    loanId: uint256
+    newLoanId: uint256
+    erc20TokenContract: address
+
 event PaymentSent:
     walletIndexed: indexed(address)
     wallet: address
@@ -198,6 +210,21 @@ def genesisContract() -> address:
 def isPayable() -> bool:
     pass
 
+@view
+@external
+def erc20TokenContract() -> address:
+    pass
+
+@view
+@external
+def lendingPoolCoreContract() -> address:
+    pass
+
+@view
+@external
+def erc20TokenSymbol() -> String[100]:
+    pass
+
 @external
 def proposeOwner(_address: address):
     pass
@@ -234,11 +261,6 @@ def changeContractStatus(_flag: bool):
 def deprecate():
     pass
 
-@view
-@external
-def erc20TokenSymbol() -> String[100]:
-    pass
-
 @view
 @external
 def getLoanPayableAmount(_borrower: address, _loanId: uint256, _timestamp: uint256) -> uint256:
@@ -254,13 +276,35 @@ def reserveEth(_amount: uint256, _interest: uint256, _maturity: uint256, _collat
 
 @payable
 @external
-def pay(_loanId: uint256):
+def refinance(_loanId: uint256, _amount: uint256, _interest: uint256, _maturity: uint256, _collaterals: DynArray[Collateral, 100], _delegations: bool, _deadline: uint256, _nonce: uint256, _genesisToken: uint256, _v: uint256, _r: uint256, _s: uint256, _loanCollaterals: DynArray[Collateral, 100]) -> uint256:
+    pass
+
+@payable
+@external
+def pay(_loanId: uint256, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def payWithPermit(_loanId: uint256, _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@payable
+@external
+def payMany(_loanIds: DynArray[uint256, 10], _collaterals: DynArray[DynArray[Collateral, 100], 10]):
+    pass
+
+@external
+def payManyWithPermit(_loanIds: DynArray[uint256, 10], _amount: uint256, _deadline: uint256, _v: uint256, _r: uint256, _s: uint256, _collaterals: DynArray[DynArray[Collateral, 100], 10]):
+    pass
+
+@external
+def settleDefault(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]):
     pass
 
 @external
-def settleDefault(_borrower: address, _loanId: uint256):
+def settleDefaults(_loans: DynArray[LoanCollaterals, 10]):
     pass
 
 @external
-def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool):
+def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool, _collaterals: DynArray[Collateral, 100]):
     pass
\ No newline at end of file
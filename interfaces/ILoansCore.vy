@@ -20,11 +20,39 @@ struct Loan:
     defaulted: bool
     canceled: bool
 
+struct LoanHeader:
+    id: uint256
+    amount: uint256
+    interest: uint256
+    maturity: uint256
+    startTime: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    collateralsHash: bytes32
+    started: bool
+    invalidated: bool
+    paid: bool
+    defaulted: bool
+    canceled: bool
+
+struct PackedLoan:
+    amount: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    terms: uint256
+    collaterals: DynArray[Collateral, 100]
+    collateralsHash: bytes32
+
+struct TopStatsEntry:
+    borrower: address
+    loanId: uint256
+    amount: uint256
+
 struct TopStats:
-    highestSingleCollateralLoan: Loan
-    highestCollateralBundleLoan: Loan
-    highestRepayment: Loan
-    highestDefaultedLoan: Loan
+    highestSingleCollateralLoan: TopStatsEntry
+    highestCollateralBundleLoan: TopStatsEntry
+    highestRepayment: TopStatsEntry
+    highestDefaultedLoan: TopStatsEntry
 
 # Events
 
@@ -48,6 +76,11 @@ event LoansPeripheralAddressSet:
     newValue: address
     erc20TokenContract: address
 
+event CollateralsCommitmentChanged:
+    erc20TokenContractIndexed: indexed(address)
+    value: bool
+    erc20TokenContract: address
+
 # Functions
 
 @view
@@ -100,6 +133,24 @@ def collateralsData(arg0: bytes32) -> Collateral:
 def collectionsBorrowedAmount(arg0: address) -> uint256:
     pass
 
+@view
+@external
+def collateralsMigrationDone() -> bool:
+    pass
+
+@view
+@external
+def collateralsCommitment() -> bool:
+    pass
+
+@external
+def migrateCollaterals(_from: address, _keys: DynArray[bytes32, 256]):
+    pass
+
+@external
+def finishCollateralsMigration():
+    pass
+
 @external
 def proposeOwner(_address: address):
     pass
@@ -112,6 +163,10 @@ def claimOwnership():
 def setLoansPeripheral(_address: address):
     pass
 
+@external
+def changeCollateralsCommitment(_flag: bool):
+    pass
+
 @view
 @external
 def isLoanCreated(_borrower: address, _loanId: uint256) -> bool:
@@ -182,6 +237,11 @@ def getLoanDefaulted(_borrower: address, _loanId: uint256) -> bool:
 def getLoanCanceled(_borrower: address, _loanId: uint256) -> bool:
     pass
 
+@view
+@external
+def getLoanCollateralsHash(_borrower: address, _loanId: uint256) -> bytes32:
+    pass
+
 @view
 @external
 def getPendingLoan(_borrower: address, _loanId: uint256) -> Loan:
@@ -192,6 +252,11 @@ def getPendingLoan(_borrower: address, _loanId: uint256) -> Loan:
 def getLoan(_borrower: address, _loanId: uint256) -> Loan:
     pass
 
+@view
+@external
+def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader:
+    pass
+
 @view
 @external
 def getHighestSingleCollateralLoan() -> Loan:
@@ -212,6 +277,26 @@ def getHighestRepayment() -> Loan:
 def getHighestDefaultedLoan() -> Loan:
     pass
 
+@view
+@external
+def getHighestSingleCollateralLoanHeader() -> LoanHeader:
+    pass
+
+@view
+@external
+def getHighestCollateralBundleLoanHeader() -> LoanHeader:
+    pass
+
+@view
+@external
+def getHighestRepaymentHeader() -> LoanHeader:
+    pass
+
+@view
+@external
+def getHighestDefaultedLoanHeader() -> LoanHeader:
+    pass
+
 @view
 @external
 def collateralKeysArray() -> DynArray[bytes32, 1048576]:
@@ -222,6 +307,26 @@ def collateralKeysArray() -> DynArray[bytes32, 1048576]:
 def getCollateralsIdsByAddress(_address: address) -> DynArray[uint256, 1048576]:
     pass
 
+@view
+@external
+def collateralKeysLength() -> uint256:
+    pass
+
+@view
+@external
+def collateralKeysPage(_offset: uint256, _limit: uint256) -> DynArray[bytes32, MAX_PAGE_SIZE]:
+    pass
+
+@view
+@external
+def getCollateralsIdsByAddressLength(_address: address) -> uint256:
+    pass
+
+@view
+@external
+def getCollateralsIdsByAddressPage(_address: address, _offset: uint256, _limit: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    pass
+
 @external
 def addCollateralToLoan(_borrower: address, _collateral: Collateral, _loanId: uint256):
     pass
@@ -268,4 +373,16 @@ def updateHighestRepayment(_borrower: address, _loanId: uint256):
 
 @external
 def updateHighestDefaultedLoan(_borrower: address, _loanId: uint256):
+    pass
+
+@external
+def startLoan(_borrower: address, _amount: uint256, _interest: uint256, _maturity: uint256, _collaterals: DynArray[Collateral, 100]) -> uint256:
+    pass
+
+@external
+def closeLoan(_borrower: address, _loanId: uint256, _paidPrincipal: uint256, _paidInterestAmount: uint256, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@external
+def defaultLoan(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]):
     pass
\ No newline at end of file
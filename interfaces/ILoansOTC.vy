@@ -20,6 +20,34 @@ struct Loan:
     defaulted: bool
     canceled: bool
 
+struct LoanHeader:
+    id: uint256
+    amount: uint256
+    interest: uint256
+    maturity: uint256
+    startTime: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    collateralsHash: bytes32
+    started: bool
+    invalidated: bool
+    paid: bool
+    defaulted: bool
+    canceled: bool
+
+struct LoanCollaterals:
+    borrower: address
+    loanId: uint256
+    collaterals: DynArray[Collateral, 100]
+
+struct PackedLoan:
+    amount: uint256
+    paidPrincipal: uint256
+    paidInterestAmount: uint256
+    terms: uint256
+    collaterals: DynArray[Collateral, 100]
+    collateralsHash: bytes32
+
 struct EIP712Domain:
     name: String[100]
     version: String[10]
@@ -98,6 +126,11 @@ event ContractStatusChanged:
     value: bool
     erc20TokenContract: address
 
+event CollateralsCommitmentChanged:
+    erc20TokenContractIndexed: indexed(address)
+    value: bool
+    erc20TokenContract: address
+
 event ContractDeprecated:
     erc20TokenContractIndexed: indexed(address)
     erc20TokenContract: address
@@ -134,6 +167,13 @@ event LoanDefaulted:
     amount: uint256
     erc20TokenContract: address
 
+event LoanRefinanced:
+    walletIndexed: indexed(address)
+    wallet: address
+    loanId: uint256
+    newLoanId: uint256
+    erc20TokenContract: address
+
 event PaymentSent:
     walletIndexed: indexed(address)
     wallet: address
@@ -206,6 +246,11 @@ def genesisContract() -> IERC721:
 def isPayable() -> bool:
     pass
 
+@view
+@external
+def collateralsCommitment() -> bool:
+    pass
+
 @external
 def initialize(_owner: address, _interestAccrualPeriod: uint256, _lendingPoolContract: address, _collateralVaultContract: address, _genesisContract: address, _isPayable: bool):
     pass
@@ -279,11 +324,21 @@ def getLoanDefaulted(_borrower: address, _loanId: uint256) -> bool:
 def getLoanCanceled(_borrower: address, _loanId: uint256) -> bool:
     pass
 
+@view
+@external
+def getLoanCollateralsHash(_borrower: address, _loanId: uint256) -> bytes32:
+    pass
+
 @view
 @external
 def getLoan(_borrower: address, _loanId: uint256) -> Loan:
     pass
 
+@view
+@external
+def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader:
+    pass
+
 @external
 def proposeOwner(_address: address):
     pass
@@ -316,6 +371,10 @@ def setLiquidationsPeripheralAddress(_address: address):
 def changeContractStatus(_flag: bool):
     pass
 
+@external
+def changeCollateralsCommitment(_flag: bool):
+    pass
+
 @external
 def deprecate():
     pass
@@ -340,13 +399,27 @@ def reserveEth(_amount: uint256, _interest: uint256, _maturity: uint256, _collat
 
 @payable
 @external
-def pay(_loanId: uint256):
+def refinance(_loanId: uint256, _amount: uint256, _interest: uint256, _maturity: uint256, _collaterals: DynArray[Collateral, 100], _delegations: bool, _deadline: uint256, _nonce: uint256, _genesisToken: uint256, _v: uint256, _r: uint256, _s: uint256, _loanCollaterals: DynArray[Collateral, 100]) -> uint256:
+    pass
+
+@payable
+@external
+def pay(_loanId: uint256, _collaterals: DynArray[Collateral, 100]):
+    pass
+
+@payable
+@external
+def payMany(_loanIds: DynArray[uint256, 10], _collaterals: DynArray[DynArray[Collateral, 100], 10]):
+    pass
+
+@external
+def settleDefault(_borrower: address, _loanId: uint256, _collaterals: DynArray[Collateral, 100]):
     pass
 
 @external
-def settleDefault(_borrower: address, _loanId: uint256):
+def settleDefaults(_loans: DynArray[LoanCollaterals, 10]):
     pass
 
 @external
-def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool):
+def setDelegation(_loanId: uint256, _collateralAddress: address, _tokenId: uint256, _value: bool, _collaterals: DynArray[Collateral, 100]):
     pass
\ No newline at end of file
@@ -376,6 +376,7 @@ class LoansCore(ContractConfig):
         version: str | None = None,
         loans_peripheral_key: str,
         abi_key: str,
+        collaterals_migration_done: bool = True,
         address: str | None = None,
     ):
         super().__init__(
@@ -384,9 +385,11 @@ class LoansCore(ContractConfig):
             project.LoansCore,
             version=version,
             abi_key=abi_key,
-            config_deps={loans_peripheral_key: self.set_loansperiph},
+            config_deps={loans_peripheral_key: self.set_loansperiph}
+            | ({key: self.finish_collaterals_migration} if collaterals_migration_done else {}),
         )
         self.loans_peripheral_key = loans_peripheral_key
+        self.collaterals_migration_done = collaterals_migration_done
         if address:
             self.load_contract(address)
 
@@ -395,6 +398,11 @@ class LoansCore(ContractConfig):
     def set_loansperiph(self, context: DeploymentContext):
         execute(context, self.key, "setLoansPeripheral", self.loans_peripheral_key)
 
+    @check_owner
+    @check_different(getter="collateralsMigrationDone", value_property="collaterals_migration_done")
+    def finish_collaterals_migration(self, context: DeploymentContext):
+        execute(context, self.key, "finishCollateralsMigration")
+
 
 @dataclass
 class LoansPeripheral(ContractConfig):
@@ -691,6 +699,7 @@ class CollateralVaultOTCImpl(ContractConfig):
         version: str | None = None,
         punks_contract_key: str,
         delegation_registry_key: str,
+        delegation_registry_version: int = 1,
         abi_key: str,
         address: str | None = None,
     ):
@@ -701,7 +710,7 @@ class CollateralVaultOTCImpl(ContractConfig):
             version=version,
             abi_key=abi_key,
             deployment_deps={punks_contract_key, delegation_registry_key},
-            deployment_args=[punks_contract_key, delegation_registry_key],
+            deployment_args=[punks_contract_key, delegation_registry_key, delegation_registry_version],
         )
         if address:
             self.load_contract(address)
@@ -0,0 +1,69 @@
+import json
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import click
+from rich import print
+
+# must not exceed the batch size accepted by migrateLenders in the contracts
+MAX_BATCH_SIZE = 256
+
+
+# migration progress, stored to disk after every transaction so that an interrupted run can be resumed
+class Cursor:
+    def __init__(self, path: Path, source_core: str, target_core: str):
+        self.path = path
+        self.state = {
+            "source_core": source_core,
+            "target_core": target_core,
+            "wallets": None,
+            "lenders": 0,
+            "locks": 0,
+            "locks_done": False,
+            "done": False,
+        }
+        if path.exists():
+            with path.open(encoding="utf8") as f:
+                state = json.load(f)
+            if (state["source_core"], state["target_core"]) != (source_core, target_core):
+                raise click.ClickException(f"Cursor {path} belongs to another migration")
+            self.state = state
+
+    def __getitem__(self, key):
+        return self.state[key]
+
+    def __setitem__(self, key, value):
+        self.state[key] = value
+        with self.path.open("w", encoding="utf8") as f:
+            json.dump(self.state, f, indent=4)
+
+    def wallets(self, read_wallets: Callable[[], Sequence[str]]) -> list[str]:
+        # the lenders array is reordered as lenders come and go,
+        # so the counters are offsets into the list read by the first run
+        if self.state["wallets"] is None:
+            self["wallets"] = list(read_wallets())
+        return self.state["wallets"]
+
+
+def migrate_in_batches(
+    method: Callable,
+    wallets: list[str],
+    read_item: Callable[[str], Any],
+    *,
+    cursor: Cursor,
+    key: str,
+    owner: Any,
+    target_gas: int,
+    gas_options: dict,
+):
+    batch_size = 1
+    while cursor[key] < len(wallets):
+        offset = cursor[key]
+        batch = [read_item(wallet) for wallet in wallets[offset : offset + batch_size]]
+        receipt = method(batch, sender=owner, **gas_options)
+        cursor[key] = offset + len(batch)
+        print(f"{key}: {cursor[key]}/{len(wallets)} migrated, {receipt.gas_used} gas for {len(batch)}")
+
+        # size the next batch from the gas used per lender in this one
+        batch_size = max(1, min(MAX_BATCH_SIZE, target_gas * len(batch) // max(receipt.gas_used, 1)))
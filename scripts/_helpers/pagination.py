@@ -0,0 +1,56 @@
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# must not exceed MAX_PAGE_SIZE in the contracts, pages are clamped to it
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_WORKERS = 8
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], Sequence[Any]],
+    total: int,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[Any]:
+    if total <= 0:
+        return
+    offsets = iter(range(0, total, page_size))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+
+        def _submit_next():
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append((offset, executor.submit(fetch_page, offset, min(page_size, total - offset))))
+
+        for _ in range(max_workers * 2):
+            _submit_next()
+
+        while pending:
+            offset, future = pending.popleft()
+            page = list(future.result())
+            expected = min(page_size, total - offset)
+            # a page shorter than requested means it was clamped by the contract, fetch the remainder
+            while 0 < len(page) < expected:
+                remainder = list(fetch_page(offset + len(page), expected - len(page)))
+                if not remainder:
+                    # the array shrank since its length was read
+                    break
+                page += remainder
+            yield from page
+            _submit_next()
+
+
+def iter_contract_array(
+    contract: Any,
+    name: str,
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[Any]:
+    total = getattr(contract, f"{name}Length")(*args)
+    page_func = getattr(contract, f"{name}Page")
+    return iter_pages(lambda offset, limit: page_func(*args, offset, limit), total, page_size, max_workers)
@@ -0,0 +1,110 @@
+import logging
+import os
+import warnings
+from pathlib import Path
+
+import click
+from ape import Contract, convert
+from ape.cli import ConnectedProviderCommand
+from rich import print
+
+from ._helpers.deployment import DeploymentManager, Environment
+from ._helpers.migration import Cursor, migrate_in_batches
+from ._helpers.pagination import iter_contract_array
+
+ENV = Environment[os.environ.get("ENV", "local")]
+CHAIN = os.environ.get("CHAIN", "nochain")
+
+DEFAULT_TARGET_GAS = 10_000_000
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+warnings.filterwarnings("ignore")
+
+
+def gas_cost(context):  # noqa: ARG001
+    return {"gas_price": convert("10 gwei", int)}
+
+
+def read_lenders(core) -> list[str]:
+    # legacy cores predate the paginated getters
+    if hasattr(core, "lendersPage"):
+        return list(iter_contract_array(core, "lenders"))
+    return list(core.lendersArray())
+
+
+def lender_funds(core, wallet: str) -> tuple:
+    funds = core.funds(wallet)
+    return (
+        wallet,
+        funds.currentAmountDeposited,
+        funds.totalAmountDeposited,
+        funds.totalAmountWithdrawn,
+        funds.sharesBasisPoints,
+        funds.activeForRewards,
+    )
+
+
+def lender_lock(lock, wallet: str) -> tuple:
+    investor_lock = lock.investorLocks(wallet)
+    return (wallet, investor_lock.lockPeriodEnd, investor_lock.lockPeriodAmount)
+
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option("--pool", required=True, help="pool id in the pools config, eg weth")
+@click.option("--source-core", required=True, help="address of the LendingPoolCore to migrate from")
+@click.option("--source-lock", default=None, help="address of the LendingPoolLock to migrate the lender locks from")
+@click.option("--target-gas", default=DEFAULT_TARGET_GAS, show_default=True, help="gas targeted by each transaction")
+@click.option("--cursor-file", default=None, help="file where the migration progress is kept")
+def cli(network, *, pool, source_core, source_lock, target_gas, cursor_file):
+    print(f"Connected to {network}")
+
+    dm = DeploymentManager(ENV, CHAIN)
+    dm.context.gas_func = gas_cost
+    dm.owner.set_autosign(True)
+    gas_options = dm.context.gas_options()
+
+    target_core = dm.context.contracts[f"{pool.lower()}.lending_pool_core"].contract
+    target_lock = dm.context.contracts[f"{pool.lower()}.lending_pool_lock"].contract
+    source = Contract(source_core)
+
+    cursor_path = Path(cursor_file or f"migration-{pool}-{source_core}.json")
+    cursor = Cursor(cursor_path, source_core, target_core.address)
+    if cursor["done"]:
+        print(f"Migration of {pool} already done")
+        return
+
+    lenders = cursor.wallets(lambda: read_lenders(source))
+    print(f"Migrating {len(lenders)} lenders of {pool} from {source_core}, resuming at {cursor['lenders']}")
+
+    migrate_in_batches(
+        target_core.migrateLenders,
+        lenders,
+        lambda wallet: lender_funds(source, wallet),
+        cursor=cursor,
+        key="lenders",
+        owner=dm.owner,
+        target_gas=target_gas,
+        gas_options=gas_options,
+    )
+
+    if source_lock:
+        lock = Contract(source_lock)
+        migrate_in_batches(
+            target_lock.migrateLenders,
+            lenders,
+            lambda wallet: lender_lock(lock, wallet),
+            cursor=cursor,
+            key="locks",
+            owner=dm.owner,
+            target_gas=target_gas,
+            gas_options=gas_options,
+        )
+        if not cursor["locks_done"]:
+            target_lock.finishMigration(sender=dm.owner, **gas_options)
+            cursor["locks_done"] = True
+
+    target_core.migrate(source_core, sender=dm.owner, **gas_options)
+    cursor["done"] = True
+
+    print("Done")
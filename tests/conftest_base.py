@@ -7,9 +7,16 @@ import pytest
 import vyper
 from boa.contracts.event_decoder import RawLogEntry
 from boa.contracts.vyper.vyper_contract import VyperContract
+from eth_abi import encode
+from eth_account import Account
+from eth_account.messages import HexBytes, SignableMessage
+from eth_utils import keccak
 from web3 import Web3
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+ZERO_BYTES32 = b"\x00" * 32
+
+PERMIT_TYPE_DEF = "Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
 
 
 def get_last_event(contract: VyperContract, name: str | None = None):
@@ -29,6 +36,20 @@ def get_events(contract: VyperContract, name: str | None = None):
     ]
 
 
+def sign_permit(token, owner: Account, spender, value: int, deadline: int):
+    struct_hash = keccak(
+        encode(
+            ["bytes32", "address", "address", "uint256", "uint256", "uint256"],
+            [keccak(text=PERMIT_TYPE_DEF), owner.address, str(spender), value, token.nonces(owner.address), deadline],
+        )
+    )
+    signed_message = Account.sign_message(
+        SignableMessage(HexBytes(b"\x01"), token.DOMAIN_SEPARATOR(), struct_hash),
+        private_key=owner.key,
+    )
+    return (signed_message.v, signed_message.r, signed_message.s)
+
+
 class EventWrapper:
     def __init__(self, event: namedtuple):  # noqa: PYI024
         self.event = event
@@ -503,6 +503,7 @@ def contracts_config(
         collateral_vault_peripheral_contract, sender=contract_owner
     )
     loans_core_contract.setLoansPeripheral(loans_peripheral_contract, sender=contract_owner)
+    loans_core_contract.finishCollateralsMigration(sender=contract_owner)
     loans_peripheral_contract.setLiquidationsPeripheralAddress(liquidations_peripheral_contract, sender=contract_owner)
     loans_peripheral_contract.setLiquidityControlsAddress(liquidity_controls_contract, sender=contract_owner)
     collateral_vault_peripheral_contract.addVault(
@@ -546,5 +547,6 @@ def usdc_contracts_config(
     )
     liquidations_peripheral_contract.addLoansCoreAddress(usdc_contract, usdc_loans_core_contract, sender=contract_owner)
     usdc_loans_core_contract.setLoansPeripheral(usdc_loans_peripheral_contract, sender=contract_owner)
+    usdc_loans_core_contract.finishCollateralsMigration(sender=contract_owner)
     usdc_loans_peripheral_contract.setLiquidationsPeripheralAddress(liquidations_peripheral_contract, sender=contract_owner)
     usdc_loans_peripheral_contract.setLiquidityControlsAddress(usdc_liquidity_controls_contract, sender=contract_owner)
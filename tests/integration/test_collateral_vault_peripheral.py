@@ -1,6 +1,6 @@
 import boa
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event
 
 
 def test_load_contract_config(contracts_config):
@@ -228,6 +228,49 @@ def test_transfer_cryptopunk_collateral_from_loan(
     assert event.toIndexed == borrower
 
 
+def test_store_and_transfer_collaterals_from_loan(
+    collateral_vault_peripheral_contract,
+    collateral_vault_core_contract,
+    cryptopunks_vault_core_contract,
+    loans_peripheral_contract,
+    erc721_contract,
+    cryptopunks_market_contract,
+    cryptopunk_collaterals,
+    erc20_contract,
+    borrower,
+    contract_owner,
+):
+    erc721_contract.mint(borrower, 0, sender=contract_owner)
+    erc721_contract.mint(borrower, 1, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower)
+    cryptopunks_market_contract.offerPunkForSaleToAddress(0, 0, cryptopunks_vault_core_contract, sender=borrower)
+    collaterals = [
+        (erc721_contract.address, 0, 0),
+        (cryptopunks_market_contract.address, 0, 0),
+        (erc721_contract.address, 1, 0),
+    ]
+
+    collateral_vault_peripheral_contract.storeCollaterals(
+        borrower, collaterals, erc20_contract, False, sender=loans_peripheral_contract.address
+    )
+    events = get_events(collateral_vault_peripheral_contract, name="CollateralStored")
+
+    assert erc721_contract.ownerOf(0) == collateral_vault_core_contract.address
+    assert erc721_contract.ownerOf(1) == collateral_vault_core_contract.address
+    assert cryptopunks_market_contract.punkIndexToAddress(0) == cryptopunks_vault_core_contract.address
+    assert [(e.collateralAddress, e.tokenId) for e in events] == [c[:2] for c in collaterals]
+
+    collateral_vault_peripheral_contract.transferCollateralsFromLoan(
+        borrower, collaterals, erc20_contract, sender=loans_peripheral_contract.address
+    )
+    events = get_events(collateral_vault_peripheral_contract, name="CollateralFromLoanTransferred")
+
+    assert erc721_contract.ownerOf(0) == borrower
+    assert erc721_contract.ownerOf(1) == borrower
+    assert cryptopunks_market_contract.punkIndexToAddress(0) == borrower
+    assert [(e.collateralAddress, e.tokenId) for e in events] == [c[:2] for c in collaterals]
+
+
 def test_transfer_collateral_from_liquidation_wrong_sender(collateral_vault_peripheral_contract):
     with boa.reverts("msg.sender is not authorised"):
         collateral_vault_peripheral_contract.transferCollateralFromLiquidation(ZERO_ADDRESS, ZERO_ADDRESS, 0)
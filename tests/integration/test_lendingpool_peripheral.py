@@ -2,9 +2,10 @@ from decimal import Decimal
 
 import boa
 import pytest
+from eth_account import Account
 from web3 import Web3
 
-from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event
+from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event, sign_permit
 
 PROTOCOL_FEES_SHARE = 2500  # parts per 10000, e.g. 2.5% is 250 parts per 10000
 MAX_CAPITAL_EFFICIENCY = 7000  # parts per 10000, e.g. 2.5% is 250 parts per 10000
@@ -556,6 +557,62 @@ def test_deposit_twice(
     assert event_deposit_2.erc20TokenContract == erc20_contract.address
 
 
+def test_deposit_with_permit_invalid_signature(
+    usdc_contracts_config, usdc_lending_pool_peripheral_contract, usdc_lending_pool_core_contract, usdc_contract, investor
+):
+    lender = Account.create()
+    amount = 10**9  # 1000 USDC
+    usdc_contract.transfer(lender.address, amount, sender=investor)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, lender, usdc_lending_pool_core_contract, amount // 2, deadline)
+
+    with boa.reverts("EIP2612: invalid signature"):
+        usdc_lending_pool_peripheral_contract.depositWithPermit(amount, deadline, v, r, s, sender=lender.address)
+
+
+def test_deposit_with_permit_front_run(
+    usdc_contracts_config, usdc_lending_pool_peripheral_contract, usdc_lending_pool_core_contract, usdc_contract, investor
+):
+    lender = Account.create()
+    amount = 10**9  # 1000 USDC
+    usdc_contract.transfer(lender.address, amount, sender=investor)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, lender, usdc_lending_pool_core_contract, amount, deadline)
+    usdc_contract.permit(
+        lender.address, usdc_lending_pool_core_contract, amount, deadline, v, r.to_bytes(32, "big"), s.to_bytes(32, "big")
+    )
+
+    usdc_lending_pool_peripheral_contract.depositWithPermit(amount, deadline, v, r, s, sender=lender.address)
+
+    assert usdc_lending_pool_core_contract.funds(lender.address)[0] == amount
+    assert usdc_contract.balanceOf(lender.address) == 0
+
+
+def test_deposit_with_permit(
+    usdc_contracts_config, usdc_lending_pool_peripheral_contract, usdc_lending_pool_core_contract, usdc_contract, investor
+):
+    lender = Account.create()
+    amount = 10**9  # 1000 USDC
+    usdc_contract.transfer(lender.address, amount, sender=investor)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, lender, usdc_lending_pool_core_contract, amount, deadline)
+    usdc_lending_pool_peripheral_contract.depositWithPermit(amount, deadline, v, r, s, sender=lender.address)
+    event = get_last_event(usdc_lending_pool_peripheral_contract, name="Deposit")
+
+    investor_funds = usdc_lending_pool_core_contract.funds(lender.address)
+    assert investor_funds[0] == amount
+    assert investor_funds[1] == amount
+    assert usdc_contract.balanceOf(lender.address) == 0
+    assert usdc_contract.nonces(lender.address) == 1
+
+    assert event.wallet == lender.address
+    assert event.amount == amount
+    assert event.erc20TokenContract == usdc_contract.address
+
+
 def test_deposit_max_pool_share_enabled(
     lending_pool_peripheral_contract,
     lending_pool_core_contract,
@@ -930,6 +987,13 @@ def test_receive_funds_eth(
     assert lending_pool_core_contract.funds(investor)[3] == Web3.to_wei(1, "ether")
     assert lending_pool_core_contract.computeWithdrawableAmount(investor) == Web3.to_wei(1 + expected_pool_fees, "ether")
 
+    assert lending_pool_core_contract.protocolFeesAccrued() == Web3.to_wei(expected_protocol_fees, "ether")
+    assert user_balance(erc20_contract, lending_pool_core_contract) == (
+        Web3.to_wei(1 + expected_pool_fees, "ether") + Web3.to_wei(expected_protocol_fees, "ether")
+    )
+
+    lending_pool_peripheral_contract.claimProtocolFees(sender=contract_owner)
+    assert lending_pool_core_contract.protocolFeesAccrued() == 0
     assert user_balance(erc20_contract, protocol_wallet) == initial_protocol_balance + Web3.to_wei(
         expected_protocol_fees, "ether"
     )
@@ -979,6 +1043,13 @@ def test_receive_funds_weth(
     assert lending_pool_core_contract.funds(investor)[3] == Web3.to_wei(1, "ether")
     assert lending_pool_core_contract.computeWithdrawableAmount(investor) == Web3.to_wei(1 + expected_pool_fees, "ether")
 
+    assert lending_pool_core_contract.protocolFeesAccrued() == Web3.to_wei(expected_protocol_fees, "ether")
+    assert user_balance(erc20_contract, lending_pool_core_contract) == (
+        Web3.to_wei(1 + expected_pool_fees, "ether") + Web3.to_wei(expected_protocol_fees, "ether")
+    )
+
+    lending_pool_peripheral_contract.claimProtocolFees(sender=contract_owner)
+    assert lending_pool_core_contract.protocolFeesAccrued() == 0
     assert user_balance(erc20_contract, protocol_wallet) == initial_protocol_balance + Web3.to_wei(
         expected_protocol_fees, "ether"
     )
@@ -1037,6 +1108,13 @@ def test_receive_funds_multiple_lenders_weth(
         3 + expected_lender2_rewards, "ether"
     )
 
+    assert lending_pool_core_contract.protocolFeesAccrued() == Web3.to_wei(expected_protocol_fees, "ether")
+    assert user_balance(erc20_contract, lending_pool_core_contract) == (
+        Web3.to_wei(4 + expected_pool_fees, "ether") + Web3.to_wei(expected_protocol_fees, "ether")
+    )
+
+    lending_pool_peripheral_contract.claimProtocolFees(sender=contract_owner)
+    assert lending_pool_core_contract.protocolFeesAccrued() == 0
     assert user_balance(erc20_contract, protocol_wallet) == initial_protocol_balance + Web3.to_wei(
         expected_protocol_fees, "ether"
     )
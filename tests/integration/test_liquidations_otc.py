@@ -257,6 +257,7 @@ def test_pay_loan_liquidations_grace_period(
     assert event_nft_purchased2.erc20TokenContract == erc20_contract.address
     assert event_nft_purchased2.method == "GRACE_PERIOD"
 
+    assert len(fund_receipt_events) == 1
     for event in fund_receipt_events:
         assert event.fundsOrigin == "liquidation_grace_period"
 
@@ -335,3 +336,70 @@ def test_claim(
     assert event_nft_claimed.method == "OTC_CLAIM"
 
     assert liquidations_otc_contract.isLoanLiquidated(borrower, loans_core_contract, loan_id)
+
+
+def test_claim_many(
+    liquidations_otc_contract,
+    loans_peripheral_contract,
+    loans_core_contract,
+    lendingpool_otc_contract,
+    collateral_vault_peripheral_contract,
+    collateral_vault_core_contract,
+    liquidity_controls_contract,
+    erc721_contract,
+    erc20_contract,
+    borrower,
+    contract_owner,
+    investor,
+):
+    erc721_contract.mint(collateral_vault_core_contract, 0, sender=contract_owner)
+    erc721_contract.mint(collateral_vault_core_contract, 1, sender=contract_owner)
+
+    lendingpool_otc_contract.depositEth(sender=investor, value=LOAN_AMOUNT * 2)
+    lendingpool_otc_contract.sendFundsEth(contract_owner, LOAN_AMOUNT, sender=loans_peripheral_contract.address)
+
+    loan_id = loans_core_contract.addLoan(
+        borrower,
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        [(erc721_contract.address, 0, LOAN_AMOUNT // 2), (erc721_contract.address, 1, LOAN_AMOUNT // 2)],
+        sender=loans_peripheral_contract.address,
+    )
+
+    loans_core_contract.updateLoanStarted(borrower, loan_id, sender=loans_peripheral_contract.address)
+    loans_core_contract.updateDefaultedLoan(borrower, loan_id, sender=loans_peripheral_contract.address)
+
+    liquidations_otc_contract.addLiquidation(borrower, loan_id, erc20_contract)
+
+    liquidation1 = Liquidation(*liquidations_otc_contract.getLiquidation(erc721_contract.address, 0))
+    liquidation2 = Liquidation(*liquidations_otc_contract.getLiquidation(erc721_contract.address, 1))
+    collaterals = [(erc721_contract.address, 0, 0), (erc721_contract.address, 1, 0)]
+
+    with boa.reverts("liquidation in grace period"):
+        liquidations_otc_contract.claimMany(collaterals, sender=investor)
+
+    boa.env.time_travel(seconds=GRACE_PERIOD_DURATION + 1)
+
+    with boa.reverts("no collaterals to claim"):
+        liquidations_otc_contract.claimMany([], sender=investor)
+
+    with boa.reverts("msg.sender is not a lender"):
+        liquidations_otc_contract.claimMany(collaterals, sender=borrower)
+
+    liquidations_otc_contract.claimMany(collaterals, sender=investor)
+
+    assert erc721_contract.ownerOf(0) == investor
+    assert erc721_contract.ownerOf(1) == investor
+
+    event_nft_claimed = get_last_event(liquidations_otc_contract, name="NFTClaimed")
+
+    assert event_nft_claimed.liquidationId == liquidation2.lid
+    assert event_nft_claimed.tokenId == 1
+    assert event_nft_claimed.buyerAddress == investor
+    assert event_nft_claimed.method == "OTC_CLAIM"
+
+    assert lendingpool_otc_contract.collateralClaimsValue() == liquidation1.principal + liquidation2.principal
+    assert lendingpool_otc_contract.fundsInvested() == 0
+
+    assert liquidations_otc_contract.isLoanLiquidated(borrower, loans_core_contract, loan_id)
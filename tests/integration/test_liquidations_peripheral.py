@@ -4,9 +4,10 @@ from decimal import Decimal
 import boa
 import eth_abi
 import pytest
+from eth_account import Account
 from web3 import Web3
 
-from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event
+from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event, sign_permit
 
 GRACE_PERIOD_DURATION = 50
 LENDER_PERIOD_DURATION = 50
@@ -619,6 +620,62 @@ def test_pay_loan_liquidations_grace_period_usdc(
     assert liquidations_core_contract.isLoanLiquidated(borrower, usdc_loans_core_contract, loan_id)
 
 
+def test_pay_loan_liquidations_grace_period_with_permit_usdc(
+    usdc_contracts_config,
+    liquidations_peripheral_contract,
+    liquidations_core_contract,
+    usdc_loans_peripheral_contract,
+    usdc_loans_core_contract,
+    usdc_lending_pool_peripheral_contract,
+    usdc_lending_pool_core_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    usdc_contract,
+    contract_owner,
+):
+    loan_amount = 10**9  # 1000 USDC
+    borrower = Account.create()
+
+    erc721_contract.mint(collateral_vault_core_contract, 0, sender=contract_owner)
+
+    usdc_contract.approve(usdc_lending_pool_core_contract, 2 * loan_amount, sender=contract_owner)
+    usdc_lending_pool_peripheral_contract.deposit(2 * loan_amount, sender=contract_owner)
+    usdc_lending_pool_peripheral_contract.sendFunds(contract_owner, loan_amount, sender=usdc_loans_peripheral_contract.address)
+
+    loan_id = usdc_loans_core_contract.addLoan(
+        borrower.address,
+        loan_amount,
+        LOAN_INTEREST,
+        MATURITY,
+        [(erc721_contract.address, 0, loan_amount)],
+        sender=usdc_loans_peripheral_contract.address,
+    )
+
+    usdc_loans_core_contract.updateLoanStarted(borrower.address, loan_id, sender=usdc_loans_peripheral_contract.address)
+    usdc_loans_core_contract.updateDefaultedLoan(borrower.address, loan_id, sender=usdc_loans_peripheral_contract.address)
+
+    liquidations_peripheral_contract.addLiquidation(borrower.address, loan_id, usdc_contract)
+
+    liquidation = liquidations_peripheral_contract.getLiquidation(erc721_contract, 0)
+    usdc_contract.transfer(borrower.address, liquidation[9], sender=contract_owner)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, borrower, usdc_lending_pool_core_contract, liquidation[9], deadline)
+    liquidations_peripheral_contract.payLoanLiquidationsGracePeriodWithPermit(
+        loan_id, usdc_contract, liquidation[9], deadline, v, r, s, sender=borrower.address
+    )
+    event_nft_purchased = get_last_event(liquidations_peripheral_contract, name="NFTPurchased")
+
+    assert event_nft_purchased.liquidationId == liquidation[0]
+    assert event_nft_purchased.amount == liquidation[9]
+    assert event_nft_purchased.buyerAddress == borrower.address
+    assert event_nft_purchased.method == "GRACE_PERIOD"
+
+    assert erc721_contract.ownerOf(0) == borrower.address
+    assert usdc_contract.balanceOf(borrower.address) == 0
+    assert liquidations_core_contract.isLoanLiquidated(borrower.address, usdc_loans_core_contract, loan_id)
+
+
 def test_add_liquidation_without_pair(
     liquidations_peripheral_contract,
     loans_peripheral_contract,
@@ -781,6 +838,7 @@ def test_pay_loan_liquidations_grace_period(
     assert event_nft_purchased2.erc20TokenContract == erc20_contract.address
     assert event_nft_purchased2.method == "GRACE_PERIOD"
 
+    assert len(fund_receipt_events) == 1
     for event in fund_receipt_events:
         assert event.fundsOrigin == "liquidation_grace_period"
 
@@ -983,6 +1041,145 @@ def test_buy_nft_lender_period(
     assert liquidations_core_contract.isLoanLiquidated(borrower, loans_core_contract, loan_id)
 
 
+def test_buy_nfts_lender_period(
+    contracts_config,
+    liquidations_peripheral_contract,
+    liquidations_core_contract,
+    loans_peripheral_contract,
+    loans_core_contract,
+    lending_pool_peripheral_contract,
+    lending_pool_core_contract,
+    collateral_vault_peripheral_contract,
+    collateral_vault_core_contract,
+    liquidity_controls_contract,
+    erc721_contract,
+    erc20_contract,
+    borrower,
+    contract_owner,
+):
+    erc721_contract.mint(collateral_vault_core_contract, 0)
+    erc721_contract.mint(collateral_vault_core_contract, 1)
+    lending_pool_peripheral_contract.depositEth(sender=contract_owner, value=LOAN_AMOUNT * 2)
+    lending_pool_peripheral_contract.sendFundsEth(contract_owner, LOAN_AMOUNT, sender=loans_peripheral_contract.address)
+
+    loan_id = loans_core_contract.addLoan(
+        borrower,
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        [(erc721_contract.address, 0, LOAN_AMOUNT // 2), (erc721_contract.address, 1, LOAN_AMOUNT // 2)],
+        sender=loans_peripheral_contract.address,
+    )
+    loans_core_contract.updateLoanStarted(borrower, loan_id, sender=loans_peripheral_contract.address)
+    loans_core_contract.updateDefaultedLoan(borrower, loan_id, sender=loans_peripheral_contract.address)
+
+    liquidations_peripheral_contract.addLiquidation(borrower, loan_id, erc20_contract)
+
+    liquidation1 = liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 0)
+    liquidation2 = liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 1)
+    collaterals = [(erc721_contract.address, 0, 0), (erc721_contract.address, 1, 0)]
+    total_price = liquidation1[10] + liquidation2[10]
+
+    with boa.reverts("liquidation in grace period"):
+        liquidations_peripheral_contract.buyNFTsLenderPeriod(collaterals, sender=contract_owner, value=total_price)
+
+    boa.env.time_travel(seconds=GRACE_PERIOD_DURATION + 1)
+
+    with boa.reverts("no collaterals to buy"):
+        liquidations_peripheral_contract.buyNFTsLenderPeriod([], sender=contract_owner, value=total_price)
+
+    with boa.reverts("msg.sender is not a lender"):
+        liquidations_peripheral_contract.buyNFTsLenderPeriod(collaterals, sender=borrower, value=total_price)
+
+    with boa.reverts("insufficient value received"):
+        liquidations_peripheral_contract.buyNFTsLenderPeriod(collaterals, sender=contract_owner, value=total_price - 1)
+
+    liquidations_peripheral_contract.buyNFTsLenderPeriod(collaterals, sender=contract_owner, value=total_price)
+    event_nft_purchased = get_last_event(liquidations_peripheral_contract, name="NFTPurchased")
+    event_funds_receipt = get_last_event(liquidations_peripheral_contract, name="FundsReceipt")
+
+    assert erc721_contract.ownerOf(0) == contract_owner
+    assert erc721_contract.ownerOf(1) == contract_owner
+    assert liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 0)[1] == ZERO_ADDRESS
+    assert liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 1)[1] == ZERO_ADDRESS
+
+    assert event_nft_purchased.liquidationId == liquidation2[0]
+    assert event_nft_purchased.tokenId == 1
+    assert event_nft_purchased.amount == liquidation2[10]
+    assert event_nft_purchased.buyerAddress == contract_owner
+    assert event_nft_purchased.method == "LENDER_PERIOD"
+
+    assert event_funds_receipt.amount == liquidation1[6] + liquidation2[6]
+    assert event_funds_receipt.fundsOrigin == "liquidation_lenders_period"
+
+    assert liquidations_core_contract.isLoanLiquidated(borrower, loans_core_contract, loan_id)
+
+
+def test_buy_nfts_lender_period_with_permit_usdc(
+    usdc_contracts_config,
+    liquidations_peripheral_contract,
+    liquidations_core_contract,
+    usdc_loans_peripheral_contract,
+    usdc_loans_core_contract,
+    usdc_lending_pool_peripheral_contract,
+    usdc_lending_pool_core_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    usdc_contract,
+    borrower,
+    contract_owner,
+):
+    loan_amount = 10**9  # 1000 USDC
+    lender = Account.create()
+
+    erc721_contract.mint(collateral_vault_core_contract, 0, sender=contract_owner)
+    erc721_contract.mint(collateral_vault_core_contract, 1, sender=contract_owner)
+
+    usdc_contract.approve(usdc_lending_pool_core_contract, 2 * loan_amount, sender=contract_owner)
+    usdc_lending_pool_peripheral_contract.deposit(2 * loan_amount, sender=contract_owner)
+    usdc_lending_pool_peripheral_contract.sendFunds(contract_owner, loan_amount, sender=usdc_loans_peripheral_contract.address)
+
+    loan_id = usdc_loans_core_contract.addLoan(
+        borrower,
+        loan_amount,
+        LOAN_INTEREST,
+        MATURITY,
+        [(erc721_contract.address, 0, loan_amount // 2), (erc721_contract.address, 1, loan_amount // 2)],
+        sender=usdc_loans_peripheral_contract.address,
+    )
+    usdc_loans_core_contract.updateLoanStarted(borrower, loan_id, sender=usdc_loans_peripheral_contract.address)
+    usdc_loans_core_contract.updateDefaultedLoan(borrower, loan_id, sender=usdc_loans_peripheral_contract.address)
+
+    liquidations_peripheral_contract.addLiquidation(borrower, loan_id, usdc_contract)
+
+    liquidation1 = liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 0)
+    liquidation2 = liquidations_peripheral_contract.getLiquidation(erc721_contract.address, 1)
+    collaterals = [(erc721_contract.address, 0, 0), (erc721_contract.address, 1, 0)]
+    total_price = liquidation1[10] + liquidation2[10]
+
+    # the buyer must be a lender of the pool
+    usdc_contract.transfer(lender.address, total_price + 1, sender=contract_owner)
+    usdc_contract.approve(usdc_lending_pool_core_contract, 1, sender=lender.address)
+    usdc_lending_pool_peripheral_contract.deposit(1, sender=lender.address)
+
+    boa.env.time_travel(seconds=GRACE_PERIOD_DURATION + 1)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, lender, usdc_lending_pool_core_contract, total_price, deadline)
+    liquidations_peripheral_contract.buyNFTsLenderPeriodWithPermit(
+        collaterals, usdc_contract, total_price, deadline, v, r, s, sender=lender.address
+    )
+    event_nft_purchased = get_last_event(liquidations_peripheral_contract, name="NFTPurchased")
+
+    assert erc721_contract.ownerOf(0) == lender.address
+    assert erc721_contract.ownerOf(1) == lender.address
+    assert event_nft_purchased.buyerAddress == lender.address
+    assert event_nft_purchased.method == "LENDER_PERIOD"
+
+    assert usdc_contract.balanceOf(lender.address) == 0
+    assert liquidations_core_contract.isLoanLiquidated(borrower, usdc_loans_core_contract, loan_id)
+
+
 def test_admin_withdrawal_wrong_sender(liquidations_peripheral_contract, erc721_contract, borrower, contract_owner):
     with boa.reverts("msg.sender is not the owner"):
         liquidations_peripheral_contract.adminWithdrawal(contract_owner, erc721_contract.address, 0, sender=borrower)
@@ -13,7 +13,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from web3 import Web3
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, get_last_event, sign_permit
 
 MAX_LOAN_DURATION = 31 * 24 * 60 * 60  # 31 days
 MATURITY = int(dt.datetime.now().timestamp()) + 30 * 24 * 60 * 60
@@ -167,11 +167,14 @@ def test_load_contract_config(contracts_config):
     pass  # contracts_config fixture active from this point on
 
 
-def test_initial_state(loans_peripheral_contract, contract_owner):
+def test_initial_state(loans_peripheral_contract, lending_pool_core_contract, erc20_contract, contract_owner):
     # Check if the constructor of the contract is set up properly
     assert loans_peripheral_contract.owner() == contract_owner
     assert loans_peripheral_contract.isAcceptingLoans() is True
     assert loans_peripheral_contract.isDeprecated() is False
+    assert loans_peripheral_contract.erc20TokenContract() == erc20_contract.address
+    assert loans_peripheral_contract.lendingPoolCoreContract() == lending_pool_core_contract.address
+    assert loans_peripheral_contract.erc20TokenSymbol() == erc20_contract.symbol()
 
 
 def test_propose_owner_wrong_sender(loans_peripheral_contract, borrower):
@@ -1109,6 +1112,146 @@ def test_pay_loan(
     assert boa.env.get_balance(borrower) + payable_amount == borrower_initial_balance + LOAN_AMOUNT
 
 
+def test_pay_many(
+    loans_peripheral_contract,
+    create_signature,
+    loans_core_contract,
+    lending_pool_peripheral_contract,
+    lending_pool_core_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    contract_owner,
+    borrower,
+    investor,
+):
+    lending_pool_peripheral_contract.depositEth(sender=investor, value=Web3.to_wei(1, "ether"))
+
+    for k in range(10):
+        erc721_contract.mint(borrower, k, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower)
+
+    loan_ids = []
+    for nonce in range(2):
+        collaterals = [(erc721_contract.address, k, LOAN_AMOUNT // 5) for k in range(nonce * 5, nonce * 5 + 5)]
+        (v, r, s) = create_signature(collaterals=collaterals, nonce=nonce)
+        loan_ids.append(
+            loans_peripheral_contract.reserveEth(
+                LOAN_AMOUNT,
+                LOAN_INTEREST,
+                MATURITY,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower,
+            )
+        )
+
+    boa.env.time_travel(seconds=14 * 86400)
+
+    now = boa.eval("block.timestamp")
+    payable_amounts = [loans_peripheral_contract.getLoanPayableAmount(borrower, loan_id, now) for loan_id in loan_ids]
+    borrower_balance = boa.env.get_balance(borrower)
+    funds_in_pool = lending_pool_core_contract.fundsInPool()
+
+    loans_peripheral_contract.payMany(loan_ids, sender=borrower, value=sum(payable_amounts))
+
+    for loan_id, payable_amount in zip(loan_ids, payable_amounts):
+        assert loans_core_contract.getLoanPaid(borrower, loan_id)
+        assert (
+            loans_core_contract.getLoanPaidPrincipal(borrower, loan_id)
+            + loans_core_contract.getLoanPaidInterestAmount(borrower, loan_id)
+            == payable_amount
+        )
+
+    for k in range(10):
+        assert erc721_contract.ownerOf(k) == borrower
+
+    assert boa.env.get_balance(borrower) == borrower_balance - sum(payable_amounts)
+    assert lending_pool_core_contract.fundsInPool() > funds_in_pool + 2 * LOAN_AMOUNT
+
+
+def test_refinance(
+    loans_peripheral_contract,
+    create_signature,
+    loans_core_contract,
+    lending_pool_peripheral_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    contract_owner,
+    borrower,
+    investor,
+    test_collaterals,
+):
+    lending_pool_peripheral_contract.depositEth(sender=investor, value=Web3.to_wei(1, "ether"))
+
+    for k in range(5):
+        erc721_contract.mint(borrower, k, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower)
+
+    (v, r, s) = create_signature()
+    loan_id = loans_peripheral_contract.reserveEth(
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        test_collaterals,
+        False,
+        VALIDATION_DEADLINE,
+        0,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+    )
+
+    boa.env.time_travel(seconds=14 * 86400)
+
+    payable_amount = loans_peripheral_contract.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    borrower_balance = boa.env.get_balance(borrower)
+
+    new_amount = 2 * LOAN_AMOUNT
+    new_collaterals = [(c[0], c[1], new_amount // 5) for c in test_collaterals]
+    (v, r, s) = create_signature(collaterals=new_collaterals, amount=new_amount, nonce=1)
+    new_loan_id = loans_peripheral_contract.refinance(
+        loan_id,
+        new_amount,
+        LOAN_INTEREST,
+        MATURITY,
+        new_collaterals,
+        False,
+        VALIDATION_DEADLINE,
+        1,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+    )
+    loan_refinanced_event = get_last_event(loans_peripheral_contract, name="LoanRefinanced")
+
+    assert loans_core_contract.getLoanPaid(borrower, loan_id)
+    assert (
+        loans_core_contract.getLoanPaidPrincipal(borrower, loan_id)
+        + loans_core_contract.getLoanPaidInterestAmount(borrower, loan_id)
+        == payable_amount
+    )
+    assert loans_core_contract.getLoanStarted(borrower, new_loan_id)
+    assert loans_core_contract.getLoanAmount(borrower, new_loan_id) == new_amount
+
+    assert loan_refinanced_event.loanId == loan_id
+    assert loan_refinanced_event.newLoanId == new_loan_id
+
+    for collateral in test_collaterals:
+        assert erc721_contract.ownerOf(collateral[1]) == collateral_vault_core_contract.address
+
+    assert boa.env.get_balance(borrower) == borrower_balance + new_amount - payable_amount
+
+
 def test_pay_loan_usdc(
     usdc_contracts_config,
     usdc_loans_peripheral_contract,
@@ -1182,6 +1325,129 @@ def test_pay_loan_usdc(
     assert usdc_contract.balanceOf(borrower) + payable_amount == borrower_initial_balance + amount
 
 
+def test_pay_loan_with_permit_usdc(
+    usdc_contracts_config,
+    usdc_loans_peripheral_contract,
+    create_signature,
+    usdc_loans_core_contract,
+    usdc_lending_pool_peripheral_contract,
+    usdc_lending_pool_core_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    usdc_contract,
+    contract_owner,
+    investor,
+):
+    amount = 10**9  # 1000 USDC
+    borrower = Account.create()
+
+    usdc_contract.approve(usdc_lending_pool_core_contract, 2 * amount, sender=investor)
+    usdc_lending_pool_peripheral_contract.deposit(2 * amount, sender=investor)
+
+    for k in range(5):
+        erc721_contract.mint(borrower.address, k, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower.address)
+    test_collaterals = [(erc721_contract.address, k, amount // 5) for k in range(5)]
+
+    (v, r, s) = create_signature(
+        amount=amount, collaterals=test_collaterals, borrower=borrower.address, verifier=usdc_loans_peripheral_contract
+    )
+    loan_id = usdc_loans_peripheral_contract.reserve(
+        amount, LOAN_INTEREST, MATURITY, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower.address
+    )
+
+    boa.env.time_travel(seconds=14 * 86400)
+
+    payable_amount = usdc_loans_peripheral_contract.getLoanPayableAmount(
+        borrower.address, loan_id, boa.eval("block.timestamp")
+    )
+    usdc_contract.transfer(borrower.address, payable_amount - amount, sender=investor)
+    deadline = boa.eval("block.timestamp") + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, borrower, usdc_lending_pool_core_contract, payable_amount, deadline)
+    usdc_loans_peripheral_contract.payWithPermit(loan_id, payable_amount, deadline, v, r, s, sender=borrower.address)
+    loan_paid_event = get_last_event(usdc_loans_peripheral_contract, name="LoanPaid")
+
+    assert usdc_loans_core_contract.getLoanPaid(borrower.address, loan_id)
+    assert loan_paid_event.wallet == borrower.address
+    assert loan_paid_event.loanId == loan_id
+    assert usdc_contract.balanceOf(borrower.address) == 0
+
+    for collateral in test_collaterals:
+        assert erc721_contract.ownerOf(collateral[1]) == borrower.address
+
+
+def test_pay_many_with_permit_usdc(
+    usdc_contracts_config,
+    usdc_loans_peripheral_contract,
+    create_signature,
+    usdc_loans_core_contract,
+    usdc_lending_pool_peripheral_contract,
+    usdc_lending_pool_core_contract,
+    collateral_vault_core_contract,
+    erc721_contract,
+    usdc_contract,
+    contract_owner,
+    investor,
+):
+    amount = 10**9  # 1000 USDC
+    borrower = Account.create()
+
+    usdc_contract.approve(usdc_lending_pool_core_contract, 4 * amount, sender=investor)
+    usdc_lending_pool_peripheral_contract.deposit(4 * amount, sender=investor)
+
+    for k in range(10):
+        erc721_contract.mint(borrower.address, k, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower.address)
+
+    loan_ids = []
+    for nonce in range(2):
+        collaterals = [(erc721_contract.address, k, amount // 5) for k in range(nonce * 5, nonce * 5 + 5)]
+        (v, r, s) = create_signature(
+            amount=amount,
+            collaterals=collaterals,
+            nonce=nonce,
+            borrower=borrower.address,
+            verifier=usdc_loans_peripheral_contract,
+        )
+        loan_ids.append(
+            usdc_loans_peripheral_contract.reserve(
+                amount,
+                LOAN_INTEREST,
+                MATURITY,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower.address,
+            )
+        )
+
+    boa.env.time_travel(seconds=14 * 86400)
+
+    now = boa.eval("block.timestamp")
+    total_payable = sum(
+        usdc_loans_peripheral_contract.getLoanPayableAmount(borrower.address, loan_id, now) for loan_id in loan_ids
+    )
+    usdc_contract.transfer(borrower.address, total_payable - 2 * amount, sender=investor)
+    deadline = now + 3600
+
+    (v, r, s) = sign_permit(usdc_contract, borrower, usdc_lending_pool_core_contract, total_payable, deadline)
+    usdc_loans_peripheral_contract.payManyWithPermit(loan_ids, total_payable, deadline, v, r, s, sender=borrower.address)
+
+    for loan_id in loan_ids:
+        assert usdc_loans_core_contract.getLoanPaid(borrower.address, loan_id)
+
+    for k in range(10):
+        assert erc721_contract.ownerOf(k) == borrower.address
+
+    assert usdc_contract.balanceOf(borrower.address) == 0
+
+
 def test_pay_loan_already_paid(
     loans_peripheral_contract,
     create_signature,
@@ -1319,6 +1585,63 @@ def test_set_default_loan(
         assert not liquidation.inAuction
 
 
+def test_settle_defaults(
+    contracts_config,
+    loans_peripheral_contract,
+    create_signature,
+    loans_core_contract,
+    lending_pool_peripheral_contract,
+    collateral_vault_core_contract,
+    liquidations_core_contract,
+    erc721_contract,
+    contract_owner,
+    investor,
+    borrower,
+):
+    lending_pool_peripheral_contract.depositEth(sender=investor, value=Web3.to_wei(1, "ether"))
+
+    for k in range(10):
+        erc721_contract.mint(borrower, k, sender=contract_owner)
+    erc721_contract.setApprovalForAll(collateral_vault_core_contract, True, sender=borrower)
+
+    maturity = boa.eval("block.timestamp") + 10
+    loan_ids = []
+    for nonce in range(2):
+        collaterals = [(erc721_contract.address, k, LOAN_AMOUNT // 5) for k in range(nonce * 5, nonce * 5 + 5)]
+        (v, r, s) = create_signature(collaterals=collaterals, maturity=maturity, nonce=nonce)
+        loan_ids.append(
+            loans_peripheral_contract.reserveEth(
+                LOAN_AMOUNT,
+                LOAN_INTEREST,
+                maturity,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower,
+            )
+        )
+
+    boa.env.time_travel(seconds=15)
+
+    loans_peripheral_contract.settleDefault(borrower, loan_ids[0], sender=contract_owner)
+    loans_peripheral_contract.settleDefaults([(borrower, loan_id, []) for loan_id in loan_ids], sender=contract_owner)
+
+    for loan_id in loan_ids:
+        assert loans_core_contract.getLoanDefaulted(borrower, loan_id)
+        assert liquidations_core_contract.isLoanLiquidated(borrower, loans_core_contract, loan_id)
+
+    for k in range(10):
+        liquidation = Liquidation(*liquidations_core_contract.getLiquidation(erc721_contract, k))
+        assert liquidation.borrower == borrower
+        assert liquidation.loanId == loan_ids[k // 5]
+        assert liquidation.principal == LOAN_AMOUNT // 5
+
+
 @given(
     loan_duration=st.integers(min_value=1, max_value=90),
     passed_time=st.integers(min_value=1, max_value=200),
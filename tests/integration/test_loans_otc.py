@@ -78,7 +78,7 @@ def collateral_vault_otc_contract(
     collateral_vault_otc_contract_def, cryptopunks_market_contract, delegation_registry_contract, contract_owner
 ):
     with boa.env.prank(contract_owner):
-        contract = collateral_vault_otc_contract_def.deploy(cryptopunks_market_contract, delegation_registry_contract)
+        contract = collateral_vault_otc_contract_def.deploy(cryptopunks_market_contract, delegation_registry_contract, 1)
         proxy_address = contract.create_proxy()
         return collateral_vault_otc_contract_def.at(proxy_address)
 
@@ -0,0 +1,47 @@
+# @version 0.4.1
+
+# Aggregates the collateral amounts per collection, both in memory as Loans._collectionsAmounts does and with the
+# storage map Loans used before as scratch space, so the reserve gas saving can be measured on its own
+
+# Structs
+
+struct Collateral:
+    contractAddress: address
+    tokenId: uint256
+    amount: uint256
+
+
+# Global variables
+
+collectionsAmount: HashMap[address, uint256]
+
+
+@external
+def collectionsAmountsInMemory(_collaterals: DynArray[Collateral, 100]) -> (DynArray[address, 100], DynArray[uint256, 100]):
+    collections: DynArray[address, 100] = []
+    amounts: DynArray[uint256, 100] = []
+    for collateral: Collateral in _collaterals:
+        found: bool = False
+        for i: uint256 in range(len(collections), bound=100):
+            if collections[i] == collateral.contractAddress:
+                amounts[i] += collateral.amount
+                found = True
+                break
+        if not found:
+            collections.append(collateral.contractAddress)
+            amounts.append(collateral.amount)
+    return collections, amounts
+
+
+@external
+def collectionsAmountsInStorage(_collaterals: DynArray[Collateral, 100]) -> (DynArray[address, 100], DynArray[uint256, 100]):
+    collections: DynArray[address, 100] = []
+    for collateral: Collateral in _collaterals:
+        if collateral.contractAddress not in collections:
+            collections.append(collateral.contractAddress)
+            self.collectionsAmount[collateral.contractAddress] = 0
+        self.collectionsAmount[collateral.contractAddress] += collateral.amount
+    amounts: DynArray[uint256, 100] = []
+    for collection: address in collections:
+        amounts.append(self.collectionsAmount[collection])
+    return collections, amounts
@@ -66,6 +66,20 @@ def transferFrom(_from: address, _to: address, _value: uint256) -> bool:
 def approve(_spender: address, _value: uint256) -> bool:
     return False
 
+@view
+@external
+def nonces(arg0: address) -> uint256:
+    return 0
+
+@view
+@external
+def DOMAIN_SEPARATOR() -> bytes32:
+    return empty(bytes32)
+
+@external
+def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32):
+    pass
+
 @external
 @payable
 def deposit():
@@ -121,6 +121,11 @@ def collateral_vault_otc_contract():
     return boa.load_partial("contracts/CollateralVaultOTC.vy")
 
 
+@pytest.fixture(scope="session")
+def liquidity_controls_contract():
+    return boa.load_partial("contracts/LiquidityControls.vy")
+
+
 @pytest.fixture(scope="session")
 def loans_core_contract():
     return boa.load_partial("contracts/LoansCore.vy")
@@ -15,14 +15,23 @@ def borrower():
 
 
 @pytest.fixture(scope="module")
-def collateral_vault_core(collateral_vault_core_contract, contract_owner):
+def delegation_registry(delegation_registry_contract, contract_owner):
     with boa.env.prank(contract_owner):
-        return collateral_vault_core_contract.deploy(boa.env.generate_address())
+        return delegation_registry_contract.deploy()
 
 
-def test_initial_state(collateral_vault_core, contract_owner):
+@pytest.fixture(scope="module")
+def collateral_vault_core(collateral_vault_core_contract, delegation_registry, contract_owner):
+    with boa.env.prank(contract_owner):
+        return collateral_vault_core_contract.deploy(delegation_registry)
+
+
+def test_initial_state(collateral_vault_core, delegation_registry, contract_owner):
     # Check if the constructor of the contract is set up properly
     assert collateral_vault_core.owner() == contract_owner
+    assert collateral_vault_core.delegationRegistry() == delegation_registry.address
+    assert collateral_vault_core.delegationRegistryVersion() == 1
+    assert collateral_vault_core.previousDelegationRegistry() == ZERO_ADDRESS
 
 
 def test_propose_owner_wrong_sender(collateral_vault_core, borrower):
@@ -108,3 +117,37 @@ def test_set_collateral_vault_address_peripheral_same_address(collateral_vault_c
 
     with boa.reverts("new value is the same"):
         collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+
+def test_set_delegation_registry_wrong_sender(collateral_vault_core, delegation_registry_contract, borrower):
+    with boa.reverts("msg.sender is not the owner"):
+        collateral_vault_core.setDelegationRegistry(delegation_registry_contract.deploy(), 2, sender=borrower)
+
+
+def test_set_delegation_registry_zero_address(collateral_vault_core, contract_owner):
+    with boa.reverts("address is the zero addr"):
+        collateral_vault_core.setDelegationRegistry(ZERO_ADDRESS, 2, sender=contract_owner)
+
+
+def test_set_delegation_registry_unsupported_version(collateral_vault_core, delegation_registry_contract, contract_owner):
+    with boa.reverts("version not supported"):
+        collateral_vault_core.setDelegationRegistry(delegation_registry_contract.deploy(), 3, sender=contract_owner)
+
+
+def test_set_delegation_registry_same_address(collateral_vault_core, delegation_registry, contract_owner):
+    with boa.reverts("new value is the same"):
+        collateral_vault_core.setDelegationRegistry(delegation_registry, 1, sender=contract_owner)
+
+
+def test_set_delegation_registry(collateral_vault_core, delegation_registry, delegation_registry_contract, contract_owner):
+    new_delegation_registry = delegation_registry_contract.deploy()
+    collateral_vault_core.setDelegationRegistry(new_delegation_registry, 2, sender=contract_owner)
+    event = get_last_event(collateral_vault_core, name="DelegationRegistrySet")
+
+    assert collateral_vault_core.delegationRegistry() == new_delegation_registry.address
+    assert collateral_vault_core.delegationRegistryVersion() == 2
+    assert collateral_vault_core.previousDelegationRegistry() == delegation_registry.address
+
+    assert event.currentValue == delegation_registry.address
+    assert event.newValue == new_delegation_registry.address
+    assert event.version == 2
@@ -1,7 +1,7 @@
 import boa
 import pytest
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, ZERO_BYTES32, get_last_event
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -68,3 +68,115 @@ def test_transfer_collateral(collateral_vault_core, erc721, borrower, contract_o
     collateral_vault_core.transferCollateral(borrower, erc721, 0, borrower, sender=collateral_vault_peripheral)
 
     assert erc721.ownerOf(0) == borrower
+
+
+def test_store_collaterals_wrong_sender(collateral_vault_core, contract_owner):
+    with boa.reverts("msg.sender is not authorised"):
+        collateral_vault_core.storeCollaterals(contract_owner, [], ZERO_ADDRESS, sender=contract_owner)
+
+
+def test_store_collaterals_not_approved(collateral_vault_core, erc721, borrower, contract_owner):
+    collateral_vault_peripheral = boa.env.generate_address()
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.approve(collateral_vault_core, 0, sender=borrower)
+
+    collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    with boa.reverts("transfer is not approved"):
+        collateral_vault_core.storeCollaterals(
+            borrower, [(erc721.address, 0, 0), (erc721.address, 1, 0)], ZERO_ADDRESS, sender=collateral_vault_peripheral
+        )
+
+
+def test_store_collaterals(collateral_vault_core, erc721, borrower, contract_owner):
+    collateral_vault_peripheral = boa.env.generate_address()
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_core, True, sender=borrower)
+
+    collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    collateral_vault_core.storeCollaterals(
+        borrower, [(erc721.address, 0, 0), (erc721.address, 1, 0)], ZERO_ADDRESS, sender=collateral_vault_peripheral
+    )
+
+    assert erc721.ownerOf(0) == collateral_vault_core.address
+    assert erc721.ownerOf(1) == collateral_vault_core.address
+
+
+def test_transfer_collaterals(collateral_vault_core, erc721, borrower, contract_owner):
+    collateral_vault_peripheral = boa.env.generate_address()
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_core, True, sender=borrower)
+    collaterals = [(erc721.address, 0, 0), (erc721.address, 1, 0)]
+
+    collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+    collateral_vault_core.storeCollaterals(borrower, collaterals, ZERO_ADDRESS, sender=collateral_vault_peripheral)
+
+    collateral_vault_core.transferCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    assert erc721.ownerOf(0) == borrower
+    assert erc721.ownerOf(1) == borrower
+
+
+def test_store_and_transfer_collaterals_with_delegations(
+    collateral_vault_core, delegation_registry, erc721, borrower, contract_owner
+):
+    collateral_vault_peripheral = boa.env.generate_address()
+    collaterals = [(erc721.address, i, 0) for i in range(3)]
+    for i in range(3):
+        erc721.mint(borrower, i, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_core, True, sender=borrower)
+
+    collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    collateral_vault_core.storeCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    for i in range(3):
+        assert delegation_registry.checkDelegateForToken(borrower, collateral_vault_core, erc721, i)
+
+    collateral_vault_core.transferCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    for i in range(3):
+        assert erc721.ownerOf(i) == borrower
+        assert not delegation_registry.checkDelegateForToken(borrower, collateral_vault_core, erc721, i)
+
+
+def test_set_delegations_wrong_sender(collateral_vault_core, contract_owner):
+    with boa.reverts("msg.sender is not authorised"):
+        collateral_vault_core.setDelegations(contract_owner, [], True, sender=contract_owner)
+
+
+def test_set_delegations_with_v2_registry(
+    collateral_vault_core, delegation_registry, delegation_registry_contract, erc721, borrower, contract_owner
+):
+    collateral_vault_peripheral = boa.env.generate_address()
+    open_collaterals = [(erc721.address, i, 0) for i in range(10, 12)]
+    new_collaterals = [(erc721.address, 12, 0)]
+    collateral_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+    collateral_vault_core.setDelegations(borrower, open_collaterals, True, sender=collateral_vault_peripheral)
+
+    delegation_registry_v2 = delegation_registry_contract.deploy()
+    collateral_vault_core.setDelegationRegistry(delegation_registry_v2, 2, sender=contract_owner)
+
+    # the delegations of open loans are kept in the v1 registry
+    for _, token_id, _ in open_collaterals:
+        assert delegation_registry.checkDelegateForToken(borrower, collateral_vault_core, erc721, token_id)
+
+    collateral_vault_core.setDelegations(borrower, new_collaterals, True, sender=collateral_vault_peripheral)
+
+    for _, token_id, _ in new_collaterals:
+        assert delegation_registry_v2.checkDelegateForERC721(borrower, collateral_vault_core, erc721, token_id, ZERO_BYTES32)
+        assert not delegation_registry.checkDelegateForToken(borrower, collateral_vault_core, erc721, token_id)
+
+    collateral_vault_core.setDelegations(
+        borrower, open_collaterals + new_collaterals, False, sender=collateral_vault_peripheral
+    )
+
+    for _, token_id, _ in open_collaterals + new_collaterals:
+        assert not delegation_registry.checkDelegateForToken(borrower, collateral_vault_core, erc721, token_id)
+        assert not delegation_registry_v2.checkDelegateForERC721(
+            borrower, collateral_vault_core, erc721, token_id, ZERO_BYTES32
+        )
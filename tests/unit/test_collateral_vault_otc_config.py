@@ -32,7 +32,7 @@ def delegation_registry(delegation_registry_contract, contract_owner):
 @pytest.fixture(scope="module")
 def collateral_vault_otc(collateral_vault_otc_contract, contract_owner, delegation_registry, cryptopunks):
     with boa.env.prank(contract_owner):
-        contract = collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry)
+        contract = collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry, 1)
         proxy_address = contract.create_proxy()
         return collateral_vault_otc_contract.at(proxy_address)
 
@@ -42,6 +42,14 @@ def test_initial_state(collateral_vault_otc, delegation_registry, cryptopunks, c
     assert collateral_vault_otc.owner() == contract_owner
     assert collateral_vault_otc.delegationRegistry() == delegation_registry.address
     assert collateral_vault_otc.cryptoPunksMarketAddress() == cryptopunks.address
+    assert collateral_vault_otc.delegationRegistryVersion() == 1
+
+
+def test_deploy_unsupported_delegation_registry_version(
+    collateral_vault_otc_contract, delegation_registry, cryptopunks, contract_owner
+):
+    with boa.reverts("version not supported"):
+        collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry, 3, sender=contract_owner)
 
 
 def test_propose_owner_wrong_sender(collateral_vault_otc, borrower):
@@ -1,7 +1,7 @@
 import boa
 import pytest
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, ZERO_BYTES32, get_events, get_last_event
 
 
 @pytest.fixture(scope="module")
@@ -56,7 +56,25 @@ def collateral_vault_otc(
     erc20_token,
 ):
     with boa.env.prank(contract_owner):
-        contract = collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry)
+        contract = collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry, 1)
+        proxy_address = contract.create_proxy()
+        proxy = collateral_vault_otc_contract.at(proxy_address)
+        proxy.setLoansAddress(loans_peripheral)
+        proxy.setLiquidationsPeripheralAddress(liquidations)
+        return proxy
+
+
+@pytest.fixture(scope="module")
+def collateral_vault_otc_v2(
+    collateral_vault_otc_contract,
+    contract_owner,
+    delegation_registry,
+    cryptopunks,
+    loans_peripheral,
+    liquidations,
+):
+    with boa.env.prank(contract_owner):
+        contract = collateral_vault_otc_contract.deploy(cryptopunks, delegation_registry, 2)
         proxy_address = contract.create_proxy()
         proxy = collateral_vault_otc_contract.at(proxy_address)
         proxy.setLoansAddress(loans_peripheral)
@@ -295,3 +313,139 @@ def test_transfer_punk_from_liquidation(
     assert event.collateralAddress == cryptopunks.address
     assert event.tokenId == 0
     assert event.toIndexed == borrower
+
+
+def test_store_collaterals_not_approved(collateral_vault_otc, loans_peripheral, erc721, erc20_token, borrower, contract_owner):
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.approve(collateral_vault_otc, 0, sender=borrower)
+
+    with boa.reverts("transfer is not approved"):
+        collateral_vault_otc.storeCollaterals(
+            borrower, [(erc721.address, 0, 0), (erc721.address, 1, 0)], erc20_token, False, sender=loans_peripheral
+        )
+
+
+def test_store_collaterals(collateral_vault_otc, loans_peripheral, erc721, cryptopunks, erc20_token, borrower, contract_owner):
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_otc, True, sender=borrower)
+    cryptopunks.mint(borrower, 0, sender=contract_owner)
+    cryptopunks.offerPunkForSaleToAddress(0, 0, collateral_vault_otc, sender=borrower)
+    collaterals = [(erc721.address, 0, 0), (cryptopunks.address, 0, 0), (erc721.address, 1, 0)]
+
+    collateral_vault_otc.storeCollaterals(borrower, collaterals, erc20_token, False, sender=loans_peripheral)
+    events = get_events(collateral_vault_otc, name="CollateralStored")
+
+    assert erc721.ownerOf(0) == collateral_vault_otc.address
+    assert erc721.ownerOf(1) == collateral_vault_otc.address
+    assert cryptopunks.punkIndexToAddress(0) == collateral_vault_otc.address
+
+    assert [(e.collateralAddress, e.tokenId) for e in events] == [c[:2] for c in collaterals]
+
+    cryptopunks.transferPunk(borrower, 0, sender=collateral_vault_otc.address)
+
+
+def test_transfer_collaterals_from_loan_wrong_sender(collateral_vault_otc, erc20_token, borrower):
+    with boa.reverts("msg.sender is not authorised"):
+        collateral_vault_otc.transferCollateralsFromLoan(borrower, [], erc20_token)
+
+
+def test_transfer_collaterals_from_loan(
+    collateral_vault_otc, loans_peripheral, erc721, cryptopunks, erc20_token, borrower, contract_owner
+):
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_otc, True, sender=borrower)
+    cryptopunks.mint(borrower, 0, sender=contract_owner)
+    cryptopunks.offerPunkForSaleToAddress(0, 0, collateral_vault_otc, sender=borrower)
+    collaterals = [(erc721.address, 0, 0), (cryptopunks.address, 0, 0)]
+
+    collateral_vault_otc.storeCollaterals(borrower, collaterals, erc20_token, False, sender=loans_peripheral)
+
+    collateral_vault_otc.transferCollateralsFromLoan(borrower, collaterals, erc20_token, sender=loans_peripheral)
+    events = get_events(collateral_vault_otc, name="CollateralFromLoanTransferred")
+
+    assert erc721.ownerOf(0) == borrower
+    assert cryptopunks.punkIndexToAddress(0) == borrower
+    assert [(e.collateralAddress, e.tokenId) for e in events] == [c[:2] for c in collaterals]
+
+
+def test_transfer_collaterals_from_liquidation_wrong_sender(collateral_vault_otc, borrower):
+    with boa.reverts("msg.sender is not authorised"):
+        collateral_vault_otc.transferCollateralsFromLiquidation(borrower, [])
+
+
+def test_transfer_collaterals_from_liquidation(
+    collateral_vault_otc, loans_peripheral, liquidations, erc721, erc20_token, borrower, contract_owner
+):
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_otc, True, sender=borrower)
+    collaterals = [(erc721.address, 0, 0), (erc721.address, 1, 0)]
+
+    collateral_vault_otc.storeCollaterals(borrower, collaterals, erc20_token, False, sender=loans_peripheral)
+
+    collateral_vault_otc.transferCollateralsFromLiquidation(borrower, collaterals, sender=liquidations)
+    events = get_events(collateral_vault_otc, name="CollateralFromLiquidationTransferred")
+
+    assert erc721.ownerOf(0) == borrower
+    assert erc721.ownerOf(1) == borrower
+    assert [(e.collateralAddress, e.tokenId) for e in events] == [c[:2] for c in collaterals]
+
+
+def test_store_and_transfer_collaterals_with_delegations(
+    collateral_vault_otc, loans_peripheral, erc721, cryptopunks, delegation_registry, erc20_token, borrower, contract_owner
+):
+    erc721.mint(borrower, 0, sender=contract_owner)
+    erc721.mint(borrower, 1, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_otc, True, sender=borrower)
+    cryptopunks.mint(borrower, 0, sender=contract_owner)
+    cryptopunks.offerPunkForSaleToAddress(0, 0, collateral_vault_otc, sender=borrower)
+    collaterals = [(erc721.address, 0, 0), (cryptopunks.address, 0, 0), (erc721.address, 1, 0)]
+
+    collateral_vault_otc.storeCollaterals(borrower, collaterals, erc20_token, True, sender=loans_peripheral)
+
+    for address, token_id, _ in collaterals:
+        assert delegation_registry.checkDelegateForToken(borrower, collateral_vault_otc, address, token_id)
+
+    collateral_vault_otc.transferCollateralsFromLoan(borrower, collaterals, erc20_token, sender=loans_peripheral)
+
+    for address, token_id, _ in collaterals:
+        assert not delegation_registry.checkDelegateForToken(borrower, collateral_vault_otc, address, token_id)
+
+
+def test_set_collateral_delegations(
+    collateral_vault_otc, loans_peripheral, erc721, delegation_registry, erc20_token, borrower, contract_owner
+):
+    collaterals = [(erc721.address, 0, 0), (erc721.address, 1, 0)]
+
+    with boa.reverts("msg.sender is not authorised"):
+        collateral_vault_otc.setCollateralDelegations(borrower, collaterals, erc20_token, True)
+
+    collateral_vault_otc.setCollateralDelegations(borrower, collaterals, erc20_token, True, sender=loans_peripheral)
+
+    for address, token_id, _ in collaterals:
+        assert delegation_registry.checkDelegateForToken(borrower, collateral_vault_otc, address, token_id)
+
+
+def test_store_and_transfer_collaterals_with_delegations_v2(
+    collateral_vault_otc_v2, loans_peripheral, erc721, cryptopunks, delegation_registry, erc20_token, borrower, contract_owner
+):
+    erc721.mint(borrower, 10, sender=contract_owner)
+    erc721.mint(borrower, 11, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault_otc_v2, True, sender=borrower)
+    cryptopunks.mint(borrower, 10, sender=contract_owner)
+    cryptopunks.offerPunkForSaleToAddress(10, 0, collateral_vault_otc_v2, sender=borrower)
+    collaterals = [(erc721.address, 10, 0), (cryptopunks.address, 10, 0), (erc721.address, 11, 0)]
+
+    collateral_vault_otc_v2.storeCollaterals(borrower, collaterals, erc20_token, True, sender=loans_peripheral)
+
+    for address, token_id, _ in collaterals:
+        assert delegation_registry.checkDelegateForERC721(borrower, collateral_vault_otc_v2, address, token_id, ZERO_BYTES32)
+
+    collateral_vault_otc_v2.transferCollateralsFromLoan(borrower, collaterals, erc20_token, sender=loans_peripheral)
+
+    for address, token_id, _ in collaterals:
+        assert not delegation_registry.checkDelegateForERC721(
+            borrower, collateral_vault_otc_v2, address, token_id, ZERO_BYTES32
+        )
@@ -26,9 +26,12 @@ def cryptopunks_vault_core(cryptopunks_vault_core_contract, delegation_registry,
         return cryptopunks_vault_core_contract.deploy(cryptopunks_contract.deploy(), delegation_registry)
 
 
-def test_initial_state(cryptopunks_vault_core, contract_owner):
+def test_initial_state(cryptopunks_vault_core, delegation_registry, contract_owner):
     # Check if the constructor of the contract is set up properly
     assert cryptopunks_vault_core.owner() == contract_owner
+    assert cryptopunks_vault_core.delegationRegistry() == delegation_registry.address
+    assert cryptopunks_vault_core.delegationRegistryVersion() == 1
+    assert cryptopunks_vault_core.previousDelegationRegistry() == ZERO_ADDRESS
 
 
 def test_propose_owner_wrong_sender(cryptopunks_vault_core, borrower):
@@ -104,3 +107,37 @@ def test_set_collateral_vault_peripheral_address(cryptopunks_vault_core, contrac
 
     assert event.currentValue == ZERO_ADDRESS
     assert event.newValue == collateral_vault_peripheral
+
+
+def test_set_delegation_registry_wrong_sender(cryptopunks_vault_core, delegation_registry_contract, borrower):
+    with boa.reverts("msg.sender is not the owner"):
+        cryptopunks_vault_core.setDelegationRegistry(delegation_registry_contract.deploy(), 2, sender=borrower)
+
+
+def test_set_delegation_registry_zero_address(cryptopunks_vault_core, contract_owner):
+    with boa.reverts("address is the zero addr"):
+        cryptopunks_vault_core.setDelegationRegistry(ZERO_ADDRESS, 2, sender=contract_owner)
+
+
+def test_set_delegation_registry_unsupported_version(cryptopunks_vault_core, delegation_registry_contract, contract_owner):
+    with boa.reverts("version not supported"):
+        cryptopunks_vault_core.setDelegationRegistry(delegation_registry_contract.deploy(), 3, sender=contract_owner)
+
+
+def test_set_delegation_registry_same_address(cryptopunks_vault_core, delegation_registry, contract_owner):
+    with boa.reverts("new value is the same"):
+        cryptopunks_vault_core.setDelegationRegistry(delegation_registry, 1, sender=contract_owner)
+
+
+def test_set_delegation_registry(cryptopunks_vault_core, delegation_registry, delegation_registry_contract, contract_owner):
+    new_delegation_registry = delegation_registry_contract.deploy()
+    cryptopunks_vault_core.setDelegationRegistry(new_delegation_registry, 2, sender=contract_owner)
+    event = get_last_event(cryptopunks_vault_core, name="DelegationRegistrySet")
+
+    assert cryptopunks_vault_core.delegationRegistry() == new_delegation_registry.address
+    assert cryptopunks_vault_core.delegationRegistryVersion() == 2
+    assert cryptopunks_vault_core.previousDelegationRegistry() == delegation_registry.address
+
+    assert event.currentValue == delegation_registry.address
+    assert event.newValue == new_delegation_registry.address
+    assert event.version == 2
@@ -1,7 +1,7 @@
 import boa
 import pytest
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, ZERO_BYTES32, get_last_event
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -84,3 +84,70 @@ def test_transfer_collateral(cryptopunks_vault_core, cryptopunks_market, contrac
 
     cryptopunks_vault_core.transferCollateral(borrower, cryptopunks_market, 0, borrower, sender=collateral_vault_peripheral)
     assert cryptopunks_market.punkIndexToAddress(0) == borrower
+
+
+def test_store_and_transfer_collaterals(cryptopunks_vault_core, cryptopunks_market, contract_owner, borrower):
+    collateral_vault_peripheral = boa.env.generate_address()
+    collaterals = [(cryptopunks_market.address, i, 0) for i in range(2)]
+    for i in range(2):
+        cryptopunks_market.mint(borrower, i, sender=contract_owner)
+        cryptopunks_market.offerPunkForSaleToAddress(i, 0, cryptopunks_vault_core.address, sender=borrower)
+    cryptopunks_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    cryptopunks_vault_core.storeCollaterals(borrower, collaterals, ZERO_ADDRESS, sender=collateral_vault_peripheral)
+    assert cryptopunks_market.punkIndexToAddress(0) == cryptopunks_vault_core.address
+    assert cryptopunks_market.punkIndexToAddress(1) == cryptopunks_vault_core.address
+
+    cryptopunks_vault_core.transferCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+    assert cryptopunks_market.punkIndexToAddress(0) == borrower
+    assert cryptopunks_market.punkIndexToAddress(1) == borrower
+
+
+def test_store_collaterals_with_delegations(
+    cryptopunks_vault_core, cryptopunks_market, delegation_registry, contract_owner, borrower
+):
+    collateral_vault_peripheral = boa.env.generate_address()
+    collaterals = [(cryptopunks_market.address, i, 0) for i in range(2)]
+    for i in range(2):
+        cryptopunks_market.mint(borrower, i, sender=contract_owner)
+        cryptopunks_market.offerPunkForSaleToAddress(i, 0, cryptopunks_vault_core.address, sender=borrower)
+    cryptopunks_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    cryptopunks_vault_core.storeCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    for i in range(2):
+        assert delegation_registry.checkDelegateForToken(borrower, cryptopunks_vault_core, cryptopunks_market, i)
+
+    cryptopunks_vault_core.setDelegations(borrower, collaterals, False, sender=collateral_vault_peripheral)
+
+    for i in range(2):
+        assert not delegation_registry.checkDelegateForToken(borrower, cryptopunks_vault_core, cryptopunks_market, i)
+
+
+def test_store_and_transfer_collaterals_with_v2_registry(
+    cryptopunks_vault_core, cryptopunks_market, delegation_registry_contract, contract_owner, borrower
+):
+    collateral_vault_peripheral = boa.env.generate_address()
+    collaterals = [(cryptopunks_market.address, i, 0) for i in range(10, 12)]
+    for _, token_id, _ in collaterals:
+        cryptopunks_market.mint(borrower, token_id, sender=contract_owner)
+        cryptopunks_market.offerPunkForSaleToAddress(token_id, 0, cryptopunks_vault_core.address, sender=borrower)
+    cryptopunks_vault_core.setCollateralVaultPeripheralAddress(collateral_vault_peripheral, sender=contract_owner)
+
+    delegation_registry_v2 = delegation_registry_contract.deploy()
+    cryptopunks_vault_core.setDelegationRegistry(delegation_registry_v2, 2, sender=contract_owner)
+
+    cryptopunks_vault_core.storeCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    for _, token_id, _ in collaterals:
+        assert delegation_registry_v2.checkDelegateForERC721(
+            borrower, cryptopunks_vault_core, cryptopunks_market, token_id, ZERO_BYTES32
+        )
+
+    cryptopunks_vault_core.transferCollaterals(borrower, collaterals, borrower, sender=collateral_vault_peripheral)
+
+    for _, token_id, _ in collaterals:
+        assert cryptopunks_market.punkIndexToAddress(token_id) == borrower
+        assert not delegation_registry_v2.checkDelegateForERC721(
+            borrower, cryptopunks_vault_core, cryptopunks_market, token_id, ZERO_BYTES32
+        )
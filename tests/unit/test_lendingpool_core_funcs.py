@@ -96,6 +96,25 @@ def test_deposit_twice(lending_pool_core, erc20, investor, contract_owner):
     assert lending_pool_core.totalSharesBasisPoints() == deposit_amount_one + deposit_amount_two
 
 
+def test_lenders_page(lending_pool_core, erc20, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    lenders = [boa.env.generate_address() for _ in range(5)]
+    deposit_amount = Web3.to_wei(0.1, "ether")
+
+    erc20.transfer(lending_pool_peripheral, deposit_amount * len(lenders), sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount * len(lenders), sender=lending_pool_peripheral)
+    for lender in lenders:
+        lending_pool_core.deposit(lender, lending_pool_peripheral, deposit_amount, sender=lending_pool_peripheral)
+
+    assert lending_pool_core.lendersLength() == len(lenders)
+    assert lending_pool_core.lendersPage(0, 2) == lenders[:2]
+    assert lending_pool_core.lendersPage(2, 2) == lenders[2:4]
+    assert lending_pool_core.lendersPage(4, 2) == lenders[4:]
+    assert lending_pool_core.lendersPage(5, 2) == []
+    assert lending_pool_core.lendersPage(0, 2**256 - 1) == lenders
+
+
 def test_withdraw_wrong_sender(lending_pool_core, investor, borrower):
     with boa.reverts("msg.sender is not LP peripheral"):
         lending_pool_core.withdraw(investor, investor, 100, sender=borrower)
@@ -235,6 +254,93 @@ def test_deposit_withdraw_deposit(lending_pool_core, erc20, investor, contract_o
     assert lending_pool_core.totalSharesBasisPoints() == Web3.to_wei(1, "ether")
 
 
+def test_deposit_checked_wrong_sender(lending_pool_core, investor, borrower):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_core.depositChecked(investor, investor, 0, False, 0, 10000, sender=borrower)
+
+
+def test_deposit_checked_not_allowed(lending_pool_core, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    payer = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+
+    with boa.reverts("Not enough funds allowed"):
+        lending_pool_core.depositChecked(
+            payer, payer, Web3.to_wei(1, "ether"), False, 0, 10000, sender=lending_pool_peripheral
+        )
+
+
+def test_deposit_checked(lending_pool_core, erc20, investor, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    deposit_amount = Web3.to_wei(1, "ether")
+    max_pool_share = 5000
+    max_capital_efficiency = 8000
+
+    erc20.mint(investor, 3 * deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, 3 * deposit_amount, sender=investor)
+
+    # a single lender can't hold more than the max pool share
+    with boa.reverts("max pool share surpassed"):
+        lending_pool_core.depositChecked(
+            investor, investor, deposit_amount, True, max_pool_share, max_capital_efficiency, sender=lending_pool_peripheral
+        )
+
+    pool_state = lending_pool_core.depositChecked(
+        investor, investor, deposit_amount, False, max_pool_share, max_capital_efficiency, sender=lending_pool_peripheral
+    )
+    assert pool_state.fundsAvailable == deposit_amount
+    assert pool_state.totalSharesBasisPoints == deposit_amount
+    assert pool_state.activeLenders == 1
+    assert lending_pool_core.funds(investor) == (deposit_amount, deposit_amount, 0, deposit_amount, True)
+    assert user_balance(erc20, lending_pool_core) == deposit_amount
+
+    with boa.reverts("max pool share surpassed"):
+        lending_pool_core.depositChecked(
+            investor, investor, deposit_amount, True, max_pool_share, max_capital_efficiency, sender=lending_pool_peripheral
+        )
+
+
+def test_withdraw_checked_wrong_sender(lending_pool_core, investor, borrower):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_core.withdrawChecked(investor, investor, 0, 0, sender=borrower)
+
+
+def test_withdraw_checked(lending_pool_core, erc20, investor, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    deposit_amount = Web3.to_wei(1, "ether")
+    withdraw_amount = Web3.to_wei(0.4, "ether")
+
+    erc20.mint(investor, deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount, sender=investor)
+    lending_pool_core.depositChecked(investor, investor, deposit_amount, False, 0, 10000, sender=lending_pool_peripheral)
+    investor_balance = user_balance(erc20, investor)
+
+    with boa.reverts("_amount more than withdrawable"):
+        lending_pool_core.withdrawChecked(investor, investor, deposit_amount + 1, 0, sender=lending_pool_peripheral)
+
+    with boa.reverts("withdraw within lock period"):
+        lending_pool_core.withdrawChecked(
+            investor, investor, withdraw_amount, deposit_amount - withdraw_amount + 1, sender=lending_pool_peripheral
+        )
+
+    pool_state = lending_pool_core.withdrawChecked(
+        investor, investor, withdraw_amount, deposit_amount - withdraw_amount, sender=lending_pool_peripheral
+    )
+    assert pool_state.fundsAvailable == deposit_amount - withdraw_amount
+    assert pool_state.activeLenders == 1
+    assert user_balance(erc20, investor) == investor_balance + withdraw_amount
+
+    pool_state = lending_pool_core.withdrawChecked(
+        investor, investor, deposit_amount - withdraw_amount, 0, sender=lending_pool_peripheral
+    )
+    assert pool_state.fundsAvailable == 0
+    assert pool_state.totalSharesBasisPoints == 0
+    assert pool_state.activeLenders == 0
+    assert lending_pool_core.activeForRewards(investor) is False
+
+
 def test_send_funds_wrong_sender(lending_pool_core, borrower):
     with boa.reverts("msg.sender is not LP peripheral"):
         lending_pool_core.sendFunds(borrower, Web3.to_wei(1, "ether"), sender=borrower)
@@ -395,6 +501,152 @@ def test_receive_funds_with_losses(lending_pool_core, erc20, investor, borrower,
     assert lending_pool_core.computeWithdrawableAmount(investor) == deposit_amount - investment_amount + recovered_amount
 
 
+def test_settle_funds_wrong_sender(lending_pool_core, borrower):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_core.settleFunds(borrower, Web3.to_wei(0.2, "ether"), 0, Web3.to_wei(0.2, "ether"), 0, sender=borrower)
+
+
+def test_settle_funds_zero_value(lending_pool_core, borrower):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    with boa.reverts("Amount has to be higher than 0"):
+        lending_pool_core.settleFunds(borrower, 0, 0, 0, 0, sender=lending_pool_peripheral)
+
+
+def test_settle_funds(lending_pool_core, erc20, investor, borrower, contract_owner):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    deposit_amount = Web3.to_wei(1, "ether")
+
+    erc20.mint(investor, deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount, sender=investor)
+    lending_pool_core.deposit(investor, investor, deposit_amount, sender=lending_pool_peripheral)
+
+    investment_amount = Web3.to_wei(0.2, "ether")
+    pool_rewards_amount = Web3.to_wei(0.018, "ether")
+    protocol_fees_amount = Web3.to_wei(0.002, "ether")
+    payment_amount = investment_amount + pool_rewards_amount + protocol_fees_amount
+    lending_pool_core.sendFunds(borrower, investment_amount, sender=lending_pool_peripheral)
+
+    erc20.mint(borrower, pool_rewards_amount + protocol_fees_amount, sender=contract_owner)
+    borrower_balance = user_balance(erc20, borrower)
+
+    erc20.approve(lending_pool_core, payment_amount - 1, sender=borrower)
+    with boa.reverts("insufficient value received"):
+        lending_pool_core.settleFunds(
+            borrower,
+            investment_amount,
+            pool_rewards_amount,
+            investment_amount,
+            protocol_fees_amount,
+            sender=lending_pool_peripheral,
+        )
+
+    erc20.approve(lending_pool_core, payment_amount, sender=borrower)
+    lending_pool_core.settleFunds(
+        borrower,
+        investment_amount,
+        pool_rewards_amount,
+        investment_amount,
+        protocol_fees_amount,
+        sender=lending_pool_peripheral,
+    )
+
+    assert user_balance(erc20, borrower) == borrower_balance - payment_amount
+    assert user_balance(erc20, lending_pool_core) == deposit_amount + pool_rewards_amount + protocol_fees_amount
+    assert lending_pool_core.fundsAvailable() == deposit_amount + pool_rewards_amount
+    assert lending_pool_core.fundsInvested() == 0
+    assert lending_pool_core.totalRewards() == pool_rewards_amount
+    assert lending_pool_core.protocolFeesAccrued() == protocol_fees_amount
+    assert lending_pool_core.computeWithdrawableAmount(investor) == deposit_amount + pool_rewards_amount
+
+
+def test_pool_state(lending_pool_core, erc20, investor, borrower, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    deposit_amount = Web3.to_wei(1, "ether")
+    investment_amount = Web3.to_wei(0.2, "ether")
+    pool_rewards_amount = Web3.to_wei(0.018, "ether")
+    protocol_fees_amount = Web3.to_wei(0.002, "ether")
+
+    erc20.mint(investor, deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount, sender=investor)
+    lending_pool_core.deposit(investor, investor, deposit_amount, sender=lending_pool_peripheral)
+    lending_pool_core.sendFunds(borrower, investment_amount, sender=lending_pool_peripheral)
+    lending_pool_core.sendFunds(borrower, investment_amount, sender=lending_pool_peripheral)
+
+    erc20.mint(borrower, pool_rewards_amount + protocol_fees_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, investment_amount + pool_rewards_amount + protocol_fees_amount, sender=borrower)
+    lending_pool_core.settleFunds(
+        borrower,
+        investment_amount,
+        pool_rewards_amount,
+        investment_amount,
+        protocol_fees_amount,
+        sender=lending_pool_peripheral,
+    )
+
+    pool_state = lending_pool_core.poolState()
+    assert pool_state.fundsAvailable == deposit_amount - investment_amount + pool_rewards_amount
+    assert pool_state.fundsInvested == investment_amount
+    assert pool_state.totalFundsInvested == 2 * investment_amount
+    assert pool_state.totalRewards == pool_rewards_amount
+    assert pool_state.totalSharesBasisPoints == deposit_amount
+    assert pool_state.activeLenders == 1
+    assert pool_state.protocolFeesAccrued == protocol_fees_amount
+
+    assert pool_state.fundsAvailable == lending_pool_core.fundsAvailable()
+    assert pool_state.fundsInvested == lending_pool_core.fundsInvested()
+    assert pool_state.totalFundsInvested == lending_pool_core.totalFundsInvested()
+    assert pool_state.totalRewards == lending_pool_core.totalRewards()
+    assert pool_state.totalSharesBasisPoints == lending_pool_core.totalSharesBasisPoints()
+    assert pool_state.activeLenders == lending_pool_core.activeLenders()
+
+
+def test_deposit_out_of_bounds(lending_pool_core, erc20, investor, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    deposit_amount = 2**128
+
+    erc20.mint(investor, deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount, sender=investor)
+
+    with boa.reverts("amount out of bounds"):
+        lending_pool_core.deposit(investor, investor, deposit_amount, sender=lending_pool_peripheral)
+
+
+def test_claim_protocol_fees_wrong_sender(lending_pool_core, contract_owner, borrower):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_core.claimProtocolFees(contract_owner, sender=borrower)
+
+
+def test_claim_protocol_fees_zero_address(lending_pool_core):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    with boa.reverts("_protocolWallet is the zero address"):
+        lending_pool_core.claimProtocolFees(ZERO_ADDRESS, sender=lending_pool_peripheral)
+
+
+def test_claim_protocol_fees_nothing_accrued(lending_pool_core, contract_owner):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    with boa.reverts("no protocol fees to claim"):
+        lending_pool_core.claimProtocolFees(contract_owner, sender=lending_pool_peripheral)
+
+
+def test_claim_protocol_fees(lending_pool_core, erc20, borrower, contract_owner):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    protocol_wallet = boa.env.generate_address()
+    protocol_fees_amount = Web3.to_wei(0.002, "ether")
+
+    erc20.mint(borrower, protocol_fees_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, protocol_fees_amount, sender=borrower)
+    lending_pool_core.settleFunds(borrower, 0, 0, 0, protocol_fees_amount, sender=lending_pool_peripheral)
+
+    lending_pool_core.claimProtocolFees(protocol_wallet, sender=lending_pool_peripheral)
+
+    assert user_balance(erc20, protocol_wallet) == protocol_fees_amount
+    assert user_balance(erc20, lending_pool_core) == 0
+    assert lending_pool_core.protocolFeesAccrued() == 0
+    assert lending_pool_core.fundsAvailable() == 0
+
+
 def test_withdrawable_precision(lending_pool_core, erc20, borrower, investor, contract_owner):
     lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
     deposit_amount1 = Web3.to_wei(1, "ether")
@@ -410,3 +662,176 @@ def test_withdrawable_precision(lending_pool_core, erc20, borrower, investor, co
 
     assert lending_pool_core.computeWithdrawableAmount(investor) == deposit_amount1
     assert lending_pool_core.computeWithdrawableAmount(contract_owner) == deposit_amount2
+
+
+def test_refinance_funds_wrong_sender(lending_pool_core, contract_owner, borrower):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_core.refinanceFunds(borrower, Web3.to_wei(0.2, "ether"), 0, Web3.to_wei(0.2, "ether"), 0, sender=borrower)
+
+
+def test_refinance_funds_zero_value(lending_pool_core, contract_owner, borrower):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    with boa.reverts("_amount has to be higher than 0"):
+        lending_pool_core.refinanceFunds(borrower, Web3.to_wei(0.2, "ether"), 0, 0, 0, sender=lending_pool_peripheral)
+
+
+def test_refinance_funds(lending_pool_core, erc20, investor, borrower, contract_owner):
+    lending_pool_peripheral = lending_pool_core.lendingPoolPeripheral()
+    deposit_amount = Web3.to_wei(1, "ether")
+
+    erc20.mint(investor, deposit_amount, sender=contract_owner)
+    erc20.approve(lending_pool_core, deposit_amount, sender=investor)
+    lending_pool_core.deposit(investor, investor, deposit_amount, sender=lending_pool_peripheral)
+
+    investment_amount = Web3.to_wei(0.2, "ether")
+    pool_rewards_amount = Web3.to_wei(0.018, "ether")
+    protocol_fees_amount = Web3.to_wei(0.002, "ether")
+    lending_pool_core.sendFunds(borrower, investment_amount, sender=lending_pool_peripheral)
+
+    # new loan lower than the payment, the borrower pays the difference
+    new_amount = Web3.to_wei(0.15, "ether")
+    difference = investment_amount + pool_rewards_amount + protocol_fees_amount - new_amount
+    erc20.mint(borrower, pool_rewards_amount + protocol_fees_amount, sender=contract_owner)
+    borrower_balance = user_balance(erc20, borrower)
+
+    erc20.approve(lending_pool_core, difference - 1, sender=borrower)
+    with boa.reverts("insufficient value received"):
+        lending_pool_core.refinanceFunds(
+            borrower,
+            investment_amount,
+            pool_rewards_amount,
+            new_amount,
+            protocol_fees_amount,
+            sender=lending_pool_peripheral,
+        )
+
+    erc20.approve(lending_pool_core, difference, sender=borrower)
+    lending_pool_core.refinanceFunds(
+        borrower,
+        investment_amount,
+        pool_rewards_amount,
+        new_amount,
+        protocol_fees_amount,
+        sender=lending_pool_peripheral,
+    )
+
+    assert user_balance(erc20, borrower) == borrower_balance - difference
+    assert lending_pool_core.protocolFeesAccrued() == protocol_fees_amount
+    assert user_balance(erc20, lending_pool_core) == deposit_amount - new_amount + pool_rewards_amount + protocol_fees_amount
+    assert lending_pool_core.fundsAvailable() == deposit_amount - new_amount + pool_rewards_amount
+    assert lending_pool_core.fundsInvested() == new_amount
+    assert lending_pool_core.totalFundsInvested() == investment_amount + new_amount
+    assert lending_pool_core.totalRewards() == pool_rewards_amount
+
+    # new loan higher than the payment, the borrower receives the difference
+    higher_amount = Web3.to_wei(0.3, "ether")
+    difference = higher_amount - new_amount - pool_rewards_amount - protocol_fees_amount
+    borrower_balance = user_balance(erc20, borrower)
+
+    lending_pool_core.refinanceFunds(
+        borrower,
+        new_amount,
+        pool_rewards_amount,
+        higher_amount,
+        protocol_fees_amount,
+        sender=lending_pool_peripheral,
+    )
+
+    assert user_balance(erc20, borrower) == borrower_balance + difference
+    assert lending_pool_core.protocolFeesAccrued() == 2 * protocol_fees_amount
+    assert user_balance(erc20, lending_pool_core) == (
+        deposit_amount - higher_amount + 2 * (pool_rewards_amount + protocol_fees_amount)
+    )
+    assert lending_pool_core.fundsAvailable() == deposit_amount - higher_amount + 2 * pool_rewards_amount
+    assert lending_pool_core.fundsInvested() == higher_amount
+    assert lending_pool_core.totalRewards() == 2 * pool_rewards_amount
+
+
+def test_lenders_registry(lending_pool_core, erc20, contract_owner):
+    lending_pool_peripheral = boa.env.generate_address()
+    lending_pool_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    lenders = [boa.env.generate_address() for _ in range(3)]
+    erc20.mint(lending_pool_peripheral, 4 * 10**18, sender=contract_owner)
+    erc20.approve(lending_pool_core, 4 * 10**18, sender=lending_pool_peripheral)
+
+    for lender in lenders:
+        lending_pool_core.deposit(lender, lending_pool_peripheral, 10**18, sender=lending_pool_peripheral)
+
+    assert lending_pool_core.activeLendersPage(0, 10) == lenders
+    assert lending_pool_core.inactiveLendersPage(0, 10) == []
+
+    lending_pool_core.withdraw(lenders[0], lenders[0], 10**18, sender=lending_pool_peripheral)
+
+    assert lending_pool_core.activeLenders() == 2
+    assert lending_pool_core.activeLendersPage(0, 10) == [lenders[2], lenders[1]]
+    assert lending_pool_core.inactiveLendersLength() == 1
+    assert lending_pool_core.inactiveLendersPage(0, 10) == [lenders[0]]
+    assert lending_pool_core.lendersLength() == 3
+    assert lending_pool_core.knownLenders(lenders[0])
+
+    lending_pool_core.deposit(lenders[0], lending_pool_peripheral, 10**18, sender=lending_pool_peripheral)
+
+    assert lending_pool_core.activeLenders() == 3
+    assert lending_pool_core.activeLendersPage(1, 10) == [lenders[1], lenders[0]]
+    assert lending_pool_core.inactiveLendersPage(0, 10) == []
+    assert lending_pool_core.lendersLength() == 3
+
+
+def test_migrate_legacy_lenders(lendingpool_core_contract, erc20, contract_owner):
+    with boa.env.prank(contract_owner):
+        legacy_core = lendingpool_core_contract.deploy(erc20)
+        lending_pool_core = lendingpool_core_contract.deploy(erc20)
+    lending_pool_peripheral = boa.env.generate_address()
+    legacy_core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    lenders = [boa.env.generate_address() for _ in range(3)]
+    erc20.mint(lending_pool_peripheral, 3 * 10**18, sender=contract_owner)
+    erc20.approve(legacy_core, 3 * 10**18, sender=lending_pool_peripheral)
+    for lender in lenders:
+        legacy_core.deposit(lender, lending_pool_peripheral, 10**18, sender=lending_pool_peripheral)
+    legacy_core.withdraw(lenders[1], lenders[1], 10**18, sender=lending_pool_peripheral)
+    legacy_lenders = legacy_core.lendersArray()
+
+    with boa.reverts("msg.sender is not the owner"):
+        lending_pool_core.migrateLegacyLenders(legacy_core.address, legacy_lenders)
+
+    with boa.reverts("lenders not migrated"):
+        lending_pool_core.migrate(legacy_core.address, sender=contract_owner)
+
+    lending_pool_core.migrateLegacyLenders(legacy_core.address, legacy_lenders[:2], sender=contract_owner)
+    lending_pool_core.migrateLegacyLenders(legacy_core.address, legacy_lenders[1:], sender=contract_owner)
+
+    assert lending_pool_core.lendersLength() == 3
+    assert sorted(lending_pool_core.activeLendersPage(0, 10)) == sorted([lenders[0], lenders[2]])
+    assert lending_pool_core.inactiveLendersPage(0, 10) == [lenders[1]]
+    for lender in lenders:
+        assert lending_pool_core.funds(lender) == legacy_core.funds(lender)
+
+    with boa.reverts("lender not found"):
+        lending_pool_core.migrateLegacyLenders(legacy_core.address, [boa.env.generate_address()], sender=contract_owner)
+
+    lending_pool_core.migrate(legacy_core.address, sender=contract_owner)
+    assert lending_pool_core.poolState() == legacy_core.poolState()
+
+    with boa.reverts("migration already done"):
+        lending_pool_core.migrateLegacyLenders(legacy_core.address, legacy_lenders, sender=contract_owner)
+
+
+def test_migrate_lenders(lendingpool_core_contract, erc20, contract_owner):
+    with boa.env.prank(contract_owner):
+        lending_pool_core = lendingpool_core_contract.deploy(erc20)
+    lenders = [(boa.env.generate_address(), 10**18 * i, 2 * 10**18 * i, 10**18 * i, 10**18 * i, i > 0) for i in range(3)]
+
+    with boa.reverts("msg.sender is not the owner"):
+        lending_pool_core.migrateLenders(lenders)
+
+    lending_pool_core.migrateLenders(lenders[:2], sender=contract_owner)
+    lending_pool_core.migrateLenders(lenders[1:], sender=contract_owner)
+
+    assert lending_pool_core.lendersLength() == 3
+    assert lending_pool_core.activeLenders() == 2
+    assert lending_pool_core.inactiveLendersPage(0, 10) == [lenders[0][0]]
+    for wallet, *funds in lenders:
+        assert lending_pool_core.funds(wallet) == tuple(funds)
+
+    with boa.reverts("lender already migrated"):
+        lending_pool_core.migrateLender(*lenders[0], sender=contract_owner)
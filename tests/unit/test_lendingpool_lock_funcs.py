@@ -37,3 +37,49 @@ def test_set_investor_lock(lending_pool_lock, investor):
     lock = lending_pool_lock.investorLocks(investor)
     assert lock[0] == loack_period_end
     assert lock[1] == lock_period_amount
+
+
+def test_lock_deposit_wrong_sender(lending_pool_lock, investor):
+    with boa.reverts("msg.sender is not LP peripheral"):
+        lending_pool_lock.lockDeposit(investor, 10**18, LOCK_PERIOD_DURATION, sender=investor)
+
+
+def test_lock_deposit(lending_pool_lock, investor):
+    lending_pool_peripheral = lending_pool_lock.lendingPoolPeripheral()
+    amount = 10**18
+    now = boa.eval("block.timestamp")
+
+    lending_pool_lock.lockDeposit(investor, amount, LOCK_PERIOD_DURATION, sender=lending_pool_peripheral)
+    assert lending_pool_lock.investorLocks(investor) == (now + LOCK_PERIOD_DURATION, amount)
+
+    # deposits within the lock period add to the locked amount
+    boa.env.time_travel(seconds=LOCK_PERIOD_DURATION // 2)
+    lending_pool_lock.lockDeposit(investor, amount, LOCK_PERIOD_DURATION, sender=lending_pool_peripheral)
+    assert lending_pool_lock.investorLocks(investor) == (now + LOCK_PERIOD_DURATION, 2 * amount)
+
+    # a deposit after the lock period starts a new one
+    boa.env.time_travel(seconds=LOCK_PERIOD_DURATION)
+    lending_pool_lock.lockDeposit(investor, amount, LOCK_PERIOD_DURATION, sender=lending_pool_peripheral)
+    assert lending_pool_lock.investorLocks(investor) == (boa.eval("block.timestamp") + LOCK_PERIOD_DURATION, amount)
+
+
+def test_migrate_lenders(lending_pool_lock, contract_owner):
+    lock_period_end = int(dt.now().timestamp()) + LOCK_PERIOD_DURATION
+    locks = [(boa.env.generate_address(), lock_period_end + i, 10**18 * i) for i in range(3)]
+
+    with boa.reverts("msg.sender is not the owner"):
+        lending_pool_lock.migrateLenders(locks)
+
+    lending_pool_lock.migrateLenders(locks[:2], sender=contract_owner)
+    lending_pool_lock.migrateLenders(locks[2:], sender=contract_owner)
+
+    for wallet, end, amount in locks:
+        assert lending_pool_lock.investorLocks(wallet) == (end, amount)
+
+    with boa.reverts("msg.sender is not the owner"):
+        lending_pool_lock.finishMigration()
+
+    lending_pool_lock.finishMigration(sender=contract_owner)
+
+    with boa.reverts("migration already done"):
+        lending_pool_lock.migrateLenders(locks, sender=contract_owner)
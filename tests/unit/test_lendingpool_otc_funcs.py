@@ -45,6 +45,14 @@ def erc20_pool(lendingpool_erc20_otc_contract, erc20_token):
         return proxy
 
 
+def test_lenders_page(erc20_pool, weth_pool):
+    for pool in (erc20_pool, weth_pool):
+        assert pool.lendersLength() == 1
+        assert pool.lendersPage(0, 10) == [LENDER]
+        assert pool.lendersPage(0, 0) == []
+        assert pool.lendersPage(1, 10) == []
+
+
 def test_deposit_eth_fail(erc20_pool, weth_pool):
     amount = 10**18
     account1 = boa.env.generate_address()
@@ -97,6 +105,28 @@ def test_deposit_eth_success(erc20_pool, weth_pool, erc20_token):
     assert current_amount_deposited == amount
 
 
+def test_pool_state(erc20_pool, weth_pool, erc20_token):
+    amount = 10**18
+    boa.env.set_balance(LENDER, amount)
+    weth_pool.depositEth(value=amount, sender=LENDER)
+
+    for pool in (erc20_pool, weth_pool):
+        pool_state = pool.poolState()
+        current_amount_deposited, total_amount_deposited, total_amount_withdrawn, _, _ = pool.poolFunds()
+
+        assert pool_state.fundsAvailable == pool.fundsAvailable()
+        assert pool_state.fundsInvested == pool.fundsInvested()
+        assert pool_state.totalFundsInvested == pool.totalFundsInvested()
+        assert pool_state.totalRewards == pool.totalRewards()
+        assert pool_state.collateralClaimsValue == pool.collateralClaimsValue()
+        assert pool_state.currentAmountDeposited == current_amount_deposited
+        assert pool_state.totalAmountDeposited == total_amount_deposited
+        assert pool_state.totalAmountWithdrawn == total_amount_withdrawn
+
+    assert weth_pool.poolState().fundsAvailable == amount
+    assert weth_pool.poolState().totalAmountDeposited == amount
+
+
 def test_deposit_erc20_fail(erc20_pool, weth9_contract):
     amount = 10**18
     account1 = boa.env.generate_address()
@@ -162,7 +192,7 @@ def test_withdraw_eth_fail(erc20_pool, weth_pool, erc20_token):
     erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
     erc20_token.eval(f"self.balanceOf[{weth_pool.address}] = {amount}")
 
-    erc20_pool.eval(f"self.fundsAvailable = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount}")
 
     # pool not allowing eth
     with boa.reverts():
@@ -177,7 +207,7 @@ def test_withdraw_eth_fail(erc20_pool, weth_pool, erc20_token):
         weth_pool.withdrawEth(0, sender=LENDER)
 
     # not engough funds available
-    weth_pool.eval(f"self.fundsAvailable = {amount - 1}")
+    weth_pool.eval(f"self.poolAmounts = {amount - 1}")
     with boa.reverts():
         weth_pool.withdrawEth(amount, sender=LENDER)
 
@@ -186,9 +216,8 @@ def test_withdraw_eth_success(weth_pool, erc20_token):
     amount = 10**18
     erc20_token.eval(f"self.balanceOf[{weth_pool.address}] = {amount}")
 
-    weth_pool.eval(f"self.fundsAvailable = {amount}")
-    weth_pool.eval(f"self.poolFunds.totalAmountDeposited = {amount}")
-    weth_pool.eval(f"self.poolFunds.currentAmountDeposited = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount}")
+    weth_pool.eval(f"self.lenderAmounts = {amount} | ({amount} << 128)")
 
     weth_pool.withdrawEth(amount, sender=LENDER)
     event = get_last_event(weth_pool, name="Withdrawal")
@@ -215,7 +244,7 @@ def test_withdraw_erc20_fail(erc20_pool, erc20_token):
     account1 = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
-    erc20_pool.eval(f"self.fundsAvailable = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount}")
 
     # account not lender
     with boa.reverts():
@@ -226,7 +255,7 @@ def test_withdraw_erc20_fail(erc20_pool, erc20_token):
         erc20_pool.withdraw(0, sender=LENDER)
 
     # not enough funds available
-    erc20_pool.eval(f"self.fundsAvailable = {amount - 1}")
+    erc20_pool.eval(f"self.poolAmounts = {amount - 1}")
     with boa.reverts():
         erc20_pool.withdraw(amount, sender=LENDER)
 
@@ -235,9 +264,8 @@ def test_withdraw_erc20_success(erc20_pool, erc20_token):
     amount = 10**18
     erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
 
-    erc20_pool.eval(f"self.fundsAvailable = {amount}")
-    erc20_pool.eval(f"self.poolFunds.totalAmountDeposited = {amount}")
-    erc20_pool.eval(f"self.poolFunds.currentAmountDeposited = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount}")
+    erc20_pool.eval(f"self.lenderAmounts = {amount} | ({amount} << 128)")
 
     erc20_pool.withdraw(amount, sender=LENDER)
     event = get_last_event(erc20_pool, name="Withdrawal")
@@ -264,7 +292,7 @@ def test_send_funds_fail(erc20_pool, erc20_token):
     loans = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
-    erc20_pool.eval(f"self.fundsAvailable = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount}")
 
     # account not lender
     with boa.reverts():
@@ -275,7 +303,7 @@ def test_send_funds_fail(erc20_pool, erc20_token):
         erc20_pool.sendFunds(wallet, 0, sender=loans)
 
     # not enough funds available
-    erc20_pool.eval(f"self.fundsAvailable = {amount - 1}")
+    erc20_pool.eval(f"self.poolAmounts = {amount - 1}")
     with boa.reverts():
         erc20_pool.sendFunds(wallet, amount, sender=loans)
 
@@ -285,7 +313,7 @@ def test_send_funds_success(erc20_pool, erc20_token):
     wallet = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
-    erc20_pool.eval(f"self.fundsAvailable = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount}")
 
     erc20_pool.sendFunds(wallet, amount, sender=erc20_pool.loansContract())
     event = get_last_event(erc20_pool, name="FundsTransfer")
@@ -305,7 +333,7 @@ def test_send_funds_eth_fail(weth_pool):
     wallet = boa.env.generate_address()
 
     boa.env.set_balance(weth_pool.address, amount)
-    weth_pool.eval(f"self.fundsAvailable = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount}")
 
     # account not lender
     with boa.reverts():
@@ -316,7 +344,7 @@ def test_send_funds_eth_fail(weth_pool):
         weth_pool.sendFundsEth(wallet, 0, sender=weth_pool.loansContract())
 
     # not enough funds available
-    weth_pool.eval(f"self.fundsAvailable = {amount - 1}")
+    weth_pool.eval(f"self.poolAmounts = {amount - 1}")
     with boa.reverts():
         weth_pool.sendFundsEth(wallet, amount, sender=weth_pool.loansContract())
 
@@ -326,7 +354,7 @@ def test_send_funds_eth_success(weth_pool, erc20_token):
     wallet = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{weth_pool.address}] = {amount}")
-    weth_pool.eval(f"self.fundsAvailable = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount}")
 
     weth_pool.sendFundsEth(wallet, amount, sender=weth_pool.loansContract())
 
@@ -348,7 +376,7 @@ def test_receive_funds_eth_fail(weth_pool):
 
     loans = weth_pool.loansContract()
     boa.env.set_balance(loans, amount + pool_rewards)
-    weth_pool.eval(f"self.fundsInvested = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     # sender not loans
     boa.env.set_balance(borrower, amount + pool_rewards)
@@ -376,7 +404,7 @@ def test_receive_funds_eth_success(weth_pool, erc20_token):
 
     loans = weth_pool.loansContract()
     boa.env.set_balance(loans, amount + pool_rewards)
-    weth_pool.eval(f"self.fundsInvested = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     weth_pool.receiveFundsEth(borrower, amount, pool_rewards, value=amount + pool_rewards, sender=loans)
 
@@ -403,7 +431,7 @@ def test_receive_funds_fail(erc20_pool, erc20_token):
     borrower = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{borrower}] = {amount + pool_rewards}")
-    erc20_pool.eval(f"self.fundsInvested = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     erc20_token.approve(erc20_pool.address, amount + pool_rewards, sender=borrower)
 
@@ -433,7 +461,7 @@ def test_receive_funds_success(erc20_pool, erc20_token):
     borrower = boa.env.generate_address()
 
     erc20_token.eval(f"self.balanceOf[{borrower}] = {amount + pool_rewards}")
-    erc20_pool.eval(f"self.fundsInvested = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     erc20_token.approve(erc20_pool.address, amount + pool_rewards, sender=borrower)
     erc20_pool.receiveFunds(borrower, amount, pool_rewards, sender=erc20_pool.loansContract())
@@ -458,7 +486,7 @@ def test_receive_collateral_from_liquidation_fail(erc20_pool, erc20_token):
     amount = 10**18
     borrower = boa.env.generate_address()
     liquidations = erc20_pool.liquidationsPeripheralContract()
-    erc20_pool.eval(f"self.fundsInvested = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     # msg.sender is not the BN addr
     with boa.reverts():
@@ -481,7 +509,7 @@ def test_receive_collateral_from_liquidation_success(erc20_pool, erc20_token):
     amount = 10**18
     borrower = boa.env.generate_address()
     liquidations = erc20_pool.liquidationsPeripheralContract()
-    erc20_pool.eval(f"self.fundsInvested = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     erc20_pool.receiveCollateralFromLiquidation(borrower, amount, "origin", sender=liquidations)
 
@@ -533,7 +561,7 @@ def test_receive_funds_from_liquidation_success(erc20_pool, erc20_token):
 
     erc20_token.eval(f"self.balanceOf[{borrower}] = {amount + rewards_amount}")
     erc20_token.approve(erc20_pool.address, amount + rewards_amount, sender=borrower)
-    erc20_pool.eval(f"self.fundsInvested = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     erc20_pool.receiveFundsFromLiquidation(borrower, amount, rewards_amount, True, "origin", sender=liquidations)
 
@@ -580,7 +608,7 @@ def test_receive_funds_from_liquidation_eth_success(weth_pool, erc20_token):
     liquidations = weth_pool.liquidationsPeripheralContract()
 
     boa.env.set_balance(liquidations, amount + rewards_amount)
-    weth_pool.eval(f"self.fundsInvested = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount} << 128")
 
     weth_pool.receiveFundsFromLiquidationEth(
         borrower, amount, rewards_amount, True, "origin", value=amount + rewards_amount, sender=liquidations
@@ -600,3 +628,72 @@ def test_receive_funds_from_liquidation_eth_success(weth_pool, erc20_token):
     assert weth_pool.fundsAvailable() == amount + rewards_amount - protocol_rewards
     assert weth_pool.totalRewards() == rewards_amount - protocol_rewards
     assert weth_pool.collateralClaimsValue() == 0
+
+
+def test_refinance_funds_success(erc20_pool, erc20_token):
+    amount = 10**18
+    pool_rewards = 10**17
+    new_amount = 5 * 10**17
+    protocol_rewards = pool_rewards * erc20_pool.protocolFeesShare() // 10000
+    borrower = boa.env.generate_address()
+    loans = erc20_pool.loansContract()
+
+    erc20_token.eval(f"self.balanceOf[{borrower}] = {amount + pool_rewards - new_amount}")
+    erc20_token.eval(f"self.balanceOf[{erc20_pool.address}] = {amount}")
+    erc20_pool.eval(f"self.poolAmounts = {amount} | ({amount} << 128)")
+
+    # sender not loans
+    with boa.reverts():
+        erc20_pool.refinanceFunds(borrower, amount, pool_rewards, new_amount, sender=borrower)
+
+    # not approved
+    erc20_token.approve(erc20_pool.address, amount + pool_rewards - new_amount - 1, sender=borrower)
+    with boa.reverts():
+        erc20_pool.refinanceFunds(borrower, amount, pool_rewards, new_amount, sender=loans)
+
+    erc20_token.approve(erc20_pool.address, amount + pool_rewards - new_amount, sender=borrower)
+    erc20_pool.refinanceFunds(borrower, amount, pool_rewards, new_amount, sender=loans)
+
+    receipt_event = get_last_event(erc20_pool, name="FundsReceipt")
+    transfer_event = get_last_event(erc20_pool, name="FundsTransfer")
+    assert receipt_event.wallet == borrower
+    assert receipt_event.amount == amount
+    assert receipt_event.rewardsPool == pool_rewards - protocol_rewards
+    assert receipt_event.rewardsProtocol == protocol_rewards
+    assert transfer_event.wallet == borrower
+    assert transfer_event.amount == new_amount
+
+    assert erc20_pool.fundsAvailable() == 2 * amount + pool_rewards - protocol_rewards - new_amount
+    assert erc20_pool.fundsInvested() == new_amount
+    assert erc20_token.balanceOf(borrower) == 0
+    assert erc20_token.balanceOf(erc20_pool.address) == 2 * amount + pool_rewards - protocol_rewards - new_amount
+    assert erc20_token.balanceOf(erc20_pool.protocolWallet()) == protocol_rewards
+
+
+def test_refinance_funds_eth_success(weth_pool, erc20_token):
+    amount = 10**18
+    pool_rewards = 10**17
+    new_amount = 2 * 10**18
+    protocol_rewards = pool_rewards * weth_pool.protocolFeesShare() // 10000
+    borrower = boa.env.generate_address()
+    loans = weth_pool.loansContract()
+
+    erc20_token.eval(f"self.balanceOf[{weth_pool.address}] = {amount}")
+    weth_pool.eval(f"self.poolAmounts = {amount} | ({amount} << 128)")
+    boa.env.set_balance(loans, 1)
+
+    # value sent when the borrower is owed the difference
+    with boa.reverts():
+        weth_pool.refinanceFundsEth(borrower, amount, pool_rewards, new_amount, value=1, sender=loans)
+
+    weth_pool.refinanceFundsEth(borrower, amount, pool_rewards, new_amount, sender=loans)
+
+    transfer_event = get_last_event(weth_pool, name="FundsTransfer")
+    assert transfer_event.wallet == borrower
+    assert transfer_event.amount == new_amount
+
+    assert weth_pool.fundsAvailable() == 2 * amount + pool_rewards - protocol_rewards - new_amount
+    assert weth_pool.fundsInvested() == new_amount
+    assert boa.env.get_balance(borrower) == new_amount - amount - pool_rewards
+    assert erc20_token.balanceOf(weth_pool.address) == 2 * amount + pool_rewards - protocol_rewards - new_amount
+    assert erc20_token.balanceOf(weth_pool.protocolWallet()) == protocol_rewards
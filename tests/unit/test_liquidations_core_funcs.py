@@ -136,6 +136,148 @@ def test_add_liquidation_already_exists(liquidations_core, contract_owner, borro
         )
 
 
+def test_add_liquidations_wrong_sender(liquidations_core, borrower):
+    erc721 = boa.env.generate_address()
+    with boa.reverts("msg.sender is not LiqPeriph addr"):
+        liquidations_core.addLiquidations(
+            [(erc721, 0, PRINCIPAL)],
+            0,
+            0,
+            0,
+            [INTEREST_AMOUNT],
+            APR,
+            [PRINCIPAL + INTEREST_AMOUNT],
+            [PRINCIPAL + INTEREST_AMOUNT],
+            borrower,
+            0,
+            boa.env.generate_address(),
+            boa.env.generate_address(),
+        )
+
+
+def test_add_liquidations(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    grace_period_prices = [PRINCIPAL + INTEREST_AMOUNT + i for i in range(2)]
+    lender_period_prices = [PRINCIPAL + INTEREST_AMOUNT + 10 + i for i in range(2)]
+    lids = liquidations_core.addLiquidations(
+        [(erc721, 0, PRINCIPAL), (erc721, 1, PRINCIPAL // 2)],
+        start_time,
+        start_time + GRACE_PERIOD_DURATION,
+        start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+        [INTEREST_AMOUNT, INTEREST_AMOUNT // 2],
+        APR,
+        grace_period_prices,
+        lender_period_prices,
+        borrower,
+        0,
+        loans_core,
+        erc20,
+        sender=liquidations_peripheral,
+    )
+
+    assert len(lids) == 2
+    assert liquidations_core.isLoanLiquidated(borrower, loans_core, 0)
+
+    for token_id, principal, interest_amount in [(0, PRINCIPAL, INTEREST_AMOUNT), (1, PRINCIPAL // 2, INTEREST_AMOUNT // 2)]:
+        liquidation = liquidations_core.getLiquidation(erc721, token_id)
+        assert liquidation[0] == lids[token_id]
+        assert liquidation[1] == erc721
+        assert liquidation[2] == token_id
+        assert liquidation[3] == start_time
+        assert liquidation[4] == start_time + GRACE_PERIOD_DURATION
+        assert liquidation[5] == start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION
+        assert liquidation[6] == principal
+        assert liquidation[7] == interest_amount
+        assert liquidation[8] == APR
+        assert liquidation[9] == grace_period_prices[token_id]
+        assert liquidation[10] == lender_period_prices[token_id]
+        assert liquidation[11] == borrower
+        assert liquidation[12] == 0
+        assert liquidation[13] == loans_core
+        assert liquidation[14] == erc20
+        assert not liquidation[15]
+
+
+def test_add_liquidations_already_exists(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    liquidations_core.addLiquidation(
+        erc721,
+        1,
+        start_time,
+        start_time + GRACE_PERIOD_DURATION,
+        start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+        PRINCIPAL,
+        INTEREST_AMOUNT,
+        APR,
+        PRINCIPAL + INTEREST_AMOUNT,
+        PRINCIPAL + INTEREST_AMOUNT,
+        borrower,
+        0,
+        loans_core,
+        erc20,
+        sender=liquidations_peripheral,
+    )
+
+    with boa.reverts("liquidation already exists"):
+        liquidations_core.addLiquidations(
+            [(erc721, 0, PRINCIPAL), (erc721, 1, PRINCIPAL)],
+            start_time,
+            start_time + GRACE_PERIOD_DURATION,
+            start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+            [INTEREST_AMOUNT, INTEREST_AMOUNT],
+            APR,
+            [PRINCIPAL + INTEREST_AMOUNT, PRINCIPAL + INTEREST_AMOUNT],
+            [PRINCIPAL + INTEREST_AMOUNT, PRINCIPAL + INTEREST_AMOUNT],
+            borrower,
+            1,
+            loans_core,
+            erc20,
+            sender=liquidations_peripheral,
+        )
+
+    assert liquidations_core.getLiquidation(erc721, 0)[3] == 0
+    assert not liquidations_core.isLoanLiquidated(borrower, loans_core, 1)
+
+
+def test_add_liquidations_loan_already_liquidated(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    liquidations_core.addLoanToLiquidated(borrower, loans_core, 0, sender=liquidations_peripheral)
+
+    with boa.reverts("loan already liquidated"):
+        liquidations_core.addLiquidations(
+            [(erc721, 0, PRINCIPAL)],
+            0,
+            0,
+            0,
+            [INTEREST_AMOUNT],
+            APR,
+            [PRINCIPAL + INTEREST_AMOUNT],
+            [PRINCIPAL + INTEREST_AMOUNT],
+            borrower,
+            0,
+            loans_core,
+            erc20,
+            sender=liquidations_peripheral,
+        )
+
+
 def test_add_loan_to_liquidated_wrong_sender(liquidations_core, contract_owner):
     loans_core = boa.env.generate_address()
     with boa.reverts("msg.sender is not LiqPeriph addr"):
@@ -200,3 +342,157 @@ def test_remove_liquidation(liquidations_core, contract_owner, borrower):
     assert liquidation[3] == 0
     assert liquidation[11] == ZERO_ADDRESS
     assert liquidation[14] == ZERO_ADDRESS
+
+
+def test_remove_liquidations_wrong_sender(liquidations_core, contract_owner):
+    erc721 = boa.env.generate_address()
+    with boa.reverts("msg.sender is not LiqPeriph addr"):
+        liquidations_core.removeLiquidations([(erc721, 0, 0)])
+
+
+def test_remove_liquidations_not_found(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    liquidations_core.addLiquidation(
+        erc721,
+        0,
+        start_time,
+        start_time + GRACE_PERIOD_DURATION,
+        start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+        PRINCIPAL,
+        INTEREST_AMOUNT,
+        APR,
+        PRINCIPAL + INTEREST_AMOUNT + (PRINCIPAL * APR * 2) // 365,
+        PRINCIPAL + INTEREST_AMOUNT + (PRINCIPAL * APR * 17) // 365,
+        borrower,
+        0,
+        loans_core,
+        erc20,
+        sender=liquidations_peripheral,
+    )
+
+    with boa.reverts("liquidation not found"):
+        liquidations_core.removeLiquidations([(erc721, 0, 0), (erc721, 1, 0)], sender=liquidations_peripheral)
+
+    assert liquidations_core.getLiquidation(erc721, 0)[1] == erc721
+
+
+def test_remove_liquidations(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    for token_id in range(2):
+        liquidations_core.addLiquidation(
+            erc721,
+            token_id,
+            start_time,
+            start_time + GRACE_PERIOD_DURATION,
+            start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+            PRINCIPAL,
+            INTEREST_AMOUNT,
+            APR,
+            PRINCIPAL + INTEREST_AMOUNT + (PRINCIPAL * APR * 2) // 365,
+            PRINCIPAL + INTEREST_AMOUNT + (PRINCIPAL * APR * 17) // 365,
+            borrower,
+            0,
+            loans_core,
+            erc20,
+            sender=liquidations_peripheral,
+        )
+
+    liquidations_core.removeLiquidations([(erc721, 0, 0), (erc721, 1, 0)], sender=liquidations_peripheral)
+
+    for token_id in range(2):
+        liquidation = liquidations_core.getLiquidation(erc721, token_id)
+        assert liquidation[1] == ZERO_ADDRESS
+        assert liquidation[3] == 0
+        assert liquidation[11] == ZERO_ADDRESS
+        assert liquidation[14] == ZERO_ADDRESS
+
+
+def test_add_liquidation_amount_out_of_bounds(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    with boa.reverts("amount out of bounds"):
+        liquidations_core.addLiquidation(
+            erc721,
+            0,
+            start_time,
+            start_time + GRACE_PERIOD_DURATION,
+            start_time + GRACE_PERIOD_DURATION + LENDER_PERIOD_DURATION,
+            2**85,
+            INTEREST_AMOUNT,
+            APR,
+            PRINCIPAL + INTEREST_AMOUNT,
+            PRINCIPAL + INTEREST_AMOUNT,
+            borrower,
+            0,
+            loans_core,
+            erc20,
+            sender=liquidations_peripheral,
+        )
+
+
+def test_add_liquidation_packed_bounds(liquidations_core, contract_owner, borrower):
+    loans_core = boa.env.generate_address()
+    erc721 = boa.env.generate_address()
+    erc20 = boa.env.generate_address()
+    liquidations_peripheral = boa.env.generate_address()
+    liquidations_core.setLiquidationsPeripheralAddress(liquidations_peripheral, sender=contract_owner)
+
+    start_time = boa.eval("block.timestamp")
+    liquidations_core.addLiquidation(
+        erc721,
+        2**256 - 1,
+        start_time,
+        2**48 - 1,
+        2**48 - 1,
+        2**85 - 1,
+        2**85 - 1,
+        2**32 - 1,
+        2**85 - 1,
+        2**85 - 1,
+        borrower,
+        2**64 - 1,
+        loans_core,
+        erc20,
+        sender=liquidations_peripheral,
+    )
+
+    liquidation = liquidations_core.getLiquidation(erc721, 2**256 - 1)
+    assert liquidation[1] == erc721
+    assert liquidation[2] == 2**256 - 1
+    assert liquidation[3] == start_time
+    assert liquidation[4] == 2**48 - 1
+    assert liquidation[5] == 2**48 - 1
+    assert liquidation[6] == 2**85 - 1
+    assert liquidation[7] == 2**85 - 1
+    assert liquidation[8] == 2**32 - 1
+    assert liquidation[9] == 2**85 - 1
+    assert liquidation[10] == 2**85 - 1
+    assert liquidation[11] == borrower
+    assert liquidation[12] == 2**64 - 1
+    assert liquidation[13] == loans_core
+    assert liquidation[14] == erc20
+    assert not liquidation[15]
+    assert liquidations_core.getLiquidationBorrower(erc721, 2**256 - 1) == borrower
+    assert liquidations_core.getLiquidationLenderPeriodMaturity(erc721, 2**256 - 1) == 2**48 - 1
+    assert liquidations_core.getLiquidationStartTime(erc721, 2**256 - 1) == start_time
+    assert liquidations_core.getLiquidationGracePeriodMaturity(erc721, 2**256 - 1) == 2**48 - 1
+    assert liquidations_core.getLiquidationInterestAmount(erc721, 2**256 - 1) == 2**85 - 1
+    assert liquidations_core.getLiquidationERC20Contract(erc721, 2**256 - 1) == erc20
+    assert not liquidations_core.isLiquidationInAuction(erc721, 2**256 - 1)
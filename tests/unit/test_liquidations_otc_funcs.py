@@ -0,0 +1,153 @@
+from textwrap import dedent
+
+import boa
+import pytest
+
+GRACE_PERIOD_DURATION = 86400
+LOAN_INTEREST = 250
+LOAN_DURATION = 30 * 86400
+MAX_AMOUNT = 2**85 - 1
+
+
+@pytest.fixture(scope="module", autouse=True)
+def owner():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def borrower():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def erc20():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def erc721():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def loans():
+    return boa.loads(
+        dedent(f"""
+    struct Collateral:
+        contractAddress: address
+        tokenId: uint256
+        amount: uint256
+
+    struct LoanHeader:
+        id: uint256
+        amount: uint256
+        interest: uint256
+        maturity: uint256
+        startTime: uint256
+        paidPrincipal: uint256
+        paidInterestAmount: uint256
+        collateralsHash: bytes32
+        started: bool
+        invalidated: bool
+        paid: bool
+        defaulted: bool
+        canceled: bool
+
+    collaterals: DynArray[Collateral, 100]
+
+    @external
+    def setCollaterals(_collaterals: DynArray[Collateral, 100]):
+        self.collaterals = _collaterals
+
+    @view
+    @external
+    def getLoanHeader(_borrower: address, _loanId: uint256) -> LoanHeader:
+        return LoanHeader(
+            id=_loanId,
+            amount=0,
+            interest={LOAN_INTEREST},
+            maturity={LOAN_DURATION},
+            startTime=0,
+            paidPrincipal=0,
+            paidInterestAmount=0,
+            collateralsHash=empty(bytes32),
+            started=True,
+            invalidated=False,
+            paid=False,
+            defaulted=True,
+            canceled=False
+        )
+
+    @view
+    @external
+    def getLoanCollaterals(_borrower: address, _loanId: uint256) -> DynArray[Collateral, 100]:
+        return self.collaterals
+    """)
+    )
+
+
+@pytest.fixture(scope="module")
+def liquidations_otc(liquidations_otc_contract, loans, owner):
+    with boa.env.prank(owner):
+        impl = liquidations_otc_contract.deploy()
+        lending_pool = boa.env.generate_address()
+        collateral_vault = boa.env.generate_address()
+        proxy_address = impl.create_proxy(GRACE_PERIOD_DURATION, loans, lending_pool, collateral_vault)
+        return liquidations_otc_contract.at(proxy_address)
+
+
+def test_add_liquidation(liquidations_otc, loans, erc20, erc721, borrower):
+    principal = 10**24
+    interest_amount = principal * LOAN_INTEREST // 10000
+    loan_id = 2**64 - 1
+    loans.setCollaterals([(erc721, 1, principal)])
+
+    liquidations_otc.addLiquidation(borrower, loan_id, erc20)
+    now = boa.eval("block.timestamp")
+    liquidation = liquidations_otc.getLiquidation(erc721, 1)
+
+    assert liquidation.collateralAddress == erc721
+    assert liquidation.tokenId == 1
+    assert liquidation.startTime == now
+    assert liquidation.gracePeriodMaturity == now + GRACE_PERIOD_DURATION
+    assert liquidation.principal == principal
+    assert liquidation.interestAmount == interest_amount
+    assert liquidation.apr == LOAN_INTEREST * 31536000 // LOAN_DURATION
+    assert liquidation.gracePeriodPrice == principal + interest_amount + principal * 250 // 10000
+    assert liquidation.borrower == borrower
+    assert liquidation.loanId == loan_id
+    assert liquidation.loansCoreContract == loans.address
+    assert liquidation.erc20TokenContract == erc20
+
+    assert liquidations_otc.getLiquidationStartTime(erc721, 1) == now
+    assert liquidations_otc.getLiquidationGracePeriodMaturity(erc721, 1) == now + GRACE_PERIOD_DURATION
+    assert liquidations_otc.getLiquidationPrincipal(erc721, 1) == principal
+    assert liquidations_otc.getLiquidationInterestAmount(erc721, 1) == interest_amount
+    assert liquidations_otc.getLiquidationBorrower(erc721, 1) == borrower
+    assert liquidations_otc.getLiquidationERC20Contract(erc721, 1) == erc20
+    assert liquidations_otc.isLoanLiquidated(borrower, loans, loan_id)
+
+
+def test_add_liquidation_max_amounts(liquidations_otc, loans, erc20, erc721, borrower, owner):
+    # the penalty fee is capped at 1, so the grace period price of the largest principal is the largest amount
+    liquidations_otc.setMaxPenaltyFee(erc20, 1, sender=owner)
+    principal = (MAX_AMOUNT - 1) * 10000 // (10000 + LOAN_INTEREST)
+    interest_amount = principal * LOAN_INTEREST // 10000
+    loans.setCollaterals([(erc721, 1, principal)])
+
+    liquidations_otc.addLiquidation(borrower, 0, erc20)
+    liquidation = liquidations_otc.getLiquidation(erc721, 1)
+
+    assert liquidation.principal == principal
+    assert liquidation.interestAmount == interest_amount
+    assert liquidation.gracePeriodPrice == principal + interest_amount + 1
+    assert liquidation.gracePeriodPrice <= MAX_AMOUNT
+    assert liquidation.borrower == borrower
+    assert liquidation.erc20TokenContract == erc20
+
+
+def test_add_liquidation_amount_out_of_bounds(liquidations_otc, loans, erc20, erc721, borrower):
+    loans.setCollaterals([(erc721, 1, MAX_AMOUNT)])
+
+    with boa.reverts("amount out of bounds"):
+        liquidations_otc.addLiquidation(borrower, 0, erc20)
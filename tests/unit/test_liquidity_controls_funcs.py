@@ -0,0 +1,112 @@
+from textwrap import dedent
+
+import boa
+import pytest
+
+MAX_LOANS_POOL_SHARE = 1500  # parts per 10000
+FUNDS_INVESTABLE = 10**20
+
+
+@pytest.fixture(scope="module", autouse=True)
+def contract_owner():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def borrower():
+    return boa.env.generate_address()
+
+
+@pytest.fixture(scope="module")
+def collections():
+    return [boa.env.generate_address() for _ in range(3)]
+
+
+@pytest.fixture
+def loans_core():
+    return boa.loads(
+        dedent("""
+    borrowedAmount: public(HashMap[address, uint256])
+    collectionsBorrowedAmount: public(HashMap[address, uint256])
+
+    @external
+    def setBorrowedAmount(_borrower: address, _amount: uint256):
+        self.borrowedAmount[_borrower] = _amount
+
+    @external
+    def setCollectionBorrowedAmount(_collection: address, _amount: uint256):
+        self.collectionsBorrowedAmount[_collection] = _amount
+     """)
+    )
+
+
+@pytest.fixture(scope="module")
+def lending_pool():
+    return boa.loads(
+        dedent(f"""
+    @view
+    @external
+    def theoreticalMaxFundsInvestable() -> uint256:
+        return {FUNDS_INVESTABLE}
+     """)
+    )
+
+
+@pytest.fixture
+def liquidity_controls(liquidity_controls_contract, contract_owner):
+    with boa.env.prank(contract_owner):
+        return liquidity_controls_contract.deploy(False, 0, False, 0, False, 0, False)
+
+
+def test_check_reserve_limits_disabled(liquidity_controls, loans_core, lending_pool, borrower, collections):
+    loans_core.setBorrowedAmount(borrower, FUNDS_INVESTABLE)
+    loans_core.setCollectionBorrowedAmount(collections[0], FUNDS_INVESTABLE)
+
+    assert liquidity_controls.checkReserveLimits(
+        borrower, FUNDS_INVESTABLE, collections, [FUNDS_INVESTABLE] * 3, loans_core, lending_pool
+    ) == (True, True)
+
+
+def test_check_reserve_limits_lengths_mismatch(liquidity_controls, loans_core, lending_pool, borrower, collections):
+    with boa.reverts("collections and amounts differ"):
+        liquidity_controls.checkReserveLimits(borrower, 0, collections, [0], loans_core, lending_pool)
+
+
+def test_check_reserve_limits_loans_pool_share(
+    liquidity_controls, loans_core, lending_pool, borrower, collections, contract_owner
+):
+    liquidity_controls.changeMaxLoansPoolShareConditions(True, MAX_LOANS_POOL_SHARE, sender=contract_owner)
+    max_amount = FUNDS_INVESTABLE * MAX_LOANS_POOL_SHARE // 10000
+    loans_core.setBorrowedAmount(borrower, max_amount // 2)
+
+    amount = max_amount - max_amount // 2
+    assert liquidity_controls.checkReserveLimits(borrower, amount, [], [], loans_core, lending_pool) == (True, True)
+    assert liquidity_controls.checkReserveLimits(
+        borrower, amount + FUNDS_INVESTABLE // 10000, [], [], loans_core, lending_pool
+    ) == (False, True)
+
+
+def test_check_reserve_limits_collection_share(
+    liquidity_controls, loans_core, lending_pool, borrower, collections, contract_owner
+):
+    limit = 10**18
+    liquidity_controls.changeMaxCollectionBorrowableAmount(True, collections[1], limit, sender=contract_owner)
+    loans_core.setCollectionBorrowedAmount(collections[1], limit // 2)
+
+    amounts = [limit, limit - limit // 2, limit]
+    result = liquidity_controls.checkReserveLimits(borrower, sum(amounts), collections, amounts, loans_core, lending_pool)
+    assert result == (True, True)
+
+    amounts[1] += 1
+    result = liquidity_controls.checkReserveLimits(borrower, sum(amounts), collections, amounts, loans_core, lending_pool)
+    assert result == (True, False)
+    assert liquidity_controls.withinCollectionShareLimit(amounts[1], collections[1], loans_core, lending_pool) is False
+
+
+def test_lender_limits(liquidity_controls, contract_owner):
+    assert liquidity_controls.lenderLimits() == (False, 0, False, 0)
+
+    liquidity_controls.changeMaxPoolShareConditions(True, 1000, sender=contract_owner)
+    liquidity_controls.changeLockPeriodConditions(True, 7 * 24 * 60 * 60, sender=contract_owner)
+
+    assert liquidity_controls.lenderLimits() == (True, 1000, True, 7 * 24 * 60 * 60)
@@ -1,11 +1,17 @@
 import boa
 import pytest
+from eth_abi import encode
+from web3 import Web3
 
 MATURITY = 123456789
 LOAN_AMOUNT = 10**17
 LOAN_INTEREST = 250
 
 
+def _collateral_key(contract_address, token_id):
+    return Web3.keccak(encode(["address", "uint256"], [contract_address, token_id]))
+
+
 @pytest.fixture(scope="module", autouse=True)
 def contract_owner():
     return boa.env.generate_address()
@@ -26,6 +32,7 @@ def loans_core(loans_core_contract, path_to_erc20_mock, contract_owner):
     with boa.env.prank(contract_owner):
         contract = loans_core_contract.deploy()
         contract.setLoansPeripheral(path_to_erc20_mock.deploy())
+        contract.finishCollateralsMigration()
         return contract
 
 
@@ -181,3 +188,326 @@ def test_update_paid_amount_multiple(loans_core, contract_owner, borrower, test_
 
     assert loans_core.getLoanPaidPrincipal(borrower, loan_id) == LOAN_AMOUNT
     assert loans_core.getLoanPaidInterestAmount(borrower, loan_id) == 0
+
+
+def test_update_collaterals_keeps_insertion_order(loans_core_contract, path_to_erc20_mock, contract_owner, erc721):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+    loans_peripheral = loans_core.loansPeripheral()
+    collaterals = [(erc721, k, LOAN_AMOUNT // 5) for k in (3, 1, 2)]
+
+    for collateral in collaterals:
+        loans_core.updateCollaterals(collateral, False, sender=loans_peripheral)
+    loans_core.updateCollaterals(collaterals[1], True, sender=loans_peripheral)
+    loans_core.updateCollaterals(collaterals[1], False, sender=loans_peripheral)
+    loans_core.updateCollaterals(collaterals[0], True, sender=loans_peripheral)
+
+    keys = loans_core.collateralKeysArray()
+    assert len(keys) == len(collaterals)
+    assert loans_core.getCollateralsIdsByAddress(erc721) == [3, 1, 2]
+    assert [loans_core.collateralsData(key) for key in keys] == collaterals
+    assert [loans_core.collateralsUsed(key) for key in keys] == [False, True, True]
+
+
+def test_collateral_keys_page(loans_core_contract, path_to_erc20_mock, contract_owner, erc721):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+    for token_id in range(5):
+        loans_core.updateCollaterals((erc721, token_id, LOAN_AMOUNT), False, sender=loans_core.loansPeripheral())
+
+    keys = loans_core.collateralKeysArray()
+    assert loans_core.collateralKeysLength() == len(keys)
+    assert loans_core.collateralKeysPage(0, 3) + loans_core.collateralKeysPage(3, 3) == keys
+    assert loans_core.collateralKeysPage(5, 3) == []
+    assert loans_core.getCollateralsIdsByAddressLength(erc721) == 5
+    assert loans_core.getCollateralsIdsByAddressPage(erc721, 1, 3) == [1, 2, 3]
+    assert loans_core.getCollateralsIdsByAddressPage(erc721, 3, 2**256 - 1) == [3, 4]
+
+
+def test_update_collaterals_remove_unknown(loans_core_contract, path_to_erc20_mock, contract_owner, erc721):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+
+    loans_core.updateCollaterals((erc721, 0, LOAN_AMOUNT), True, sender=loans_core.loansPeripheral())
+
+    assert loans_core.collateralKeysArray() == []
+    assert loans_core.getCollateralsIdsByAddress(erc721) == []
+
+
+def test_migrate_collaterals(loans_core_contract, path_to_erc20_mock, contract_owner, erc721):
+    with boa.env.prank(contract_owner):
+        legacy_core = loans_core_contract.deploy()
+        legacy_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+        loans_core = loans_core_contract.deploy()
+    collaterals = [(erc721, k, LOAN_AMOUNT // 5) for k in range(5)]
+    for collateral in collaterals:
+        legacy_core.updateCollaterals(collateral, False, sender=legacy_core.loansPeripheral())
+    legacy_core.updateCollaterals(collaterals[2], True, sender=legacy_core.loansPeripheral())
+    legacy_keys = legacy_core.collateralKeysArray()
+
+    with boa.reverts("msg.sender is not the owner"):
+        loans_core.migrateCollaterals(legacy_core.address, legacy_keys)
+
+    loans_core.migrateCollaterals(legacy_core.address, legacy_keys[:3], sender=contract_owner)
+    loans_core.migrateCollaterals(legacy_core.address, legacy_keys[2:], sender=contract_owner)
+
+    assert loans_core.collateralKeysArray() == legacy_keys
+    assert loans_core.getCollateralsIdsByAddress(erc721) == legacy_core.getCollateralsIdsByAddress(erc721)
+    assert [loans_core.collateralsUsed(key) for key in legacy_keys] == [True, True, False, True, True]
+
+    with boa.reverts("collateral not found"):
+        loans_core.migrateCollaterals(legacy_core.address, [b"\x01" * 32], sender=contract_owner)
+
+    loans_core.finishCollateralsMigration(sender=contract_owner)
+    assert loans_core.collateralsMigrationDone()
+
+    with boa.reverts("migration already done"):
+        loans_core.migrateCollaterals(legacy_core.address, legacy_keys, sender=contract_owner)
+
+
+def test_start_loan_before_migration(loans_core_contract, path_to_erc20_mock, contract_owner, borrower, test_collaterals):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+
+    with boa.reverts("migration not done"):
+        loans_core.startLoan(
+            borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_core.loansPeripheral()
+        )
+
+
+def test_start_loan_wrong_sender(loans_core, contract_owner, borrower, test_collaterals):
+    with boa.reverts("msg.sender is not the loans addr"):
+        loans_core.startLoan(borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=contract_owner)
+
+
+def test_start_loan(loans_core_contract, path_to_erc20_mock, contract_owner, borrower, erc721):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+        loans_core.finishCollateralsMigration()
+    other_collection = boa.env.generate_address()
+    collaterals = [(erc721, 0, LOAN_AMOUNT // 4), (other_collection, 0, LOAN_AMOUNT // 2), (erc721, 1, LOAN_AMOUNT // 4)]
+
+    loan_id = loans_core.startLoan(
+        borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, collaterals, sender=loans_core.loansPeripheral()
+    )
+
+    loan = loans_core.getLoan(borrower, loan_id)
+    assert loan[0] == loan_id
+    assert loan[4] == boa.env.evm.patch.timestamp
+    assert loan[5] == collaterals
+    assert loan[8]
+    assert loans_core.ongoingLoans(borrower) == 1
+    assert loans_core.borrowedAmount(borrower) == LOAN_AMOUNT
+    assert loans_core.collectionsBorrowedAmount(erc721) == LOAN_AMOUNT // 2
+    assert loans_core.collectionsBorrowedAmount(other_collection) == LOAN_AMOUNT // 2
+    assert loans_core.getHighestCollateralBundleLoan() == loan
+
+    for contract_address, token_id, _ in collaterals:
+        assert loans_core.collateralsInLoans(_collateral_key(contract_address, token_id), borrower) == loan_id
+        assert loans_core.collateralsInLoansUsed(_collateral_key(contract_address, token_id), borrower, loan_id)
+        assert loans_core.collateralsUsed(_collateral_key(contract_address, token_id))
+
+
+def test_get_loan_header(loans_core, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    assert loans_core.getLoanHeader(borrower, 0) == loans_core.getLoanHeader(borrower, 999)
+    assert not loans_core.getLoanHeader(borrower, 999)[8]
+
+    loan_id = loans_core.startLoan(borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral)
+    loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT, LOAN_AMOUNT // 10, [], sender=loans_peripheral)
+
+    loan = loans_core.getLoan(borrower, loan_id)
+    loan_header = loans_core.getLoanHeader(borrower, loan_id)
+    assert loan_header[:5] == loan[:5]
+    assert loan_header[5:7] == loan[6:8]
+    assert loan_header[7] == loans_core.getLoanCollateralsHash(borrower, loan_id)
+    assert loan_header[8:] == loan[8:]
+    assert loan_header[8]
+    assert loan_header[10]
+
+
+def test_close_loan_wrong_sender(loans_core, contract_owner, borrower):
+    with boa.reverts("msg.sender is not the loans addr"):
+        loans_core.closeLoan(borrower, 0, LOAN_AMOUNT, 0, [], sender=contract_owner)
+
+
+def test_close_loan_not_started(loans_core, borrower):
+    with boa.reverts("loan not found"):
+        loans_core.closeLoan(borrower, 999, LOAN_AMOUNT, 0, [], sender=loans_core.loansPeripheral())
+
+
+def test_close_loan(loans_core, erc721, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    loan_id = loans_core.startLoan(borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral)
+    borrowed_amount = loans_core.borrowedAmount(borrower)
+    ongoing_loans = loans_core.ongoingLoans(borrower)
+    collection_amount = loans_core.collectionsBorrowedAmount(erc721)
+
+    loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT, LOAN_AMOUNT // 10, [], sender=loans_peripheral)
+
+    loan = loans_core.getLoan(borrower, loan_id)
+    assert loan[6] == LOAN_AMOUNT
+    assert loan[7] == LOAN_AMOUNT // 10
+    assert loan[10]
+    assert loans_core.borrowedAmount(borrower) == borrowed_amount - LOAN_AMOUNT
+    assert loans_core.ongoingLoans(borrower) == ongoing_loans - 1
+    assert loans_core.collectionsBorrowedAmount(erc721) == collection_amount - LOAN_AMOUNT
+    assert loans_core.getHighestRepayment()[10]
+
+    for contract_address, token_id, _ in test_collaterals:
+        key = _collateral_key(contract_address, token_id)
+        assert not loans_core.collateralsInLoansUsed(key, borrower, loan_id)
+        assert not loans_core.collateralsUsed(key)
+
+
+def test_default_loan_wrong_sender(loans_core, contract_owner, borrower):
+    with boa.reverts("msg.sender is not the loans addr"):
+        loans_core.defaultLoan(borrower, 0, [], sender=contract_owner)
+
+
+def test_default_loan(loans_core, erc721, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    loan_id = loans_core.startLoan(borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral)
+    borrowed_amount = loans_core.borrowedAmount(borrower)
+    ongoing_loans = loans_core.ongoingLoans(borrower)
+    collection_amount = loans_core.collectionsBorrowedAmount(erc721)
+
+    loans_core.defaultLoan(borrower, loan_id, [], sender=loans_peripheral)
+
+    assert loans_core.getLoanDefaulted(borrower, loan_id)
+    assert loans_core.borrowedAmount(borrower) == borrowed_amount - LOAN_AMOUNT
+    assert loans_core.ongoingLoans(borrower) == ongoing_loans - 1
+    assert loans_core.collectionsBorrowedAmount(erc721) == collection_amount - LOAN_AMOUNT
+    assert loans_core.getHighestDefaultedLoan()[11]
+
+    for contract_address, token_id, _ in test_collaterals:
+        key = _collateral_key(contract_address, token_id)
+        assert not loans_core.collateralsInLoansUsed(key, borrower, loan_id)
+        assert not loans_core.collateralsUsed(key)
+
+
+def test_highest_loans_resolved_from_current_loan(loans_core, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    assert loans_core.getHighestCollateralBundleLoan()[1] == 0
+    assert not loans_core.getHighestRepayment()[8]
+
+    small_loan_id = loans_core.startLoan(
+        borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral
+    )
+    loan_id = loans_core.startLoan(
+        borrower, LOAN_AMOUNT * 2, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral
+    )
+    assert loans_core.getHighestCollateralBundleLoan()[0] == loan_id
+
+    loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT * 2, 0, [], sender=loans_peripheral)
+    loans_core.closeLoan(borrower, small_loan_id, LOAN_AMOUNT, 0, [], sender=loans_peripheral)
+
+    assert loans_core.getHighestCollateralBundleLoan() == loans_core.getLoan(borrower, loan_id)
+    assert loans_core.getHighestCollateralBundleLoan()[10]
+    assert loans_core.getHighestRepayment()[0] == loan_id
+
+
+def test_start_loan_terms_out_of_bounds(loans_core, borrower, test_collaterals):
+    with boa.reverts("interest out of bounds"):
+        loans_core.startLoan(borrower, LOAN_AMOUNT, 2**32, MATURITY, test_collaterals, sender=loans_core.loansPeripheral())
+
+    with boa.reverts("maturity out of bounds"):
+        loans_core.startLoan(
+            borrower, LOAN_AMOUNT, LOAN_INTEREST, 2**64, test_collaterals, sender=loans_core.loansPeripheral()
+        )
+
+
+def test_loan_terms_round_trip(loans_core, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    interest = 2**32 - 1
+    maturity = 2**64 - 1
+    loan_id = loans_core.startLoan(borrower, LOAN_AMOUNT, interest, maturity, test_collaterals, sender=loans_peripheral)
+    start_time = boa.env.evm.patch.timestamp
+
+    loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT, 1, [], sender=loans_peripheral)
+
+    assert loans_core.getLoanInterest(borrower, loan_id) == interest
+    assert loans_core.getLoanMaturity(borrower, loan_id) == maturity
+    assert loans_core.getLoanStartTime(borrower, loan_id) == start_time
+    assert loans_core.getLoanStarted(borrower, loan_id)
+    assert loans_core.getLoanPaid(borrower, loan_id)
+    assert not loans_core.getLoanInvalidated(borrower, loan_id)
+    assert not loans_core.getLoanDefaulted(borrower, loan_id)
+    assert not loans_core.getLoanCanceled(borrower, loan_id)
+    assert loans_core.getLoan(borrower, loan_id) == (
+        loan_id,
+        LOAN_AMOUNT,
+        interest,
+        maturity,
+        start_time,
+        test_collaterals,
+        LOAN_AMOUNT,
+        1,
+        True,
+        False,
+        True,
+        False,
+        False,
+    )
+
+
+def test_change_collaterals_commitment(loans_core, contract_owner, borrower):
+    with boa.reverts("msg.sender is not the owner"):
+        loans_core.changeCollateralsCommitment(True, sender=borrower)
+
+    loans_core.changeCollateralsCommitment(True, sender=contract_owner)
+    assert loans_core.collateralsCommitment()
+
+    with boa.reverts("new value is the same"):
+        loans_core.changeCollateralsCommitment(True, sender=contract_owner)
+
+
+def test_top_stats_with_collaterals_commitment(loans_core_contract, path_to_erc20_mock, contract_owner, borrower, erc721):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.setLoansPeripheral(path_to_erc20_mock.deploy())
+        loans_core.finishCollateralsMigration()
+        loans_core.changeCollateralsCommitment(True)
+    collaterals = [(erc721, k, LOAN_AMOUNT // 2) for k in range(2)]
+
+    assert loans_core.getHighestCollateralBundleLoanHeader() == loans_core.getLoanHeader(borrower, 0)
+
+    loan_id = loans_core.startLoan(
+        borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, collaterals, sender=loans_core.loansPeripheral()
+    )
+
+    assert loans_core.getHighestCollateralBundleLoan()[0] == loan_id
+    assert loans_core.getHighestCollateralBundleLoan()[5] == []
+    assert loans_core.getHighestCollateralBundleLoanHeader() == loans_core.getLoanHeader(borrower, loan_id)
+    assert loans_core.getHighestCollateralBundleLoanHeader()[7] == Web3.keccak(
+        encode(["(address,uint256,uint256)[]"], [collaterals])
+    )
+
+
+def test_close_loan_with_collaterals_commitment(loans_core, contract_owner, erc721, borrower, test_collaterals):
+    loans_peripheral = loans_core.loansPeripheral()
+    loans_core.changeCollateralsCommitment(True, sender=contract_owner)
+    collection_amount = loans_core.collectionsBorrowedAmount(erc721)
+
+    loan_id = loans_core.startLoan(borrower, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, sender=loans_peripheral)
+
+    assert loans_core.getLoanCollaterals(borrower, loan_id) == []
+    assert loans_core.getLoanCollateralsHash(borrower, loan_id) == Web3.keccak(
+        encode(["(address,uint256,uint256)[]"], [test_collaterals])
+    )
+    assert loans_core.collectionsBorrowedAmount(erc721) == collection_amount + LOAN_AMOUNT
+
+    with boa.reverts("collaterals do not match loan"):
+        loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT, 0, test_collaterals[1:], sender=loans_peripheral)
+
+    loans_core.closeLoan(borrower, loan_id, LOAN_AMOUNT, 0, test_collaterals, sender=loans_peripheral)
+
+    assert loans_core.getLoanPaid(borrower, loan_id)
+    assert loans_core.collectionsBorrowedAmount(erc721) == collection_amount
+    for contract_address, token_id, _ in test_collaterals:
+        assert not loans_core.collateralsInLoansUsed(_collateral_key(contract_address, token_id), borrower, loan_id)
@@ -12,7 +12,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from web3 import Web3
 
-from ..conftest_base import ZERO_ADDRESS, get_last_event
+from ..conftest_base import ZERO_ADDRESS, get_events, get_last_event
 
 NOW = boa.eval("block.timestamp")
 MATURITY = NOW + 7 * 86400
@@ -118,12 +118,20 @@ def lending_pool():
 def collateral_vault(empty_contract):
     return boa.loads(
         dedent("""
+    struct Collateral:
+        contractAddress: address
+        tokenId: uint256
+        amount: uint256
+
+    delegations: public(HashMap[uint256, bool])
+
     @external
-    def storeCollateral(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _createDelegation: bool):
-        pass
+    def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+        for collateral: Collateral in _collaterals:
+            self.delegations[collateral.tokenId] = _createDelegation
 
     @external
-    def transferCollateralFromLoan(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address):
+    def transferCollateralsFromLoan(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address):
         pass
 
     @external
@@ -133,6 +141,11 @@ def collateral_vault(empty_contract):
     @external
     def setCollateralDelegation(_wallet: address, _collateralAddress: address, _tokenId: uint256, _erc20TokenContract: address, _value: bool):
         pass
+
+    @external
+    def setCollateralDelegations(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _value: bool):
+        for collateral: Collateral in _collaterals:
+            self.delegations[collateral.tokenId] = _value
      """)  # noqa: E501
     )
 
@@ -141,10 +154,26 @@ def collateral_vault(empty_contract):
 def liquidations(empty_contract):
     return boa.loads(
         dedent("""
+    struct Collateral:
+        contractAddress: address
+        tokenId: uint256
+        amount: uint256
+
+    struct LoanCollaterals:
+        borrower: address
+        loanId: uint256
+        collaterals: DynArray[Collateral, 100]
+
+    liquidatedLoans: public(uint256)
+
     @external
-    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address):
-        pass
-     """)
+    def addLiquidation(_borrower: address, _loanId: uint256, _erc20TokenContract: address, _collaterals: DynArray[Collateral, 100]):
+        self.liquidatedLoans += 1
+
+    @external
+    def addLiquidations(_loans: DynArray[LoanCollaterals, 10], _erc20TokenContract: address):
+        self.liquidatedLoans += len(_loans)
+     """)  # noqa: E501
     )
 
 
@@ -480,6 +509,11 @@ def test_create_loan(
     assert loan_details.defaulted is False
     assert loan_details.canceled is False
 
+    loan_header = loans.getLoanHeader(borrower, loan_id)
+    assert loan_header[:7] == (loan_id, LOAN_AMOUNT, LOAN_INTEREST, MATURITY, loan_details.startTime, 0, 0)
+    assert loan_header[7] == b"\x00" * 32
+    assert loan_header[8:] == (True, False, False, False, False)
+
     assert event.wallet == borrower
     assert event.loanId == 0
 
@@ -875,6 +909,588 @@ def test_set_default_loan(
     assert loans.getLoanDefaulted(borrower, loan_id)
 
 
+def test_settle_defaults(
+    loans,
+    create_signature,
+    collateral_vault,
+    liquidations,
+    erc721,
+    contract_owner,
+    borrower,
+):
+    for k in range(15):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    maturity = boa.eval("block.timestamp") + 10
+    loan_ids = []
+    for nonce in range(3):
+        collaterals = [(erc721.address, k, LOAN_AMOUNT // 5) for k in range(nonce * 5, nonce * 5 + 5)]
+        (v, r, s) = create_signature(collaterals=collaterals, maturity=maturity, nonce=nonce)
+        loan_ids.append(
+            loans.reserveEth(
+                LOAN_AMOUNT,
+                LOAN_INTEREST,
+                maturity,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower,
+            )
+        )
+
+    with boa.reverts("msg.sender is not the admin"):
+        loans.settleDefaults([(borrower, loan_ids[0], [])], sender=borrower)
+
+    with boa.reverts("loan is within maturity period"):
+        loans.settleDefaults([(borrower, loan_ids[0], [])], sender=contract_owner)
+
+    boa.env.time_travel(seconds=15)
+
+    loans.settleDefault(borrower, loan_ids[0], sender=contract_owner)
+    assert liquidations.liquidatedLoans() == 1
+
+    loans.settleDefaults([(borrower, loan_id, []) for loan_id in [*loan_ids, loan_ids[2]]], sender=contract_owner)
+    events = get_events(loans, name="LoanDefaulted")
+
+    assert [event.loanId for event in events] == loan_ids[1:]
+    assert liquidations.liquidatedLoans() == 3
+    for loan_id in loan_ids:
+        assert loans.getLoanDefaulted(borrower, loan_id)
+
+    loans.settleDefaults([(borrower, loan_ids[0], [])], sender=contract_owner)
+    assert liquidations.liquidatedLoans() == 3
+
+
+def test_pay_loan_with_collaterals_commitment(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+    loans.changeCollateralsCommitment(True, sender=contract_owner)
+
+    (v, r, s) = create_signature()
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+
+    assert loans.getLoanCollaterals(borrower, loan_id) == []
+    assert loans.getLoanCollateralsHash(borrower, loan_id) == keccak(
+        encode(["(address,uint256,uint256)[]"], [test_collaterals])
+    )
+    assert loans.getLoanHeader(borrower, loan_id)[7] == loans.getLoanCollateralsHash(borrower, loan_id)
+
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    boa.env.set_balance(borrower, payable_amount)
+
+    with boa.reverts("collaterals do not match loan"):
+        loans.pay(loan_id, sender=borrower, value=payable_amount)
+
+    with boa.reverts("collaterals do not match loan"):
+        loans.pay(loan_id, test_collaterals[:-1], sender=borrower, value=payable_amount)
+
+    loans.pay(loan_id, test_collaterals, sender=borrower, value=payable_amount)
+
+    assert loans.getLoanPaid(borrower, loan_id)
+
+
+def test_pay_many(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+):
+    for k in range(10):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    loan_ids = []
+    for nonce in range(2):
+        collaterals = [(erc721.address, k, LOAN_AMOUNT // 5) for k in range(nonce * 5, nonce * 5 + 5)]
+        (v, r, s) = create_signature(collaterals=collaterals, nonce=nonce)
+        loan_ids.append(
+            loans.reserveEth(
+                LOAN_AMOUNT,
+                LOAN_INTEREST,
+                MATURITY,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower,
+            )
+        )
+
+    boa.env.time_travel(seconds=6 * 86400)
+
+    now = boa.eval("block.timestamp")
+    payable_amounts = [loans.getLoanPayableAmount(borrower, loan_id, now) for loan_id in loan_ids]
+    boa.env.set_balance(borrower, sum(payable_amounts) + 1)
+
+    with boa.reverts("duplicated loan id"):
+        loans.payMany([loan_ids[0], loan_ids[0]], sender=borrower, value=sum(payable_amounts))
+
+    with boa.reverts("insufficient value received"):
+        loans.payMany(loan_ids, sender=borrower, value=sum(payable_amounts) - 1)
+
+    loans.payMany(loan_ids, sender=borrower, value=sum(payable_amounts) + 1)
+    loan_payment_events = get_events(loans, name="LoanPayment")
+    payment_sent_events = get_events(loans, name="PaymentSent")
+
+    assert boa.env.get_balance(borrower) == 1
+    assert [event.loanId for event in loan_payment_events] == loan_ids
+    assert [event.principal + event.interestAmount for event in loan_payment_events] == payable_amounts
+    assert payment_sent_events[0].amount == sum(payable_amounts)
+    assert payment_sent_events[1].wallet == borrower
+    assert payment_sent_events[1].amount == 1
+
+    for loan_id in loan_ids:
+        assert loans.getLoanPaid(borrower, loan_id)
+        assert loans.getLoanPayableAmount(borrower, loan_id, now) == 0
+
+    for k in range(10):
+        assert erc721.ownerOf(k) == borrower
+
+    boa.env.set_balance(borrower, payable_amounts[1])
+    with boa.reverts("loan already paid"):
+        loans.payMany(loan_ids[1:], sender=borrower, value=payable_amounts[1])
+
+
+def test_pay_many_over_100_collaterals(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+):
+    # two 60 collateral loans, released by the vault in more than one call
+    collaterals_per_loan = 60
+    amount = collaterals_per_loan * 10**15
+    for k in range(2 * collaterals_per_loan):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    loan_ids = []
+    for nonce in range(2):
+        collaterals = [
+            (erc721.address, k, 10**15) for k in range(nonce * collaterals_per_loan, (nonce + 1) * collaterals_per_loan)
+        ]
+        (v, r, s) = create_signature(collaterals=collaterals, amount=amount, nonce=nonce)
+        loan_ids.append(
+            loans.reserveEth(
+                amount,
+                LOAN_INTEREST,
+                MATURITY,
+                collaterals,
+                False,
+                VALIDATION_DEADLINE,
+                nonce,
+                0,
+                v,
+                r,
+                s,
+                sender=borrower,
+            )
+        )
+
+    now = boa.eval("block.timestamp")
+    payable_amount = sum(loans.getLoanPayableAmount(borrower, loan_id, now) for loan_id in loan_ids)
+    boa.env.set_balance(borrower, payable_amount)
+
+    loans.payMany(loan_ids, sender=borrower, value=payable_amount)
+
+    for loan_id in loan_ids:
+        assert loans.getLoanPaid(borrower, loan_id)
+
+    for k in range(2 * collaterals_per_loan):
+        assert erc721.ownerOf(k) == borrower
+
+
+def test_pay_many_with_collaterals_commitment(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+    loans.changeCollateralsCommitment(True, sender=contract_owner)
+
+    (v, r, s) = create_signature()
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    boa.env.set_balance(borrower, payable_amount)
+
+    with boa.reverts("collaterals do not match loan"):
+        loans.payMany([loan_id], sender=borrower, value=payable_amount)
+
+    with boa.reverts("collaterals length mismatch"):
+        loans.payMany([loan_id], [test_collaterals, test_collaterals], sender=borrower, value=payable_amount)
+
+    loans.payMany([loan_id], [test_collaterals], sender=borrower, value=payable_amount)
+
+    assert loans.getLoanPaid(borrower, loan_id)
+
+
+def test_refinance(
+    loans,
+    create_signature,
+    lending_pool,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(6):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    (v, r, s) = create_signature()
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+
+    boa.env.time_travel(seconds=6 * 86400)
+
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    new_amount = LOAN_AMOUNT // 2
+    new_maturity = MATURITY + 7 * 86400
+    new_collaterals = [(address, token_id, new_amount // 5) for address, token_id, _ in test_collaterals]
+    (v, r, s) = create_signature(collaterals=new_collaterals, amount=new_amount, maturity=new_maturity, nonce=1)
+    due_amount = payable_amount - new_amount
+    boa.env.set_balance(borrower, due_amount + 1)
+    pool_balance = boa.env.get_balance(lending_pool.address)
+
+    with boa.reverts("collaterals do not match loan"):
+        loans.refinance(
+            loan_id,
+            new_amount,
+            LOAN_INTEREST,
+            new_maturity,
+            [*new_collaterals[:-1], (erc721.address, 5, new_amount // 5)],
+            False,
+            VALIDATION_DEADLINE,
+            1,
+            0,
+            v,
+            r,
+            s,
+            sender=borrower,
+            value=due_amount,
+        )
+
+    with boa.reverts("insufficient value received"):
+        loans.refinance(
+            loan_id,
+            new_amount,
+            LOAN_INTEREST,
+            new_maturity,
+            new_collaterals,
+            False,
+            VALIDATION_DEADLINE,
+            1,
+            0,
+            v,
+            r,
+            s,
+            sender=borrower,
+            value=due_amount - 1,
+        )
+
+    new_loan_id = loans.refinance(
+        loan_id,
+        new_amount,
+        LOAN_INTEREST,
+        new_maturity,
+        new_collaterals,
+        False,
+        VALIDATION_DEADLINE,
+        1,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+        value=due_amount + 1,
+    )
+    loan_payment_event = get_last_event(loans, name="LoanPayment")
+    loan_created_event = get_last_event(loans, name="LoanCreated")
+    loan_refinanced_event = get_last_event(loans, name="LoanRefinanced")
+
+    assert new_loan_id == 1
+    assert loans.getLoanPaid(borrower, loan_id)
+    assert loan_payment_event.loanId == loan_id
+    assert loan_payment_event.principal + loan_payment_event.interestAmount == payable_amount
+    assert loan_created_event.loanId == new_loan_id
+    assert loan_created_event.amount == new_amount
+    assert loan_refinanced_event.wallet == borrower
+    assert loan_refinanced_event.loanId == loan_id
+    assert loan_refinanced_event.newLoanId == new_loan_id
+
+    new_loan = LoanInfo(*loans.getLoan(borrower, new_loan_id))
+    assert new_loan.amount == new_amount
+    assert new_loan.maturity == new_maturity
+    assert new_loan.collaterals == new_collaterals
+    assert new_loan.started
+    assert not new_loan.paid
+
+    assert boa.env.get_balance(borrower) == 1
+    assert boa.env.get_balance(lending_pool.address) == pool_balance + due_amount
+
+
+def test_refinance_higher_amount(
+    loans,
+    create_signature,
+    lending_pool,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    amount = LOAN_AMOUNT // 2
+    collaterals = [(address, token_id, amount // 5) for address, token_id, _ in test_collaterals]
+    (v, r, s) = create_signature(collaterals=collaterals, amount=amount)
+    loan_id = loans.reserveEth(
+        amount, LOAN_INTEREST, MATURITY, collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+    pool_balance = boa.env.get_balance(lending_pool.address)
+
+    # a new loan higher than the payment requires no value
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    (v, r, s) = create_signature(nonce=1)
+    new_loan_id = loans.refinance(
+        loan_id,
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        test_collaterals,
+        False,
+        VALIDATION_DEADLINE,
+        1,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+    )
+
+    assert loans.getLoanPaidPrincipal(borrower, loan_id) == amount
+    assert loans.getLoanPaidInterestAmount(borrower, loan_id) == payable_amount - amount
+    assert loans.getLoanAmount(borrower, new_loan_id) == LOAN_AMOUNT
+    assert boa.env.get_balance(lending_pool.address) == pool_balance
+
+    (v, r, s) = create_signature(nonce=2)
+    with boa.reverts("loan already paid"):
+        loans.refinance(
+            loan_id,
+            LOAN_AMOUNT,
+            LOAN_INTEREST,
+            MATURITY,
+            test_collaterals,
+            False,
+            VALIDATION_DEADLINE,
+            2,
+            0,
+            v,
+            r,
+            s,
+            sender=borrower,
+        )
+
+
+@pytest.mark.parametrize(("delegations", "new_delegations"), [(True, False), (False, True), (True, True)])
+def test_refinance_sets_delegations(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+    delegations,
+    new_delegations,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+
+    (v, r, s) = create_signature(delegations=delegations)
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        test_collaterals,
+        delegations,
+        VALIDATION_DEADLINE,
+        0,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+    )
+    assert all(collateral_vault.delegations(k) == delegations for k in range(5))
+
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    boa.env.set_balance(borrower, payable_amount - LOAN_AMOUNT)
+    (v, r, s) = create_signature(delegations=new_delegations, nonce=1)
+    loans.refinance(
+        loan_id,
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        test_collaterals,
+        new_delegations,
+        VALIDATION_DEADLINE,
+        1,
+        0,
+        v,
+        r,
+        s,
+        sender=borrower,
+        value=payable_amount - LOAN_AMOUNT,
+    )
+
+    assert all(collateral_vault.delegations(k) == new_delegations for k in range(5))
+
+
+def test_refinance_with_collaterals_commitment(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+    loans.changeCollateralsCommitment(True, sender=contract_owner)
+
+    (v, r, s) = create_signature()
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT, LOAN_INTEREST, MATURITY, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+
+    (v, r, s) = create_signature(nonce=1)
+    with boa.reverts("collaterals do not match loan"):
+        loans.refinance(
+            loan_id,
+            LOAN_AMOUNT,
+            LOAN_INTEREST,
+            MATURITY,
+            test_collaterals,
+            False,
+            VALIDATION_DEADLINE,
+            1,
+            0,
+            v,
+            r,
+            s,
+            sender=borrower,
+        )
+
+    payable_amount = loans.getLoanPayableAmount(borrower, loan_id, boa.eval("block.timestamp"))
+    boa.env.set_balance(borrower, payable_amount - LOAN_AMOUNT)
+    new_loan_id = loans.refinance(
+        loan_id,
+        LOAN_AMOUNT,
+        LOAN_INTEREST,
+        MATURITY,
+        test_collaterals,
+        False,
+        VALIDATION_DEADLINE,
+        1,
+        0,
+        v,
+        r,
+        s,
+        test_collaterals,
+        sender=borrower,
+        value=payable_amount - LOAN_AMOUNT,
+    )
+
+    assert loans.getLoanPaid(borrower, loan_id)
+    assert loans.getLoanCollateralsHash(borrower, new_loan_id) == loans.getLoanCollateralsHash(borrower, loan_id)
+
+
+def test_set_default_loan_with_collaterals_commitment(
+    loans,
+    create_signature,
+    collateral_vault,
+    erc721,
+    contract_owner,
+    borrower,
+    test_collaterals,
+):
+    for k in range(5):
+        erc721.mint(borrower, k, sender=contract_owner)
+    erc721.setApprovalForAll(collateral_vault, True, sender=borrower)
+    loans.changeCollateralsCommitment(True, sender=contract_owner)
+
+    maturity = boa.eval("block.timestamp") + 10
+    (v, r, s) = create_signature(maturity=maturity)
+    loan_id = loans.reserveEth(
+        LOAN_AMOUNT, LOAN_INTEREST, maturity, test_collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower
+    )
+
+    boa.env.time_travel(seconds=15)
+
+    with boa.reverts("collaterals do not match loan"):
+        loans.settleDefault(borrower, loan_id, sender=contract_owner)
+
+    loans.settleDefault(borrower, loan_id, test_collaterals, sender=contract_owner)
+
+    assert loans.getLoanDefaulted(borrower, loan_id)
+
+
+def test_change_collaterals_commitment(loans, contract_owner, borrower):
+    with boa.reverts("msg.sender is not the owner"):
+        loans.changeCollateralsCommitment(True, sender=borrower)
+
+    loans.changeCollateralsCommitment(True, sender=contract_owner)
+    event = get_last_event(loans, "CollateralsCommitmentChanged")
+
+    assert loans.collateralsCommitment()
+    assert event.value
+
+    with boa.reverts("new value is the same"):
+        loans.changeCollateralsCommitment(True, sender=contract_owner)
+
+
 @given(
     loan_duration=st.integers(min_value=1, max_value=90),
     passed_time=st.integers(min_value=1, max_value=200),
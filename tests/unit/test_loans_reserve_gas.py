@@ -0,0 +1,193 @@
+from textwrap import dedent
+
+import boa
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from eth_account.messages import HexBytes, SignableMessage
+from eth_utils import keccak
+
+NOW = boa.eval("block.timestamp")
+MATURITY = NOW + 7 * 86400
+VALIDATION_DEADLINE = MATURITY + 1800
+COLLATERAL_AMOUNT = 10**16
+LOAN_INTEREST = 250
+INTEREST_ACCRUAL_PERIOD = 24 * 60 * 60
+
+# lower bound on the reserve gas saved per collection by aggregating the collection amounts in memory instead of using
+# a storage map as scratch space, which costs a cold SSTORE per collection
+MIN_SAVING_PER_COLLECTION = 10_000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def contract_owner(owner_account):
+    return owner_account.address
+
+
+@pytest.fixture(scope="module")
+def lending_pool():
+    return boa.loads(
+        dedent("""
+    @view
+    @external
+    def maxFundsInvestable() -> uint256:
+        return 10**60
+
+    @view
+    @external
+    def erc20TokenContract() -> address:
+        return self
+
+    @view
+    @external
+    def lendingPoolCoreContract() -> address:
+        return self
+
+    @view
+    @external
+    def symbol() -> String[100]:
+        return "WETH"
+
+    @external
+    def sendFunds(_to: address, _amount: uint256):
+        pass
+     """)
+    )
+
+
+@pytest.fixture(scope="module")
+def collateral_vault():
+    return boa.loads(
+        dedent("""
+    struct Collateral:
+        contractAddress: address
+        tokenId: uint256
+        amount: uint256
+
+    @external
+    def storeCollaterals(_wallet: address, _collaterals: DynArray[Collateral, 100], _erc20TokenContract: address, _createDelegation: bool):
+        pass
+     """)  # noqa: E501
+    )
+
+
+@pytest.fixture(scope="module")
+def liquidity_controls():
+    return boa.loads(
+        dedent("""
+    @view
+    @external
+    def checkReserveLimits(
+        _borrower: address,
+        _amount: uint256,
+        _collections: DynArray[address, 100],
+        _amounts: DynArray[uint256, 100],
+        _loansCoreContractAddress: address,
+        _lpPeripheralContractAddress: address
+    ) -> (bool, bool):
+        return True, True
+     """)
+    )
+
+
+@pytest.fixture(scope="module")
+def collections_amounts_benchmark():
+    return boa.load("tests/stubs/CollectionsAmountsBenchmark.vy")
+
+
+def _deploy_loans(loans_contract, loans_core_contract, lending_pool, collateral_vault, liquidity_controls, contract_owner):
+    with boa.env.prank(contract_owner):
+        loans_core = loans_core_contract.deploy()
+        loans_core.finishCollateralsMigration()
+        contract = loans_contract.deploy(
+            INTEREST_ACCRUAL_PERIOD, loans_core, lending_pool, collateral_vault, boa.env.generate_address(), False
+        )
+        contract.setLiquidityControlsAddress(liquidity_controls)
+        loans_core.setLoansPeripheral(contract)
+        return contract, loans_core
+
+
+@pytest.fixture(scope="module")
+def loans(loans_peripheral_contract, loans_core_contract, lending_pool, collateral_vault, liquidity_controls, contract_owner):
+    return _deploy_loans(
+        loans_peripheral_contract, loans_core_contract, lending_pool, collateral_vault, liquidity_controls, contract_owner
+    )
+
+
+def _create_signature(loans, signer, borrower, amount, collaterals):
+    domain_type_def = "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+    reserve_type_def = "ReserveMessageContent(address borrower,uint256 amount,uint256 interest,uint256 maturity,Collateral[] collaterals,bool delegations,uint256 deadline,uint256 nonce,uint256 genesisToken)"  # noqa: E501
+    collateral_type_def = "Collateral(address contractAddress,uint256 tokenId,uint256 amount)"
+
+    domain_hash = keccak(
+        encode(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                keccak(text=domain_type_def),
+                keccak(text="Zharta"),
+                keccak(text="1"),
+                boa.env.evm.chain.chain_id,
+                loans.address,
+            ],
+        )
+    )
+    collateral_type_hash = keccak(text=collateral_type_def)
+    collaterals_hash = keccak(
+        encode(
+            ["bytes32"] * len(collaterals),
+            [keccak(encode(["bytes32", "address", "uint256", "uint256"], [collateral_type_hash, *c])) for c in collaterals],
+        )
+    )
+    message_hash = keccak(
+        encode(
+            ["bytes32", "address", "uint256", "uint256", "uint256", "bytes32", "bool", "uint256", "uint256", "uint256"],
+            [
+                keccak(text=reserve_type_def + collateral_type_def),
+                borrower,
+                amount,
+                LOAN_INTEREST,
+                MATURITY,
+                collaterals_hash,
+                False,
+                VALIDATION_DEADLINE,
+                0,
+                0,
+            ],
+        )
+    )
+    signed_message = Account.sign_message(
+        SignableMessage(HexBytes(b"\x01"), domain_hash, message_hash), private_key=signer.key
+    )
+    return (signed_message.v, signed_message.r, signed_message.s)
+
+
+def _reserve_gas(loans, signer, collaterals):
+    borrower = boa.env.generate_address()
+    amount = COLLATERAL_AMOUNT * len(collaterals)
+    (v, r, s) = _create_signature(loans, signer, borrower, amount, collaterals)
+    loans.reserve(amount, LOAN_INTEREST, MATURITY, collaterals, False, VALIDATION_DEADLINE, 0, 0, v, r, s, sender=borrower)
+    return loans._computation.net_gas_used
+
+
+@pytest.mark.parametrize(("collaterals_count", "collections_count"), [(1, 1), (10, 1), (10, 10), (100, 1), (100, 100)])
+def test_reserve_gas_saving(loans, collections_amounts_benchmark, owner_account, collaterals_count, collections_count):
+    loans_contract, loans_core = loans
+    collections = [boa.env.generate_address() for _ in range(collections_count)]
+    collaterals = [(collections[k % collections_count], k, COLLATERAL_AMOUNT) for k in range(collaterals_count)]
+
+    storage_scratch_result = collections_amounts_benchmark.collectionsAmountsInStorage(collaterals)
+    storage_scratch_gas = collections_amounts_benchmark._computation.net_gas_used
+    memory_result = collections_amounts_benchmark.collectionsAmountsInMemory(collaterals)
+    memory_gas = collections_amounts_benchmark._computation.net_gas_used
+    reserve_gas = _reserve_gas(loans_contract, owner_account, collaterals)
+
+    # run with -s to see the numbers
+    print(
+        f"reserve of {collaterals_count} collaterals in {collections_count} collections: {reserve_gas} gas, "
+        f"{storage_scratch_gas - memory_gas} gas saved by aggregating in memory"
+    )
+
+    assert memory_result == storage_scratch_result
+    for collection in collections:
+        assert loans_core.collectionsBorrowedAmount(collection) == COLLATERAL_AMOUNT * collaterals_count // collections_count
+    assert storage_scratch_gas - memory_gas >= MIN_SAVING_PER_COLLECTION * collections_count
@@ -0,0 +1,211 @@
+from types import SimpleNamespace
+
+import boa
+import click
+import pytest
+
+from scripts._helpers.migration import MAX_BATCH_SIZE, Cursor, migrate_in_batches
+from scripts._helpers.pagination import iter_contract_array
+
+GAS_PER_LENDER = 50_000
+OWNER = "0x0000000000000000000000000000000000000001"
+
+
+class MigrateLenders:
+    def __init__(self, fail_at_call: int | None = None):
+        self.batches = []
+        self.fail_at_call = fail_at_call
+
+    def __call__(self, batch, sender, **kwargs):  # noqa: ARG002
+        if len(self.batches) == self.fail_at_call:
+            raise RuntimeError("transaction failed")
+        self.batches.append(batch)
+        return SimpleNamespace(gas_used=GAS_PER_LENDER * len(batch))
+
+    @property
+    def migrated(self):
+        return [wallet for batch in self.batches for wallet in batch]
+
+
+def contract_method(contract, name):
+    # boa returns the call result, the migration helper expects a receipt with the gas used
+    def call(batch, sender, **kwargs):
+        getattr(contract, name)(batch, sender=sender, **kwargs)
+        return SimpleNamespace(gas_used=contract._computation.net_gas_used)
+
+    return call
+
+
+@pytest.fixture
+def erc20(weth9_contract, contract_owner):
+    with boa.env.prank(contract_owner):
+        return weth9_contract.deploy("ERC20", "ERC20", 18, 10**20)
+
+
+@pytest.fixture
+def source_pool(lendingpool_core_contract, lendingpool_lock_contract, erc20, contract_owner):
+    with boa.env.prank(contract_owner):
+        core = lendingpool_core_contract.deploy(erc20)
+        lock = lendingpool_lock_contract.deploy(erc20)
+    lending_pool_peripheral = boa.env.generate_address()
+    core.setLendingPoolPeripheralAddress(lending_pool_peripheral, sender=contract_owner)
+    erc20.mint(lending_pool_peripheral, 10**20, sender=contract_owner)
+    erc20.approve(core, 10**20, sender=lending_pool_peripheral)
+
+    lenders = [boa.env.generate_address() for _ in range(5)]
+    for i, lender in enumerate(lenders):
+        core.deposit(lender, lending_pool_peripheral, 10**18 * (i + 1), sender=lending_pool_peripheral)
+    core.withdraw(lenders[1], lenders[1], 2 * 10**18, sender=lending_pool_peripheral)
+    lock_period_end = boa.eval("block.timestamp") + 86400
+    lock.migrateLenders([(lender, lock_period_end, 10**18) for lender in lenders[::2]], sender=contract_owner)
+    lock.finishMigration(sender=contract_owner)
+
+    return SimpleNamespace(core=core, lock=lock, lenders=lenders, peripheral=lending_pool_peripheral)
+
+
+@pytest.fixture
+def target_pool(lendingpool_core_contract, lendingpool_lock_contract, erc20, contract_owner):
+    with boa.env.prank(contract_owner):
+        return SimpleNamespace(core=lendingpool_core_contract.deploy(erc20), lock=lendingpool_lock_contract.deploy(erc20))
+
+
+def migrate_pool(source, target, cursor, wallets, owner):
+    migrate_in_batches(
+        contract_method(target.core, "migrateLenders"),
+        wallets,
+        lambda wallet: (wallet, *source.core.funds(wallet)),
+        cursor=cursor,
+        key="lenders",
+        owner=owner,
+        target_gas=3 * GAS_PER_LENDER,
+        gas_options={},
+    )
+    migrate_in_batches(
+        contract_method(target.lock, "migrateLenders"),
+        wallets,
+        lambda wallet: (wallet, *source.lock.investorLocks(wallet)),
+        cursor=cursor,
+        key="locks",
+        owner=owner,
+        target_gas=3 * GAS_PER_LENDER,
+        gas_options={},
+    )
+    target.lock.finishMigration(sender=owner)
+    target.core.migrate(source.core.address, sender=owner)
+
+
+@pytest.fixture
+def wallets():
+    return [f"0x{i:040x}" for i in range(1, 1001)]
+
+
+@pytest.fixture
+def cursor_path(tmp_path):
+    return tmp_path / "cursor.json"
+
+
+def test_cursor_other_migration(cursor_path):
+    Cursor(cursor_path, "source", "target")["lenders"] = 1
+
+    with pytest.raises(click.ClickException):
+        Cursor(cursor_path, "source", "other_target")
+
+
+def test_cursor_keeps_wallets_snapshot(cursor_path, wallets):
+    assert Cursor(cursor_path, "source", "target").wallets(lambda: wallets) == wallets
+
+    assert Cursor(cursor_path, "source", "target").wallets(lambda: list(reversed(wallets))) == wallets
+
+
+def test_migrate_in_batches(cursor_path, wallets):
+    cursor = Cursor(cursor_path, "source", "target")
+    method = MigrateLenders()
+
+    migrate_in_batches(
+        method,
+        wallets,
+        lambda wallet: wallet,
+        cursor=cursor,
+        key="lenders",
+        owner=OWNER,
+        target_gas=20 * GAS_PER_LENDER,
+        gas_options={},
+    )
+
+    assert method.migrated == wallets
+    assert [len(batch) for batch in method.batches[:3]] == [1, 20, 20]
+    assert Cursor(cursor_path, "source", "target")["lenders"] == len(wallets)
+
+
+def test_migrate_in_batches_max_batch_size(cursor_path, wallets):
+    cursor = Cursor(cursor_path, "source", "target")
+    method = MigrateLenders()
+
+    migrate_in_batches(
+        method, wallets, lambda wallet: wallet, cursor=cursor, key="lenders", owner=OWNER, target_gas=10**12, gas_options={}
+    )
+
+    assert method.migrated == wallets
+    assert max(len(batch) for batch in method.batches) == MAX_BATCH_SIZE
+
+
+def test_migrate_in_batches_resume(cursor_path, wallets):
+    cursor = Cursor(cursor_path, "source", "target")
+    method = MigrateLenders(fail_at_call=5)
+
+    with pytest.raises(RuntimeError):
+        migrate_in_batches(
+            method,
+            cursor.wallets(lambda: wallets),
+            lambda wallet: wallet,
+            cursor=cursor,
+            key="lenders",
+            owner=OWNER,
+            target_gas=20 * GAS_PER_LENDER,
+            gas_options={},
+        )
+    migrated = method.migrated
+    assert 0 < len(migrated) < len(wallets)
+
+    # the source array is reordered between runs, the resumed run keeps using the first snapshot
+    reordered = migrated[::2] + wallets[len(migrated) :] + migrated[1::2]
+    cursor = Cursor(cursor_path, "source", "target")
+    method = MigrateLenders()
+    migrate_in_batches(
+        method,
+        cursor.wallets(lambda: reordered),
+        lambda wallet: wallet,
+        cursor=cursor,
+        key="lenders",
+        owner=OWNER,
+        target_gas=20 * GAS_PER_LENDER,
+        gas_options={},
+    )
+
+    assert migrated + method.migrated == wallets
+    assert cursor["lenders"] == len(wallets)
+
+
+def test_migrate_pool(cursor_path, source_pool, target_pool, contract_owner):
+    cursor = Cursor(cursor_path, source_pool.core.address, target_pool.core.address)
+    wallets = cursor.wallets(lambda: list(iter_contract_array(source_pool.core, "lenders", max_workers=1)))
+
+    migrate_pool(source_pool, target_pool, cursor, wallets, contract_owner)
+
+    assert sorted(wallets) == sorted(source_pool.lenders)
+    assert target_pool.core.poolState() == source_pool.core.poolState()
+    assert target_pool.core.activeLenders() == source_pool.core.activeLenders()
+    for wallet in wallets:
+        assert target_pool.core.funds(wallet) == source_pool.core.funds(wallet)
+        assert target_pool.lock.investorLocks(wallet) == source_pool.lock.investorLocks(wallet)
+
+
+def test_migrate_pool_stale_snapshot(cursor_path, source_pool, target_pool, contract_owner):
+    cursor = Cursor(cursor_path, source_pool.core.address, target_pool.core.address)
+    wallets = cursor.wallets(lambda: list(iter_contract_array(source_pool.core, "lenders", max_workers=1)))
+
+    # a lender joining after the snapshot is not migrated, so the active lenders no longer match the source
+    source_pool.core.deposit(boa.env.generate_address(), source_pool.peripheral, 10**18, sender=source_pool.peripheral)
+
+    with boa.reverts("lenders not migrated"):
+        migrate_pool(source_pool, target_pool, cursor, wallets, contract_owner)
@@ -0,0 +1,109 @@
+import random
+import threading
+import time
+from textwrap import dedent
+
+import boa
+import pytest
+
+from scripts._helpers.pagination import iter_contract_array, iter_pages
+
+
+@pytest.fixture
+def array_contract():
+    return boa.loads(
+        dedent("""
+    MAX_PAGE_SIZE: constant(uint256) = 7
+
+    values: public(DynArray[uint256, 2**16])
+
+    @external
+    def setValues(_values: DynArray[uint256, 2**16]):
+        self.values = _values
+
+    @view
+    @external
+    def valuesLength() -> uint256:
+        return len(self.values)
+
+    @view
+    @external
+    def valuesPage(_offset: uint256, _limit: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+        page: DynArray[uint256, MAX_PAGE_SIZE] = []
+        for i: uint256 in range(min(_limit, MAX_PAGE_SIZE), bound=MAX_PAGE_SIZE):
+            if _offset + i >= len(self.values):
+                break
+            page.append(self.values[_offset + i])
+        return page
+    """)
+    )
+
+
+def clamped_fetch(array: list, max_page_size: int):
+    calls = []
+
+    def fetch_page(offset, limit):
+        calls.append((offset, limit))
+        return array[offset : offset + min(limit, max_page_size)]
+
+    return fetch_page, calls
+
+
+def test_iter_pages_empty():
+    fetch_page, calls = clamped_fetch([], 10)
+
+    assert list(iter_pages(fetch_page, 0)) == []
+    assert calls == []
+
+
+@pytest.mark.parametrize(("total", "page_size"), [(1, 10), (10, 10), (11, 10), (95, 10), (1000, 7)])
+def test_iter_pages(total, page_size):
+    array = list(range(total))
+    fetch_page, calls = clamped_fetch(array, page_size)
+
+    assert list(iter_pages(fetch_page, total, page_size=page_size)) == array
+    assert sorted(calls) == [(offset, min(page_size, total - offset)) for offset in range(0, total, page_size)]
+
+
+def test_iter_pages_keeps_order_with_concurrent_fetches():
+    array = list(range(200))
+    threads = set()
+
+    def fetch_page(offset, limit):
+        threads.add(threading.get_ident())
+        time.sleep(random.uniform(0, 0.01))
+        return array[offset : offset + limit]
+
+    assert list(iter_pages(fetch_page, len(array), page_size=10, max_workers=4)) == array
+    assert len(threads) > 1
+
+
+def test_iter_pages_clamped():
+    array = list(range(95))
+    fetch_page, calls = clamped_fetch(array, 7)
+
+    assert list(iter_pages(fetch_page, len(array), page_size=20)) == array
+    assert (0, 20) in calls
+    assert (7, 13) in calls
+    assert (14, 6) in calls
+
+
+def test_iter_pages_shrinking_array():
+    array = list(range(50))
+    fetch_page, _ = clamped_fetch(array, 7)
+    total = len(array)
+    del array[30:]
+
+    assert list(iter_pages(fetch_page, total, page_size=20)) == list(range(30))
+
+
+def test_iter_contract_array(array_contract):
+    values = [i * 3 for i in range(40)]
+    array_contract.setValues(values)
+
+    # the boa env is not thread safe, the contract is called from a single worker
+    assert list(iter_contract_array(array_contract, "values", page_size=10, max_workers=1)) == values
+
+
+def test_iter_contract_array_empty(array_contract):
+    assert list(iter_contract_array(array_contract, "values", max_workers=1)) == []